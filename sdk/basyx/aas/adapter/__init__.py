@@ -6,4 +6,6 @@ This package contains different kinds of adapters.
 * :ref:`xml <adapter.xml.__init__>`: This package offers an adapter for serialization and deserialization of BaSyx
   Python SDK objects to/from XML.
 * :ref:`aasx <adapter.aasx>`: This package offers functions for reading and writing AASX-files.
+* :ref:`directory <adapter.directory>`: This module offers a function for loading all JSON, XML and AASX files from a
+  directory in parallel.
 """
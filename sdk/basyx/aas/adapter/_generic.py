@@ -7,9 +7,14 @@
 """
 The dicts defined in this module are used in the json and xml modules to translate enum members of our
 implementation to the respective string and vice versa.
+
+Furthermore, it contains helpers shared by the adapters.
 """
+import contextlib
+import gc
+import inspect
 import os
-from typing import BinaryIO, Dict, IO, Type, Union
+from typing import BinaryIO, Dict, IO, Iterator, NamedTuple, Optional, Type, Union
 
 from basyx.aas import model
 
@@ -120,3 +125,56 @@ IEC61360_LEVEL_TYPES_INVERSE: Dict[str, model.base.IEC61360LevelType] = \
 
 KEY_TYPES_CLASSES_INVERSE: Dict[model.KeyTypes, Type[model.Referable]] = \
     {v: k for k, v in model.KEY_TYPES_CLASSES.items()}
+
+
+class AbstractClasses(NamedTuple):
+    """
+    The abstract classes from model.base, which a type inherits from, and its ``modelType`` (if it is a Referable)
+    """
+    has_extension: bool
+    has_data_specification: bool
+    referable: bool
+    identifiable: bool
+    has_semantics: bool
+    has_kind: bool
+    qualifiable: bool
+    model_type: Optional[str]
+
+
+_ABSTRACT_CLASSES_CACHE: Dict[type, AbstractClasses] = {}
+
+
+def abstract_classes(type_: type) -> AbstractClasses:
+    """
+    Determine the abstract classes of a type once per type, as they are needed for (de)serializing most objects
+    """
+    try:
+        return _ABSTRACT_CLASSES_CACHE[type_]
+    except KeyError:
+        pass
+    model_type = next((t.__name__ for t in inspect.getmro(type_) if t in model.KEY_TYPES_CLASSES), None)
+    result = _ABSTRACT_CLASSES_CACHE[type_] = AbstractClasses(
+        issubclass(type_, model.HasExtension), issubclass(type_, model.HasDataSpecification),
+        issubclass(type_, model.Referable), issubclass(type_, model.Identifiable),
+        issubclass(type_, model.HasSemantics), issubclass(type_, model.HasKind), issubclass(type_, model.Qualifiable),
+        model_type)
+    return result
+
+
+@contextlib.contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Context manager to pause the cyclic garbage collector while deserializing a document
+
+    Deserialization creates hardly any cyclic garbage, but lots of long-living objects. Each collection of the oldest
+    generation traverses all of them again, which makes the garbage collection the most expensive part of reading a
+    large document.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
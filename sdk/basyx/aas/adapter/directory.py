@@ -0,0 +1,200 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+.. _adapter.directory:
+
+Functionality for loading all AAS files (JSON, XML and AASX) from a directory at once.
+
+The files are parsed in parallel in a pool of worker processes by :func:`~.load_directory_into`. The parsed objects are
+transferred back to the calling process in pickled form, which is much faster to load than the original file, and
+added to the given :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` file by file.
+"""
+import concurrent.futures
+import io
+import logging
+import os
+import pathlib
+import pickle
+import time
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+from .. import model
+from ..util import traversal
+from . import aasx
+from ._generic import Path, gc_paused
+from .json import read_aas_json_file
+from .xml import read_aas_xml_file
+
+logger = logging.getLogger(__name__)
+
+#: The file name suffixes (in lower case) of the files read by :func:`load_directory_into`
+SUPPORTED_SUFFIXES = (".json", ".xml", ".aasx")
+
+
+class LoadedFile(NamedTuple):
+    """
+    Report on a single file read by :func:`load_directory_into`
+
+    :ivar path: The path of the file
+    :ivar identifiers: The :class:`Identifiers <basyx.aas.model.base.Identifier>` of the objects from the file, which
+                       have been added to the object store
+    :ivar parse_time: The time in seconds it took to parse the file (in the worker process)
+    :ivar merge_time: The time in seconds it took to add the parsed objects to the object store
+    """
+    path: pathlib.Path
+    identifiers: Set[model.Identifier]
+    parse_time: float
+    merge_time: float
+
+
+def load_directory_into(object_store: model.AbstractObjectStore, file_store: aasx.AbstractSupplementaryFileContainer,
+                        path: Path, workers: Optional[int] = None, replace_existing: bool = False,
+                        ignore_existing: bool = False, failsafe: bool = True) -> List[LoadedFile]:
+    """
+    Read all JSON, XML and AASX files from a directory into the given object store
+
+    The files (identified by their suffix, see :data:`SUPPORTED_SUFFIXES`) are parsed in parallel by a pool of
+    ``workers`` processes. Afterwards, the objects of each file are added to the ``object_store`` in the order of the
+    file names, so the result does not depend on the order in which the workers finish. Objects with an identifier,
+    which already exists in the ``object_store`` (e.g. from a previous file), are handled just like by
+    :func:`~basyx.aas.adapter.json.json_deserialization.read_aas_json_file_into`. The supplementary files of AASX
+    packages, referenced by :class:`~basyx.aas.model.submodel.File` objects of the added
+    :class:`Submodels <basyx.aas.model.submodel.Submodel>`, are added to the ``file_store``.
+
+    If a file cannot be read (in non-failsafe mode: if it contains any error), the exception is raised and the objects
+    of all previous files stay in the ``object_store``.
+
+    :param object_store: The :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` in which the
+                         identifiable objects should be stored
+    :param file_store: The :class:`SupplementaryFileContainer <.aasx.AbstractSupplementaryFileContainer>` to add the
+                       supplementary files of the AASX packages to
+    :param path: The directory to read the files from. Subdirectories are not read.
+    :param workers: The number of worker processes to parse the files in. Defaults to the number of CPUs. If it is
+                    ``1``, the files are parsed in the calling process.
+    :param replace_existing: Whether to replace existing objects with the same identifier in the object store or not
+    :param ignore_existing: Whether to ignore existing objects (e.g. log a message) or raise an error.
+                            This parameter is ignored if replace_existing is ``True``.
+    :param failsafe: If ``True``, the files are parsed in a failsafe way: Missing attributes and elements are logged
+                     instead of causing exceptions. Defect objects are skipped.
+    :raises KeyError: Encountered an identifier that already exists in the given ``object_store`` with both
+                     ``replace_existing`` and ``ignore_existing`` set to ``False``
+    :raises (~basyx.aas.model.base.AASConstraintViolation, KeyError, ValueError, TypeError): **Non-failsafe**:
+        Errors during construction of the objects
+    :return: A report for each of the read files, in the order they have been added to the ``object_store``
+    """
+    files = sorted(file for file in pathlib.Path(os.fsdecode(path)).iterdir()
+                   if file.is_file() and file.suffix.lower() in SUPPORTED_SUFFIXES)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ret: List[LoadedFile] = []
+
+    # The garbage collector is only paused while parsing or unpickling a file (as it would repeatedly traverse all
+    # objects created so far), but not while adding the objects to the object store
+    if workers <= 1 or len(files) <= 1:
+        for file in files:
+            start = time.perf_counter()
+            with gc_paused():
+                objects, supplementary_files = _read_file(file, failsafe)
+            ret.append(_merge_file(object_store, file_store, file, objects, supplementary_files,
+                                   time.perf_counter() - start, replace_existing, ignore_existing))
+        return ret
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+        futures = [executor.submit(_read_file_pickled, file, failsafe) for file in files]
+        try:
+            for file, future in zip(files, futures):
+                data, parse_time = future.result()
+                start = time.perf_counter()
+                with gc_paused():
+                    objects, supplementary_files = pickle.loads(data)
+                ret.append(_merge_file(object_store, file_store, file, objects, supplementary_files,
+                                       parse_time, replace_existing, ignore_existing, start))
+        finally:
+            # Don't parse the remaining files, if an error occurred
+            for future in futures:
+                future.cancel()
+    return ret
+
+
+def _read_file(file: pathlib.Path, failsafe: bool) \
+        -> Tuple[List[model.Identifiable], Optional[aasx.DictSupplementaryFileContainer]]:
+    """
+    Parse a single file for :func:`load_directory_into`
+
+    :return: The parsed objects and the supplementary files (only for AASX packages)
+    """
+    suffix = file.suffix.lower()
+    if suffix == ".json":
+        return list(read_aas_json_file(file, failsafe=failsafe)), None
+    if suffix == ".xml":
+        return list(read_aas_xml_file(file, failsafe=failsafe)), None
+    object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+    supplementary_files = aasx.DictSupplementaryFileContainer()
+    with aasx.AASXReader(file) as reader:
+        reader.read_into(object_store, supplementary_files, failsafe=failsafe)
+    return list(object_store), supplementary_files
+
+
+def _read_file_pickled(file: pathlib.Path, failsafe: bool) -> Tuple[bytes, float]:
+    """
+    Parse a single file in a worker process of :func:`load_directory_into`
+
+    :return: The pickled result of :func:`_read_file` and the time it took to create it
+    """
+    start = time.perf_counter()
+    with gc_paused():
+        data = pickle.dumps(_read_file(file, failsafe), protocol=pickle.HIGHEST_PROTOCOL)
+    return data, time.perf_counter() - start
+
+
+def _merge_file(object_store: model.AbstractObjectStore, file_store: aasx.AbstractSupplementaryFileContainer,
+                file: pathlib.Path, objects: List[model.Identifiable],
+                supplementary_files: Optional[aasx.DictSupplementaryFileContainer], parse_time: float,
+                replace_existing: bool, ignore_existing: bool, start: Optional[float] = None) -> LoadedFile:
+    """
+    Add the objects parsed from a single file to the object store
+
+    :param start: The point in time (see :func:`time.perf_counter`) the merging has been started, if it included
+                  further steps (i.e. unpickling the objects)
+    """
+    if start is None:
+        start = time.perf_counter()
+    identifiers: Set[model.Identifier] = set()
+    for item in objects:
+        existing_element = object_store.get(item.id)
+        if existing_element is not None:
+            if not replace_existing:
+                error_message = f"object with identifier {item.id} already exists " \
+                                f"in the object store: {existing_element}!"
+                if not ignore_existing:
+                    raise KeyError(error_message + f" failed to insert {item} from {file}!")
+                logger.info(error_message + f" skipping insertion of {item} from {file}...")
+                continue
+            object_store.discard(existing_element)
+        if supplementary_files is not None and isinstance(item, model.Submodel):
+            _add_supplementary_files(item, supplementary_files, file_store)
+        object_store.add(item)
+        identifiers.add(item.id)
+    merge_time = time.perf_counter() - start
+    logger.info("Loaded %d objects from %s (parsing: %.3f s, merging: %.3f s)", len(identifiers), file, parse_time,
+                merge_time)
+    return LoadedFile(file, identifiers, parse_time, merge_time)
+
+
+def _add_supplementary_files(submodel: model.Submodel, supplementary_files: aasx.DictSupplementaryFileContainer,
+                             file_store: aasx.AbstractSupplementaryFileContainer) -> None:
+    """
+    Add the supplementary files referenced by the File objects of a Submodel to the file store and update the File
+    objects' values with their (possibly changed) names in the file store
+    """
+    for element in traversal.walk_submodel(submodel):
+        if isinstance(element, model.File) and element.value is not None and element.value in supplementary_files:
+            content = io.BytesIO()
+            supplementary_files.write_file(element.value, content)
+            content.seek(0)
+            element.value = file_store.add_file(element.value, content,
+                                                supplementary_files.get_content_type(element.value))
@@ -37,18 +37,23 @@ However, several features and routes are currently not supported:
 import abc
 import base64
 import binascii
+import collections
+import contextvars
 import datetime
 import enum
+import hashlib
 import io
 import json
 import itertools
+import threading
+import weakref
 
 from lxml import etree
 import werkzeug.exceptions
 import werkzeug.routing
 import werkzeug.urls
 import werkzeug.utils
-from werkzeug.exceptions import BadRequest, Conflict, NotFound, UnprocessableEntity
+from werkzeug.exceptions import BadRequest, Conflict, NotFound, PreconditionFailed, UnprocessableEntity
 from werkzeug.routing import MapAdapter, Rule, Submount
 from werkzeug.wrappers import Request, Response
 from werkzeug.datastructures import FileStorage
@@ -58,8 +63,9 @@ from ._generic import XML_NS_MAP
 from .xml import XMLConstructables, read_aas_xml_element, xml_serialization, object_to_xml_element
 from .json import AASToJsonEncoder, StrictAASFromJsonDecoder, StrictStrippedAASFromJsonDecoder
 from . import aasx
+from ..backend import backends
 
-from typing import Callable, Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Type, TypeVar, Union, Tuple
 
 
 @enum.unique
@@ -92,6 +98,16 @@ class Result:
         self.messages: List[Message] = messages
 
 
+class PagingMetadata:
+    """
+    The paging metadata of a paginated response.
+
+    :ivar cursor: Opaque cursor to request the next page with or ``None``, if there are no further results
+    """
+    def __init__(self, cursor: Optional[str] = None):
+        self.cursor: Optional[str] = cursor
+
+
 class ResultToJsonEncoder(AASToJsonEncoder):
     @classmethod
     def _result_to_json(cls, result: Result) -> Dict[str, object]:
@@ -127,17 +143,37 @@ ResponseData = Union[Result, object, List[object]]
 
 
 class APIResponse(abc.ABC, Response):
+    """
+    Base class of the responses of the :class:`~.WSGIApp`, serializing the response data in a specific format.
+
+    Instead of ``obj``, an already serialized response body may be passed as ``serialized``.
+
+    If ``stream`` is ``True``, ``obj`` must be an iterable of objects, which is serialized incrementally as a list, one
+    object at a time, while the response body is sent to the client. In this case, the iterable is only iterated after
+    the response has been returned from the WSGI application, so errors occurring while iterating it can't be reported
+    via the HTTP status code anymore.
+    """
     @abc.abstractmethod
-    def __init__(self, obj: Optional[ResponseData] = None, cursor: Optional[int] = None,
-                 stripped: bool = False, *args, **kwargs):
+    def __init__(self, obj: Optional[ResponseData] = None, paging_metadata: Optional[PagingMetadata] = None,
+                 stripped: bool = False, *args, stream: bool = False, serialized: Optional[bytes] = None, **kwargs):
         super().__init__(*args, **kwargs)
-        if obj is None:
+        if serialized is not None:
+            self.data = serialized
+        elif obj is None:
             self.status_code = 204
+        elif stream:
+            assert isinstance(obj, Iterable)
+            self.response = self.serialize_stream(obj, paging_metadata, stripped)
         else:
-            self.data = self.serialize(obj, cursor, stripped)
+            self.data = self.serialize(obj, paging_metadata, stripped)
 
     @abc.abstractmethod
-    def serialize(self, obj: ResponseData, cursor: Optional[int], stripped: bool) -> str:
+    def serialize(self, obj: ResponseData, paging_metadata: Optional[PagingMetadata], stripped: bool) -> str:
+        pass
+
+    @abc.abstractmethod
+    def serialize_stream(self, obj: Iterable[object], paging_metadata: Optional[PagingMetadata], stripped: bool) \
+            -> Iterator[bytes]:
         pass
 
 
@@ -145,12 +181,12 @@ class JsonResponse(APIResponse):
     def __init__(self, *args, content_type="application/json", **kwargs):
         super().__init__(*args, **kwargs, content_type=content_type)
 
-    def serialize(self, obj: ResponseData, cursor: Optional[int], stripped: bool) -> str:
-        if cursor is None:
+    def serialize(self, obj: ResponseData, paging_metadata: Optional[PagingMetadata], stripped: bool) -> str:
+        if paging_metadata is None:
             data = obj
         else:
             data = {
-                "paging_metadata": {"cursor": str(cursor)},
+                "paging_metadata": self._paging_metadata_to_json(paging_metadata),
                 "result": obj
             }
         return json.dumps(
@@ -159,15 +195,36 @@ class JsonResponse(APIResponse):
             separators=(",", ":")
         )
 
+    def serialize_stream(self, obj: Iterable[object], paging_metadata: Optional[PagingMetadata], stripped: bool) \
+            -> Iterator[bytes]:
+        """
+        Serializes the objects one at a time. For paginated results, the ``paging_metadata`` is written after the
+        ``result``, since the cursor is only known after the last object of the page has been retrieved.
+        """
+        encoder = (StrippedResultToJsonEncoder if stripped else ResultToJsonEncoder)(separators=(",", ":"))
+        yield b'{"result":[' if paging_metadata is not None else b"["
+        separator = b""
+        for item in obj:
+            yield separator + encoder.encode(item).encode("utf-8")
+            separator = b","
+        yield b"]"
+        if paging_metadata is not None:
+            yield b',"paging_metadata":' + encoder.encode(self._paging_metadata_to_json(paging_metadata))\
+                .encode("utf-8") + b"}"
+
+    @staticmethod
+    def _paging_metadata_to_json(paging_metadata: PagingMetadata) -> Dict[str, object]:
+        return {"cursor": paging_metadata.cursor} if paging_metadata.cursor is not None else {}
+
 
 class XmlResponse(APIResponse):
     def __init__(self, *args, content_type="application/xml", **kwargs):
         super().__init__(*args, **kwargs, content_type=content_type)
 
-    def serialize(self, obj: ResponseData, cursor: Optional[int], stripped: bool) -> str:
+    def serialize(self, obj: ResponseData, paging_metadata: Optional[PagingMetadata], stripped: bool) -> str:
         root_elem = etree.Element("response", nsmap=XML_NS_MAP)
-        if cursor is not None:
-            root_elem.set("cursor", str(cursor))
+        if paging_metadata is not None and paging_metadata.cursor is not None:
+            root_elem.set("cursor", paging_metadata.cursor)
         if isinstance(obj, Result):
             result_elem = result_to_xml(obj, **XML_NS_MAP)
             for child in result_elem:
@@ -184,12 +241,118 @@ class XmlResponse(APIResponse):
         xml_str = etree.tostring(root_elem, xml_declaration=True, encoding="utf-8")
         return xml_str  # type: ignore[return-value]
 
+    def serialize_stream(self, obj: Iterable[object], paging_metadata: Optional[PagingMetadata], stripped: bool) \
+            -> Iterator[bytes]:
+        """
+        Serializes the objects one at a time, producing the same document as :meth:`~.serialize`. Since the cursor of
+        paginated results is an attribute of the root element, the objects of a page are retrieved before the response
+        is started in this case. Still, they are serialized one at a time.
+        """
+        if paging_metadata is not None:
+            obj = list(obj)
+        root_elem = etree.Element("response", nsmap=XML_NS_MAP)
+        if paging_metadata is not None and paging_metadata.cursor is not None:
+            root_elem.set("cursor", paging_metadata.cursor)
+        # serialize the empty root element and split it into start and end tag: `<response …/>`
+        empty_root = etree.tostring(root_elem, xml_declaration=True, encoding="utf-8")
+        yield empty_root[:-2] + b">"
+        for item in obj:
+            # serialize each item within its own root element, to only declare the namespaces once in the document
+            item_root = etree.Element("response", nsmap=XML_NS_MAP)
+            item_root.append(object_to_xml_element(item))
+            etree.cleanup_namespaces(item_root)
+            item_str = etree.tostring(item_root, encoding="utf-8")
+            yield item_str[item_str.index(b">") + 1:-len(b"</response>")]
+        yield b"</response>"
+
 
 class XmlResponseAlt(XmlResponse):
     def __init__(self, *args, content_type="text/xml", **kwargs):
         super().__init__(*args, **kwargs, content_type=content_type)
 
 
+ResponseCacheKey = Tuple[model.Identifier, Optional[str], Tuple[str, ...], Type[APIResponse], str, bool]
+
+
+class ResponseCache:
+    """
+    A bounded LRU cache of serialized response bodies of the :class:`~.WSGIApp`.
+
+    The entries are keyed by the identifier of the Identifiable, the revision of its data in its external data source
+    (see :meth:`~basyx.aas.backend.backends.Backend.get_revision`), if known, and the id_short path of the Referable
+    within it, which have been serialized, the response type (i.e. the format), the endpoint and whether the response
+    is stripped. Each entry is stored with the :attr:`~basyx.aas.model.base.Referable.commit_version` of the
+    Identifiable and only served for the same version. So entries of objects are never served after the object has
+    been changed in its data source (if the revision is known) or changed and committed via
+    :meth:`~basyx.aas.model.base.Referable.commit`. The :class:`~.WSGIApp` invalidates the entries, when objects are
+    changed through the API or updated from their external data sources without a known revision. If objects in the
+    object store are changed otherwise without being committed, :meth:`~.invalidate` or :meth:`~.clear` must be
+    called.
+
+    :ivar maxsize: Maximum number of cached responses. If ``0``, no responses are cached.
+    :ivar hits: Number of cache hits
+    :ivar misses: Number of cache misses
+    """
+    def __init__(self, maxsize: int = 128):
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        # key → (commit_version of the Identifiable, serialized response body)
+        self._entries: "collections.OrderedDict[ResponseCacheKey, Tuple[int, bytes]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ResponseCacheKey, commit_version: int = 0) -> Optional[bytes]:
+        """
+        :param commit_version: The current :attr:`~basyx.aas.model.base.Referable.commit_version` of the Identifiable
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != commit_version:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: ResponseCacheKey, data: bytes, commit_version: int = 0) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (commit_version, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, identifier: model.Identifier, id_shorts: Tuple[str, ...] = (),
+                   commit_version: Optional[int] = None) -> None:
+        """
+        Removes all entries of the Referable with the given id_short path within the Identifiable with the given
+        identifier, as well as the entries of its ancestors and descendants, since their serialization contains it.
+
+        :param identifier: The identifier of the Identifiable
+        :param id_shorts: The id_short path of the changed Referable within the Identifiable. If empty, all entries of
+                          the Identifiable are removed.
+        :param commit_version: The new :attr:`~basyx.aas.model.base.Referable.commit_version` of the Identifiable, if
+                               it has been incremented by committing only this change. The remaining entries of the
+                               previous version are still valid for it.
+        """
+        with self._lock:
+            for key, (version, data) in list(self._entries.items()):
+                if key[0] != identifier:
+                    continue
+                if key[2][:len(id_shorts)] == id_shorts[:len(key[2])]:
+                    del self._entries[key]
+                elif commit_version is not None and version == commit_version - 1:
+                    self._entries[key] = (commit_version, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def result_to_xml(result: Result, **kwargs) -> etree._Element:
     result_elem = etree.Element("result", **kwargs)
     success_elem = etree.Element("success")
@@ -423,11 +586,23 @@ class IdShortPathConverter(werkzeug.routing.UnicodeConverter):
         return id_shorts
 
 
+# The Identifiable of the resource of the request currently handled, which has already been updated from its external
+# data source (see WSGIApp._update())
+_updated_identifiable: "contextvars.ContextVar[Optional[model.Identifiable]]" = \
+    contextvars.ContextVar("_updated_identifiable", default=None)
+
+
 class WSGIApp:
     def __init__(self, object_store: model.AbstractObjectStore, file_store: aasx.AbstractSupplementaryFileContainer,
-                 base_path: str = "/api/v3.0"):
+                 base_path: str = "/api/v3.0", response_cache_size: int = 128, update_max_age: float = 0):
         self.object_store: model.AbstractObjectStore = object_store
         self.file_store: aasx.AbstractSupplementaryFileContainer = file_store
+        # maximum age in seconds of the data of objects with an external data source, before they are updated again
+        self.update_max_age: float = update_max_age
+        self.response_cache: ResponseCache = ResponseCache(response_cache_size)
+        # cached ETags (content hashes) of the Identifiables without a known source revision with the commit_version of
+        # the Identifiable they have been computed for. They are discarded when an Identifiable is changed.
+        self._etags: "weakref.WeakKeyDictionary[model.Identifiable, Tuple[int, str]]" = weakref.WeakKeyDictionary()
         self.url_map = werkzeug.routing.Map([
             Submount(base_path, [
                 Rule("/serialization", methods=["GET"], endpoint=self.not_implemented),
@@ -573,14 +748,162 @@ class WSGIApp:
         identifiable = self.object_store.get(identifier)
         if not isinstance(identifiable, type_):
             raise NotFound(f"No {type_.__name__} with {identifier} found!")
-        identifiable.update()
+        self._update(identifiable)
         return identifiable
 
-    def _get_all_obj_of_type(self, type_: Type[model.provider._IT]) -> Iterator[model.provider._IT]:
-        for obj in self.object_store:
-            if isinstance(obj, type_):
-                obj.update()
-                yield obj
+    def _update(self, identifiable: model.Identifiable) -> None:
+        """
+        Updates an Identifiable from its external data source, if its data is older than ``update_max_age``, unless it
+        has already been updated while handling the current request.
+
+        The ETag and the cached responses of Identifiables with a known source revision (see :meth:`~._get_revision`)
+        are bound to the revision. For other Identifiables, they are discarded, if the Identifiable has been updated,
+        since it may have changed.
+        """
+        if _updated_identifiable.get() is identifiable:
+            return
+        last_source_update = identifiable.last_source_update
+        identifiable.update(max_age=self.update_max_age)
+        if identifiable.source != "" and identifiable.last_source_update != last_source_update \
+                and self._get_revision(identifiable) is None:
+            self._etags.pop(identifiable, None)
+            self.response_cache.invalidate(identifiable.id)
+
+    @staticmethod
+    def _get_revision(identifiable: model.Identifiable) -> Optional[str]:
+        """
+        Returns the revision of the data of an Identifiable in its external data source (see
+        :meth:`~basyx.aas.backend.backends.Backend.get_revision`) or ``None``, if it has no external data source or the
+        revision is unknown.
+        """
+        if identifiable.source == "":
+            return None
+        try:
+            return backends.get_backend(identifiable.source).get_revision(identifiable)
+        except (backends.UnknownBackendException, ValueError):
+            return None
+
+    def _cached_response(self, response_t: Type[APIResponse], endpoint: Callable, identifiable: model.Identifiable,
+                         id_shorts: List[str], obj: model.Referable, stripped: bool) -> APIResponse:
+        """
+        Returns the response for a Referable, using the serialized response body from the
+        :class:`~.ResponseCache`, if it is cached.
+
+        :param endpoint: The endpoint creating the response
+        :param identifiable: The Identifiable containing the Referable
+        :param id_shorts: The id_short path of the Referable within the Identifiable
+        """
+        key: ResponseCacheKey = (identifiable.id, self._get_revision(identifiable), tuple(id_shorts), response_t,
+                                 endpoint.__name__, stripped)
+        commit_version = identifiable.commit_version
+        data = self.response_cache.get(key, commit_version)
+        if data is not None:
+            return response_t(serialized=data)
+        response = response_t(obj, stripped=stripped)
+        self.response_cache.put(key, response.get_data(), commit_version)
+        return response
+
+    def _get_etag(self, identifiable: model.Identifiable) -> str:
+        """
+        Returns the ETag of an Identifiable, which is the hash of its source and the revision of its data in the source,
+        if the revision is known (see :meth:`~._get_revision`), or the hash of its JSON serialization otherwise. The
+        latter is cached until the Identifiable is changed through the API, committed (see
+        :attr:`~basyx.aas.model.base.Referable.commit_version`) or updated from its external data source.
+        """
+        revision = self._get_revision(identifiable)
+        if revision is not None:
+            return hashlib.sha256("{}#{}".format(identifiable.source, revision).encode("utf-8")).hexdigest()
+        cached = self._etags.get(identifiable)
+        if cached is not None and cached[0] == identifiable.commit_version:
+            return cached[1]
+        commit_version = identifiable.commit_version
+        etag = hashlib.sha256(json.dumps(identifiable, cls=AASToJsonEncoder, separators=(",", ":"))
+                              .encode("utf-8")).hexdigest()
+        self._etags[identifiable] = (commit_version, etag)
+        return etag
+
+    def _get_conditional_identifiable(self, endpoint: Callable, url_args: Mapping[str, Any]) \
+            -> Optional[model.Identifiable]:
+        """
+        Returns the Identifiable, whose ETag applies to the resource of a request, i.e. the Identifiable the resource
+        is part of, or ``None``, if there is no such Identifiable.
+        """
+        if endpoint == self.aas_submodel_refs_redirect:
+            return None
+        # The Submodel is the resource of the routes below /shells/<aas_id>/submodels/<submodel_id>, while the
+        # submodel_id of /shells/<aas_id>/submodel-refs/<submodel_id> only identifies a reference within the AAS
+        keys: Tuple[Tuple[str, Type[model.Identifiable]], ...] = (
+            ("submodel_id", model.Submodel), ("aas_id", model.AssetAdministrationShell),
+            ("concept_id", model.ConceptDescription))
+        if endpoint == self.delete_aas_submodel_refs_specific:
+            keys = keys[1:]
+        for key, type_ in keys:
+            if key in url_args:
+                identifiable = self.object_store.get(url_args[key])
+                return identifiable if isinstance(identifiable, type_) else None
+        return None
+
+    def _evaluate_preconditions(self, request: Request, identifiable: Optional[model.Identifiable]) \
+            -> Optional[Response]:
+        """
+        Evaluates the ``If-None-Match`` header of GET requests and the ``If-Match`` header of all other requests
+        against the ETag of the Identifiable of the requested resource.
+
+        :return: A "304 Not Modified" response, if the resource has not been modified, or ``None``, if the request is
+                 to be handled
+        :raises PreconditionFailed: If ``If-Match`` is given and doesn't match
+        """
+        if request.method in ("GET", "HEAD"):
+            if request.if_none_match and identifiable is not None:
+                etag = self._get_etag(identifiable)
+                if request.if_none_match.contains_weak(etag):
+                    response = Response(status=304)
+                    response.set_etag(etag)
+                    return response
+        elif request.if_match:
+            if identifiable is None:
+                raise PreconditionFailed("The resource does not exist!")
+            if not request.if_match.contains(self._get_etag(identifiable)):
+                raise PreconditionFailed("The resource has been modified!")
+        return None
+
+    def _get_all_obj_of_type(self, type_: Type[model.provider._IT], id_short: Optional[model.NameType] = None,
+                             semantic_id: Optional[model.Reference] = None,
+                             specific_asset_ids: Iterable[model.SpecificAssetId] = (),
+                             after: Optional[model.Identifier] = None) -> Iterator[model.provider._IT]:
+        # the filter criteria are pushed into the object store, which may answer them from indexes or on the server
+        for obj in self.object_store.query(type_, id_short=id_short, semantic_id=semantic_id,
+                                           specific_asset_ids=specific_asset_ids, after=after):
+            self._update(obj)
+            yield obj
+
+    def _commit(self, referable: model.Referable) -> None:
+        """
+        Commits the changes of a Referable, which has been modified through the API, discards the cached ETag and
+        responses of the Identifiable containing it and updates the indexes of the object store (if any) for it.
+        """
+        referable.commit()
+        identifiable: object = referable
+        id_shorts: List[str] = []
+        while isinstance(identifiable, model.Referable) and not isinstance(identifiable, model.Identifiable):
+            if identifiable.id_short is None:
+                # elements of a SubmodelElementList don't have an id_short, so the whole list is invalidated instead
+                id_shorts.clear()
+            else:
+                id_shorts.append(identifiable.id_short)
+            identifiable = identifiable.parent
+        if isinstance(identifiable, model.Identifiable):
+            self._etags.pop(identifiable, None)
+            # The other cached responses of the Identifiable are not affected by the change
+            self.response_cache.invalidate(identifiable.id, tuple(reversed(id_shorts)), identifiable.commit_version)
+            # Object stores with indexes over attributes of the stored objects need to be notified about changes
+            reindex = getattr(self.object_store, "reindex", None)
+            if reindex is not None:
+                reindex(identifiable)
+
+    def _remove(self, identifiable: model.Identifiable) -> None:
+        self.object_store.remove(identifiable)
+        self.response_cache.invalidate(identifiable.id)
 
     def _resolve_reference(self, reference: model.ModelReference[model.base._RT]) -> model.base._RT:
         try:
@@ -645,65 +968,110 @@ class WSGIApp:
         raise NotFound(f"The AAS {aas!r} doesn't have a submodel reference to {submodel_id!r}!")
 
     @classmethod
-    def _get_slice(cls, request: Request, iterator: Iterable[T]) -> Tuple[Iterator[T], int]:
+    def _get_limit(cls, request: Request) -> int:
         limit_str = request.args.get('limit', default="10")
-        cursor_str = request.args.get('cursor', default="0")
         try:
-            limit, cursor = int(limit_str), int(cursor_str)
-            if limit < 0 or cursor < 0:
+            limit = int(limit_str)
+            if limit < 1:
                 raise ValueError
         except ValueError:
-            raise BadRequest("Cursor and limit must be positive integers!")
-        start_index = cursor
-        end_index = cursor + limit
-        paginated_slice = itertools.islice(iterator, start_index, end_index)
-        return paginated_slice, end_index
+            raise BadRequest("Limit must be a positive integer!")
+        return limit
+
+    @classmethod
+    def _get_cursor(cls, request: Request) -> Optional[str]:
+        """
+        Returns the key of the last item of the previous page, which is encoded in the opaque cursor of the request.
+        """
+        cursor = request.args.get('cursor')
+        if cursor is None:
+            return None
+        return base64url_decode(cursor)
+
+    @classmethod
+    def _iter_submodel_elements_after(cls, submodel_elements: model.NamespaceSet[model.SubmodelElement],
+                                      after: Optional[str]) -> Iterator[model.SubmodelElement]:
+        """
+        Iterates submodel elements in the order of the model, starting after the element with the given id_short.
 
-    def _get_shells(self, request: Request) -> Tuple[Iterator[model.AssetAdministrationShell], int]:
-        aas: Iterator[model.AssetAdministrationShell] = self._get_all_obj_of_type(model.AssetAdministrationShell)
+        :raises BadRequest: If the element the cursor refers to does not exist (anymore)
+        """
+        if after is None:
+            return iter(submodel_elements)
+        cursor_element = submodel_elements.get("id_short", after)
+        if cursor_element is None:
+            raise BadRequest(f"Cursor refers to a submodel element with id_short {after!r}, which does not exist!")
+        elements = iter(submodel_elements)
+        for element in elements:
+            if element is cursor_element:
+                break
+        return elements
 
+    @classmethod
+    def _get_slice(cls, request: Request, iterator: Iterable[T], key: Callable[[T], str]) \
+            -> Tuple[Iterator[T], PagingMetadata]:
+        """
+        Takes the next page from an iterator, which already starts after the cursor of the request (i.e. the key of the
+        last item of the previous page).
+
+        The page is returned as a lazy iterator. The cursor of the returned paging metadata is set, once the iterator
+        has been exhausted and there are further results.
+
+        :param key: Function to compute the key of an item, which is encoded in the cursor
+        """
+        limit = cls._get_limit(request)
+        paging_metadata = PagingMetadata()
+
+        def page() -> Iterator[T]:
+            last_item: T
+            for i, item in enumerate(iterator):
+                if i == limit:
+                    # there are further results beyond this page
+                    paging_metadata.cursor = base64url_encode(key(last_item))
+                    return
+                last_item = item
+                yield item
+
+        return page(), paging_metadata
+
+    def _get_shells(self, request: Request) -> Tuple[Iterator[model.AssetAdministrationShell], PagingMetadata]:
         id_short = request.args.get("idShort")
-        if id_short is not None:
-            aas = filter(lambda shell: shell.id_short == id_short, aas)
-
-        asset_ids = request.args.getlist("assetIds")
-        if asset_ids is not None:
-            # Decode and instantiate SpecificAssetIds
-            # This needs to be a list, otherwise we can only iterate it once.
-            specific_asset_ids: List[model.SpecificAssetId] = list(
-                map(lambda asset_id: HTTPApiDecoder.base64urljson(asset_id, model.SpecificAssetId, False), asset_ids))
-            # Filter AAS based on these SpecificAssetIds
-            aas = filter(lambda shell: all(specific_asset_id in shell.asset_information.specific_asset_id
-                                           for specific_asset_id in specific_asset_ids), aas)
-
-        paginated_aas, end_index = self._get_slice(request, aas)
-        return paginated_aas, end_index
+        # Decode and instantiate SpecificAssetIds
+        specific_asset_ids: List[model.SpecificAssetId] = [
+            HTTPApiDecoder.base64urljson(asset_id, model.SpecificAssetId, False)
+            for asset_id in request.args.getlist("assetIds")]
+        aas: Iterator[model.AssetAdministrationShell] = self._get_all_obj_of_type(
+            model.AssetAdministrationShell, id_short=id_short, specific_asset_ids=specific_asset_ids,
+            after=self._get_cursor(request))
+        return self._get_slice(request, aas, lambda shell: shell.id)
 
     def _get_shell(self, url_args: Dict) -> model.AssetAdministrationShell:
         return self._get_obj_ts(url_args["aas_id"], model.AssetAdministrationShell)
 
-    def _get_submodels(self, request: Request) -> Tuple[Iterator[model.Submodel], int]:
-        submodels: Iterator[model.Submodel] = self._get_all_obj_of_type(model.Submodel)
+    def _get_submodels(self, request: Request) -> Tuple[Iterator[model.Submodel], PagingMetadata]:
         id_short = request.args.get("idShort")
-        if id_short is not None:
-            submodels = filter(lambda sm: sm.id_short == id_short, submodels)
         semantic_id = request.args.get("semanticId")
+        spec_semantic_id: Optional[model.Reference] = None
         if semantic_id is not None:
             spec_semantic_id = HTTPApiDecoder.base64urljson(
                 semantic_id, model.Reference, False)  # type: ignore[type-abstract]
-            submodels = filter(lambda sm: sm.semantic_id == spec_semantic_id, submodels)
-        paginated_submodels, end_index = self._get_slice(request, submodels)
-        return paginated_submodels, end_index
+        submodels: Iterator[model.Submodel] = self._get_all_obj_of_type(
+            model.Submodel, id_short=id_short, semantic_id=spec_semantic_id, after=self._get_cursor(request))
+        return self._get_slice(request, submodels, lambda sm: sm.id)
 
     def _get_submodel(self, url_args: Dict) -> model.Submodel:
         return self._get_obj_ts(url_args["submodel_id"], model.Submodel)
 
     def _get_submodel_submodel_elements(self, request: Request, url_args: Dict) -> \
-            Tuple[Iterator[model.SubmodelElement], int]:
+            Tuple[Iterator[model.SubmodelElement], PagingMetadata]:
         submodel = self._get_submodel(url_args)
-        paginated_submodel_elements: Iterator[model.SubmodelElement]
-        paginated_submodel_elements, end_index = self._get_slice(request, submodel.submodel_element)
-        return paginated_submodel_elements, end_index
+        submodel_elements = self._iter_submodel_elements_after(submodel.submodel_element, self._get_cursor(request))
+        return self._get_slice(request, submodel_elements, self._get_id_short_key)
+
+    @staticmethod
+    def _get_id_short_key(referable: model.Referable) -> str:
+        # id_shorts of submodel elements in a Submodel are never None
+        return referable.id_short  # type: ignore[return-value]
 
     def _get_submodel_submodel_elements_id_short_path(self, url_args: Dict) -> model.SubmodelElement:
         submodel = self._get_submodel(url_args)
@@ -722,21 +1090,41 @@ class WSGIApp:
 
         try:
             endpoint, values = map_adapter.match()
-            return endpoint(request, values, response_t=response_t, map_adapter=map_adapter)
+            identifiable = self._get_conditional_identifiable(endpoint, values)
+            if identifiable is None:
+                return self._handle_request(request, endpoint, values, response_t, map_adapter, None)
+            # The Identifiable of the requested resource is updated only once per request
+            self._update(identifiable)
+            token = _updated_identifiable.set(identifiable)
+            try:
+                return self._handle_request(request, endpoint, values, response_t, map_adapter, identifiable)
+            finally:
+                _updated_identifiable.reset(token)
 
         # any raised error that leaves this function will cause a 500 internal server error
         # so catch raised http exceptions and return them
         except werkzeug.exceptions.HTTPException as e:
             return http_exception_to_response(e, response_t)
 
+    def _handle_request(self, request: Request, endpoint: Callable, values: Mapping[str, Any],
+                        response_t: Type[APIResponse], map_adapter: MapAdapter,
+                        identifiable: Optional[model.Identifiable]) -> Response:
+        not_modified_response = self._evaluate_preconditions(request, identifiable)
+        if not_modified_response is not None:
+            return not_modified_response
+        response = endpoint(request, values, response_t=response_t, map_adapter=map_adapter)
+        if request.method in ("GET", "HEAD") and response.status_code == 200 and identifiable is not None:
+            response.set_etag(self._get_etag(identifiable))
+        return response
+
     # ------ all not implemented ROUTES -------
     def not_implemented(self, request: Request, url_args: Dict, **_kwargs) -> Response:
         raise werkzeug.exceptions.NotImplemented("This route is not implemented!")
 
     # ------ AAS REPO ROUTES -------
     def get_aas_all(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
-        aashells, cursor = self._get_shells(request)
-        return response_t(list(aashells), cursor=cursor)
+        aashells, paging_metadata = self._get_shells(request)
+        return response_t(aashells, paging_metadata=paging_metadata, stream=True)
 
     def post_aas(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                  map_adapter: MapAdapter) -> Response:
@@ -745,7 +1133,7 @@ class WSGIApp:
             self.object_store.add(aas)
         except KeyError as e:
             raise Conflict(f"AssetAdministrationShell with Identifier {aas.id} already exists!") from e
-        aas.commit()
+        self._commit(aas)
         created_resource_url = map_adapter.build(self.get_aas, {
             "aas_id": aas.id
         }, force_external=True)
@@ -753,15 +1141,15 @@ class WSGIApp:
 
     def get_aas_all_reference(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                               **_kwargs) -> Response:
-        aashells, cursor = self._get_shells(request)
-        references: list[model.ModelReference] = [model.ModelReference.from_referable(aas)
-                                                  for aas in aashells]
-        return response_t(references, cursor=cursor)
+        aashells, paging_metadata = self._get_shells(request)
+        references: Iterator[model.ModelReference] = (model.ModelReference.from_referable(aas)
+                                                      for aas in aashells)
+        return response_t(references, paging_metadata=paging_metadata, stream=True)
 
     # --------- AAS ROUTES ---------
     def get_aas(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
         aas = self._get_shell(url_args)
-        return response_t(aas)
+        return self._cached_response(response_t, self.get_aas, aas, [], aas, False)
 
     def get_aas_reference(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
         aas = self._get_shell(url_args)
@@ -772,12 +1160,12 @@ class WSGIApp:
         aas = self._get_shell(url_args)
         aas.update_from(HTTPApiDecoder.request_body(request, model.AssetAdministrationShell,
                                                     is_stripped_request(request)))
-        aas.commit()
+        self._commit(aas)
         return response_t()
 
     def delete_aas(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
         aas = self._get_shell(url_args)
-        self.object_store.remove(aas)
+        self._remove(aas)
         return response_t()
 
     def get_aas_asset_information(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
@@ -789,15 +1177,20 @@ class WSGIApp:
                                   **_kwargs) -> Response:
         aas = self._get_shell(url_args)
         aas.asset_information = HTTPApiDecoder.request_body(request, model.AssetInformation, False)
-        aas.commit()
+        self._commit(aas)
         return response_t()
 
     def get_aas_submodel_refs(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                               **_kwargs) -> Response:
         aas = self._get_shell(url_args)
-        submodel_refs: Iterator[model.ModelReference[model.Submodel]]
-        submodel_refs, cursor = self._get_slice(request, aas.submodel)
-        return response_t(list(submodel_refs), cursor=cursor)
+        cursor = self._get_cursor(request)
+        # aas.submodel is a set, so we sort the references by their identifier to get a stable order
+        sorted_submodel_refs: Iterator[model.ModelReference[model.Submodel]] = (
+            ref for ref in sorted(aas.submodel, key=lambda ref: ref.get_identifier())
+            if cursor is None or ref.get_identifier() > cursor)
+        submodel_refs, paging_metadata = self._get_slice(request, sorted_submodel_refs,
+                                                         lambda ref: ref.get_identifier())
+        return response_t(submodel_refs, paging_metadata=paging_metadata, stream=True)
 
     def post_aas_submodel_refs(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                **_kwargs) -> Response:
@@ -806,14 +1199,14 @@ class WSGIApp:
         if sm_ref in aas.submodel:
             raise Conflict(f"{sm_ref!r} already exists!")
         aas.submodel.add(sm_ref)
-        aas.commit()
+        self._commit(aas)
         return response_t(sm_ref, status=201)
 
     def delete_aas_submodel_refs_specific(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                           **_kwargs) -> Response:
         aas = self._get_shell(url_args)
         aas.submodel.remove(self._get_submodel_reference(aas, url_args["submodel_id"]))
-        aas.commit()
+        self._commit(aas)
         return response_t()
 
     def put_aas_submodel_refs_submodel(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
@@ -826,11 +1219,11 @@ class WSGIApp:
         id_changed: bool = submodel.id != new_submodel.id
         # TODO: https://github.com/eclipse-basyx/basyx-python-sdk/issues/216
         submodel.update_from(new_submodel)
-        submodel.commit()
+        self._commit(submodel)
         if id_changed:
             aas.submodel.remove(sm_ref)
             aas.submodel.add(model.ModelReference.from_referable(submodel))
-            aas.commit()
+            self._commit(aas)
         return response_t()
 
     def delete_aas_submodel_refs_submodel(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
@@ -838,9 +1231,9 @@ class WSGIApp:
         aas = self._get_shell(url_args)
         sm_ref = self._get_submodel_reference(aas, url_args["submodel_id"])
         submodel = self._resolve_reference(sm_ref)
-        self.object_store.remove(submodel)
+        self._remove(submodel)
         aas.submodel.remove(sm_ref)
-        aas.commit()
+        self._commit(aas)
         return response_t()
 
     def aas_submodel_refs_redirect(self, request: Request, url_args: Dict, map_adapter: MapAdapter,
@@ -859,8 +1252,9 @@ class WSGIApp:
 
     # ------ SUBMODEL REPO ROUTES -------
     def get_submodel_all(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
-        submodels, cursor = self._get_submodels(request)
-        return response_t(list(submodels), cursor=cursor, stripped=is_stripped_request(request))
+        submodels, paging_metadata = self._get_submodels(request)
+        return response_t(submodels, paging_metadata=paging_metadata, stripped=is_stripped_request(request),
+                          stream=True)
 
     def post_submodel(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                       map_adapter: MapAdapter) -> Response:
@@ -869,7 +1263,7 @@ class WSGIApp:
             self.object_store.add(submodel)
         except KeyError as e:
             raise Conflict(f"Submodel with Identifier {submodel.id} already exists!") from e
-        submodel.commit()
+        self._commit(submodel)
         created_resource_url = map_adapter.build(self.get_submodel, {
             "submodel_id": submodel.id
         }, force_external=True)
@@ -877,30 +1271,32 @@ class WSGIApp:
 
     def get_submodel_all_metadata(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                   **_kwargs) -> Response:
-        submodels, cursor = self._get_submodels(request)
-        return response_t(list(submodels), cursor=cursor, stripped=True)
+        submodels, paging_metadata = self._get_submodels(request)
+        return response_t(submodels, paging_metadata=paging_metadata, stripped=True, stream=True)
 
     def get_submodel_all_reference(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                    **_kwargs) -> Response:
-        submodels, cursor = self._get_submodels(request)
-        references: list[model.ModelReference] = [model.ModelReference.from_referable(submodel)
-                                                  for submodel in submodels]
-        return response_t(references, cursor=cursor, stripped=is_stripped_request(request))
+        submodels, paging_metadata = self._get_submodels(request)
+        references: Iterator[model.ModelReference] = (model.ModelReference.from_referable(submodel)
+                                                      for submodel in submodels)
+        return response_t(references, paging_metadata=paging_metadata, stripped=is_stripped_request(request),
+                          stream=True)
 
     # --------- SUBMODEL ROUTES ---------
 
     def delete_submodel(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
-        self.object_store.remove(self._get_obj_ts(url_args["submodel_id"], model.Submodel))
+        self._remove(self._get_obj_ts(url_args["submodel_id"], model.Submodel))
         return response_t()
 
     def get_submodel(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
         submodel = self._get_submodel(url_args)
-        return response_t(submodel, stripped=is_stripped_request(request))
+        return self._cached_response(response_t, self.get_submodel, submodel, [], submodel,
+                                     is_stripped_request(request))
 
     def get_submodels_metadata(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                **_kwargs) -> Response:
         submodel = self._get_submodel(url_args)
-        return response_t(submodel, stripped=True)
+        return self._cached_response(response_t, self.get_submodels_metadata, submodel, [], submodel, True)
 
     def get_submodels_reference(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                 **_kwargs) -> Response:
@@ -911,36 +1307,42 @@ class WSGIApp:
     def put_submodel(self, request: Request, url_args: Dict, response_t: Type[APIResponse], **_kwargs) -> Response:
         submodel = self._get_submodel(url_args)
         submodel.update_from(HTTPApiDecoder.request_body(request, model.Submodel, is_stripped_request(request)))
-        submodel.commit()
+        self._commit(submodel)
         return response_t()
 
     def get_submodel_submodel_elements(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                        **_kwargs) -> Response:
-        submodel_elements, cursor = self._get_submodel_submodel_elements(request, url_args)
-        return response_t(list(submodel_elements), cursor=cursor, stripped=is_stripped_request(request))
+        submodel_elements, paging_metadata = self._get_submodel_submodel_elements(request, url_args)
+        return response_t(submodel_elements, paging_metadata=paging_metadata, stripped=is_stripped_request(request),
+                          stream=True)
 
     def get_submodel_submodel_elements_metadata(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                                 **_kwargs) -> Response:
-        submodel_elements, cursor = self._get_submodel_submodel_elements(request, url_args)
-        return response_t(list(submodel_elements), cursor=cursor, stripped=True)
+        submodel_elements, paging_metadata = self._get_submodel_submodel_elements(request, url_args)
+        return response_t(submodel_elements, paging_metadata=paging_metadata, stripped=True, stream=True)
 
     def get_submodel_submodel_elements_reference(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                                  **_kwargs) -> Response:
-        submodel_elements, cursor = self._get_submodel_submodel_elements(request, url_args)
-        references: list[model.ModelReference] = [model.ModelReference.from_referable(element) for element in
-                                                  list(submodel_elements)]
-        return response_t(references, cursor=cursor, stripped=is_stripped_request(request))
+        submodel_elements, paging_metadata = self._get_submodel_submodel_elements(request, url_args)
+        references: Iterator[model.ModelReference] = (model.ModelReference.from_referable(element)
+                                                      for element in submodel_elements)
+        return response_t(references, paging_metadata=paging_metadata, stripped=is_stripped_request(request),
+                          stream=True)
 
     def get_submodel_submodel_elements_id_short_path(self, request: Request, url_args: Dict,
                                                      response_t: Type[APIResponse],
                                                      **_kwargs) -> Response:
-        submodel_element = self._get_submodel_submodel_elements_id_short_path(url_args)
-        return response_t(submodel_element, stripped=is_stripped_request(request))
+        submodel = self._get_submodel(url_args)
+        submodel_element = self._get_nested_submodel_element(submodel, url_args["id_shorts"])
+        return self._cached_response(response_t, self.get_submodel_submodel_elements_id_short_path, submodel,
+                                     url_args["id_shorts"], submodel_element, is_stripped_request(request))
 
     def get_submodel_submodel_elements_id_short_path_metadata(self, request: Request, url_args: Dict,
                                                               response_t: Type[APIResponse], **_kwargs) -> Response:
-        submodel_element = self._get_submodel_submodel_elements_id_short_path(url_args)
-        return response_t(submodel_element, stripped=True)
+        submodel = self._get_submodel(url_args)
+        submodel_element = self._get_nested_submodel_element(submodel, url_args["id_shorts"])
+        return self._cached_response(response_t, self.get_submodel_submodel_elements_id_short_path_metadata,
+                                     submodel, url_args["id_shorts"], submodel_element, True)
 
     def get_submodel_submodel_elements_id_short_path_reference(self, request: Request, url_args: Dict,
                                                                response_t: Type[APIResponse], **_kwargs) -> Response:
@@ -966,6 +1368,7 @@ class WSGIApp:
                 raise
             raise Conflict(f"SubmodelElement with idShort {new_submodel_element.id_short} already exists "
                            f"within {parent}!")
+        self._commit(parent)
         submodel = self._get_submodel(url_args)
         id_short_path = url_args.get("id_shorts", [])
         created_resource_url = map_adapter.build(self.get_submodel_submodel_elements_id_short_path, {
@@ -984,7 +1387,7 @@ class WSGIApp:
                                                            model.SubmodelElement,  # type: ignore[type-abstract]
                                                            is_stripped_request(request))
         submodel_element.update_from(new_submodel_element)
-        submodel_element.commit()
+        self._commit(submodel_element)
         return response_t()
 
     def delete_submodel_submodel_elements_id_short_path(self, request: Request, url_args: Dict,
@@ -993,6 +1396,8 @@ class WSGIApp:
         sm_or_se = self._get_submodel_or_nested_submodel_element(url_args)
         parent: model.UniqueIdShortNamespace = self._expect_namespace(sm_or_se.parent, sm_or_se.id_short)
         self._namespace_submodel_element_op(parent, parent.remove_referable, sm_or_se.id_short)
+        assert isinstance(parent, model.Referable)
+        self._commit(parent)
         return response_t()
 
     def get_submodel_submodel_element_attachment(self, request: Request, url_args: Dict, **_kwargs) -> Response:
@@ -1043,7 +1448,7 @@ class WSGIApp:
                 f"while {submodel_element!r} has content_type {submodel_element.content_type!r}!")
 
         submodel_element.value = self.file_store.add_file(filename, file_storage.stream, submodel_element.content_type)
-        submodel_element.commit()
+        self._commit(submodel_element)
         return response_t()
 
     def delete_submodel_submodel_element_attachment(self, request: Request, url_args: Dict,
@@ -1066,7 +1471,7 @@ class WSGIApp:
                 pass
             submodel_element.value = None
 
-        submodel_element.commit()
+        self._commit(submodel_element)
         return response_t()
 
     def get_submodel_submodel_element_qualifiers(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
@@ -1084,7 +1489,7 @@ class WSGIApp:
         if sm_or_se.qualifier.contains_id("type", qualifier.type):
             raise Conflict(f"Qualifier with type {qualifier.type} already exists!")
         sm_or_se.qualifier.add(qualifier)
-        sm_or_se.commit()
+        self._commit(sm_or_se)
         created_resource_url = map_adapter.build(self.get_submodel_submodel_element_qualifiers, {
             "submodel_id": url_args["submodel_id"],
             "id_shorts": url_args.get("id_shorts") or None,
@@ -1103,7 +1508,7 @@ class WSGIApp:
             raise Conflict(f"A qualifier of type {new_qualifier.type!r} already exists for {sm_or_se!r}")
         sm_or_se.remove_qualifier_by_type(qualifier.type)
         sm_or_se.qualifier.add(new_qualifier)
-        sm_or_se.commit()
+        self._commit(sm_or_se)
         if qualifier_type_changed:
             created_resource_url = map_adapter.build(self.get_submodel_submodel_element_qualifiers, {
                 "submodel_id": url_args["submodel_id"],
@@ -1119,15 +1524,17 @@ class WSGIApp:
         sm_or_se = self._get_submodel_or_nested_submodel_element(url_args)
         qualifier_type = url_args["qualifier_type"]
         self._qualifiable_qualifier_op(sm_or_se, sm_or_se.remove_qualifier_by_type, qualifier_type)
-        sm_or_se.commit()
+        self._commit(sm_or_se)
         return response_t()
 
     # --------- CONCEPT DESCRIPTION ROUTES ---------
     def get_concept_description_all(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                     **_kwargs) -> Response:
-        concept_descriptions: Iterator[model.ConceptDescription] = self._get_all_obj_of_type(model.ConceptDescription)
-        concept_descriptions, cursor = self._get_slice(request, concept_descriptions)
-        return response_t(list(concept_descriptions), cursor=cursor, stripped=is_stripped_request(request))
+        concept_descriptions: Iterator[model.ConceptDescription] = self._get_all_obj_of_type(
+            model.ConceptDescription, after=self._get_cursor(request))
+        concept_description_page, paging_metadata = self._get_slice(request, concept_descriptions, lambda cd: cd.id)
+        return response_t(concept_description_page, paging_metadata=paging_metadata,
+                          stripped=is_stripped_request(request), stream=True)
 
     def post_concept_description(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                  map_adapter: MapAdapter) -> Response:
@@ -1137,7 +1544,7 @@ class WSGIApp:
             self.object_store.add(concept_description)
         except KeyError as e:
             raise Conflict(f"ConceptDescription with Identifier {concept_description.id} already exists!") from e
-        concept_description.commit()
+        self._commit(concept_description)
         created_resource_url = map_adapter.build(self.get_concept_description, {
             "concept_id": concept_description.id
         }, force_external=True)
@@ -1146,19 +1553,20 @@ class WSGIApp:
     def get_concept_description(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                 **_kwargs) -> Response:
         concept_description = self._get_concept_description(url_args)
-        return response_t(concept_description, stripped=is_stripped_request(request))
+        return self._cached_response(response_t, self.get_concept_description, concept_description, [],
+                                     concept_description, is_stripped_request(request))
 
     def put_concept_description(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                 **_kwargs) -> Response:
         concept_description = self._get_concept_description(url_args)
         concept_description.update_from(HTTPApiDecoder.request_body(request, model.ConceptDescription,
                                                                     is_stripped_request(request)))
-        concept_description.commit()
+        self._commit(concept_description)
         return response_t()
 
     def delete_concept_description(self, request: Request, url_args: Dict, response_t: Type[APIResponse],
                                    **_kwargs) -> Response:
-        self.object_store.remove(self._get_concept_description(url_args))
+        self._remove(self._get_concept_description(url_args))
         return response_t()
 
 
@@ -19,4 +19,4 @@ AAS objects within a JSON file and return them as BaSyx Python SDK
 
 from .json_serialization import AASToJsonEncoder, StrippedAASToJsonEncoder, write_aas_json_file, object_store_to_json
 from .json_deserialization import AASFromJsonDecoder, StrictAASFromJsonDecoder, StrippedAASFromJsonDecoder, \
-    StrictStrippedAASFromJsonDecoder, read_aas_json_file, read_aas_json_file_into
+    StrictStrippedAASFromJsonDecoder, read_aas_json_file, read_aas_json_file_into, iter_aas_json_file
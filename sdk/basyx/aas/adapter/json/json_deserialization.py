@@ -21,25 +21,30 @@ Additionally, there's the :meth:`~basyx.aas.adapter.json.json_deserialization.re
 takes a complete AAS JSON file, reads its contents and stores the objects in the provided
 :class:`~basyx.aas.model.provider.AbstractObjectStore`. :meth:`read_aas_json_file` is a wrapper for this function.
 Instead of storing the objects in a given :class:`~basyx.aas.model.provider.AbstractObjectStore`,
-it returns a :class:`~basyx.aas.model.provider.DictObjectStore` containing parsed objects.
+it returns a :class:`~basyx.aas.model.provider.DictObjectStore` containing parsed objects. Both are based on
+:meth:`~basyx.aas.adapter.json.json_deserialization.iter_aas_json_file`, which reads the file incrementally and yields
+the objects one at a time.
 
 The deserialization is performed in a bottom-up approach: The ``object_hook()`` method gets called for every parsed JSON
-object (as dict) and checks for existence of the ``modelType`` attribute. If it is present, the ``AAS_CLASS_PARSERS``
+object (as dict) and checks for existence of the ``modelType`` attribute. If it is present, the ``_CLASS_PARSERS``
 dict defines, which of the constructor methods of the class is to be used for converting the dict into an object.
 Embedded objects that should have a ``modelType`` themselves are expected to be converted already.
 Other embedded objects are converted using a number of helper constructor methods.
 """
 import base64
+import codecs
 import contextlib
 import json
 import logging
 import pprint
-from typing import Dict, Callable, ContextManager, TypeVar, Type, List, IO, Optional, Set, get_args
+import re
+from typing import Dict, Callable, ContextManager, TypeVar, Type, List, IO, Iterator, Optional, Set, Tuple, cast, \
+    get_args
 
 from basyx.aas import model
 from .._generic import MODELLING_KIND_INVERSE, ASSET_KIND_INVERSE, KEY_TYPES_INVERSE, ENTITY_TYPES_INVERSE, \
     IEC61360_DATA_TYPES_INVERSE, IEC61360_LEVEL_TYPES_INVERSE, KEY_TYPES_CLASSES_INVERSE, REFERENCE_TYPES_INVERSE, \
-    DIRECTION_INVERSE, STATE_OF_EVENT_INVERSE, QUALIFIER_KIND_INVERSE, PathOrIO, Path
+    DIRECTION_INVERSE, STATE_OF_EVENT_INVERSE, QUALIFIER_KIND_INVERSE, PathOrIO, Path, gc_paused, abstract_classes
 
 logger = logging.getLogger(__name__)
 
@@ -85,8 +90,9 @@ def _expect_type(object_: object, type_: Type, context: str, failsafe: bool) ->
 
     :param object_: The object to be type-checked
     :param type_: The expected type
-    :param context: A string to add to the exception message / log message, that describes the context in that the
-                    object has been found
+    :param context: An object (typically the parent object) whose string representation is added to the exception
+                    message / log message, to describe the context in that the object has been found. It is only
+                    converted to a string if the type check fails.
     :param failsafe: Log error and return false instead of raising a TypeError
     :return: True if the object is of the expected type
     :raises TypeError: If the object is not of the expected type and the failsafe mode is not active
@@ -94,12 +100,26 @@ def _expect_type(object_: object, type_: Type, context: str, failsafe: bool) ->
     if isinstance(object_, type_):
         return True
     if failsafe:
-        logger.error("Expected a %s in %s, but found %s", type_.__name__, context, repr(object_))
+        logger.error("Expected a %s in %s, but found %r", type_.__name__, context, object_)
     else:
-        raise TypeError("Expected a %s in %s, but found %s" % (type_.__name__, context, repr(object_)))
+        raise TypeError("Expected a %s in %s, but found %r" % (type_.__name__, context, object_))
     return False
 
 
+class _PrettyPrint:
+    """
+    Wrapper for a JSON object to be pretty-printed in a log message
+
+    The (potentially expensive) formatting is deferred until the message is actually emitted by the logging framework,
+    so it is skipped entirely if the message is filtered.
+    """
+    def __init__(self, obj: object):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return pprint.pformat(self.obj, depth=2, width=2 ** 14, compact=True)
+
+
 class AASFromJsonDecoder(json.JSONDecoder):
     """
     Custom JSONDecoder class to use the :mod:`json` module for deserializing Asset Administration Shell data from the
@@ -150,6 +170,42 @@ class AASFromJsonDecoder(json.JSONDecoder):
     failsafe = True
     stripped = False
 
+    # The following dict specifies a constructor method for all AAS classes that may be identified using the
+    # ``modelType`` attribute in their JSON representation. Each of those constructor functions takes the JSON
+    # representation of an object and tries to construct a Python object from it. Embedded objects that have a
+    # modelType themselves are expected to be converted to the correct PythonType already. The methods are given by
+    # name, so overridden constructor methods of subclasses are used.
+    _CLASS_PARSERS: Dict[str, str] = {
+        'AssetAdministrationShell': '_construct_asset_administration_shell',
+        'AssetInformation': '_construct_asset_information',
+        'SpecificAssetId': '_construct_specific_asset_id',
+        'ConceptDescription': '_construct_concept_description',
+        'Extension': '_construct_extension',
+        'Submodel': '_construct_submodel',
+        'Capability': '_construct_capability',
+        'Entity': '_construct_entity',
+        'BasicEventElement': '_construct_basic_event_element',
+        'Operation': '_construct_operation',
+        'RelationshipElement': '_construct_relationship_element',
+        'AnnotatedRelationshipElement': '_construct_annotated_relationship_element',
+        'SubmodelElementCollection': '_construct_submodel_element_collection',
+        'SubmodelElementList': '_construct_submodel_element_list',
+        'Blob': '_construct_blob',
+        'File': '_construct_file',
+        'MultiLanguageProperty': '_construct_multi_language_property',
+        'Property': '_construct_property',
+        'Range': '_construct_range',
+        'ReferenceElement': '_construct_reference_element',
+        'DataSpecificationIec61360': '_construct_data_specification_iec61360',
+    }
+    # The constructor methods of ``_CLASS_PARSERS``, resolved for this class. Each subclass gets its own cache, which is
+    # filled on first use of a ``modelType``.
+    _parser_cache: Dict[str, Callable[[Dict[str, object]], object]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._parser_cache = {}
+
     def __init__(self, *args, **kwargs):
         json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
 
@@ -160,64 +216,40 @@ class AASFromJsonDecoder(json.JSONDecoder):
         if 'modelType' not in dct:
             return dct
 
-        # The following dict specifies a constructor method for all AAS classes that may be identified using the
-        # ``modelType`` attribute in their JSON representation. Each of those constructor functions takes the JSON
-        # representation of an object and tries to construct a Python object from it. Embedded objects that have a
-        # modelType themselves are expected to be converted to the correct PythonType already. Additionally, each
-        # function takes a bool parameter ``failsafe``, which indicates weather to log errors and skip defective objects
-        # instead of raising an Exception.
-        AAS_CLASS_PARSERS: Dict[str, Callable[[Dict[str, object]], object]] = {
-            'AssetAdministrationShell': cls._construct_asset_administration_shell,
-            'AssetInformation': cls._construct_asset_information,
-            'SpecificAssetId': cls._construct_specific_asset_id,
-            'ConceptDescription': cls._construct_concept_description,
-            'Extension': cls._construct_extension,
-            'Submodel': cls._construct_submodel,
-            'Capability': cls._construct_capability,
-            'Entity': cls._construct_entity,
-            'BasicEventElement': cls._construct_basic_event_element,
-            'Operation': cls._construct_operation,
-            'RelationshipElement': cls._construct_relationship_element,
-            'AnnotatedRelationshipElement': cls._construct_annotated_relationship_element,
-            'SubmodelElementCollection': cls._construct_submodel_element_collection,
-            'SubmodelElementList': cls._construct_submodel_element_list,
-            'Blob': cls._construct_blob,
-            'File': cls._construct_file,
-            'MultiLanguageProperty': cls._construct_multi_language_property,
-            'Property': cls._construct_property,
-            'Range': cls._construct_range,
-            'ReferenceElement': cls._construct_reference_element,
-            'DataSpecificationIec61360': cls._construct_data_specification_iec61360,
-        }
-
         # Get modelType and constructor function
-        if not isinstance(dct['modelType'], str):
-            logger.warning("JSON object has unexpected format of modelType: %s", dct['modelType'])
+        model_type = dct['modelType']
+        if not isinstance(model_type, str):
+            logger.warning("JSON object has unexpected format of modelType: %s", model_type)
             # Even in strict mode, we consider 'modelType' attributes of wrong type as non-AAS objects instead of
             #   raising an exception. However, the object's type will probably checked later by read_json_aas_file() or
             #   _expect_type()
             return dct
-        model_type = dct['modelType']
-        if model_type not in AAS_CLASS_PARSERS:
-            if not cls.failsafe:
-                raise TypeError("Found JSON object with modelType=\"%s\", which is not a known AAS class" % model_type)
-            logger.error("Found JSON object with modelType=\"%s\", which is not a known AAS class", model_type)
-            return dct
+        try:
+            parser = cls._parser_cache[model_type]
+        except KeyError:
+            if model_type not in cls._CLASS_PARSERS:
+                if not cls.failsafe:
+                    raise TypeError("Found JSON object with modelType=\"%s\", which is not a known AAS class"
+                                    % model_type)
+                logger.error("Found JSON object with modelType=\"%s\", which is not a known AAS class", model_type)
+                return dct
+            parser = cls._parser_cache[model_type] = getattr(cls, cls._CLASS_PARSERS[model_type])
 
-        # Use constructor function to transform JSON representation into BaSyx Python SDK model object
+        # Use constructor function to transform JSON representation into BaSyx Python SDK model object. Each
+        # constructor function indicates errors by raising an exception, which is logged in failsafe mode.
         try:
-            return AAS_CLASS_PARSERS[model_type](dct)
+            return parser(dct)
         except (KeyError, TypeError, model.AASConstraintViolation) as e:
-            error_message = "Error while trying to convert JSON object into {}: {} >>> {}".format(
-                model_type, e, pprint.pformat(dct, depth=2, width=2**14, compact=True))
             if cls.failsafe:
-                logger.error(error_message, exc_info=e)
+                logger.error("Error while trying to convert JSON object into %s: %s >>> %s", model_type, e,
+                             _PrettyPrint(dct), exc_info=e)
                 # In failsafe mode, we return the raw JSON object dict, if there were errors while parsing an object, so
                 #   a client application is able to handle this data. The read_json_aas_file() function and all
                 #   constructors for complex objects will skip those items by using _expect_type().
                 return dct
-            else:
-                raise (type(e) if isinstance(e, (KeyError, TypeError)) else TypeError)(error_message) from e
+            error_message = "Error while trying to convert JSON object into {}: {} >>> {}".format(
+                model_type, e, _PrettyPrint(dct))
+            raise (type(e) if isinstance(e, (KeyError, TypeError)) else TypeError)(error_message) from e
 
     # ##################################################################################################
     # Utility Methods used in constructor methods to add general attributes (from abstract base classes)
@@ -232,37 +264,46 @@ class AASFromJsonDecoder(json.JSONDecoder):
         :param obj: The object to amend its attributes
         :param dct: The object's dict representation from JSON
         """
-        if isinstance(obj, model.Referable):
+        # The abstract classes of each type are only determined once, as this method is called for most objects
+        classes = abstract_classes(type(obj))
+        if classes.referable:
+            referable = cast(model.Referable, obj)
             if 'idShort' in dct:
-                obj.id_short = _get_ts(dct, 'idShort', str)
+                referable.id_short = _get_ts(dct, 'idShort', str)
             if 'category' in dct:
-                obj.category = _get_ts(dct, 'category', str)
+                referable.category = _get_ts(dct, 'category', str)
             if 'displayName' in dct:
-                obj.display_name = cls._construct_lang_string_set(_get_ts(dct, 'displayName', list),
-                                                                  model.MultiLanguageNameType)
+                referable.display_name = cls._construct_lang_string_set(_get_ts(dct, 'displayName', list),
+                                                                        model.MultiLanguageNameType)
             if 'description' in dct:
-                obj.description = cls._construct_lang_string_set(_get_ts(dct, 'description', list),
-                                                                 model.MultiLanguageTextType)
-        if isinstance(obj, model.Identifiable):
+                referable.description = cls._construct_lang_string_set(_get_ts(dct, 'description', list),
+                                                                       model.MultiLanguageTextType)
+        if classes.identifiable:
             if 'administration' in dct:
-                obj.administration = cls._construct_administrative_information(_get_ts(dct, 'administration', dict))
-        if isinstance(obj, model.HasSemantics):
+                cast(model.Identifiable, obj).administration = cls._construct_administrative_information(
+                    _get_ts(dct, 'administration', dict))
+        if classes.has_semantics:
+            has_semantics = cast(model.HasSemantics, obj)
             if 'semanticId' in dct:
-                obj.semantic_id = cls._construct_reference(_get_ts(dct, 'semanticId', dict))
+                has_semantics.semantic_id = cls._construct_reference(_get_ts(dct, 'semanticId', dict))
             if 'supplementalSemanticIds' in dct:
                 for ref in _get_ts(dct, 'supplementalSemanticIds', list):
-                    obj.supplemental_semantic_id.append(cls._construct_reference(ref))
+                    has_semantics.supplemental_semantic_id.append(cls._construct_reference(ref))
         # `HasKind` provides only mandatory, immutable attributes; so we cannot do anything here, after object creation.
         # However, the `cls._get_kind()` function may assist by retrieving them from the JSON object
-        if isinstance(obj, model.Qualifiable) and not cls.stripped:
+        if cls.stripped:
+            return
+        if classes.qualifiable:
             if 'qualifiers' in dct:
+                qualifiable = cast(model.Qualifiable, obj)
                 for constraint_dct in _get_ts(dct, 'qualifiers', list):
                     constraint = cls._construct_qualifier(constraint_dct)
-                    obj.qualifier.add(constraint)
-        if isinstance(obj, model.HasDataSpecification) and not cls.stripped:
+                    qualifiable.qualifier.add(constraint)
+        if classes.has_data_specification:
             if 'embeddedDataSpecifications' in dct:
+                has_data_specification = cast(model.HasDataSpecification, obj)
                 for dspec in _get_ts(dct, 'embeddedDataSpecifications', list):
-                    obj.embedded_data_specifications.append(
+                    has_data_specification.embedded_data_specifications.append(
                         # TODO: remove the following type: ignore comment when mypy supports abstract types for Type[T]
                         # see https://github.com/python/mypy/issues/5374
                         model.EmbeddedDataSpecification(
@@ -271,10 +312,11 @@ class AASFromJsonDecoder(json.JSONDecoder):
                                                                model.DataSpecificationContent)  # type: ignore
                         )
                     )
-        if isinstance(obj, model.HasExtension) and not cls.stripped:
+        if classes.has_extension:
             if 'extensions' in dct:
+                has_extension = cast(model.HasExtension, obj)
                 for extension in _get_ts(dct, 'extensions', list):
-                    obj.extension.add(cls._construct_extension(extension))
+                    has_extension.extension.add(cls._construct_extension(extension))
 
     @classmethod
     def _get_kind(cls, dct: Dict[str, object]) -> model.ModellingKind:
@@ -381,12 +423,12 @@ class AASFromJsonDecoder(json.JSONDecoder):
             try:
                 ret[_get_ts(desc, 'language', str)] = _get_ts(desc, 'text', str)
             except (KeyError, TypeError) as e:
-                error_message = "Error while trying to convert JSON object into {}: {} >>> {}".format(
-                    object_class.__name__, e, pprint.pformat(desc, depth=2, width=2 ** 14, compact=True))
                 if cls.failsafe:
-                    logger.error(error_message, exc_info=e)
+                    logger.error("Error while trying to convert JSON object into %s: %s >>> %s",
+                                 object_class.__name__, e, _PrettyPrint(desc), exc_info=e)
                 else:
-                    raise type(e)(error_message) from e
+                    raise type(e)("Error while trying to convert JSON object into {}: {} >>> {}".format(
+                        object_class.__name__, e, _PrettyPrint(desc))) from e
         return object_class(ret)
 
     @classmethod
@@ -396,12 +438,12 @@ class AASFromJsonDecoder(json.JSONDecoder):
             try:
                 ret.add(cls._construct_value_reference_pair(element))
             except (KeyError, TypeError) as e:
-                error_message = "Error while trying to convert JSON object into ValueReferencePair: {} >>> {}".format(
-                    e, pprint.pformat(element, depth=2, width=2 ** 14, compact=True))
                 if cls.failsafe:
-                    logger.error(error_message, exc_info=e)
+                    logger.error("Error while trying to convert JSON object into ValueReferencePair: %s >>> %s",
+                                 e, _PrettyPrint(element), exc_info=e)
                 else:
-                    raise type(e)(error_message) from e
+                    raise type(e)("Error while trying to convert JSON object into ValueReferencePair: {} >>> {}"
+                                  .format(e, _PrettyPrint(element))) from e
         return ret
 
     @classmethod
@@ -518,7 +560,7 @@ class AASFromJsonDecoder(json.JSONDecoder):
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'statements' in dct:
             for element in _get_ts(dct, "statements", list):
-                if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe):
+                if _expect_type(element, model.SubmodelElement, ret, cls.failsafe):
                     ret.statement.add(element)
         return ret
 
@@ -555,7 +597,7 @@ class AASFromJsonDecoder(json.JSONDecoder):
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'submodelElements' in dct:
             for element in _get_ts(dct, "submodelElements", list):
-                if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe):
+                if _expect_type(element, model.SubmodelElement, ret, cls.failsafe):
                     ret.submodel_element.add(element)
         return ret
 
@@ -602,12 +644,12 @@ class AASFromJsonDecoder(json.JSONDecoder):
                     try:
                         target.add(cls._construct_operation_variable(variable_data))
                     except (KeyError, TypeError) as e:
-                        error_message = "Error while trying to convert JSON object into {} of {}: {}".format(
-                            json_name, ret, pprint.pformat(variable_data, depth=2, width=2 ** 14, compact=True))
                         if cls.failsafe:
-                            logger.error(error_message, exc_info=e)
+                            logger.error("Error while trying to convert JSON object into %s of %s: %s",
+                                         json_name, ret, _PrettyPrint(variable_data), exc_info=e)
                         else:
-                            raise type(e)(error_message) from e
+                            raise type(e)("Error while trying to convert JSON object into {} of {}: {}".format(
+                                json_name, ret, _PrettyPrint(variable_data))) from e
         return ret
 
     @classmethod
@@ -630,7 +672,7 @@ class AASFromJsonDecoder(json.JSONDecoder):
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'annotations' in dct:
             for element in _get_ts(dct, 'annotations', list):
-                if _expect_type(element, model.DataElement, str(ret), cls.failsafe):
+                if _expect_type(element, model.DataElement, ret, cls.failsafe):
                     ret.annotation.add(element)
         return ret
 
@@ -642,7 +684,7 @@ class AASFromJsonDecoder(json.JSONDecoder):
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'value' in dct:
             for element in _get_ts(dct, "value", list):
-                if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe):
+                if _expect_type(element, model.SubmodelElement, ret, cls.failsafe):
                     ret.value.add(element)
         return ret
 
@@ -667,7 +709,7 @@ class AASFromJsonDecoder(json.JSONDecoder):
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'value' in dct:
             for element in _get_ts(dct, 'value', list):
-                if _expect_type(element, type_value_list_element, str(ret), cls.failsafe):
+                if _expect_type(element, type_value_list_element, ret, cls.failsafe):
                     ret.value.add(element)
         return ret
 
@@ -791,19 +833,175 @@ def _select_decoder(failsafe: bool, stripped: bool, decoder: Optional[Type[AASFr
         return StrictAASFromJsonDecoder
 
 
-def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathOrIO, replace_existing: bool = False,
-                            ignore_existing: bool = False, failsafe: bool = True, stripped: bool = False,
-                            decoder: Optional[Type[AASFromJsonDecoder]] = None) -> Set[model.Identifier]:
+# Names of the top-level arrays of an AAS JSON document and the expected types of their items
+_TOP_LEVEL_SECTIONS: Dict[str, Type[model.Identifiable]] = {
+    'assetAdministrationShells': model.AssetAdministrationShell,
+    'submodels': model.Submodel,
+    'conceptDescriptions': model.ConceptDescription,
+}
+
+
+class _JsonStreamParser:
     """
-    Read an Asset Administration Shell JSON file according to 'Details of the Asset Administration Shell', chapter 5.5
-    into a given object store.
+    A minimal incremental parser for the top-level structure of an AAS JSON document.
+
+    The document is read in chunks into a buffer. The parser only tokenizes the outer JSON object and the arrays of the
+    :data:`_TOP_LEVEL_SECTIONS`. Each array item (and each value of other top-level keys) is read completely into the
+    buffer and then decoded as a whole using the given JSONDecoder. Consumed parts of the buffer are dropped, so the
+    buffer never holds much more than a single item.
+
+    :param file: The text or binary file to read from
+    :param decoder: The JSONDecoder to decode the array items with
+    """
+    CHUNK_SIZE = 65536
+    _WHITESPACE = re.compile(r'\s*')
+
+    def __init__(self, file: IO, decoder: json.JSONDecoder) -> None:
+        self.file = file
+        self.decoder = decoder
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._plain_decoder = json.JSONDecoder()
+        self._text_decoder: Optional[codecs.IncrementalDecoder] = None
+
+    def _fill(self, size: int = 0) -> bool:
+        """
+        Read the next chunk from the file and append it to the buffer
+
+        :param size: The minimum number of characters to read, if it is larger than the :attr:`CHUNK_SIZE`
+        :return: ``False``, if the end of the file has been reached
+        """
+        if self.eof:
+            return False
+        chunk = self.file.read(max(size, self.CHUNK_SIZE))
+        if isinstance(chunk, bytes):
+            if self._text_decoder is None:
+                # Like json.load(), detect the encoding of binary files from their first (up to four) bytes
+                while 0 < len(chunk) < 4:
+                    more = self.file.read(self.CHUNK_SIZE)
+                    if not more:
+                        break
+                    chunk += more
+                self._text_decoder = codecs.getincrementaldecoder(json.detect_encoding(chunk))()
+            text = self._text_decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        if not chunk:
+            self.eof = True
+        self.buffer += text
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it (or an empty string at the end of the file)
+        """
+        while True:
+            match = self._WHITESPACE.match(self.buffer, self.pos)
+            assert match is not None
+            self.pos = match.end()
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, characters: str) -> str:
+        """
+        Skip whitespace and consume the next character, which must be one of the given characters
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise self._error("Expecting one of {!r}".format(characters))
+        self.pos += 1
+        return character
+
+    def _read_value(self) -> None:
+        """
+        Make sure that the JSON value starting at the current position is completely contained in the buffer, reading
+        further chunks as required
+
+        The value is parsed by a plain JSONDecoder (without any hooks), which is much faster than scanning the value in
+        Python. If it fails because the value is incomplete, more data (at least as much as already buffered for the
+        value) is read and parsing is retried.
+        """
+        if not self.peek():
+            raise self._error("Expecting value")
+        if self.pos > self.CHUNK_SIZE:
+            # Drop the consumed part of the buffer
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        while True:
+            try:
+                _, end = self._plain_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Errors, which are not caused by the end of the buffer, are raised immediately
+                if e.pos + 64 < len(self.buffer) and not e.msg.startswith("Unterminated string"):
+                    raise
+                if not self._fill(len(self.buffer) - self.pos):
+                    raise
+                continue
+            # A number at the end of the buffer may be continued in the next chunk
+            if end < len(self.buffer) or not self._fill():
+                return
+
+    def value(self, decoder: Optional[json.JSONDecoder] = None) -> object:
+        """
+        Decode the JSON value starting at the current position and consume it
+
+        :param decoder: The JSONDecoder to use instead of the parser's decoder
+        """
+        self._read_value()
+        obj, self.pos = (decoder or self.decoder).raw_decode(self.buffer, self.pos)
+        return obj
+
+    def iter_sections(self) -> Iterator[Tuple[str, object]]:
+        """
+        Iterate the items of the :data:`_TOP_LEVEL_SECTIONS` arrays of the document, as tuples of the name of the array
+        and the decoded item. The values of all other top-level keys are skipped.
+        """
+        plain_decoder = json.JSONDecoder()
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            name = self.value(plain_decoder)
+            assert isinstance(name, str)
+            self.expect(":")
+            if name in _TOP_LEVEL_SECTIONS and self.peek() == "[":
+                self.pos += 1
+                if self.peek() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        # The cyclic garbage collector is paused while decoding a single item, as it would repeatedly
+                        # traverse the objects decoded so far. It is not paused while the caller processes the item.
+                        with gc_paused():
+                            item = self.value()
+                        yield name, item
+                        if self.expect(",]") == "]":
+                            break
+            else:
+                self.value(plain_decoder)
+            if self.expect(",}") == "}":
+                break
+        if self.peek():
+            raise self._error("Extra data")
+
+
+def iter_aas_json_file(file: PathOrIO, failsafe: bool = True, stripped: bool = False,
+                       decoder: Optional[Type[AASFromJsonDecoder]] = None) -> Iterator[model.Identifiable]:
+    """
+    Incrementally read an Asset Administration Shell JSON file according to 'Details of the Asset Administration Shell',
+    chapter 5.5, and yield the contained :class:`~basyx.aas.model.base.Identifiable` objects one at a time.
+
+    In contrast to parsing the whole document with :func:`json.load`, only a single top-level object is held in memory
+    at once (as JSON text and as BaSyx Python SDK object), such that large files can be processed with bounded memory.
 
-    :param object_store: The :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` in which the
-                         identifiable objects should be stored
     :param file: A filename or file-like object to read the JSON-serialized data from
-    :param replace_existing: Whether to replace existing objects with the same identifier in the object store or not
-    :param ignore_existing: Whether to ignore existing objects (e.g. log a message) or raise an error.
-                            This parameter is ignored if replace_existing is ``True``.
     :param failsafe: If ``True``, the document is parsed in a failsafe way: Missing attributes and elements are logged
                      instead of causing exceptions. Defect objects are skipped.
                      This parameter is ignored if a decoder class is specified.
@@ -811,19 +1009,15 @@ def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathO
                      See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
                      This parameter is ignored if a decoder class is specified.
     :param decoder: The decoder class used to decode the JSON objects
-    :raises KeyError: **Non-failsafe**: Encountered a duplicate identifier
-    :raises KeyError: Encountered an identifier that already exists in the given ``object_store`` with both
-                     ``replace_existing`` and ``ignore_existing`` set to ``False``
+    :raises json.JSONDecodeError: If the document is not valid JSON
     :raises (~basyx.aas.model.base.AASConstraintViolation, KeyError, ValueError, TypeError): **Non-failsafe**:
         Errors during construction of the objects
     :raises TypeError: **Non-failsafe**: Encountered an element in the wrong list
                                          (e.g. an AssetAdministrationShell in ``submodels``)
-    :return: A set of :class:`Identifiers <basyx.aas.model.base.Identifier>` that were added to object_store
+    :return: An iterator over the :class:`~basyx.aas.model.base.Identifiable` objects in the file
     """
-    ret: Set[model.Identifier] = set()
     decoder_ = _select_decoder(failsafe, stripped, decoder)
 
-    # json.load() accepts TextIO and BinaryIO
     cm: ContextManager[IO]
     if isinstance(file, get_args(Path)):
         # 'file' is a path, needs to be opened first
@@ -833,49 +1027,80 @@ def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathO
         # mypy seems to have issues narrowing the type due to get_args()
         cm = contextlib.nullcontext(file)  # type: ignore[arg-type]
 
-    # read, parse and convert JSON file
     with cm as fp:
-        data = json.load(fp, cls=decoder_)
-
-    for name, expected_type in (('assetAdministrationShells', model.AssetAdministrationShell),
-                                ('submodels', model.Submodel),
-                                ('conceptDescriptions', model.ConceptDescription)):
-        try:
-            lst = _get_ts(data, name, list)
-        except (KeyError, TypeError):
-            continue
-
-        for item in lst:
-            error_message = "Expected a {} in list '{}', but found {}".format(
-                expected_type.__name__, name, repr(item))
+        for name, item in _JsonStreamParser(fp, decoder_()).iter_sections():
+            expected_type = _TOP_LEVEL_SECTIONS[name]
             if isinstance(item, model.Identifiable):
                 if not isinstance(item, expected_type):
                     if decoder_.failsafe:
                         logger.warning("{} was in wrong list '{}'; nevertheless, we'll use it".format(item, name))
                     else:
-                        raise TypeError(error_message)
-                if item.id in ret:
-                    error_message = f"{item} has a duplicate identifier already parsed in the document!"
-                    if not decoder_.failsafe:
-                        raise KeyError(error_message)
-                    logger.error(error_message + " skipping it...")
-                    continue
-                existing_element = object_store.get(item.id)
-                if existing_element is not None:
-                    if not replace_existing:
-                        error_message = f"object with identifier {item.id} already exists " \
-                                        f"in the object store: {existing_element}!"
-                        if not ignore_existing:
-                            raise KeyError(error_message + f" failed to insert {item}!")
-                        logger.info(error_message + f" skipping insertion of {item}...")
-                        continue
-                    object_store.discard(existing_element)
-                object_store.add(item)
-                ret.add(item.id)
-            elif decoder_.failsafe:
-                logger.error(error_message)
+                        raise TypeError("Expected a {} in list '{}', but found {}".format(
+                            expected_type.__name__, name, repr(item)))
+                yield item
             else:
-                raise TypeError(error_message)
+                error_message = "Expected a {} in list '{}', but found {}".format(
+                    expected_type.__name__, name, repr(item))
+                if not decoder_.failsafe:
+                    raise TypeError(error_message)
+                logger.error(error_message)
+
+
+def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathOrIO, replace_existing: bool = False,
+                            ignore_existing: bool = False, failsafe: bool = True, stripped: bool = False,
+                            decoder: Optional[Type[AASFromJsonDecoder]] = None) -> Set[model.Identifier]:
+    """
+    Read an Asset Administration Shell JSON file according to 'Details of the Asset Administration Shell', chapter 5.5
+    into a given object store.
+
+    The file is read incrementally using :func:`~.iter_aas_json_file` and each object is added to the object store
+    immediately after decoding it. Thus, in non-failsafe mode, the objects preceding an erroneous object in the file
+    have already been added when the error is raised.
+
+    :param object_store: The :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` in which the
+                         identifiable objects should be stored
+    :param file: A filename or file-like object to read the JSON-serialized data from
+    :param replace_existing: Whether to replace existing objects with the same identifier in the object store or not
+    :param ignore_existing: Whether to ignore existing objects (e.g. log a message) or raise an error.
+                            This parameter is ignored if replace_existing is ``True``.
+    :param failsafe: If ``True``, the document is parsed in a failsafe way: Missing attributes and elements are logged
+                     instead of causing exceptions. Defect objects are skipped.
+                     This parameter is ignored if a decoder class is specified.
+    :param stripped: If ``True``, stripped JSON objects are parsed.
+                     See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
+                     This parameter is ignored if a decoder class is specified.
+    :param decoder: The decoder class used to decode the JSON objects
+    :raises KeyError: **Non-failsafe**: Encountered a duplicate identifier
+    :raises KeyError: Encountered an identifier that already exists in the given ``object_store`` with both
+                     ``replace_existing`` and ``ignore_existing`` set to ``False``
+    :raises (~basyx.aas.model.base.AASConstraintViolation, KeyError, ValueError, TypeError): **Non-failsafe**:
+        Errors during construction of the objects
+    :raises TypeError: **Non-failsafe**: Encountered an element in the wrong list
+                                         (e.g. an AssetAdministrationShell in ``submodels``)
+    :return: A set of :class:`Identifiers <basyx.aas.model.base.Identifier>` that were added to object_store
+    """
+    ret: Set[model.Identifier] = set()
+    decoder_ = _select_decoder(failsafe, stripped, decoder)
+
+    for item in iter_aas_json_file(file, decoder=decoder_):
+        if item.id in ret:
+            error_message = f"{item} has a duplicate identifier already parsed in the document!"
+            if not decoder_.failsafe:
+                raise KeyError(error_message)
+            logger.error(error_message + " skipping it...")
+            continue
+        existing_element = object_store.get(item.id)
+        if existing_element is not None:
+            if not replace_existing:
+                error_message = f"object with identifier {item.id} already exists " \
+                                f"in the object store: {existing_element}!"
+                if not ignore_existing:
+                    raise KeyError(error_message + f" failed to insert {item}!")
+                logger.info(error_message + f" skipping insertion of {item}...")
+                continue
+            object_store.discard(existing_element)
+        object_store.add(item)
+        ret.add(item.id)
     return ret
 
 
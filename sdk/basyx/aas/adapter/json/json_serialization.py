@@ -16,8 +16,8 @@ specification, the latter serializes stripped objects, excluding some attributes
 Each class contains a custom :meth:`~.AASToJsonEncoder.default` function which converts BaSyx Python SDK objects to
 simple python types for an automatic JSON serialization.
 To simplify the usage of this module, the :meth:`write_aas_json_file` and :meth:`object_store_to_json` are provided.
-The former is used to serialize a given :class:`~basyx.aas.model.provider.AbstractObjectStore` to a file, while the
-latter serializes the object store to a string and returns it.
+The former is used to serialize a given :class:`~basyx.aas.model.provider.AbstractObjectStore` (or any other iterable of
+AAS objects) to a file, while the latter serializes the object store to a string and returns it.
 
 The serialization is performed in an iterative approach: The :meth:`~.AASToJsonEncoder.default` function gets called for
 every object and checks if an object is an BaSyx Python SDK object. In this case, it calls a special function for the
@@ -28,9 +28,10 @@ conversion functions to handle all the attributes of abstract base classes.
 """
 import base64
 import contextlib
-import inspect
 import io
-from typing import ContextManager, List, Dict, Optional, TextIO, Type, Callable, get_args
+import shutil
+import tempfile
+from typing import ContextManager, IO, Iterable, List, Dict, Optional, TextIO, Type, cast, get_args
 import json
 
 from basyx.aas import model
@@ -57,6 +58,46 @@ class AASToJsonEncoder(json.JSONEncoder):
     """
     stripped = False
 
+    # The names of the transformation functions for the BaSyx Python SDK classes. They are looked up by the type of the
+    # object to serialize or, for subclasses, by the first class of their MRO found here.
+    _SERIALIZERS: Dict[Type, str] = {
+        model.AdministrativeInformation: "_administrative_information_to_json",
+        model.AnnotatedRelationshipElement: "_annotated_relationship_element_to_json",
+        model.AssetAdministrationShell: "_asset_administration_shell_to_json",
+        model.AssetInformation: "_asset_information_to_json",
+        model.BasicEventElement: "_basic_event_element_to_json",
+        model.Blob: "_blob_to_json",
+        model.Capability: "_capability_to_json",
+        model.ConceptDescription: "_concept_description_to_json",
+        model.DataSpecificationIEC61360: "_data_specification_iec61360_to_json",
+        model.Entity: "_entity_to_json",
+        model.Extension: "_extension_to_json",
+        model.File: "_file_to_json",
+        model.Key: "_key_to_json",
+        model.LangStringSet: "_lang_string_set_to_json",
+        model.MultiLanguageProperty: "_multi_language_property_to_json",
+        model.Operation: "_operation_to_json",
+        model.Property: "_property_to_json",
+        model.Qualifier: "_qualifier_to_json",
+        model.Range: "_range_to_json",
+        model.Reference: "_reference_to_json",
+        model.ReferenceElement: "_reference_element_to_json",
+        model.RelationshipElement: "_relationship_element_to_json",
+        model.Resource: "_resource_to_json",
+        model.SpecificAssetId: "_specific_asset_id_to_json",
+        model.Submodel: "_submodel_to_json",
+        model.SubmodelElementCollection: "_submodel_element_collection_to_json",
+        model.SubmodelElementList: "_submodel_element_list_to_json",
+        model.ValueReferencePair: "_value_reference_pair_to_json",
+    }
+    # Cache of the transformation function names by type. Each subclass gets its own cache, as it may extend
+    # `_SERIALIZERS`.
+    _serializer_cache: Dict[Type, Optional[str]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._serializer_cache = {}
+
     def default(self, obj: object) -> object:
         """
         The overwritten ``default`` method for :class:`json.JSONEncoder`
@@ -64,41 +105,14 @@ class AASToJsonEncoder(json.JSONEncoder):
         :param obj: The object to serialize to json
         :return: The serialized object
         """
-        mapping: Dict[Type, Callable] = {
-            model.AdministrativeInformation: self._administrative_information_to_json,
-            model.AnnotatedRelationshipElement: self._annotated_relationship_element_to_json,
-            model.AssetAdministrationShell: self._asset_administration_shell_to_json,
-            model.AssetInformation: self._asset_information_to_json,
-            model.BasicEventElement: self._basic_event_element_to_json,
-            model.Blob: self._blob_to_json,
-            model.Capability: self._capability_to_json,
-            model.ConceptDescription: self._concept_description_to_json,
-            model.DataSpecificationIEC61360: self._data_specification_iec61360_to_json,
-            model.Entity: self._entity_to_json,
-            model.Extension: self._extension_to_json,
-            model.File: self._file_to_json,
-            model.Key: self._key_to_json,
-            model.LangStringSet: self._lang_string_set_to_json,
-            model.MultiLanguageProperty: self._multi_language_property_to_json,
-            model.Operation: self._operation_to_json,
-            model.Property: self._property_to_json,
-            model.Qualifier: self._qualifier_to_json,
-            model.Range: self._range_to_json,
-            model.Reference: self._reference_to_json,
-            model.ReferenceElement: self._reference_element_to_json,
-            model.RelationshipElement: self._relationship_element_to_json,
-            model.Resource: self._resource_to_json,
-            model.SpecificAssetId: self._specific_asset_id_to_json,
-            model.Submodel: self._submodel_to_json,
-            model.SubmodelElementCollection: self._submodel_element_collection_to_json,
-            model.SubmodelElementList: self._submodel_element_list_to_json,
-            model.ValueReferencePair: self._value_reference_pair_to_json,
-        }
-        for typ in mapping:
-            if isinstance(obj, typ):
-                mapping_method = mapping[typ]
-                return mapping_method(obj)
-        return super().default(obj)
+        try:
+            serializer = self._serializer_cache[type(obj)]
+        except KeyError:
+            serializer = self._serializer_cache[type(obj)] = next(
+                (self._SERIALIZERS[t] for t in type(obj).__mro__ if t in self._SERIALIZERS), None)
+        if serializer is None:
+            return super().default(obj)
+        return getattr(self, serializer)(obj)
 
     @classmethod
     def _abstract_classes_to_json(cls, obj: object) -> Dict[str, object]:
@@ -109,47 +123,53 @@ class AASToJsonEncoder(json.JSONEncoder):
         :return: dict with the serialized attributes of the abstract classes this object inherits from
         """
         data: Dict[str, object] = {}
-        if isinstance(obj, model.HasExtension) and not cls.stripped:
-            if obj.extension:
-                data['extensions'] = list(obj.extension)
-        if isinstance(obj, model.HasDataSpecification) and not cls.stripped:
-            if obj.embedded_data_specifications:
+        classes = _generic.abstract_classes(type(obj))
+        if classes.has_extension and not cls.stripped:
+            has_extension = cast(model.HasExtension, obj)
+            if has_extension.extension:
+                data['extensions'] = list(has_extension.extension)
+        if classes.has_data_specification and not cls.stripped:
+            has_data_specification = cast(model.HasDataSpecification, obj)
+            if has_data_specification.embedded_data_specifications:
                 data['embeddedDataSpecifications'] = [
                     {'dataSpecification': spec.data_specification,
                      'dataSpecificationContent': spec.data_specification_content}
-                    for spec in obj.embedded_data_specifications
+                    for spec in has_data_specification.embedded_data_specifications
                 ]
 
-        if isinstance(obj, model.Referable):
-            if obj.id_short and not isinstance(obj.parent, model.SubmodelElementList):
-                data['idShort'] = obj.id_short
-            if obj.display_name:
-                data['displayName'] = obj.display_name
-            if obj.category:
-                data['category'] = obj.category
-            if obj.description:
-                data['description'] = obj.description
-            try:
-                ref_type = next(iter(t for t in inspect.getmro(type(obj)) if t in model.KEY_TYPES_CLASSES))
-            except StopIteration as e:
+        if classes.referable:
+            referable = cast(model.Referable, obj)
+            if referable.id_short and not isinstance(referable.parent, model.SubmodelElementList):
+                data['idShort'] = referable.id_short
+            if referable.display_name:
+                data['displayName'] = referable.display_name
+            if referable.category:
+                data['category'] = referable.category
+            if referable.description:
+                data['description'] = referable.description
+            if classes.model_type is None:
                 raise TypeError("Object of type {} is Referable but does not inherit from a known AAS type"
-                                .format(obj.__class__.__name__)) from e
-            data['modelType'] = ref_type.__name__
-        if isinstance(obj, model.Identifiable):
-            data['id'] = obj.id
-            if obj.administration:
-                data['administration'] = obj.administration
-        if isinstance(obj, model.HasSemantics):
-            if obj.semantic_id:
-                data['semanticId'] = obj.semantic_id
-            if obj.supplemental_semantic_id:
-                data['supplementalSemanticIds'] = list(obj.supplemental_semantic_id)
-        if isinstance(obj, model.HasKind):
-            if obj.kind is model.ModellingKind.TEMPLATE:
-                data['kind'] = _generic.MODELLING_KIND[obj.kind]
-        if isinstance(obj, model.Qualifiable) and not cls.stripped:
-            if obj.qualifier:
-                data['qualifiers'] = list(obj.qualifier)
+                                .format(referable.__class__.__name__))
+            data['modelType'] = classes.model_type
+        if classes.identifiable:
+            identifiable = cast(model.Identifiable, obj)
+            data['id'] = identifiable.id
+            if identifiable.administration:
+                data['administration'] = identifiable.administration
+        if classes.has_semantics:
+            has_semantics = cast(model.HasSemantics, obj)
+            if has_semantics.semantic_id:
+                data['semanticId'] = has_semantics.semantic_id
+            if has_semantics.supplemental_semantic_id:
+                data['supplementalSemanticIds'] = list(has_semantics.supplemental_semantic_id)
+        if classes.has_kind:
+            has_kind = cast(model.HasKind, obj)
+            if has_kind.kind is model.ModellingKind.TEMPLATE:
+                data['kind'] = _generic.MODELLING_KIND[has_kind.kind]
+        if classes.qualifiable and not cls.stripped:
+            qualifiable = cast(model.Qualifiable, obj)
+            if qualifiable.qualifier:
+                data['qualifiers'] = list(qualifiable.qualifier)
         return data
 
     # #############################################################
@@ -742,15 +762,42 @@ class _DetachingTextIOWrapper(io.TextIOWrapper):
         self.detach()
 
 
-def write_aas_json_file(file: _generic.PathOrIO, data: model.AbstractObjectStore, stripped: bool = False,
+# Names of the top-level arrays of an AAS JSON document and the types of their items, in the order of serialization
+_TOP_LEVEL_SECTIONS = (('assetAdministrationShells', model.AssetAdministrationShell),
+                       ('submodels', model.Submodel),
+                       ('conceptDescriptions', model.ConceptDescription))
+
+# Maximum size of the (serialized) array of a top-level section, which is kept in memory. Larger arrays are spooled to
+# a temporary file.
+SPOOL_MAX_SIZE = 1024 * 1024
+
+
+def _split_template(encoder: json.JSONEncoder, template: object) -> List[str]:
+    """
+    Serialize a template structure, containing ``None`` as placeholders, and split the result at the placeholders.
+
+    This is used to get the exact JSON syntax (brackets, separators and indentation) surrounding the objects, as
+    produced by the given encoder.
+    """
+    return "".join(encoder.iterencode(template)).split("null")
+
+
+def write_aas_json_file(file: _generic.PathOrIO, data: Iterable[model.Identifiable], stripped: bool = False,
                         encoder: Optional[Type[AASToJsonEncoder]] = None, **kwargs) -> None:
     """
     Write a set of AAS objects to an Asset Administration Shell JSON file according to 'Details of the Asset
     Administration Shell', chapter 5.5
 
+    The objects are retrieved from ``data`` in a single pass and serialized one at a time. The serialized arrays of
+    the top-level sections are collected in temporary files (kept in memory up to :data:`SPOOL_MAX_SIZE`), before they
+    are written to the file. Thus, any iterable of objects (like a lazily retrieving
+    :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>`) can be written with bounded memory. The result
+    is identical to serializing all objects with :func:`json.dump` at once.
+
     :param file: A filename or file-like object to write the JSON-serialized data to
-    :param data: :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` which contains different objects of
-                 the AAS metamodel which should be serialized to a JSON file
+    :param data: :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` or any other iterable which
+                 contains different objects of the AAS metamodel which should be serialized to a JSON file. Objects
+                 other than AssetAdministrationShells, Submodels and ConceptDescriptions are ignored.
     :param stripped: If `True`, objects are serialized to stripped json objects.
                      See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
                      This parameter is ignored if an encoder class is specified.
@@ -758,6 +805,7 @@ def write_aas_json_file(file: _generic.PathOrIO, data: model.AbstractObjectStore
     :param kwargs: Additional keyword arguments to be passed to `json.dump()`
     """
     encoder_ = _select_encoder(stripped, encoder)
+    json_encoder = encoder_(**kwargs)
 
     # json.dump() only accepts TextIO
     cm: ContextManager[TextIO]
@@ -773,6 +821,37 @@ def write_aas_json_file(file: _generic.PathOrIO, data: model.AbstractObjectStore
         # mypy seems to have issues narrowing the type due to get_args()
         cm = contextlib.nullcontext(file)  # type: ignore[arg-type]
 
-    # serialize object to json
-    with cm as fp:
-        json.dump(_create_dict(data), fp, cls=encoder_, **kwargs)
+    with contextlib.ExitStack() as stack:
+        # serialize the objects of each section into a spool file
+        spools: Dict[str, IO[str]] = {}
+        templates: Dict[str, List[str]] = {}
+        for obj in data:
+            for name, type_ in _TOP_LEVEL_SECTIONS:
+                if isinstance(obj, type_):
+                    break
+            else:
+                continue
+            spool = spools.get(name)
+            if spool is None:
+                spool = spools[name] = stack.enter_context(tempfile.SpooledTemporaryFile(
+                    SPOOL_MAX_SIZE, mode="w+", encoding="utf-8"))
+                templates[name] = _split_template(json_encoder, {name: [None, None]})
+            else:
+                # separator between the array items
+                spool.write(templates[name][1])
+            # serialize the object within its section, to get the correct indentation
+            serialized = "".join(json_encoder.iterencode({name: [obj]}))
+            spool.write(serialized[len(templates[name][0]):len(serialized) - len(templates[name][2])])
+
+        # write the document, using the spooled sections
+        names = [name for name, _ in _TOP_LEVEL_SECTIONS if name in spools]
+        if json_encoder.sort_keys:
+            names.sort()
+        document = _split_template(json_encoder, {name: [None] for name in names})
+        with cm as fp:
+            fp.write(document[0])
+            for name, following in zip(names, document[1:]):
+                spool = spools[name]
+                spool.seek(0)
+                shutil.copyfileobj(spool, fp)
+                fp.write(following)
@@ -21,7 +21,7 @@ Then, the Backend class needs to be registered to handle update/commit requests
 """
 import abc
 import re
-from typing import List, Dict, Type, TYPE_CHECKING
+from typing import List, Dict, Type, TYPE_CHECKING, Any, Iterator, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from ..model import Referable
@@ -113,6 +113,22 @@ class Backend(metaclass=abc.ABCMeta):
         """
         pass
 
+    @classmethod
+    def get_revision(cls, store_object: "Referable") -> Optional[str]:
+        """
+        Function (class method) to get the revision of the data in the external data source, which the given object
+        has been updated from or committed to most recently.
+
+        The revision is an opaque string, which changes whenever the data is changed in the data source. It allows
+        users of the objects (e.g. the HTTP API) to detect changes of the data without comparing the objects
+        themselves. The default implementation returns ``None``, i.e. the revision is unknown.
+
+        :param store_object: The object which originates from the relevant data source (i.e. has the relevant source
+            attribute)
+        :return: The revision or ``None``, if the revision is unknown
+        """
+        return None
+
 
 # Global registry for backends by URI scheme
 # TODO allow multiple backends per scheme with priority
@@ -158,6 +174,120 @@ def get_backend(url: str) -> Type[Backend]:
         raise UnknownBackendException("Could not find Backend for source '{}'".format(url)) from e
 
 
+# #################################################################################################
+# Helper functions for backends, which store the JSON serialization of Identifiables, to commit changes of single
+# elements (delta commits)
+
+# The attributes of the JSON serialization of Referables, which contain their child elements, by modelType
+JSON_CHILD_ATTRIBUTES: Dict[str, str] = {
+    "Submodel": "submodelElements",
+    "SubmodelElementCollection": "value",
+    "SubmodelElementList": "value",
+    "Entity": "statements",
+    "AnnotatedRelationshipElement": "annotations",
+}
+# The attributes of the JSON serialization of Operations, which contain their variables. Each variable contains the
+# serialization of its SubmodelElement in its attribute ``value``.
+JSON_OPERATION_VARIABLE_ATTRIBUTES = ("inputVariables", "outputVariables", "inoutputVariables")
+
+
+def _iter_json_children(data: Dict[str, Any]) -> Iterator[Tuple[List[Any], int, bool]]:
+    """
+    Iterate the positions of all child elements in the JSON serialization of a Referable as tuples of the containing
+    list, the index in the list and whether the element is wrapped in an operation variable
+    """
+    attribute = JSON_CHILD_ATTRIBUTES.get(data.get("modelType", ""))
+    if attribute is not None and isinstance(data.get(attribute), list):
+        for i in range(len(data[attribute])):
+            yield data[attribute], i, False
+    for attribute in JSON_OPERATION_VARIABLE_ATTRIBUTES:
+        if isinstance(data.get(attribute), list):
+            for i in range(len(data[attribute])):
+                yield data[attribute], i, True
+
+
+def _find_json_child(data: Dict[str, Any], id_short: str) -> Optional[Tuple[List[Any], int, bool]]:
+    for container, index, wrapped in _iter_json_children(data):
+        child = container[index]["value"] if wrapped else container[index]
+        if isinstance(child, dict) and child.get("idShort") == id_short:
+            return container, index, wrapped
+    return None
+
+
+def iter_json_elements(data: Dict[str, Any], prefix: Tuple[str, ...] = ()) \
+        -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    """
+    Iterate the JSON serialization of a Referable and all its (recursively) contained elements with an ``idShort``,
+    together with their relative path of ``idShorts`` (like the ``relative_path`` of :meth:`~.Backend.commit_object`)
+
+    :param data: The JSON serialization (as parsed JSON data) of the Referable
+    :param prefix: The path of the Referable itself, which is prepended to the paths of all elements
+    """
+    yield prefix, data
+    for container, index, wrapped in _iter_json_children(data):
+        child = container[index]["value"] if wrapped else container[index]
+        if isinstance(child, dict) and isinstance(child.get("idShort"), str):
+            yield from iter_json_elements(child, prefix + (child["idShort"],))
+
+
+def set_json_element(data: Dict[str, Any], relative_path: Sequence[str], element: Dict[str, Any]) -> bool:
+    """
+    Replace an element within the JSON serialization of a Referable (e.g. the stored document of an Identifiable) by
+    the given JSON serialization of the element.
+
+    An element, which is not contained in the JSON serialization (e.g. since it has been added or its ``idShort`` has
+    been changed since), is never appended to its parent, since an outdated element with the old ``idShort`` would be
+    kept. Instead, the nearest ancestor contained in the JSON serialization needs to be replaced as a whole.
+
+    Applying the same change twice has the same effect as applying it once.
+
+    :param data: The JSON serialization (as parsed JSON data) of the Referable, which is modified in place
+    :param relative_path: The path of ``idShorts`` from the Referable to the element (see
+        :meth:`~.Backend.commit_object`). It must not be empty.
+    :param element: The new JSON serialization (as JSON data) of the element
+    :return: ``False``, if there is no element at this path, in which case the data is not modified, ``True`` otherwise
+    """
+    node = data
+    for id_short in relative_path[:-1]:
+        position = _find_json_child(node, id_short)
+        if position is None:
+            return False
+        container, index, wrapped = position
+        node = container[index]["value"] if wrapped else container[index]
+    position = _find_json_child(node, relative_path[-1])
+    if position is None:
+        return False
+    container, index, wrapped = position
+    if wrapped:
+        container[index]["value"] = element
+    else:
+        container[index] = element
+    return True
+
+
+def find_addressable_element(store_object: "Referable", relative_path: Sequence[Optional[str]]) \
+        -> Tuple[List[str], "Referable"]:
+    """
+    Find the innermost element on the ``relative_path`` from the ``store_object`` (see :meth:`~.Backend.commit_object`),
+    which can be addressed by a path of ``idShorts`` in the JSON serialization of the ``store_object``. Elements of
+    :class:`SubmodelElementLists <basyx.aas.model.submodel.SubmodelElementList>` (and their children) can't be
+    addressed, since their ``id_shorts`` are generated and not serialized.
+
+    :return: The path of ``idShorts`` to the element and the element itself. The path is empty, if only the
+        ``store_object`` itself can be addressed.
+    """
+    from ..model import SubmodelElementList, UniqueIdShortNamespace
+    path: List[str] = []
+    element = store_object
+    for id_short in relative_path:
+        if id_short is None or isinstance(element, SubmodelElementList) \
+                or not isinstance(element, UniqueIdShortNamespace):
+            break
+        element = element.get_referable(id_short)
+        path.append(id_short)
+    return path, element
+
+
 # #################################################################################################
 # Custom Exception classes for reporting errors during interaction with Backends
 class BackendError(Exception):
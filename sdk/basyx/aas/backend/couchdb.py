@@ -11,9 +11,13 @@ in a CouchDB.
 The :class:`~.CouchDBBackend` takes care of updating and committing objects from and to the CouchDB, while the
 :class:`~CouchDBObjectStore` handles adding, deleting and otherwise managing the AAS objects in a specific CouchDB.
 """
+import asyncio
+import inspect
+import itertools
 import threading
 import weakref
-from typing import List, Dict, Any, Optional, Iterator, Iterable, Union, Tuple, MutableMapping
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Union, Tuple, MutableMapping, Set, Type, TypeVar, \
+    AsyncIterator, Callable, cast
 import urllib.parse
 import urllib.request
 import urllib.error
@@ -27,7 +31,12 @@ from basyx.aas import model
 
 
 logger = logging.getLogger(__name__)
-_http_pool_manager = urllib3.PoolManager()
+# Default number of concurrent requests of the asyncio variants of the backend and the object store. The connection pool
+# keeps as many connections to each CouchDB server, so they can be reused by concurrent requests.
+DEFAULT_MAX_CONCURRENCY = 10
+_http_pool_manager = urllib3.PoolManager(maxsize=DEFAULT_MAX_CONCURRENCY)
+
+_QT = TypeVar('_QT', bound=model.Identifiable)
 
 
 class CouchDBBackend(backends.Backend):
@@ -36,6 +45,11 @@ class CouchDBBackend(backends.Backend):
     document's id is build from the object's identifier. The document's contents comprise a single property ``data``,
     containing the JSON serialization of the BaSyx Python SDK object. The :ref:`adapter.json <adapter.json.__init__>`
     package is used for serialization and deserialization of objects.
+
+    Objects are only updated, if their document has been changed in the database since they have been retrieved or
+    committed. This is checked using the stored CouchDB revision of the document (see :func:`~.set_couchdb_revision`)
+    and thus saves transferring and decoding unchanged documents. However, local changes of such objects, which have not
+    been committed, are not discarded by updating them.
     """
     @classmethod
     def update_object(cls,
@@ -47,10 +61,20 @@ class CouchDBBackend(backends.Backend):
             raise CouchDBSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                      "in the CouchDB")
         url = CouchDBBackend._parse_source(store_object.source)
+        if is_couchdb_revision_current(url):
+            # The _changes feed of the database did not report any change of the document since we retrieved it
+            logger.debug("Skipping update of %s, which is known to be up to date.", url)
+            return
 
+        revision = get_couchdb_revision(url)
         try:
-            data = CouchDBBackend.do_request(url)
+            data = CouchDBBackend.do_request(url, additional_headers=_if_none_match_header(revision))
         except CouchDBServerError as e:
+            if e.code == 304 and revision is not None:
+                # The document has not been changed since we retrieved the stored revision. Storing it again confirms
+                # it as the latest revision (see CouchDBChangesFollower).
+                set_couchdb_revision(url, revision)
+                return
             if e.code == 404:
                 raise KeyError("No Identifiable found in CouchDB at {}".format(url)) from e
             raise
@@ -72,6 +96,17 @@ class CouchDBBackend(backends.Backend):
         if get_couchdb_revision(url) is None:
             raise CouchDBConflictError("No revision found for the given object. Try calling `update` on it.")
 
+        # Elements of SubmodelElementLists can't be addressed, so the nearest addressable ancestor is committed
+        path, element = backends.find_addressable_element(store_object, relative_path)
+        if has_update_handler(url.rsplit("/", 1)[0]):
+            # An element, which is not contained in the document (yet), is committed with its nearest ancestor, which is
+            # contained in the document
+            while path:
+                if cls._commit_delta(url, element, store_object, path):
+                    return
+                path = path[:-1]
+                element = cast(model.Referable, element.parent)
+
         data = json.dumps({'data': store_object, "_rev": get_couchdb_revision(url)},
                           cls=json_serialization.AASToJsonEncoder)
 
@@ -88,6 +123,46 @@ class CouchDBBackend(backends.Backend):
                                .format(store_object.id, url)) from e
             raise
 
+    @classmethod
+    def get_revision(cls, store_object: model.Referable) -> Optional[str]:
+        """
+        Get the stored CouchDB revision of the object's document (see :func:`~.get_couchdb_revision`)
+        """
+        if not isinstance(store_object, model.Identifiable):
+            return None
+        return get_couchdb_revision(cls._parse_source(store_object.source))
+
+    @classmethod
+    def _commit_delta(cls, url: str, committed_object: model.Referable, store_object: model.Identifiable,
+                      relative_path: List[str]) -> bool:
+        """
+        Commit a single element within the document by sending only its JSON serialization to the update handler of
+        the database (see :meth:`.CouchDBObjectStore.create_update_handler`)
+
+        :return: ``False``, if the element can't be committed separately, because it is not contained in the document
+        """
+        database_url, document_id = url.rsplit("/", 1)
+        data = json.dumps({'rev': get_couchdb_revision(url), 'path': relative_path, 'element': committed_object},
+                          cls=json_serialization.AASToJsonEncoder)
+        try:
+            _response, headers = CouchDBBackend._do_request_with_headers(
+                "{}/{}/_update/{}/{}".format(database_url, UPDATE_HANDLER_DESIGN_DOCUMENT, UPDATE_HANDLER_NAME,
+                                             document_id),
+                method='PUT', additional_headers={'Content-type': 'application/json'}, body=data.encode('utf-8'))
+        except CouchDBServerError as e:
+            if e.code == 404 and e.error == "element_not_found":
+                logger.debug("%s not found in %s, committing its parent instead.", relative_path, url)
+                return False
+            if e.code == 409:
+                raise CouchDBConflictError("Could not commit changes to id {} due to a concurrent modification in the "
+                                           "database.".format(store_object.id)) from e
+            elif e.code == 404:
+                raise KeyError("Object with id {} was not found in the CouchDB at {}"
+                               .format(store_object.id, url)) from e
+            raise
+        set_couchdb_revision(url, headers['X-Couch-Update-NewRev'])
+        return True
+
     @classmethod
     def _parse_source(cls, source: str) -> str:
         """
@@ -119,6 +194,17 @@ class CouchDBBackend(backends.Backend):
         :param body: Request body for POST, PUT, and PATCH requests
         :return: The parsed JSON data if the request ``method`` is other than 'HEAD' or the response headers for 'HEAD'
             requests
+        :raises CouchDBServerError: If the server responds with an error or with 304 (Not Modified) to a conditional
+            request
+        """
+        return cls._do_request_with_headers(url, method, additional_headers, body)[0]
+
+    @classmethod
+    def _do_request_with_headers(cls, url: str, method: str = "GET",
+                                 additional_headers: Optional[Dict[str, str]] = None, body: Optional[bytes] = None) \
+            -> Tuple[MutableMapping[str, Any], MutableMapping[str, str]]:
+        """
+        Like :meth:`~.do_request`, but additionally returns the response headers
         """
         url_parts = urllib.parse.urlparse(url)
         host = url_parts.scheme + url_parts.netloc
@@ -137,6 +223,9 @@ class CouchDBBackend(backends.Backend):
         if not (200 <= response.status < 300):
             logger.debug("Request %s %s finished with HTTP status code %s.",
                          method, url, response.status)
+            if response.status == 304:
+                # The response to a conditional request does not have a body
+                raise CouchDBServerError(response.status, "not_modified", "", "HTTP 304")
             if response.headers.get('Content-type', None) != 'application/json':
                 raise CouchDBResponseError("Unexpected Content-type header {} of response from CouchDB server"
                                            .format(response.headers.get('Content-type', None)))
@@ -155,7 +244,7 @@ class CouchDBBackend(backends.Backend):
         # Check response & parse data
         logger.debug("Request %s %s finished successfully.", method, url)
         if method == 'HEAD':
-            return response.headers
+            return response.headers, response.headers
 
         if response.headers.get('Content-type') != 'application/json':
             raise CouchDBResponseError("Unexpected Content-type header")
@@ -163,7 +252,17 @@ class CouchDBBackend(backends.Backend):
             data = json.loads(response.data.decode('utf-8'), cls=json_deserialization.AASFromJsonDecoder)
         except json.JSONDecodeError as e:
             raise CouchDBResponseError("Could not parse CouchDB server response as JSON data.") from e
-        return data
+        return data, response.headers
+
+
+def _if_none_match_header(revision: Optional[str]) -> Dict[str, str]:
+    """
+    Helper function to create the headers for a request of a CouchDB document, which is only answered with the document,
+    if its revision does not match the given revision
+
+    :param revision: The revision we hold of the document or ``None``
+    """
+    return {'If-None-Match': '"{}"'.format(revision)} if revision is not None else {}
 
 
 backends.register_backend("couchdb", CouchDBBackend)
@@ -196,6 +295,71 @@ def register_credentials(url: str, username: str, password: str):
 # Global registry for CouchDB Revisions
 _revision_store_lock = threading.Lock()
 _revision_store: Dict[str, str] = {}
+# Global registry of the latest CouchDB Revisions of the documents in the databases, whose _changes feed is followed by
+# a CouchDBChangesFollower. Revisions are only present for documents, which have been retrieved or changed since the
+# follower was started.
+_latest_revision_store: Dict[str, str] = {}
+_followed_databases: Set[str] = set()
+
+
+# Global registry of the databases, which contain the update handler for delta commits (see
+# `CouchDBObjectStore.create_update_handler()`)
+_update_handler_databases: Set[str] = set()
+
+UPDATE_HANDLER_DESIGN_DOCUMENT = "_design/basyx"
+UPDATE_HANDLER_NAME = "set_element"
+# The update handler replaces a single element (given by its path of idShorts) within the JSON serialization of the
+# Identifiable in a document, like `backends.set_json_element()`. It never appends a missing element.
+_UPDATE_HANDLER_FUNCTION = """function(doc, req) {
+    var CHILD_ATTRIBUTES = %s;
+    var VARIABLE_ATTRIBUTES = %s;
+    function error(code, name, reason) {
+        return [null, {code: code, json: {error: name, reason: reason}}];
+    }
+    function findChild(node, idShort) {
+        var containers = [];
+        var attribute = CHILD_ATTRIBUTES[node.modelType];
+        if (attribute && Array.isArray(node[attribute])) containers.push([node[attribute], false]);
+        VARIABLE_ATTRIBUTES.forEach(function(name) {
+            if (Array.isArray(node[name])) containers.push([node[name], true]);
+        });
+        for (var i = 0; i < containers.length; i++) {
+            var container = containers[i][0], wrapped = containers[i][1];
+            for (var j = 0; j < container.length; j++) {
+                var child = wrapped ? container[j].value : container[j];
+                if (child && child.idShort === idShort) return {container: container, index: j, wrapped: wrapped};
+            }
+        }
+        return null;
+    }
+    if (!doc) return error(404, "not_found", "missing");
+    var body = JSON.parse(req.body);
+    if (body.rev !== doc._rev) return error(409, "conflict", "Document update conflict.");
+    var node = doc.data, position;
+    for (var i = 0; i < body.path.length - 1; i++) {
+        position = findChild(node, body.path[i]);
+        if (!position) return error(404, "element_not_found", "Parent element not found");
+        node = position.wrapped ? position.container[position.index].value : position.container[position.index];
+    }
+    position = findChild(node, body.path[body.path.length - 1]);
+    if (!position) return error(404, "element_not_found", "Element not found");
+    if (position.wrapped) {
+        position.container[position.index].value = body.element;
+    } else {
+        position.container[position.index] = body.element;
+    }
+    return [doc, {json: {ok: true}}];
+}""" % (json.dumps(backends.JSON_CHILD_ATTRIBUTES), json.dumps(list(backends.JSON_OPERATION_VARIABLE_ATTRIBUTES)))
+
+
+def has_update_handler(database_url: str) -> bool:
+    """
+    Check if the given database is known to contain the update handler for delta commits
+
+    :param database_url: URL to the CouchDB database
+    """
+    with _revision_store_lock:
+        return database_url in _update_handler_databases
 
 
 def set_couchdb_revision(url: str, revision: str):
@@ -207,6 +371,24 @@ def set_couchdb_revision(url: str, revision: str):
     """
     with _revision_store_lock:
         _revision_store[url] = revision
+        if url.rsplit("/", 1)[0] in _followed_databases:
+            # The _changes feed may already have reported a newer revision, which must not be overwritten. Otherwise,
+            # the feed will report this revision (or a newer one) later.
+            _latest_revision_store.setdefault(url, revision)
+
+
+def is_couchdb_revision_current(url: str) -> bool:
+    """
+    Check if the CouchDB revision of the given document in the revision store is known to be its latest revision in the
+    database, as reported by a :class:`~.CouchDBChangesFollower` of the database
+
+    :param url: URL to the CouchDB document
+    :return: ``True``, if the document is known to be unchanged, ``False`` otherwise
+    """
+    with _revision_store_lock:
+        revision = _revision_store.get(url)
+        return revision is not None and url.rsplit("/", 1)[0] in _followed_databases \
+            and _latest_revision_store.get(url) == revision
 
 
 def get_couchdb_revision(url: str) -> Optional[str]:
@@ -282,6 +464,57 @@ class CouchDBObjectStore(model.AbstractObjectStore):
         logger.info("Creating CouchDB database %s/%s ...", self.url, self.database_name)
         CouchDBBackend.do_request("{}/{}".format(self.url, self.database_name), 'PUT')
 
+    # Fields of the documents, which are indexed by `create_indexes()` to answer the criteria of `query()`
+    INDEXED_FIELDS = ("data.modelType", "data.idShort", "data.semanticId", "data.assetInformation.globalAssetId",
+                      "data.assetInformation.specificAssetIds")
+
+    def create_indexes(self) -> None:
+        """
+        Create the Mango indexes of the database, which are used by :meth:`~.query` (if they do not exist yet)
+
+        The indexes are stored in the design document ``_design/basyx-query`` of the database. Each index is a
+        compound index of one of the :attr:`INDEXED_FIELDS` and the document id, so a query by the field can be
+        answered in the order of the document ids from the index. Queries work without them, but then the CouchDB
+        server has to scan all documents of the database for each query.
+
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        for field in self.INDEXED_FIELDS:
+            logger.debug("Creating index on %s in CouchDB database %s ...", field, self.database_name)
+            data = json.dumps({'index': {'fields': [field, "_id"]}, 'ddoc': "basyx-query", 'name': field,
+                               'type': "json"})
+            CouchDBBackend.do_request("{}/{}/_index".format(self.url, self.database_name), 'POST',
+                                      {'Content-type': 'application/json'}, data.encode('utf-8'))
+
+    def create_update_handler(self) -> None:
+        """
+        Create (or upgrade) the design document with the update handler for delta commits in the database and enable
+        delta commits for it in this process
+
+        With delta commits, :meth:`~basyx.aas.model.base.Referable.commit` of an element within a stored Identifiable
+        only sends the element's JSON serialization to the CouchDB server, which merges it into the document. Without
+        the update handler, the whole Identifiable is sent.
+
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        url = "{}/{}/{}".format(self.url, self.database_name, UPDATE_HANDLER_DESIGN_DOCUMENT)
+        try:
+            design_document = CouchDBBackend.do_request(url)
+        except CouchDBServerError as e:
+            if e.code != 404:
+                raise
+            design_document = {'_id': UPDATE_HANDLER_DESIGN_DOCUMENT}
+        if design_document.get('updates', {}).get(UPDATE_HANDLER_NAME) != _UPDATE_HANDLER_FUNCTION:
+            logger.info("Creating update handler in CouchDB database %s/%s ...", self.url, self.database_name)
+            design_document['updates'] = dict(design_document.get('updates', {}),
+                                              **{UPDATE_HANDLER_NAME: _UPDATE_HANDLER_FUNCTION})
+            CouchDBBackend.do_request(url, 'PUT', {'Content-type': 'application/json'},
+                                      json.dumps(design_document).encode('utf-8'))
+        with _revision_store_lock:
+            _update_handler_databases.add("{}/{}".format(self.url, self.database_name))
+
     def get_identifiable_by_couchdb_id(self, couchdb_id: str) -> model.Identifiable:
         """
         Retrieve an AAS object from the CouchDB by its couchdb-ID-string
@@ -290,16 +523,37 @@ class CouchDBObjectStore(model.AbstractObjectStore):
         :raises CouchDBError: If error occur during the request to the CouchDB server
                               (see ``_do_request()`` for details)
         """
-        # Create and issue HTTP request (raises HTTPError on status != 200)
-
+        # If we still have a local replication of that object, which is known to be up to date (see
+        # CouchDBChangesFollower), we can return it without a request
+        url = "{}/{}/{}".format(self.url, self.database_name, urllib.parse.quote(couchdb_id, safe=''))
+        with self._object_cache_lock:
+            cached_obj = self._object_cache.get(couchdb_id)
+        if cached_obj is not None and cached_obj.source != self._generate_source(cached_obj.id):
+            cached_obj = None
+        if cached_obj is not None and is_couchdb_revision_current(url):
+            return cached_obj
+
+        # Create and issue HTTP request (raises HTTPError on status != 200). If we have a local replication, the
+        # document is only transferred, if it has been changed since.
+        revision = get_couchdb_revision(url) if cached_obj is not None else None
         try:
-            data = CouchDBBackend.do_request(
-                "{}/{}/{}".format(self.url, self.database_name, urllib.parse.quote(couchdb_id, safe='')))
+            data = CouchDBBackend.do_request(url, additional_headers=_if_none_match_header(revision))
         except CouchDBServerError as e:
+            if e.code == 304 and cached_obj is not None and revision is not None:
+                set_couchdb_revision(url, revision)
+                return cached_obj
             if e.code == 404:
                 raise KeyError("No Identifiable with couchdb-id {} found in CouchDB database".format(couchdb_id)) from e
             raise
+        return self._identifiable_from_document(couchdb_id, data)
 
+    def _identifiable_from_document(self, couchdb_id: str, data: MutableMapping[str, Any]) -> model.Identifiable:
+        """
+        Get the AAS object from a (deserialized) CouchDB document, stores its revision and merges it into the local
+        replication of the object, if there is one.
+
+        :raises CouchDBResponseError: If the document does not contain an Identifiable
+        """
         # Add CouchDB metadata (for later commits) to object
         obj = data['data']
         if not isinstance(obj, model.Identifiable):
@@ -459,32 +713,301 @@ class CouchDBObjectStore(model.AbstractObjectStore):
         """
         logger.debug("Fetching number of documents from database ...")
         data = CouchDBBackend.do_request("{}/{}".format(self.url, self.database_name))
-        return data['doc_count']
+        # The document count includes design documents (e.g. of the indexes created by `create_indexes()`)
+        design_docs = CouchDBBackend.do_request("{}/{}/_all_docs?{}".format(
+            self.url, self.database_name,
+            urllib.parse.urlencode({'startkey': json.dumps("_design/"), 'endkey': json.dumps("_design0")})))
+        return data['doc_count'] - len(design_docs['rows'])
 
     def __iter__(self) -> Iterator[model.Identifiable]:
         """
         Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the CouchDB database.
 
-        This method returns a lazy iterator, containing only a list of all identifiers in the database and retrieving
-        the identifiable objects on the fly.
+        This method returns a lazy iterator, retrieving the objects in batches via :meth:`~.iter_from`.
 
         :raises CouchDBError: If error occur during fetching the list of objects from the CouchDB server (see
                               ``_do_request()`` for details)
         """
-        # Iterator class storing the list of ids and fetching Identifiable objects on the fly
-        class CouchDBIdentifiableIterator(Iterator[model.Identifiable]):
-            def __init__(self, store: CouchDBObjectStore, ids: Iterable[str]):
-                self._iter = iter(ids)
-                self._store = store
+        logger.debug("Creating iterator over objects in database ...")
+        return self.iter_from()
+
+    def iter_from(self, after: Optional[model.Identifier] = None, batch_size: int = 100) \
+            -> Iterator[model.Identifiable]:
+        """
+        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the CouchDB database, ordered by their
+        document id (i.e. their :class:`~basyx.aas.model.base.Identifier`), starting after the given
+        :class:`~basyx.aas.model.base.Identifier`.
 
-            def __next__(self):
-                next_id = next(self._iter)
-                return self._store.get_identifiable_by_couchdb_id(next_id)
+        The documents are fetched in batches of ``batch_size`` from the ``_all_docs`` view (including the documents),
+        using its ``startkey`` parameter, so the documents preceding the given position are never transferred.
 
-        # Fetch a list of all ids and construct Iterator object
-        logger.debug("Creating iterator over objects in database ...")
-        data = CouchDBBackend.do_request("{}/{}/_all_docs".format(self.url, self.database_name))
-        return CouchDBIdentifiableIterator(self, (row['id'] for row in data['rows']))
+        :param after: The :class:`~basyx.aas.model.base.Identifier` to start after or ``None`` to start at the first
+                      object
+        :param batch_size: Number of documents to fetch per request
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        start_key: Optional[str] = self._transform_id(after, False) if after is not None else None
+        while True:
+            objects, start_key = self._fetch_page(start_key, batch_size)
+            yield from objects
+            if start_key is None:
+                return
+
+    def _fetch_page(self, start_key: Optional[str], batch_size: int) \
+            -> Tuple[List[model.Identifiable], Optional[str]]:
+        """
+        Fetch the objects of up to ``batch_size`` documents following the given document id from the ``_all_docs`` view
+
+        :return: The objects and the document id to start the next page after or ``None``, if this was the last page
+        """
+        query = {"limit": str(batch_size + 1 if start_key is not None else batch_size), "include_docs": "true"}
+        if start_key is not None:
+            query["startkey"] = json.dumps(start_key)
+        data = CouchDBBackend.do_request(
+            "{}/{}/_all_docs?{}".format(self.url, self.database_name, urllib.parse.urlencode(query)))
+        rows = data['rows']
+        objects = [self._identifiable_from_document(row['id'], row['doc'])
+                   for row in rows
+                   if row['id'] != start_key and not row['id'].startswith("_design/")]
+        return objects, (rows[-1]['id'] if len(rows) >= int(query["limit"]) else None)
+
+    def query(self, type_: Type[_QT], id_short: Optional[model.NameType] = None,
+              semantic_id: Optional[model.Reference] = None, global_asset_id: Optional[model.Identifier] = None,
+              specific_asset_ids: Iterable[model.SpecificAssetId] = (), after: Optional[model.Identifier] = None,
+              batch_size: int = 100) -> Iterator[_QT]:
+        """
+        Iterate all objects of the given type in the CouchDB database, which match all of the given criteria, ordered
+        by their document id (like :meth:`~.iter_from`).
+
+        If the type is the only criterion, the objects are iterated via :meth:`~.iter_from` and filtered locally.
+        Otherwise, the criteria are evaluated by the CouchDB server via a Mango query (``_find``), sorted by the
+        document id. If one of the criteria is matched by equality, the query is sorted by this field first, so the
+        CouchDB server can use its compound index (see :meth:`~.create_indexes`). The matching documents are fetched
+        in batches of ``batch_size``, each batch starting after the last document id of the previous one, and yielded
+        as they arrive. See
+        :meth:`basyx.aas.model.provider.AbstractObjectStore.query` for the other parameters.
+
+        :param batch_size: Number of documents to fetch per request
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        specific_asset_ids = list(specific_asset_ids)
+        if id_short is None and semantic_id is None and global_asset_id is None and not specific_asset_ids:
+            for obj in self.iter_from(after, batch_size):
+                if isinstance(obj, type_):
+                    yield obj
+            return
+
+        selector: Dict[str, Any] = {'data.modelType': {'$in': self._model_types(type_)}}
+        if id_short is not None:
+            selector['data.idShort'] = id_short
+        if semantic_id is not None:
+            selector['data.semanticId'] = {'$eq': semantic_id}
+        if global_asset_id is not None:
+            selector['data.assetInformation.globalAssetId'] = global_asset_id
+        if specific_asset_ids:
+            selector['data.assetInformation.specificAssetIds'] = {'$all': specific_asset_ids}
+
+        # All matching documents have the same value of a field matched by equality, so sorting by it keeps the order
+        # of the document ids
+        sort: List[Dict[str, str]] = [{'_id': 'asc'}]
+        for field, value in (('data.idShort', id_short), ('data.assetInformation.globalAssetId', global_asset_id),
+                             ('data.semanticId', semantic_id)):
+            if value is not None:
+                sort.insert(0, {field: 'asc'})
+                break
+
+        start_key: Optional[str] = self._transform_id(after, False) if after is not None else None
+        while True:
+            if start_key is not None:
+                selector['_id'] = {'$gt': start_key}
+            request = {'selector': selector, 'sort': sort, 'limit': batch_size}
+            data = CouchDBBackend.do_request(
+                "{}/{}/_find".format(self.url, self.database_name), 'POST', {'Content-type': 'application/json'},
+                json.dumps(request, cls=json_serialization.AASToJsonEncoder).encode('utf-8'))
+            for doc in data['docs']:
+                obj = self._identifiable_from_document(doc['_id'], doc)
+                # The CouchDB compares the semanticId and specificAssetIds by their JSON representation, so the results
+                # are checked again
+                if isinstance(obj, type_) and self._matches(obj, id_short, semantic_id, global_asset_id,
+                                                            specific_asset_ids):
+                    yield obj
+            if len(data['docs']) < batch_size:
+                return
+            start_key = data['docs'][-1]['_id']
+
+    @staticmethod
+    def _model_types(type_: type) -> List[str]:
+        """
+        Helper method to get the possible ``modelType`` values of the JSON serialization of objects of the given type
+        """
+        for t in inspect.getmro(type_):
+            if t in model.KEY_TYPES_CLASSES:
+                return [t.__name__]
+        return [t.__name__ for t in model.KEY_TYPES_CLASSES if issubclass(t, type_)]
+
+    def add_many(self, objects: Iterable[model.Identifiable], batch_size: int = 1000) -> None:
+        """
+        Add multiple objects to the store, using the ``_bulk_docs`` API of the CouchDB to add ``batch_size`` objects
+        per request
+
+        In contrast to :meth:`~.add`, an object, which cannot be added, does not prevent the others from being added.
+        Instead, the errors of all objects are collected and reported afterwards.
+
+        :raises CouchDBBulkError: If any of the objects could not be added. Its errors are ``KeyErrors`` for objects,
+                                  which exist already in the database.
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        errors: Dict[model.Identifier, Exception] = {}
+        for batch in self._batched(objects, batch_size):
+            logger.debug("Adding %s objects to CouchDB database ...", len(batch))
+            results = self._bulk_docs([{'_id': self._transform_id(x.id, False), 'data': x} for x in batch])
+            for x, result in zip(batch, results):
+                if 'error' in result:
+                    errors[x.id] = KeyError("Identifiable with id {} already exists in CouchDB database".format(x.id)) \
+                        if result['error'] == 'conflict' else self._bulk_error(result)
+                    continue
+                set_couchdb_revision(self._document_url(x.id), result["rev"])
+                with self._object_cache_lock:
+                    self._object_cache[x.id] = x
+                self.generate_source(x)
+        if errors:
+            raise CouchDBBulkError(errors, "{} objects could not be added to the CouchDB database".format(len(errors)))
+
+    def commit_many(self, objects: Iterable[model.Identifiable], batch_size: int = 1000) -> None:
+        """
+        Commit the local changes of multiple objects from this store to the CouchDB database, using the ``_bulk_docs``
+        API of the CouchDB to commit ``batch_size`` objects per request
+
+        This is the bulk equivalent of calling :meth:`~basyx.aas.model.base.Referable.commit` on each of the objects,
+        which must have been retrieved from or added to this store.
+
+        :raises CouchDBBulkError: If any of the objects could not be committed. Its errors are
+                                  :class:`CouchDBConflictErrors <.CouchDBConflictError>` for objects, which have been
+                                  modified in the database concurrently, or for which no revision is known.
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        errors: Dict[model.Identifier, Exception] = {}
+        for batch in self._batched(objects, batch_size):
+            docs: List[Dict[str, Any]] = []
+            committed: List[model.Identifiable] = []
+            for x in batch:
+                rev = get_couchdb_revision(self._document_url(x.id))
+                if rev is None:
+                    errors[x.id] = CouchDBConflictError("No revision found for the object with id {}. Try calling "
+                                                        "`update` on it.".format(x.id))
+                    continue
+                docs.append({'_id': self._transform_id(x.id, False), '_rev': rev, 'data': x})
+                committed.append(x)
+            if not docs:
+                continue
+            logger.debug("Committing %s objects to CouchDB database ...", len(docs))
+            for x, result in zip(committed, self._bulk_docs(docs)):
+                if 'error' in result:
+                    errors[x.id] = self._bulk_conflict_error(x.id, result)
+                    continue
+                set_couchdb_revision(self._document_url(x.id), result["rev"])
+        if errors:
+            raise CouchDBBulkError(errors, "{} objects could not be committed to the CouchDB database"
+                                   .format(len(errors)))
+
+    def discard_many(self, objects: Iterable[model.Identifiable], safe_delete=False, batch_size: int = 1000) -> None:
+        """
+        Delete multiple objects from the CouchDB database, using the ``_bulk_docs`` API of the CouchDB to delete
+        ``batch_size`` objects per request
+
+        :param objects: The objects to be deleted
+        :param safe_delete: If ``True``, only delete the objects, which have not been modified in the database in
+                            comparison to their stored revision (see :meth:`~.discard`). Otherwise, the current
+                            revisions are fetched from the database with a single request per batch.
+        :raises CouchDBBulkError: If any of the objects could not be deleted. Its errors are ``KeyErrors`` for objects,
+                                  which do not exist in the database, and
+                                  :class:`CouchDBConflictErrors <.CouchDBConflictError>` for objects, which have been
+                                  modified in the database (with ``safe_delete``).
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        errors: Dict[model.Identifier, Exception] = {}
+        for batch in self._batched(objects, batch_size):
+            revs: Dict[model.Identifier, Optional[str]]
+            if safe_delete:
+                revs = {x.id: get_couchdb_revision(self._document_url(x.id)) for x in batch}
+            else:
+                logger.debug("fetching the current object revisions for deletion ...")
+                data = CouchDBBackend.do_request(
+                    "{}/{}/_all_docs".format(self.url, self.database_name), 'POST',
+                    {'Content-type': 'application/json'},
+                    json.dumps({'keys': [self._transform_id(x.id, False) for x in batch]}).encode('utf-8'))
+                revs = {row['key']: row['value']['rev'] for row in data['rows']
+                        if 'value' in row and not row['value'].get('deleted')}
+            docs: List[Dict[str, Any]] = []
+            deleted: List[model.Identifiable] = []
+            for x in batch:
+                rev = revs.get(self._transform_id(x.id, False))
+                if rev is None:
+                    errors[x.id] = CouchDBConflictError("No CouchDBRevision found for the object with id {}"
+                                                        .format(x.id)) if safe_delete \
+                        else KeyError("No AAS object with id {} exists in CouchDB database".format(x.id))
+                    continue
+                docs.append({'_id': self._transform_id(x.id, False), '_rev': rev, '_deleted': True})
+                deleted.append(x)
+            if not docs:
+                continue
+            logger.debug("Deleting %s objects from CouchDB database ...", len(docs))
+            for x, result in zip(deleted, self._bulk_docs(docs)):
+                if 'error' in result:
+                    errors[x.id] = self._bulk_conflict_error(x.id, result)
+                    continue
+                delete_couchdb_revision(self._document_url(x.id))
+                with self._object_cache_lock:
+                    self._object_cache.pop(x.id, None)
+                x.source = ""
+        if errors:
+            raise CouchDBBulkError(errors, "{} objects could not be deleted from the CouchDB database"
+                                   .format(len(errors)))
+
+    def _bulk_docs(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create, update or delete multiple documents with a single request to the ``_bulk_docs`` API of the CouchDB
+
+        :return: The result objects of all documents, in the same order as the given documents
+        """
+        data = json.dumps({'docs': docs}, cls=json_serialization.AASToJsonEncoder)
+        return CouchDBBackend.do_request(  # type: ignore[return-value]
+            "{}/{}/_bulk_docs".format(self.url, self.database_name), 'POST', {'Content-type': 'application/json'},
+            data.encode('utf-8'))
+
+    @staticmethod
+    def _bulk_error(result: Dict[str, Any]) -> "CouchDBError":
+        return CouchDBError("Document {} could not be written: {} (reason: {})"
+                            .format(result.get('id'), result['error'], result.get('reason')))
+
+    @classmethod
+    def _bulk_conflict_error(cls, identifier: model.Identifier, result: Dict[str, Any]) -> Exception:
+        if result['error'] == 'conflict':
+            return CouchDBConflictError("Object with id {} has been modified in the database concurrently."
+                                        .format(identifier))
+        elif result['error'] == 'not_found':
+            return KeyError("No AAS object with id {} exists in CouchDB database".format(identifier))
+        return cls._bulk_error(result)
+
+    @staticmethod
+    def _batched(objects: Iterable[model.Identifiable], batch_size: int) -> Iterator[List[model.Identifiable]]:
+        iterator = iter(objects)
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _document_url(self, identifier: model.Identifier) -> str:
+        """
+        Helper method to get the URL of the CouchDB document of an AAS object
+        """
+        return "{}/{}/{}".format(self.url, self.database_name, self._transform_id(identifier))
 
     @staticmethod
     def _transform_id(identifier: model.Identifier, url_quote=True) -> str:
@@ -504,9 +1027,337 @@ class CouchDBObjectStore(model.AbstractObjectStore):
 
         :param identifiable: Identifiable object
         """
+        identifiable.source = self._generate_source(identifiable.id)
+
+    def _generate_source(self, identifier: model.Identifier) -> str:
         source: str = self.url.replace("https://", "couchdbs://").replace("http://", "couchdb://")
-        source += "/" + self.database_name + "/" + self._transform_id(identifiable.id)
-        identifiable.source = source
+        source += "/" + self.database_name + "/" + self._transform_id(identifier)
+        return source
+
+    def follow_changes(self, **kwargs) -> "CouchDBChangesFollower":
+        """
+        Start a :class:`~.CouchDBChangesFollower` for the database of this store
+
+        :param kwargs: Keyword arguments for the :class:`~.CouchDBChangesFollower`
+        :return: The started follower, which should be stopped via :meth:`~.CouchDBChangesFollower.stop`, when it's not
+                 required anymore
+        """
+        follower = CouchDBChangesFollower(self.url, self.database_name, **kwargs)
+        follower.start()
+        return follower
+
+
+class CouchDBChangesFollower:
+    """
+    Follows the ``_changes`` feed of a CouchDB database in a background thread, to record the latest revision of each
+    document.
+
+    As long as the follower is running, :meth:`~basyx.aas.model.base.Referable.update` of an object, whose document has
+    not been changed in the database since the object has been retrieved or committed, does not make any request to the
+    CouchDB server. The same applies to retrieving such an object from a :class:`~.CouchDBObjectStore`, as long as it is
+    still referenced in the application. Changes are reported by the feed with a short delay, so objects may be stale
+    for this time after changes by other clients.
+
+    If the connection to the CouchDB server is lost, all recorded revisions of the database are forgotten, until the
+    feed is followed again.
+
+    :param url: URL to the CouchDB
+    :param database: Name of the Database inside the CouchDB
+    :param timeout: Timeout of the long polling requests to the ``_changes`` feed in seconds. :meth:`~.stop` may block
+                    for this time.
+    :param retry_interval: Time in seconds to wait after a failed request to the ``_changes`` feed, before retrying
+    """
+    def __init__(self, url: str, database: str, timeout: float = 10, retry_interval: float = 5):
+        self.url: str = url
+        self.database_name: str = database
+        self.timeout: float = timeout
+        self.retry_interval: float = retry_interval
+        self._database_url = "{}/{}".format(url, database)
+        self._last_seq: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start following the ``_changes`` feed in a background thread
+
+        :raises CouchDBError: If the current sequence of the database could not be retrieved from the CouchDB server
+        """
+        if self._thread is not None:
+            raise RuntimeError("The CouchDBChangesFollower has already been started")
+        self._start_following()
+        self._thread = threading.Thread(target=self._run, name="CouchDBChangesFollower", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop following the ``_changes`` feed and forget all recorded revisions of the database
+        """
+        self._stop_event.set()
+        self._forget()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _start_following(self) -> None:
+        # The current sequence is retrieved before the database is marked as followed, so no changes of documents
+        # retrieved afterwards can be missed.
+        data = CouchDBBackend.do_request(self._database_url)
+        self._last_seq = data['update_seq']
+        with _revision_store_lock:
+            _followed_databases.add(self._database_url)
+
+    def _forget(self) -> None:
+        with _revision_store_lock:
+            _followed_databases.discard(self._database_url)
+            for url in [url for url in _latest_revision_store if url.rsplit("/", 1)[0] == self._database_url]:
+                del _latest_revision_store[url]
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self._last_seq is None:
+                    self._start_following()
+                query = {'feed': 'longpoll', 'since': self._last_seq, 'timeout': str(int(self.timeout * 1000))}
+                data = CouchDBBackend.do_request(
+                    "{}/_changes?{}".format(self._database_url, urllib.parse.urlencode(query)))
+            except CouchDBError as e:
+                logger.warning("Error while following the _changes feed of %s: %s", self._database_url, e)
+                self._forget()
+                self._last_seq = None
+                self._stop_event.wait(self.retry_interval)
+                continue
+            with _revision_store_lock:
+                if self._stop_event.is_set():
+                    return
+                for row in data['results']:
+                    _latest_revision_store["{}/{}".format(self._database_url,
+                                                          urllib.parse.quote(row['id'], safe=''))] \
+                        = row['changes'][0]['rev']
+            self._last_seq = data['last_seq']
+
+
+# #################################################################################################
+# asyncio variants of the backend and the object store
+
+_RT = TypeVar('_RT')
+
+
+class _ConcurrencyLimiter:
+    """
+    Helper class to run blocking functions in the default executor of the running event loop, with at most ``limit``
+    of them at a time
+
+    The semaphore is created for each event loop, since asyncio primitives are bound to the loop they are used in.
+    """
+    def __init__(self, limit: int):
+        self.limit: int = limit
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] \
+            = weakref.WeakKeyDictionary()
+
+    async def run(self, func: Callable[..., _RT], *args: Any, **kwargs: Any) -> _RT:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        async with semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+
+class AsyncCouchDBBackend:
+    """
+    The asyncio variant of the :class:`~.CouchDBBackend`
+
+    The requests are performed by the :class:`~.CouchDBBackend` in worker threads, with at most
+    :data:`~.DEFAULT_MAX_CONCURRENCY` requests at a time, so the event loop is not blocked while waiting for the
+    CouchDB server. The revisions of the documents are shared with the :class:`~.CouchDBBackend`, so objects may be
+    updated and committed with either of them.
+
+    This backend is not registered for the ``couchdb`` URI schemes, since
+    :meth:`~basyx.aas.model.base.Referable.update` and :meth:`~basyx.aas.model.base.Referable.commit` are synchronous.
+    Instead, its methods are called directly with the object to update or commit.
+    """
+    _limiter = _ConcurrencyLimiter(DEFAULT_MAX_CONCURRENCY)
+
+    @classmethod
+    async def update_object(cls,
+                            updated_object: model.Referable,
+                            store_object: model.Referable,
+                            relative_path: List[str]) -> None:
+        """
+        Update the given object from the CouchDB (see :meth:`.CouchDBBackend.update_object`)
+        """
+        await cls._run(CouchDBBackend.update_object, updated_object, store_object, relative_path)
+
+    @classmethod
+    async def commit_object(cls,
+                            committed_object: model.Referable,
+                            store_object: model.Referable,
+                            relative_path: List[str]) -> None:
+        """
+        Commit the given object to the CouchDB (see :meth:`.CouchDBBackend.commit_object`)
+        """
+        await cls._run(CouchDBBackend.commit_object, committed_object, store_object, relative_path)
+
+    @classmethod
+    async def do_request(cls, url: str, method: str = "GET", additional_headers: Optional[Dict[str, str]] = None,
+                         body: Optional[bytes] = None) -> MutableMapping[str, Any]:
+        """
+        Perform an HTTP(S) request to the CouchDBServer (see :meth:`.CouchDBBackend.do_request`)
+        """
+        return await cls._run(CouchDBBackend.do_request, url, method, additional_headers, body)
+
+    @classmethod
+    async def _run(cls, func: Callable[..., _RT], *args: Any) -> _RT:
+        return await cls._limiter.run(func, *args)
+
+
+class AsyncCouchDBObjectStore:
+    """
+    The asyncio variant of the :class:`~.CouchDBObjectStore`
+
+    All methods are coroutines, which do not block the event loop while waiting for the CouchDB server. Up to
+    ``max_concurrency`` requests of this store are performed concurrently, e.g. by :meth:`~.get_many`, which retrieves
+    multiple objects at once, or by :meth:`~.add_many` and :meth:`~.commit_many`, which send their batches
+    concurrently. Thus, loading many objects is bounded by the number of connections instead of the round trip time
+    per object.
+
+    The store wraps a synchronous :class:`~.CouchDBObjectStore` (:attr:`~.sync_store`), whose requests are performed in
+    worker threads. It can still be used by synchronous code and shares the local replications of the objects with this
+    store, so both of them return the *same* objects.
+
+    :param url: URL to the CouchDB
+    :param database: Name of the Database inside the CouchDB
+    :param max_concurrency: Maximum number of concurrent requests of this store
+    :ivar sync_store: The synchronous :class:`~.CouchDBObjectStore` of the same database
+    """
+    def __init__(self, url: str, database: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.sync_store: CouchDBObjectStore = CouchDBObjectStore(url, database)
+        self._limiter = _ConcurrencyLimiter(max_concurrency)
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._limiter.limit
+
+    async def check_database(self, create=False) -> None:
+        """
+        Check if the database exists and created it if not (see :meth:`.CouchDBObjectStore.check_database`)
+        """
+        await self._limiter.run(self.sync_store.check_database, create)
+
+    async def get_identifiable(self, identifier: model.Identifier) -> model.Identifiable:
+        """
+        Retrieve an AAS object from the CouchDB by its :class:`~basyx.aas.model.base.Identifier`
+
+        :raises KeyError: If no such object is stored in the database
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        return await self._limiter.run(self.sync_store.get_identifiable, identifier)
+
+    async def get(self, identifier: model.Identifier, default: Optional[model.Identifiable] = None) \
+            -> Optional[model.Identifiable]:
+        """
+        Retrieve an AAS object from the CouchDB by its :class:`~basyx.aas.model.base.Identifier` or return ``default``,
+        if no such object is stored in the database
+        """
+        try:
+            return await self.get_identifiable(identifier)
+        except KeyError:
+            return default
+
+    async def get_many(self, identifiers: Iterable[model.Identifier]) -> List[model.Identifiable]:
+        """
+        Retrieve multiple AAS objects from the CouchDB concurrently
+
+        :return: The objects in the order of the given :class:`Identifiers <basyx.aas.model.base.Identifier>`
+        :raises KeyError: If any of the objects is not stored in the database
+        :raises CouchDBError: If error occur during the requests to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        return list(await asyncio.gather(*(self.get_identifiable(identifier) for identifier in identifiers)))
+
+    async def add(self, x: model.Identifiable) -> None:
+        """
+        Add an object to the store (see :meth:`.CouchDBObjectStore.add`)
+        """
+        await self._limiter.run(self.sync_store.add, x)
+
+    async def discard(self, x: model.Identifiable, safe_delete=False) -> None:
+        """
+        Delete an object from the CouchDB database (see :meth:`.CouchDBObjectStore.discard`)
+        """
+        await self._limiter.run(self.sync_store.discard, x, safe_delete)
+
+    async def contains(self, x: object) -> bool:
+        """
+        Check if an object is contained in the CouchDB database (see :meth:`.CouchDBObjectStore.__contains__`)
+        """
+        return await self._limiter.run(self.sync_store.__contains__, x)
+
+    async def count(self) -> int:
+        """
+        Retrieve the number of objects in the CouchDB database (see :meth:`.CouchDBObjectStore.__len__`)
+        """
+        return await self._limiter.run(self.sync_store.__len__)
+
+    async def add_many(self, objects: Iterable[model.Identifiable], batch_size: int = 1000) -> None:
+        """
+        Add multiple objects to the store, sending the batches concurrently (see :meth:`.CouchDBObjectStore.add_many`)
+
+        :raises CouchDBBulkError: If any of the objects could not be added
+        """
+        await self._bulk(self.sync_store.add_many, objects, batch_size, "added to")
+
+    async def commit_many(self, objects: Iterable[model.Identifiable], batch_size: int = 1000) -> None:
+        """
+        Commit the local changes of multiple objects to the CouchDB database, sending the batches concurrently (see
+        :meth:`.CouchDBObjectStore.commit_many`)
+
+        :raises CouchDBBulkError: If any of the objects could not be committed
+        """
+        await self._bulk(self.sync_store.commit_many, objects, batch_size, "committed to")
+
+    async def _bulk(self, func: Callable[[List[model.Identifiable], int], None], objects: Iterable[model.Identifiable],
+                    batch_size: int, action: str) -> None:
+        results = await asyncio.gather(*(self._limiter.run(func, batch, batch_size)
+                                         for batch in CouchDBObjectStore._batched(objects, batch_size)),
+                                       return_exceptions=True)
+        errors: Dict[model.Identifier, Exception] = {}
+        for result in results:
+            if isinstance(result, CouchDBBulkError):
+                errors.update(result.errors)
+            elif isinstance(result, BaseException):
+                raise result
+        if errors:
+            raise CouchDBBulkError(errors, "{} objects could not be {} the CouchDB database"
+                                   .format(len(errors), action))
+
+    def __aiter__(self) -> AsyncIterator[model.Identifiable]:
+        return self.iter_from()
+
+    async def iter_from(self, after: Optional[model.Identifier] = None, batch_size: int = 100) \
+            -> AsyncIterator[model.Identifiable]:
+        """
+        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the CouchDB database, ordered by their
+        document id, starting after the given :class:`~basyx.aas.model.base.Identifier` (see
+        :meth:`.CouchDBObjectStore.iter_from`)
+
+        The next batch of documents is fetched, while the objects of the current batch are consumed.
+        """
+        start_key: Optional[str] = CouchDBObjectStore._transform_id(after, False) if after is not None else None
+        next_page = asyncio.ensure_future(self._limiter.run(self.sync_store._fetch_page, start_key, batch_size))
+        try:
+            while True:
+                objects, start_key = await next_page
+                if start_key is not None:
+                    next_page = asyncio.ensure_future(
+                        self._limiter.run(self.sync_store._fetch_page, start_key, batch_size))
+                for obj in objects:
+                    yield obj
+                if start_key is None:
+                    return
+        finally:
+            next_page.cancel()
 
 
 # #################################################################################################
@@ -544,3 +1395,15 @@ class CouchDBServerError(CouchDBError):
 class CouchDBConflictError(CouchDBError):
     """Exception raised when an object could not be committed due to a concurrent modification in the database"""
     pass
+
+
+class CouchDBBulkError(CouchDBError):
+    """
+    Exception raised when some objects of a bulk operation could not be processed
+
+    :ivar errors: The errors of the objects, which could not be processed, by their
+                  :class:`~basyx.aas.model.base.Identifier`
+    """
+    def __init__(self, errors: Dict[model.Identifier, Exception], *args):
+        super().__init__(*args)
+        self.errors = errors
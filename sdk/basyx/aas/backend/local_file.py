@@ -11,14 +11,26 @@ in local files.
 The :class:`~.LocalFileBackend` takes care of updating and committing objects from and to the files, while the
 :class:`~LocalFileObjectStore` handles adding, deleting and otherwise managing the AAS objects in a specific Directory.
 """
-from typing import List, Iterator, Iterable, Union
+from typing import Any, cast, Dict, IO, List, Iterator, Iterable, NamedTuple, Optional, Set, Tuple, Type, TypeVar, Union
+import contextlib
+import functools
 import logging
 import json
 import os
+import bisect
+import gzip
 import hashlib
+import io
+import lzma
 import threading
+import uuid
 import weakref
 
+try:
+    import fcntl
+except ImportError:  # e.g. on Windows: No inter-process locking
+    fcntl = None  # type: ignore
+
 from . import backends
 from ..adapter.json import json_serialization, json_deserialization
 from basyx.aas import model
@@ -26,6 +38,10 @@ from basyx.aas import model
 
 logger = logging.getLogger(__name__)
 
+# An entry of the synced objects of the LocalFileBackend: The stat of the document, a weak reference to the object and
+# the `commit_version` of the object, if it has been read from the document
+_SyncedObject = Tuple[Tuple[int, int, int], "weakref.ReferenceType[model.Identifiable]", Optional[int]]
+
 
 class LocalFileBackend(backends.Backend):
     """
@@ -33,7 +49,68 @@ class LocalFileBackend(backends.Backend):
     Each document's id is build from the object's identifier using a SHA256 sum of its identifiable; the document's
     contents comprise a single property ``data``, containing the JSON serialization of the BaSyx Python SDK object. The
     :ref:`adapter.json <adapter.json.__init__>` package is used for serialization and deserialization of objects.
+
+    When a single element within an Identifiable is committed, only the element is serialized and appended to a patch
+    journal next to the document (``<hash>.journal``), which is applied when the document is read. Each change is
+    appended by a single write and synced to disk, so a crash leaves at most an incomplete last line, which is discarded
+    when reading the journal. As soon as the journal contains :attr:`~.COMPACT_JOURNAL_ENTRIES` changes or becomes
+    larger than :attr:`~.COMPACT_JOURNAL_RATIO` times the document, the journal is compacted, i.e. merged into the
+    document. Committing the whole Identifiable rewrites the document and discards the journal.
+
+    Documents are always written atomically, i.e. to a temporary file, which replaces the document afterwards. The file
+    name suffix of a document determines its compression (see :data:`~.DOCUMENT_SUFFIXES`). Documents in directories,
+    which have been registered via :meth:`~.set_compact`, are written without any whitespace.
+
+    Directories can have a sharded layout (see :meth:`~.set_sharding`), where documents are placed in subdirectories
+    named by the prefixes of their hash (e.g. ``ab/cd/<hash>.json``). If a document is not found at the file name given
+    by the ``source`` of an object (e.g. since the directory has been migrated to another layout in the meantime), the
+    backend looks it up according to the layout of its directory (see :meth:`~.resolve_file_name`).
+
+    The backend records, which objects are in sync with their documents (see :meth:`~.set_synced`), identified by the
+    modification time and size of the document (and its journal). This allows the :class:`~.LocalFileObjectStore` to
+    return such objects without reading their documents again. Updating an object, which has been read from its
+    document and not been committed since, returns early, if the document has not been changed. Thus, other local
+    changes of such an object are only discarded by an update, once the document has been changed.
+
+    All changes of documents are done while holding an exclusive advisory lock (``fcntl.flock()``) on the file
+    ``.lock`` of the directory, documents are read while holding a shared lock (see :meth:`~.lock`). So multiple
+    processes (e.g. the workers of a WSGI server) can safely use the same directory. Each change is recorded in the
+    cross-process change journal of the directory (see :class:`~._ChangeLog`).
     """
+    LOCK_FILE_NAME = ".lock"
+    #: The maximum number of changes in a patch journal, before it is compacted
+    COMPACT_JOURNAL_ENTRIES = 32
+    #: The maximum size of a patch journal relative to the size of its document, before it is compacted
+    COMPACT_JOURNAL_RATIO = 0.25
+
+    # Cache of the elements in the stored documents (including their journals) for checking if a delta commit of an
+    # element is possible without reading the document. It maps the (absolute) directory paths and the hashes of the
+    # documents (see `_cache_key()`) to the (modification time, size) of the document and the size of the journal, for
+    # which the entry is valid, the relative paths of the elements to their modelType and the number of changes in the
+    # journal.
+    _element_paths: Dict[str, Dict[str, Tuple[Tuple[int, int, int], Dict[Tuple[str, ...], str], int]]] = {}
+    # The lock for the caches and the registry of directory locks within this process. It is only held briefly and never
+    # while acquiring the lock of a directory (see `lock()`).
+    _journal_lock = threading.RLock()
+    # The locks of the directories in this process by their (absolute) path
+    _directory_locks: Dict[str, "_DirectoryLock"] = {}
+    # The objects, which are known to be in sync with the stored documents (parse cache), mapping the (absolute)
+    # directory paths and the hashes of the documents (see `_cache_key()`) to the stat (see `_file_sizes()`) of the
+    # document, a weak reference to the object and the `commit_version` of the object, if it has been read from the
+    # document (or `None`, if it has been committed to it), when the document had this stat. The entries are removed,
+    # when the objects are garbage collected.
+    _synced_objects: Dict[str, Dict[str, _SyncedObject]] = {}
+    # The (absolute) paths of the directories, whose documents are written in compact form
+    _compact_directories: Set[str] = set()
+    # The (absolute) paths of the directories with a sharded layout, mapped to the number of levels of subdirectories
+    # and the number of hash characters per level
+    _sharded_directories: Dict[str, Tuple[int, int]] = {}
+    # The suffixes of the documents in the (absolute) directory paths, for which all documents are known (see
+    # `_note_documents()`), so `find_file_name()` does not need to try the others
+    _document_suffixes: Dict[str, Set[str]] = {}
+    # The (absolute) paths of the directories of `_document_suffixes`, which contain documents not placed according to
+    # their layout, i.e. a migration of their layout is pending (see `LocalFileObjectStore.migrate_layout()`)
+    _pending_migrations: Set[str] = set()
 
     @classmethod
     def update_object(cls,
@@ -44,11 +121,15 @@ class LocalFileBackend(backends.Backend):
         if not isinstance(store_object, model.Identifiable):
             raise FileBackendSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                          "in the FileBackend")
-        file_name: str = store_object.source.replace("file://localhost/", "")
-        with open(file_name, "r") as file:
-            data = json.load(file, cls=json_deserialization.AASFromJsonDecoder)
-            updated_store_object = data["data"]
-            store_object.update_from(updated_store_object)
+        file_name = cls._resolve_source(store_object)
+        stat = cls._file_sizes(file_name)
+        if cls.is_synced(file_name, store_object, stat, read=True):
+            # Neither the document nor (by a commit) the object have been changed since the object has been read
+            return
+        data = cls.load_document(file_name)
+        updated_store_object = data["data"]
+        store_object.update_from(updated_store_object)
+        cls.set_synced(file_name, store_object, stat, read=True)
 
     @classmethod
     def commit_object(cls,
@@ -58,26 +139,1100 @@ class LocalFileBackend(backends.Backend):
         if not isinstance(store_object, model.Identifiable):
             raise FileBackendSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                          "in the FileBackend")
+        file_name = cls._resolve_source(store_object)
+        with cls.lock(cls.directory_of(file_name)):
+            # Elements of SubmodelElementLists can't be addressed, so the nearest addressable ancestor is committed
+            path, element = backends.find_addressable_element(store_object, relative_path)
+            if path and cls._commit_delta(file_name, element, path):
+                _Manifest.update_stat(file_name, cls._file_sizes(file_name))
+                cls._update_synced(file_name, store_object)
+            else:
+                _write_document(file_name, {'data': store_object}, cls.is_compact(file_name),
+                                json_serialization.AASToJsonEncoder)
+                cls.discard_journal(file_name)
+                stat = cls._file_sizes(file_name)
+                _Manifest.put(file_name, _ManifestEntry.from_identifiable(store_object, stat))
+                cls.set_synced(file_name, store_object, stat)
+            _ChangeLog.record(file_name)
+
+    @classmethod
+    def get_revision(cls, store_object: model.Referable) -> Optional[str]:
+        """
+        Get the stat of the object's document (see :meth:`~.set_synced`), when the object has been read from or
+        committed to it, or ``None``, if the object is not known to be in sync with its document
+        """
+        if not isinstance(store_object, model.Identifiable):
+            return None
+        directory_path, hash_ = cls._cache_key(store_object.source.replace("file://localhost/", ""))
+        with cls._journal_lock:
+            synced = cls._synced_objects.get(directory_path, {}).get(hash_)
+            if synced is None or synced[1]() is not store_object:
+                return None
+            return "{}-{}-{}".format(*synced[0])
+
+    @classmethod
+    @contextlib.contextmanager
+    def lock(cls, directory_path: str, shared: bool = False) -> Iterator[None]:
+        """
+        Acquire the lock of the given directory for this thread and an advisory lock on the file ``.lock`` of the
+        directory for this process, to exclude other threads and processes from changing (or, if not shared, from
+        reading) the stored documents in the meantime.
+
+        The lock is reentrant. A nested exclusive lock converts a shared lock into an exclusive lock (not atomically,
+        i.e. other threads and processes may acquire the exclusive lock in between). Without ``fcntl`` (e.g. on
+        Windows), only the lock for the threads of this process is acquired.
+
+        :param directory_path: The path of the directory
+        :param shared: If ``True``, a shared lock (for reading) is acquired instead of an exclusive lock
+        """
+        directory_path = os.path.abspath(directory_path)
+        with cls._journal_lock:
+            directory_lock = cls._directory_locks.get(directory_path)
+            # Lock files are reopened in forked processes, since the locks are shared with the parent process otherwise
+            if directory_lock is None or directory_lock.pid != os.getpid():
+                directory_lock = _DirectoryLock(os.path.join(directory_path, cls.LOCK_FILE_NAME))
+                cls._directory_locks[directory_path] = directory_lock
+        directory_lock.acquire(shared)
+        try:
+            yield
+        finally:
+            directory_lock.release()
+
+    @classmethod
+    def set_compact(cls, directory_path: str, compact: bool = True) -> None:
+        """
+        Set, if the documents in the given directory are written in compact form, i.e. without any whitespace, or
+        indented (the default)
+
+        :param directory_path: The path of the directory
+        :param compact: If ``True``, documents are written in compact form
+        """
+        if compact:
+            cls._compact_directories.add(os.path.abspath(directory_path))
+        else:
+            cls._compact_directories.discard(os.path.abspath(directory_path))
+
+    @classmethod
+    def is_compact(cls, file_name: str) -> bool:
+        """
+        Check if the given document is to be written in compact form (see :meth:`~.set_compact`)
+        """
+        return cls.directory_of(file_name) in cls._compact_directories
+
+    @classmethod
+    def set_sharding(cls, directory_path: str, levels: int, width: int = 2) -> None:
+        """
+        Set the layout of the given directory: Documents are either placed directly in the directory (``levels=0``) or
+        in ``levels`` levels of subdirectories, named by the next ``width`` characters of the document's hash each.
+
+        :param directory_path: The path of the directory
+        :param levels: The number of levels of subdirectories
+        :param width: The number of hash characters per level
+        :raises ValueError: If the levels or width are out of range
+        """
+        if levels < 0 or width < 1 or levels * width > 32:
+            raise ValueError("Invalid sharding of {} levels of width {}".format(levels, width))
+        if cls._sharded_directories.get(os.path.abspath(directory_path)) != ((levels, width) if levels else None):
+            # The places of the documents need to be checked again
+            cls._document_suffixes.pop(os.path.abspath(directory_path), None)
+        if levels:
+            cls._sharded_directories[os.path.abspath(directory_path)] = (levels, width)
+        else:
+            cls._sharded_directories.pop(os.path.abspath(directory_path), None)
+
+    @classmethod
+    def directory_of(cls, file_name: str) -> str:
+        """
+        Get the (absolute) path of the directory, which a document belongs to, i.e. the nearest sharded directory (see
+        :meth:`~.set_sharding`) containing the document or the directory of the document's file otherwise
+        """
+        directory_path = os.path.dirname(os.path.abspath(file_name))
+        candidate = directory_path
+        for _ in range(max((levels for levels, _width in cls._sharded_directories.values()), default=0)):
+            if candidate in cls._sharded_directories:
+                return candidate
+            candidate = os.path.dirname(candidate)
+        return candidate if candidate in cls._sharded_directories else directory_path
+
+    @classmethod
+    def document_file_name(cls, directory_path: str, hash_: str, suffix: str = ".json") -> str:
+        """
+        Get the file name of a document according to the layout of its directory
+
+        :param directory_path: The path of the directory
+        :param hash_: The hash of the document's :class:`~basyx.aas.model.base.Identifier`
+        :param suffix: The file name suffix of the document (see :data:`~.DOCUMENT_SUFFIXES`)
+        """
+        levels, width = cls._sharded_directories.get(os.path.abspath(directory_path), (0, 0))
+        return os.path.join(directory_path, *(hash_[i * width:(i + 1) * width] for i in range(levels)),
+                            hash_ + suffix)
+
+    @classmethod
+    def find_file_name(cls, directory_path: str, hash_: str, suffix: str = ".json") -> Optional[str]:
+        """
+        Find the file of a stored document in the given directory, trying the given suffix according to the layout of
+        the directory first, then other suffixes and finally the flat layout (e.g. for documents, which have not been
+        migrated yet, see :meth:`~.LocalFileObjectStore.migrate_layout`)
+
+        Once all documents of the directory are known (i.e. its manifest has been loaded), only the suffixes of the
+        existing documents are tried and the flat layout only while a migration is pending. Thus, usually only a single
+        file name is checked.
+
+        :return: The file name or ``None``, if there is no such document
+        """
+        known_suffixes = cls._document_suffixes.get(os.path.abspath(directory_path))
+        if known_suffixes is None:
+            return cls._search_file_name(directory_path, hash_, suffix)
+        suffixes = [suffix] + [s for s in DOCUMENT_SUFFIXES if s != suffix and s in known_suffixes]
+        candidates = [cls.document_file_name(directory_path, hash_, s) for s in suffixes]
+        if os.path.abspath(directory_path) in cls._pending_migrations:
+            candidates.extend(os.path.join(directory_path, hash_ + s) for s in suffixes)
+        for file_name in candidates:
+            if os.path.exists(file_name):
+                return file_name
+        return None
+
+    @classmethod
+    def _search_file_name(cls, directory_path: str, hash_: str, suffix: str = ".json") -> Optional[str]:
+        """
+        Find the file of a stored document like :meth:`~.find_file_name`, but trying all suffixes and the flat layout,
+        e.g. for documents, which may have been written by other processes
+        """
+        suffixes = [suffix] + [s for s in DOCUMENT_SUFFIXES if s != suffix]
+        candidates = [cls.document_file_name(directory_path, hash_, s) for s in suffixes]
+        if os.path.abspath(directory_path) in cls._sharded_directories:
+            candidates.extend(os.path.join(directory_path, hash_ + s) for s in suffixes)
+        for file_name in candidates:
+            if os.path.exists(file_name):
+                cls._note_document(file_name)
+                return file_name
+        return None
+
+    @classmethod
+    def _note_documents(cls, directory_path: str, file_names: Iterable[str]) -> None:
+        """
+        Remember the suffixes of all documents of the given directory and whether any of them is not placed according
+        to the layout of the directory for :meth:`~.find_file_name`
+        """
+        directory_path = os.path.abspath(directory_path)
+        suffixes: Set[str] = set()
+        pending_migration = False
+        for file_name in file_names:
+            suffix, placed = cls._document_place(directory_path, file_name)
+            suffixes.add(suffix)
+            pending_migration = pending_migration or not placed
+        if pending_migration:
+            cls._pending_migrations.add(directory_path)
+        else:
+            cls._pending_migrations.discard(directory_path)
+        cls._document_suffixes[directory_path] = suffixes
+
+    @classmethod
+    def _note_document(cls, file_name: str) -> None:
+        """
+        Remember the suffix and the place of a new or changed document, if all documents of its directory are known
+        """
+        directory_path = cls.directory_of(file_name)
+        suffixes = cls._document_suffixes.get(directory_path)
+        if suffixes is None:
+            return
+        suffix, placed = cls._document_place(directory_path, file_name)
+        if not placed:
+            cls._pending_migrations.add(directory_path)
+        suffixes.add(suffix)
+
+    @classmethod
+    def _document_place(cls, directory_path: str, file_name: str) -> Tuple[str, bool]:
+        """
+        Get the suffix of a document and whether it is placed according to the layout of its directory
+        """
+        document_name = _split_document_name(os.path.basename(file_name))
+        assert document_name is not None
+        target_file_name = cls.document_file_name(directory_path, *document_name)
+        return document_name[1], os.path.abspath(file_name) == os.path.abspath(target_file_name)
+
+    @classmethod
+    def resolve_file_name(cls, file_name: str) -> str:
+        """
+        Resolve the file name of a stored document, which may have been moved to another place according to the layout
+        of its directory in the meantime
+
+        :return: The actual file name of the document or the given file name, if the document can't be found
+        """
+        if os.path.exists(file_name):
+            return file_name
+        name = os.path.basename(file_name)
+        document_name = _split_document_name(name)
+        if document_name is None:
+            return file_name
+        directory_path = cls.directory_of(file_name)
+        if not file_name.startswith("/"):
+            directory_path = os.path.relpath(directory_path)
+        return cls.find_file_name(directory_path, *document_name) or file_name
+
+    @classmethod
+    def _resolve_source(cls, store_object: model.Identifiable) -> str:
+        """
+        Get the file name of an object's document from its source and update the source, if the document has been
+        moved
+        """
         file_name: str = store_object.source.replace("file://localhost/", "")
-        with open(file_name, "w") as file:
-            json.dump({'data': store_object}, file, cls=json_serialization.AASToJsonEncoder, indent=4)
+        resolved_file_name = cls.resolve_file_name(file_name)
+        if resolved_file_name != file_name:
+            store_object.source = "file://localhost/" + resolved_file_name
+        return resolved_file_name
+
+    @classmethod
+    def is_synced(cls, file_name: str, obj: model.Identifiable, stat: Tuple[int, int, int], read: bool = False) \
+            -> bool:
+        """
+        Check if the given object is known to be in sync with the stored document of the given stat (see
+        :meth:`~.set_synced`), such that it does not need to be read and decoded again
+
+        :param read: If ``True``, the object must have been read from the document and must not have been committed
+                     since (i.e. its ``commit_version`` is unchanged)
+        """
+        directory_path, hash_ = cls._cache_key(file_name)
+        with cls._journal_lock:
+            synced = cls._synced_objects.get(directory_path, {}).get(hash_)
+            return synced is not None and synced[0] == stat and synced[1]() is obj \
+                and (not read or synced[2] == obj.commit_version)
+
+    @classmethod
+    def set_synced(cls, file_name: str, obj: model.Identifiable, stat: Tuple[int, int, int], read: bool = False) \
+            -> None:
+        """
+        Record, that the given object has been read from or committed to the stored document, when it had the given
+        stat
+
+        :param read: ``True``, if the object has been read from the document, ``False``, if it has been committed to it
+        """
+        directory_path, hash_ = cls._cache_key(file_name)
+        with cls._journal_lock:
+            synced_objects = cls._synced_objects.setdefault(directory_path, {})
+            synced_objects[hash_] = (stat, weakref.ref(obj, functools.partial(_forget_synced, synced_objects, hash_)),
+                                     obj.commit_version if read else None)
+
+    @classmethod
+    def _update_synced(cls, file_name: str, obj: model.Identifiable) -> None:
+        """
+        Record the new stat of a stored document after a delta commit of an element of the given object, if the object
+        has been in sync with the document before
+        """
+        directory_path, hash_ = cls._cache_key(file_name)
+        with cls._journal_lock:
+            synced_objects = cls._synced_objects.get(directory_path, {})
+            synced = synced_objects.get(hash_)
+            if synced is not None and synced[1]() is obj:
+                synced_objects[hash_] = (cls._file_sizes(file_name), synced[1], synced[2])
+
+    @classmethod
+    def load_document(cls, file_name: str) -> Dict[str, Any]:
+        """
+        Read a stored document, apply the changes from its patch journal (if any) and deserialize it
+
+        :param file_name: The file name of the document
+        :return: The deserialized document, containing the Identifiable in its ``data`` property
+        :raises FileNotFoundError: If there is no such document
+        """
+        with cls.lock(cls.directory_of(file_name), shared=True):
+            if not os.path.exists(cls._journal_file_name(file_name)):
+                with _open_document(file_name) as file:
+                    return json.load(file, cls=json_deserialization.AASFromJsonDecoder)
+            data = cls._load_raw_document(file_name)
+        return _decode_json(data)
+
+    @classmethod
+    def compact(cls, file_name: str) -> None:
+        """
+        Merge the patch journal of a stored document (if any) into the document
+
+        :param file_name: The file name of the document
+        """
+        with cls.lock(cls.directory_of(file_name)):
+            if not os.path.exists(cls._journal_file_name(file_name)):
+                return
+            logger.debug("Compacting patch journal of %s ...", file_name)
+            data = cls._load_raw_document(file_name)
+            _write_document(file_name, data, cls.is_compact(file_name))
+            os.remove(cls._journal_file_name(file_name))
+
+    @classmethod
+    def discard_journal(cls, file_name: str) -> None:
+        """
+        Delete the patch journal of a stored document (if any), e.g. after the document has been rewritten or deleted
+
+        :param file_name: The file name of the document
+        """
+        directory_path, hash_ = cls._cache_key(file_name)
+        with cls._journal_lock:
+            cls._element_paths.get(directory_path, {}).pop(hash_, None)
+            cls._synced_objects.get(directory_path, {}).pop(hash_, None)
+            try:
+                os.remove(cls._journal_file_name(file_name))
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def _commit_delta(cls, file_name: str, committed_object: model.Referable, relative_path: List[str]) -> bool:
+        """
+        Append the JSON serialization of a committed element to the patch journal of a document
+
+        An element, which is not contained in the document (e.g. since it has been added or its ``id_short`` has been
+        changed since), is committed with its nearest ancestor, which is contained in the document.
+
+        :return: ``False``, if the element can't be committed separately, because none of its ancestors (except the
+                 Identifiable) is contained in the document
+        """
+        path = tuple(relative_path)
+        with cls.lock(cls.directory_of(file_name)):
+            if not os.path.exists(file_name):
+                return False
+            element_paths, journal_entries = cls._get_element_paths(file_name)
+            while path not in element_paths:
+                path = path[:-1]
+                if not path:
+                    return False
+                committed_object = cast(model.Referable, committed_object.parent)
+            element = json.loads(json.dumps(committed_object, cls=json_serialization.AASToJsonEncoder))
+            _append_line(cls._journal_file_name(file_name),
+                         json.dumps({"path": list(path), "data": element}, separators=(",", ":")))
+            journal_entries += 1
+            for old_path in [p for p in element_paths if p[:len(path)] == path]:
+                del element_paths[old_path]
+            element_paths.update((p, e.get("modelType", "")) for p, e in backends.iter_json_elements(element, path))
+            if journal_entries >= cls.COMPACT_JOURNAL_ENTRIES or os.path.getsize(cls._journal_file_name(file_name)) \
+                    > os.path.getsize(file_name) * cls.COMPACT_JOURNAL_RATIO:
+                cls.compact(file_name)
+                journal_entries = 0
+            sizes = cls._file_sizes(file_name)
+            directory_path, hash_ = cls._cache_key(file_name)
+            with cls._journal_lock:
+                cls._element_paths.setdefault(directory_path, {})[hash_] = (sizes, element_paths, journal_entries)
+        return True
+
+    @classmethod
+    def _get_element_paths(cls, file_name: str) -> Tuple[Dict[Tuple[str, ...], str], int]:
+        """
+        Get the relative paths of the elements in a stored document (including its journal) mapped to their modelType
+        and the number of changes in its journal
+        """
+        sizes = cls._file_sizes(file_name)
+        directory_path, hash_ = cls._cache_key(file_name)
+        cached = cls._element_paths.get(directory_path, {}).get(hash_)
+        if cached is not None and cached[0] == sizes:
+            return cached[1], cached[2]
+        data = cls._load_raw_document(file_name)["data"]
+        journal_entries = 0
+        if sizes[2]:
+            with open(cls._journal_file_name(file_name), "rb") as journal:
+                journal_entries = sum(1 for line in journal if line.strip())
+        return {path: element.get("modelType", "") for path, element in backends.iter_json_elements(data)}, \
+            journal_entries
+
+    @classmethod
+    def _load_raw_document(cls, file_name: str) -> Dict[str, Any]:
+        """
+        Read a stored document as JSON data and apply the changes from its patch journal (if any)
+
+        An incomplete last line of the journal (i.e. a partially written change) is removed from the journal.
+        """
+        with _open_document(file_name) as file:
+            data = json.load(file)
+        journal_file_name = cls._journal_file_name(file_name)
+        offset = 0
+        try:
+            with open(journal_file_name, "rb") as journal:
+                for line in journal:
+                    if not line.endswith(b"\n"):
+                        logger.warning("Discarding incomplete change at the end of %s", journal_file_name)
+                        break
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if not backends.set_json_element(data["data"], entry["path"], entry["data"]):
+                        logger.warning("Could not apply change of %s from the patch journal of %s",
+                                       "/".join(entry["path"]), file_name)
+                else:
+                    return data
+        except FileNotFoundError:
+            return data
+        try:
+            os.truncate(journal_file_name, offset)
+        except OSError as e:
+            # e.g. in a read-only directory: The incomplete change is discarded again the next time
+            logger.debug("Could not truncate %s: %s", journal_file_name, e)
+        return data
+
+    @classmethod
+    def _cache_key(cls, file_name: str) -> Tuple[str, str]:
+        """
+        Get the keys of a stored document in the caches of the backend: The (absolute) path of its directory and its
+        hash
+        """
+        return cls.directory_of(file_name), _document_hash(file_name)
+
+    @staticmethod
+    def _journal_file_name(file_name: str) -> str:
+        return os.path.join(os.path.dirname(file_name), _document_hash(file_name) + ".journal")
+
+    @classmethod
+    def _file_sizes(cls, file_name: str) -> Tuple[int, int, int]:
+        """
+        Get the modification time and size of a stored document and the size of its patch journal
+
+        :raises FileNotFoundError: If there is no such document
+        """
+        stat = os.stat(file_name)
+        try:
+            journal_size = os.path.getsize(cls._journal_file_name(file_name))
+        except FileNotFoundError:
+            journal_size = 0
+        return stat.st_mtime_ns, stat.st_size, journal_size
+
+
+class _DirectoryLock:
+    """
+    The lock of a directory of the :class:`~.LocalFileBackend` in a process: A reentrant readers-writer lock for the
+    threads of the process and the ``flock()`` lock on the lock file of the directory, which excludes other processes.
+    The process holds the ``flock()`` lock in the mode of the strongest lock held by any of its threads. If the lock
+    file can't be created (e.g. in a read-only directory), only the threads of the process are excluded.
+    """
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.file: Optional[IO[str]] = None
+        self.mode: Optional[int] = None
+        self.pid = os.getpid()
+        self.lock_free = False
+        self._condition = threading.Condition(threading.Lock())
+        # The number of nested shared locks of the threads holding a shared lock
+        self._readers: Dict[int, int] = {}
+        # The thread holding the exclusive lock, the number of its nested locks and of the shared locks it has held
+        # before acquiring the exclusive lock
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writer_readers = 0
+
+    def acquire(self, shared: bool) -> None:
+        thread = threading.get_ident()
+        with self._condition:
+            if self._writer == thread:
+                self._writer_depth += 1
+                return
+            if shared:
+                if thread not in self._readers:
+                    while self._writer is not None:
+                        self._condition.wait()
+                    if self.mode is None:
+                        self._flock(fcntl.LOCK_SH if fcntl is not None else None)
+                self._readers[thread] = self._readers.get(thread, 0) + 1
+                return
+            own_readers = self._readers.pop(thread, 0)
+            if own_readers and not self._readers:
+                self._condition.notify_all()
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._flock(fcntl.LOCK_EX if fcntl is not None else None)
+            self._writer = thread
+            self._writer_depth = 1
+            self._writer_readers = own_readers
+
+    def release(self) -> None:
+        thread = threading.get_ident()
+        with self._condition:
+            if self._writer == thread:
+                self._writer_depth -= 1
+                if self._writer_depth:
+                    return
+                self._writer = None
+                if self._writer_readers:
+                    self._readers[thread] = self._writer_readers
+            else:
+                self._readers[thread] -= 1
+                if self._readers[thread]:
+                    return
+                del self._readers[thread]
+            if self._writer is None:
+                if self._readers:
+                    self._flock(fcntl.LOCK_SH if fcntl is not None else None)
+                else:
+                    self._flock(None)
+                self._condition.notify_all()
+
+    def _flock(self, mode: Optional[int]) -> None:
+        """
+        Change the mode of the ``flock()`` lock of the process, (re)opening the lock file if required
+        """
+        if fcntl is None or self.lock_free or mode == self.mode:
+            return
+        if mode is None:
+            if self.file is not None:
+                fcntl.flock(self.file, fcntl.LOCK_UN)
+            self.mode = None
+            return
+        while True:
+            if self.file is None:
+                try:
+                    self.file = open(self.file_name, "a")
+                except FileNotFoundError:
+                    # The directory does not exist (yet)
+                    return
+                except OSError as e:
+                    logger.warning("Could not open lock file %s, proceeding without inter-process locking: %s",
+                                   self.file_name, e)
+                    self.lock_free = True
+                    return
+            fcntl.flock(self.file, mode)
+            if self.mode is not None:
+                self.mode = mode
+                return
+            try:
+                if os.stat(self.file_name).st_ino == os.fstat(self.file.fileno()).st_ino:
+                    self.mode = mode
+                    return
+            except FileNotFoundError:
+                pass
+            # The lock file has been deleted (e.g. with its directory) in the meantime
+            self.file.close()
+            self.file = None
+
+
+def _forget_synced(synced_objects: Dict[str, _SyncedObject], hash_: str,
+                   ref: "weakref.ReferenceType[model.Identifiable]") -> None:
+    """
+    Remove the entry of a garbage collected object from the synced objects of a directory (see
+    :meth:`LocalFileBackend.set_synced`), unless it has been replaced in the meantime
+
+    This is called by the garbage collector, so it must not acquire any locks. Removing a replacing entry by accident
+    only causes the document to be read again.
+    """
+    synced = synced_objects.get(hash_)
+    if synced is not None and synced[1] is ref:
+        synced_objects.pop(hash_, None)
+
+
+def _decode_json(data: Any) -> Any:
+    """
+    Deserialize AAS objects in already parsed JSON data, like parsing it with the
+    :class:`~basyx.aas.adapter.json.json_deserialization.AASFromJsonDecoder`
+    """
+    if isinstance(data, dict):
+        return json_deserialization.AASFromJsonDecoder.object_hook({key: _decode_json(value)
+                                                                    for key, value in data.items()})
+    if isinstance(data, list):
+        return [_decode_json(value) for value in data]
+    return data
+
+
+# The file name suffixes of the stored documents, mapped to the compression of the documents
+DOCUMENT_SUFFIXES: Dict[str, Optional[str]] = {
+    ".json": None,
+    ".json.gz": "gzip",
+    ".json.xz": "lzma",
+}
+
+
+def _split_document_name(name: str) -> Optional[Tuple[str, str]]:
+    """
+    Split the name of a stored document into its hash and its suffix (see :data:`~.DOCUMENT_SUFFIXES`)
+
+    :return: The hash and the suffix or ``None``, if the name is not the name of a stored document
+    """
+    if name.startswith("."):
+        return None
+    for suffix in DOCUMENT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)], suffix
+    return None
+
+
+def _document_hash(file_name: str) -> str:
+    name = os.path.basename(file_name)
+    document_name = _split_document_name(name)
+    return document_name[0] if document_name is not None else name
+
+
+def _compression(file_name: str) -> Optional[str]:
+    document_name = _split_document_name(os.path.basename(file_name))
+    return DOCUMENT_SUFFIXES[document_name[1]] if document_name is not None else None
+
+
+def _open_document(file_name: str) -> IO[str]:
+    """
+    Open a stored document for reading, decompressing it according to its suffix
+    """
+    compression = _compression(file_name)
+    if compression == "gzip":
+        return gzip.open(file_name, "rt", encoding="utf-8")
+    if compression == "lzma":
+        return lzma.open(file_name, "rt", encoding="utf-8")
+    return open(file_name, "r", encoding="utf-8")
+
+
+def _append_line(file_name: str, line: str) -> None:
+    """
+    Append a line to a file by a single write and sync it to disk, such that a crash leaves at most an incomplete last
+    line
+    """
+    data = (line + "\n").encode("utf-8")
+    fd = os.open(file_name, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        written = os.write(fd, data)
+        while written < len(data):
+            # Only a full disk or a signal should cause a short write
+            written += os.write(fd, data[written:])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_document(file_name: str, data: object, compact: bool = False,
+                    encoder: Optional[Type[json.JSONEncoder]] = None) -> None:
+    """
+    Atomically write a JSON document, compressed according to its suffix
+
+    The document is written to a hidden temporary file in the same directory, which is synced to disk and then replaces
+    the document. Thus, readers will always find either the old or the new document, even if writing fails.
+
+    :param file_name: The file name of the document
+    :param data: The data to be serialized
+    :param compact: If ``True``, the document is written without any whitespace, otherwise it is indented
+    :param encoder: The JSONEncoder to be used
+    """
+    directory_path, name = os.path.split(file_name)
+    temp_file_name = os.path.join(directory_path, ".{}.{}.tmp".format(name, uuid.uuid4().hex))
+    compression = _compression(file_name)
+    try:
+        with open(temp_file_name, "xb") as raw_file:
+            compressed_file: Optional[Union[gzip.GzipFile, lzma.LZMAFile]] = None
+            if compression == "gzip":
+                compressed_file = gzip.GzipFile(fileobj=raw_file, mode="wb")
+            elif compression == "lzma":
+                compressed_file = lzma.LZMAFile(raw_file, "wb")
+            text_file = io.TextIOWrapper(compressed_file or raw_file, encoding="utf-8")
+            if compact:
+                json.dump(data, text_file, cls=encoder, separators=(",", ":"))
+            else:
+                json.dump(data, text_file, cls=encoder, indent=4)
+            text_file.flush()
+            text_file.detach()
+            if compressed_file is not None:
+                compressed_file.close()
+            raw_file.flush()
+            os.fsync(raw_file.fileno())
+        os.replace(temp_file_name, file_name)
+    except BaseException:
+        try:
+            os.remove(temp_file_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 backends.register_backend("file", LocalFileBackend)
 
 
+class _ManifestEntry(NamedTuple):
+    """
+    The entry of a stored document in the manifest of a :class:`~.LocalFileObjectStore`
+    """
+    id: model.Identifier
+    type: str
+    id_short: Optional[str]
+    semantic_id: Optional[Dict[str, Any]]
+    stat: Tuple[int, int, int]
+
+    @classmethod
+    def from_identifiable(cls, obj: model.Identifiable, stat: Tuple[int, int, int]) -> "_ManifestEntry":
+        semantic_id = obj.semantic_id if isinstance(obj, model.HasSemantics) else None
+        return cls(obj.id, _model_type(type(obj)), obj.id_short,
+                   _to_json_data(semantic_id) if semantic_id is not None else None, stat)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any], stat: Tuple[int, int, int]) -> "_ManifestEntry":
+        return cls(data["id"], data.get("modelType", ""), data.get("idShort"), data.get("semanticId"), stat)
+
+
+class _Manifest:
+    """
+    The manifest of the stored documents in the directory of a :class:`~.LocalFileObjectStore`, mapping the file names
+    (i.e. the hashes of the :class:`Identifiers <basyx.aas.model.base.Identifier>`) to their
+    :class:`entries <._ManifestEntry>`
+
+    The manifest is persisted as an append-only log of JSON lines in the file ``.manifest`` of the directory, which is
+    rewritten, when it contains too many outdated lines. When the manifest is loaded, it is checked against the files in
+    the directory. Each store keeps its own manifest, while changes (also by the :class:`~.LocalFileBackend`) are
+    applied to the manifests of all stores of the directory in this process.
+    """
+    FILE_NAME = ".manifest"
+
+    # The manifests of the LocalFileObjectStores in this process by their (absolute) directory path
+    _instances: Dict[str, "weakref.WeakSet[_Manifest]"] = {}
+    _instances_lock = threading.RLock()
+
+    def __init__(self, directory_path: str):
+        self.directory_path: str = os.path.abspath(directory_path)
+        self.entries: Dict[str, _ManifestEntry] = {}
+        self._sorted_hashes: Optional[List[str]] = None
+        self._loaded = False
+
+    def load(self) -> None:
+        """
+        Load the manifest from its file and bring it up to date with the documents in the directory (if not done yet)
+        """
+        if self._loaded:
+            return
+        with LocalFileBackend.lock(self.directory_path), self._instances_lock:
+            if self._loaded:
+                return
+            log_lines = 0
+            try:
+                with open(os.path.join(self.directory_path, self.FILE_NAME), "r") as file:
+                    for line in file:
+                        if not line.strip():
+                            continue
+                        log_lines += 1
+                        data = json.loads(line)
+                        if data.get("deleted"):
+                            self.entries.pop(data["hash"], None)
+                        else:
+                            self.entries[data["hash"]] = _ManifestEntry.from_json(data, tuple(data["stat"]))
+            except FileNotFoundError:
+                pass
+
+            changes: Dict[str, Optional[_ManifestEntry]] = {}
+            found: Set[str] = set()
+            file_names: List[str] = []
+            for hash_, file_name in _iter_document_files(self.directory_path):
+                file_names.append(file_name)
+                if hash_ in found:
+                    continue
+                try:
+                    stat = LocalFileBackend._file_sizes(file_name)
+                    found.add(hash_)
+                    entry = self.entries.get(hash_)
+                    if entry is None or entry.stat != stat:
+                        logger.debug("Indexing %s ...", file_name)
+                        changes[hash_] = _ManifestEntry.from_json(
+                            LocalFileBackend._load_raw_document(file_name)["data"], stat)
+                except FileNotFoundError:
+                    continue
+            for hash_ in self.entries:
+                if hash_ not in found:
+                    changes[hash_] = None
+            LocalFileBackend._note_documents(self.directory_path, file_names)
+            self._apply(changes)
+            self._loaded = True
+            self._instances.setdefault(self.directory_path, weakref.WeakSet()).add(self)
+            if log_lines > 2 * len(self.entries) + 100:
+                self._rewrite()
+            else:
+                self._append(changes)
+
+    def sorted_hashes(self) -> List[str]:
+        if self._sorted_hashes is None:
+            self._sorted_hashes = sorted(self.entries)
+        return self._sorted_hashes
+
+    def _apply(self, changes: Dict[str, Optional[_ManifestEntry]]) -> None:
+        for hash_, entry in changes.items():
+            if entry is None:
+                if self.entries.pop(hash_, None) is not None:
+                    self._sorted_hashes = None
+            else:
+                if hash_ not in self.entries:
+                    self._sorted_hashes = None
+                self.entries[hash_] = entry
+
+    def _append(self, changes: Dict[str, Optional[_ManifestEntry]]) -> None:
+        if not changes:
+            return
+        try:
+            with open(os.path.join(self.directory_path, self.FILE_NAME), "a") as file:
+                file.write("".join(self._log_line(hash_, entry) for hash_, entry in changes.items()))
+        except OSError as e:
+            # e.g. in a read-only directory: The manifest is only kept in memory and checked against the documents again
+            # the next time it is loaded
+            logger.debug("Could not write manifest of %s: %s", self.directory_path, e)
+
+    def _rewrite(self) -> None:
+        logger.debug("Rewriting manifest of %s ...", self.directory_path)
+        file_name = os.path.join(self.directory_path, self.FILE_NAME)
+        try:
+            with open(file_name + ".tmp", "w") as file:
+                file.write("".join(self._log_line(hash_, entry) for hash_, entry in self.entries.items()))
+            os.replace(file_name + ".tmp", file_name)
+        except OSError as e:
+            logger.debug("Could not write manifest of %s: %s", self.directory_path, e)
+
+    @staticmethod
+    def _log_line(hash_: str, entry: Optional[_ManifestEntry]) -> str:
+        if entry is None:
+            return json.dumps({"hash": hash_, "deleted": True}) + "\n"
+        return json.dumps({"hash": hash_, "id": entry.id, "modelType": entry.type, "idShort": entry.id_short,
+                           "semanticId": entry.semantic_id, "stat": entry.stat}, separators=(",", ":")) + "\n"
+
+    @classmethod
+    def _change(cls, file_name: str, entry: Optional[_ManifestEntry]) -> None:
+        """
+        Apply a change of a stored document to the manifests of all stores of its directory in this process and to the
+        manifest file
+        """
+        directory_path = LocalFileBackend.directory_of(file_name)
+        hash_ = _document_hash(file_name)
+        if entry is not None:
+            LocalFileBackend._note_document(file_name)
+        with LocalFileBackend.lock(directory_path), cls._instances_lock:
+            manifests = list(cls._instances.get(directory_path, ()))
+            for manifest in manifests:
+                manifest._apply({hash_: entry})
+            if manifests:
+                manifests[0]._append({hash_: entry})
+
+    @classmethod
+    def put(cls, file_name: str, entry: _ManifestEntry) -> None:
+        cls._change(file_name, entry)
+
+    @classmethod
+    def remove(cls, file_name: str) -> None:
+        cls._change(file_name, None)
+
+    @classmethod
+    def update_stat(cls, file_name: str, stat: Tuple[int, int, int]) -> None:
+        directory_path = LocalFileBackend.directory_of(file_name)
+        with LocalFileBackend.lock(directory_path), cls._instances_lock:
+            for manifest in cls._instances.get(directory_path, ()):
+                entry = manifest.entries.get(_document_hash(file_name))
+                if entry is not None:
+                    cls._change(file_name, entry._replace(stat=stat))
+                    return
+
+
+class _ChangeLog:
+    """
+    The cross-process change journal of the directory of a :class:`~.LocalFileObjectStore`
+
+    Each change of a stored document is recorded as a line ``<pid> <hash>`` in the append-only file ``.changes`` of the
+    directory, while holding the lock of the directory. Each process remembers the position, up to which it has read
+    the file, so it can cheaply find the documents, which have been changed by other processes since, and invalidate
+    exactly those in its caches and manifests (see :meth:`~.refresh`). When the file grows too large, it is replaced by
+    an empty file, which makes other processes invalidate everything once.
+    """
+    FILE_NAME = ".changes"
+    MAX_SIZE = 1024 * 1024
+
+    # The (inode, position) of the change journal file of each (absolute) directory path, up to which it has been read.
+    # The inode is 0, if the file did not exist.
+    _positions: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def record(cls, file_name: str) -> None:
+        """
+        Record the change of a stored document. The lock of its directory must be held exclusively.
+        """
+        directory_path = LocalFileBackend.directory_of(file_name)
+        change_log_file_name = os.path.join(directory_path, cls.FILE_NAME)
+        try:
+            if os.path.getsize(change_log_file_name) > cls.MAX_SIZE:
+                # Make sure not to miss the changes of other processes, before starting over
+                cls.refresh(directory_path)
+                logger.debug("Rotating change journal of %s ...", directory_path)
+                with open(change_log_file_name + ".tmp", "w"):
+                    pass
+                os.replace(change_log_file_name + ".tmp", change_log_file_name)
+                cls._positions[directory_path] = (os.stat(change_log_file_name).st_ino, 0)
+        except FileNotFoundError:
+            pass
+        with open(change_log_file_name, "a") as file:
+            file.write("{} {}\n".format(os.getpid(), _document_hash(file_name)))
+
+    @classmethod
+    def refresh(cls, directory_path: str) -> None:
+        """
+        Read the changes of other processes from the change journal of the given directory, which have been recorded
+        since the last refresh, and invalidate the respective objects in the caches of the :class:`~.LocalFileBackend`
+        and the manifests of all :class:`~.LocalFileObjectStore` of the directory in this process
+        """
+        directory_path = os.path.abspath(directory_path)
+        change_log_file_name = os.path.join(directory_path, cls.FILE_NAME)
+        position = cls._positions.get(directory_path)
+        try:
+            stat = os.stat(change_log_file_name)
+            if position is not None and position == (stat.st_ino, stat.st_size):
+                return
+        except FileNotFoundError:
+            if position is not None and position[0] == 0:
+                return
+        with LocalFileBackend.lock(directory_path, shared=True):
+            position = cls._positions.get(directory_path)
+            try:
+                with open(change_log_file_name, "rb") as file:
+                    stat = os.fstat(file.fileno())
+                    if position is None:
+                        # Everything, which is read afterwards, is up to date
+                        cls._positions[directory_path] = (stat.st_ino, stat.st_size)
+                        return
+                    inode, offset = position
+                    if inode == 0:
+                        # The file has been created since the last refresh
+                        inode = stat.st_ino
+                    if inode != stat.st_ino or stat.st_size < offset:
+                        cls._positions[directory_path] = (stat.st_ino, stat.st_size)
+                        cls._invalidate(directory_path, None)
+                        return
+                    if stat.st_size == offset:
+                        return
+                    file.seek(offset)
+                    data = file.read(stat.st_size - offset)
+            except FileNotFoundError:
+                cls._positions[directory_path] = (0, 0)
+                if position is not None and position[0] != 0:
+                    cls._invalidate(directory_path, None)
+                return
+            # Only read complete lines
+            end = data.rfind(b"\n") + 1
+            cls._positions[directory_path] = (inode, offset + end)
+            pid = str(os.getpid())
+            hashes: Set[str] = set()
+            for line in data[:end].decode("utf-8").splitlines():
+                line_pid, _, hash_ = line.partition(" ")
+                if line_pid != pid:
+                    hashes.add(hash_)
+            if hashes:
+                cls._invalidate(directory_path, hashes)
+
+    @classmethod
+    def _invalidate(cls, directory_path: str, hashes: Optional[Set[str]]) -> None:
+        """
+        Invalidate the objects with the given hashes (or all objects, if ``None``) of the directory in this process
+        """
+        logger.debug("Invalidating %s objects of %s, which have been changed by other processes",
+                     len(hashes) if hashes is not None else "all", directory_path)
+        with LocalFileBackend._journal_lock:
+            for caches in (LocalFileBackend._synced_objects, LocalFileBackend._element_paths):
+                if hashes is None:
+                    caches.pop(directory_path, None)
+                    continue
+                entries = caches.get(directory_path, {})
+                for hash_ in hashes:
+                    entries.pop(hash_, None)
+        with _Manifest._instances_lock:
+            manifests = [manifest for manifest in _Manifest._instances.get(directory_path, ()) if manifest._loaded]
+            if not manifests or hashes is None:
+                # The documents of the directory are known again, once a manifest is loaded
+                LocalFileBackend._document_suffixes.pop(directory_path, None)
+            if not manifests:
+                return
+            if hashes is None:
+                for manifest in manifests:
+                    manifest._loaded = False
+                return
+            changes: Dict[str, Optional[_ManifestEntry]] = {}
+            for hash_ in hashes:
+                # The document may have been written in another form or place by the other process
+                document_file_name = LocalFileBackend._search_file_name(directory_path, hash_)
+                try:
+                    if document_file_name is None:
+                        raise FileNotFoundError(hash_)
+                    stat = LocalFileBackend._file_sizes(document_file_name)
+                    entry = manifests[0].entries.get(hash_)
+                    if entry is None or entry.stat != stat:
+                        changes[hash_] = _ManifestEntry.from_json(
+                            LocalFileBackend._load_raw_document(document_file_name)["data"], stat)
+                except FileNotFoundError:
+                    changes[hash_] = None
+            for manifest in manifests:
+                manifest._apply(changes)
+
+
+def _iter_document_files(directory_path: str, levels: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Iterate the hashes and file names of the stored documents in the given directory, i.e. the documents directly in
+    the directory and in its subdirectories according to its layout (see :meth:`LocalFileBackend.set_sharding`)
+
+    :param directory_path: The path of the directory
+    :param levels: The number of levels of subdirectories to search instead of the levels of the directory's layout
+    """
+    if levels is None:
+        levels = LocalFileBackend._sharded_directories.get(os.path.abspath(directory_path), (0, 0))[0]
+    pending = [(directory_path, 0)]
+    while pending:
+        path, level = pending.pop()
+        try:
+            entries = list(os.scandir(path))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            document_name = _split_document_name(entry.name)
+            if document_name is not None:
+                yield document_name[0], entry.path
+            elif level < levels and not entry.name.startswith(".") and entry.is_dir():
+                pending.append((entry.path, level + 1))
+
+
+def _model_type(type_: type) -> str:
+    """
+    Get the ``modelType`` of the JSON serialization of objects of the given type
+    """
+    for t in type_.__mro__:
+        if t in model.KEY_TYPES_CLASSES:
+            return t.__name__
+    return type_.__name__
+
+
+def _to_json_data(obj: object) -> Any:
+    return json.loads(json.dumps(obj, cls=json_serialization.AASToJsonEncoder))
+
+
+_QT = TypeVar('_QT', bound=model.Identifiable)
+
+
 class LocalFileObjectStore(model.AbstractObjectStore):
     """
     An ObjectStore implementation for :class:`~basyx.aas.model.base.Identifiable` BaSyx Python SDK objects backed
     by a local file based local backend
+
+    The store keeps a manifest of the stored documents (in the file ``.manifest`` of the directory) with the
+    :class:`~basyx.aas.model.base.Identifier`, type, ``id_short`` and ``semantic_id`` of each object, so that counting,
+    listing and filtering the objects (via :meth:`~.query`) does not require reading the documents. Documents are only
+    read and decoded, if they have been changed since the requested object has been read or committed.
+
+    Documents are written atomically. They can optionally be written in compact form and compressed. Documents of other
+    forms in the directory are still read, but new documents are written in the configured form.
+
+    For large numbers of objects, the documents can be sharded into subdirectories named by the prefixes of their hash
+    (e.g. ``ab/cd/<hash>.json`` for ``shard_levels=2``), to keep the number of files per directory small. Documents in
+    the flat layout are still found, so an existing directory can be migrated online via :meth:`~.migrate_layout`.
+
+    Multiple processes may use stores of the same directory: Changes are done while holding an advisory lock on the
+    directory (see :meth:`LocalFileBackend.lock`) and recorded in a change journal, from which the changes of other
+    processes are applied to the manifest and caches of this process before each access (see :class:`~._ChangeLog`).
     """
-    def __init__(self, directory_path: str):
+    def __init__(self, directory_path: str, compact: bool = False, compression: Optional[str] = None,
+                 shard_levels: int = 0, shard_width: int = 2):
         """
         Initializer of class LocalFileObjectStore
 
         :param directory_path: Path to the local file backend (the path where you want to store your AAS JSON files)
+        :param compact: If ``True``, the documents are written without any whitespace instead of being indented
+        :param compression: The compression of the written documents: ``None``, ``"gzip"`` (``<hash>.json.gz``) or
+                            ``"lzma"`` (``<hash>.json.xz``)
+        :param shard_levels: The number of levels of subdirectories, in which the documents are placed (``0`` for the
+                             flat layout)
+        :param shard_width: The number of hash characters used for naming the subdirectories of each level
+        :raises ValueError: If the compression or the sharding is invalid
         """
         self.directory_path: str = directory_path.rstrip("/")
+        for suffix, suffix_compression in DOCUMENT_SUFFIXES.items():
+            if suffix_compression == compression:
+                self.file_suffix: str = suffix
+                break
+        else:
+            raise ValueError("Unknown compression {}".format(compression))
+        self.compact: bool = compact
+        LocalFileBackend.set_compact(self.directory_path, compact)
+        LocalFileBackend.set_sharding(self.directory_path, shard_levels, shard_width)
 
         # A dictionary of weak references to local replications of stored objects. Objects are kept in this cache as
         # long as there is any other reference in the Python application to them. We use this to make sure that only one
@@ -87,6 +1242,8 @@ class LocalFileObjectStore(model.AbstractObjectStore):
         self._object_cache: weakref.WeakValueDictionary[model.Identifier, model.Identifiable] \
             = weakref.WeakValueDictionary()
         self._object_cache_lock = threading.Lock()
+        self._manifest = _Manifest(self.directory_path)
+        _ChangeLog.refresh(self.directory_path)
 
     def check_directory(self, create=False):
         """
@@ -107,14 +1264,32 @@ class LocalFileObjectStore(model.AbstractObjectStore):
 
         :raises KeyError: If the respective file could not be found
         """
+        _ChangeLog.refresh(self.directory_path)
+        file_name = self._find_file_name(hash_)
+        try:
+            if file_name is None:
+                raise FileNotFoundError(hash_)
+            stat = LocalFileBackend._file_sizes(file_name)
+        except FileNotFoundError as e:
+            raise KeyError("No Identifiable with hash {} found in local file database".format(hash_)) from e
+        # If we still have a local replication of that object, which has been read from or committed to the unchanged
+        # file, we can return it without decoding the file again
+        entry = self._manifest.entries.get(hash_)
+        with self._object_cache_lock:
+            cached_obj = self._object_cache.get(entry.id) if entry is not None else None
+        if cached_obj is not None and cached_obj.source == "file://localhost/" + file_name \
+                and LocalFileBackend.is_synced(file_name, cached_obj, stat):
+            return cached_obj
+
         # Try to get the correct file
         try:
-            with open("{}/{}.json".format(self.directory_path, hash_), "r") as file:
-                data = json.load(file, cls=json_deserialization.AASFromJsonDecoder)
-                obj = data["data"]
-                self.generate_source(obj)
+            data = LocalFileBackend.load_document(file_name)
+            obj = data["data"]
+            obj.source = "file://localhost/" + file_name
         except FileNotFoundError as e:
             raise KeyError("No Identifiable with hash {} found in local file database".format(hash_)) from e
+        if entry is None or entry.stat != stat:
+            _Manifest.put(file_name, _ManifestEntry.from_identifiable(obj, stat))
         # If we still have a local replication of that object (since it is referenced from anywhere else), update that
         # replication and return it.
         with self._object_cache_lock:
@@ -124,8 +1299,9 @@ class LocalFileObjectStore(model.AbstractObjectStore):
                 # to another backend now, so we return a fresh copy
                 if old_obj.source == obj.source:
                     old_obj.update_from(obj)
-                    return old_obj
-        self._object_cache[obj.id] = obj
+                    obj = old_obj
+            self._object_cache[obj.id] = obj
+        LocalFileBackend.set_synced(file_name, obj, stat, read=True)
         return obj
 
     def get_identifiable(self, identifier: model.Identifier) -> model.Identifiable:
@@ -146,13 +1322,22 @@ class LocalFileObjectStore(model.AbstractObjectStore):
         :raises KeyError: If an object with the same id exists already in the object store
         """
         logger.debug("Adding object %s to Local File Store ...", repr(x))
-        if os.path.exists("{}/{}.json".format(self.directory_path, self._transform_id(x.id))):
-            raise KeyError("Identifiable with id {} already exists in local file database".format(x.id))
-        with open("{}/{}.json".format(self.directory_path, self._transform_id(x.id)), "w") as file:
-            json.dump({"data": x}, file, cls=json_serialization.AASToJsonEncoder, indent=4)
-            with self._object_cache_lock:
-                self._object_cache[x.id] = x
-            self.generate_source(x)  # Set the source of the object
+        hash_ = self._transform_id(x.id)
+        self._refresh()
+        with LocalFileBackend.lock(self.directory_path):
+            if self._find_file_name(hash_) is not None:
+                raise KeyError("Identifiable with id {} already exists in local file database".format(x.id))
+            file_name = LocalFileBackend.document_file_name(self.directory_path, hash_, self.file_suffix)
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            _write_document(file_name, {"data": x}, self.compact, json_serialization.AASToJsonEncoder)
+            LocalFileBackend.discard_journal(file_name)
+            stat = LocalFileBackend._file_sizes(file_name)
+            _Manifest.put(file_name, _ManifestEntry.from_identifiable(x, stat))
+            _ChangeLog.record(file_name)
+        with self._object_cache_lock:
+            self._object_cache[x.id] = x
+        self.generate_source(x)  # Set the source of the object
+        LocalFileBackend.set_synced(file_name, x, stat)
 
     def discard(self, x: model.Identifiable) -> None:
         """
@@ -162,10 +1347,18 @@ class LocalFileObjectStore(model.AbstractObjectStore):
         :raises KeyError: If the object does not exist in the database
         """
         logger.debug("Deleting object %s from Local File Store database ...", repr(x))
-        try:
-            os.remove("{}/{}.json".format(self.directory_path, self._transform_id(x.id)))
-        except FileNotFoundError as e:
-            raise KeyError("No AAS object with id {} exists in local file database".format(x.id)) from e
+        self._refresh()
+        with LocalFileBackend.lock(self.directory_path):
+            file_name = self._find_file_name(self._transform_id(x.id))
+            try:
+                if file_name is None:
+                    raise FileNotFoundError(x.id)
+                os.remove(file_name)
+            except FileNotFoundError as e:
+                raise KeyError("No AAS object with id {} exists in local file database".format(x.id)) from e
+            LocalFileBackend.discard_journal(file_name)
+            _Manifest.remove(file_name)
+            _ChangeLog.record(file_name)
         with self._object_cache_lock:
             del self._object_cache[x.id]
         x.source = ""
@@ -186,27 +1379,155 @@ class LocalFileObjectStore(model.AbstractObjectStore):
         else:
             return False
         logger.debug("Checking existence of object with id %s in database ...", repr(x))
-        return os.path.exists("{}/{}.json".format(self.directory_path, self._transform_id(identifier)))
+        return self._find_file_name(self._transform_id(identifier)) is not None
 
     def __len__(self) -> int:
         """
         Retrieve the number of objects in the local file database
 
-        :return: The number of objects (determined from the number of documents)
+        :return: The number of objects (determined from the manifest)
         """
         logger.debug("Fetching number of documents from database ...")
-        return len(os.listdir(self.directory_path))
+        self._refresh()
+        return len(self._manifest.entries)
 
     def __iter__(self) -> Iterator[model.Identifiable]:
         """
-        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the CouchDB database.
+        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the local file database.
 
         This method returns an iterator, containing only a list of all identifiers in the database and retrieving
         the identifiable objects on the fly.
         """
         logger.debug("Iterating over objects in database ...")
-        for name in os.listdir(self.directory_path):
-            yield self.get_identifiable_by_hash(name.rstrip(".json"))
+        return self.iter_from()
+
+    def iter_from(self, after: Optional[model.Identifier] = None) -> Iterator[model.Identifiable]:
+        """
+        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the local file database, ordered by the
+        hash of their :class:`~basyx.aas.model.base.Identifier` (i.e. their file name), starting after the position of
+        the given :class:`~basyx.aas.model.base.Identifier`.
+
+        The objects are listed from the manifest and only the objects following the given position are read from their
+        files.
+
+        :param after: The :class:`~basyx.aas.model.base.Identifier` to start after or ``None`` to start at the first
+                      object
+        """
+        logger.debug("Iterating over objects in database, starting after %s ...", after)
+        for hash_ in self._iter_hashes(self._transform_id(after) if after is not None else None):
+            try:
+                yield self.get_identifiable_by_hash(hash_)
+            except KeyError:
+                # The file has been deleted in the meantime
+                continue
+
+    def query(self, type_: Type[_QT], id_short: Optional[model.NameType] = None,
+              semantic_id: Optional[model.Reference] = None, global_asset_id: Optional[model.Identifier] = None,
+              specific_asset_ids: Iterable[model.SpecificAssetId] = (),
+              after: Optional[model.Identifier] = None) -> Iterator[_QT]:
+        """
+        Iterate all stored objects of the given type, which match all of the given criteria, ordered like
+        :meth:`~.iter_from`.
+
+        The type, ``id_short`` and ``semantic_id`` are checked against the manifest, so only the files of matching
+        objects are read. See :meth:`basyx.aas.model.provider.AbstractObjectStore.query` for the parameters.
+        """
+        specific_asset_ids = list(specific_asset_ids)
+        model_types = {t.__name__ for t in model.KEY_TYPES_CLASSES if issubclass(t, type_) or issubclass(type_, t)}
+        semantic_id_data = _to_json_data(semantic_id) if semantic_id is not None else None
+        for hash_ in self._iter_hashes(self._transform_id(after) if after is not None else None):
+            entry = self._manifest.entries.get(hash_)
+            if entry is None or entry.type not in model_types \
+                    or (id_short is not None and entry.id_short != id_short) \
+                    or (semantic_id_data is not None and entry.semantic_id != semantic_id_data):
+                continue
+            try:
+                obj = self.get_identifiable_by_hash(hash_)
+            except KeyError:
+                continue
+            if isinstance(obj, type_) and self._matches(obj, id_short, semantic_id, global_asset_id,
+                                                        specific_asset_ids):
+                yield obj
+
+    def migrate_layout(self) -> int:
+        """
+        Move all documents in the directory, which are not placed according to the layout of this store (e.g. after
+        enabling sharding for a directory with the flat layout), to their place.
+
+        The store can be used while migrating: Each document's patch journal is compacted, before the document is
+        moved with an atomic rename. Documents, which have not been moved yet, are still found in their old place and
+        objects, whose documents have been moved, are resolved by the :class:`~.LocalFileBackend`.
+
+        :return: The number of moved documents
+        """
+        logger.info("Migrating the layout of %s ...", self.directory_path)
+        self._refresh()
+        moved = 0
+        misplaced = 0
+        for hash_, file_name in list(_iter_document_files(self.directory_path, levels=32)):
+            document_name = _split_document_name(os.path.basename(file_name))
+            assert document_name is not None
+            target_file_name = LocalFileBackend.document_file_name(self.directory_path, hash_, document_name[1])
+            if os.path.abspath(target_file_name) == os.path.abspath(file_name):
+                continue
+            with LocalFileBackend.lock(self.directory_path):
+                if os.path.exists(target_file_name):
+                    logger.warning("Not moving %s, since %s exists already", file_name, target_file_name)
+                    misplaced += 1
+                    continue
+                try:
+                    LocalFileBackend.compact(file_name)
+                    os.makedirs(os.path.dirname(target_file_name), exist_ok=True)
+                    os.rename(file_name, target_file_name)
+                except FileNotFoundError:
+                    # The document has been deleted in the meantime
+                    continue
+                LocalFileBackend.discard_journal(file_name)
+                _Manifest.update_stat(target_file_name, LocalFileBackend._file_sizes(target_file_name))
+                _ChangeLog.record(target_file_name)
+            entry = self._manifest.entries.get(hash_)
+            with self._object_cache_lock:
+                obj = self._object_cache.get(entry.id) if entry is not None else None
+                if obj is not None and obj.source == "file://localhost/" + file_name:
+                    obj.source = "file://localhost/" + target_file_name
+            # Remove the subdirectories, which became empty
+            directory_path = os.path.dirname(file_name)
+            while os.path.abspath(directory_path) != os.path.abspath(self.directory_path):
+                try:
+                    os.rmdir(directory_path)
+                except OSError:
+                    break
+                directory_path = os.path.dirname(directory_path)
+            moved += 1
+        if not misplaced:
+            # Documents are only looked up according to the layout from now on
+            LocalFileBackend._pending_migrations.discard(os.path.abspath(self.directory_path))
+        logger.info("Moved %s documents in %s", moved, self.directory_path)
+        return moved
+
+    def _find_file_name(self, hash_: str) -> Optional[str]:
+        return LocalFileBackend.find_file_name(self.directory_path, hash_, self.file_suffix)
+
+    def _refresh(self) -> None:
+        """
+        Apply the changes of other processes to the manifest (see :class:`~._ChangeLog`) and load the manifest
+        """
+        _ChangeLog.refresh(self.directory_path)
+        self._manifest.load()
+
+    def _iter_hashes(self, after: Optional[str]) -> Iterator[str]:
+        """
+        Iterate the hashes of the stored objects from the manifest in their order, starting after the given hash. The
+        manifest may be changed while iterating.
+        """
+        self._refresh()
+        while True:
+            sorted_hashes = self._manifest.sorted_hashes()
+            index = bisect.bisect_right(sorted_hashes, after) if after is not None else 0
+            if index >= len(sorted_hashes):
+                return
+            after = sorted_hashes[index]
+            yield after
 
     @staticmethod
     def _transform_id(identifier: model.Identifier) -> str:
@@ -221,13 +1542,15 @@ class LocalFileObjectStore(model.AbstractObjectStore):
 
         :param identifiable: Identifiable object
         """
-        source: str = "file://localhost/{}/{}.json".format(
-            self.directory_path,
-            self._transform_id(identifiable.id)
-        )
+        source = self._generate_source(self._transform_id(identifiable.id))
         identifiable.source = source
         return source
 
+    def _generate_source(self, hash_: str) -> str:
+        file_name = self._find_file_name(hash_) \
+            or LocalFileBackend.document_file_name(self.directory_path, hash_, self.file_suffix)
+        return "file://localhost/" + file_name
+
 
 class FileBackendSourceError(Exception):
     """
@@ -0,0 +1,364 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+This module adds a durable, log-structured layer in front of an in-memory
+:class:`~basyx.aas.model.provider.AbstractObjectStore` (by default a
+:class:`~basyx.aas.model.provider.DictObjectStore`).
+
+All objects are held in the underlying store, which serves all read accesses. Each mutation (adding, changing or
+discarding an :class:`~basyx.aas.model.base.Identifiable`) is appended as a JSON line to a segment file in a local
+directory. From time to time, a compacted snapshot of all objects is written and the segment files it contains are
+deleted. When the :class:`~.LogStructuredObjectStore` is created for an existing directory, it restores the objects by
+loading the snapshot and replaying the segment files written afterwards, which is much faster than reading the objects
+from their original (e.g. XML or AASX) files.
+
+The directory contains the following files:
+
+- ``snapshot.jsonl``: A header line ``{"segment": <n>}`` with the number of the first segment not contained in the
+  snapshot, followed by the JSON serialization of each object in a line
+- ``segment-<n>.log``: A line for each mutation, either ``{"op": "put", "data": <object>}`` or
+  ``{"op": "delete", "id": <identifier>}``
+
+Changes of the attributes of a stored object are not noticed by the store. They need to be reported via
+:meth:`~.LogStructuredObjectStore.reindex` to be logged.
+"""
+from typing import cast, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+import json
+import logging
+import os
+import re
+import threading
+import uuid
+
+from ..adapter.json import json_serialization, json_deserialization
+from basyx.aas import model
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE_NAME = "snapshot.jsonl"
+SEGMENT_FILE_PATTERN = re.compile(r"^segment-(\d+)\.log$")
+
+_IT = TypeVar('_IT', bound=model.Identifiable)
+_QT = TypeVar('_QT', bound=model.Identifiable)
+
+
+class LogStructuredObjectStore(model.AbstractObjectStore[_IT], Generic[_IT]):
+    """
+    An ObjectStore, which keeps its objects in an underlying (in-memory) ObjectStore and logs all mutations to segment
+    files in a local directory, such that the objects can be restored from there.
+
+    In the default (synchronous) mode, each mutation is written (and synced to disk, if ``sync`` is ``True``) before the
+    mutating method returns. In write-behind mode, mutations are only collected and written by a background thread every
+    ``flush_interval`` seconds (or when calling :meth:`~.flush`). Multiple changes of the same object within this
+    interval are written only once. Thus, the last changes may be lost in case of a crash.
+
+    The directory must only be used by a single LogStructuredObjectStore at a time. :meth:`~.close` should be called,
+    when the store is not used anymore.
+
+    :param directory_path: The directory to store the snapshot and the segment files in. It is created, if it does not
+                           exist.
+    :param store: The underlying ObjectStore, which must be empty. Defaults to a new
+                  :class:`~basyx.aas.model.provider.DictObjectStore`.
+    :param snapshot_interval: The number of logged mutations, after which a new snapshot is written automatically or
+                              ``None`` to write snapshots only when calling :meth:`~.snapshot`
+    :param write_behind: If ``True``, mutations are written asynchronously by a background thread
+    :param flush_interval: The interval of the background thread in seconds
+    :param sync: If ``False``, the written data is not synced to disk explicitly (faster, but less durable)
+    """
+    def __init__(self, directory_path: str, store: Optional[model.AbstractObjectStore[_IT]] = None,
+                 snapshot_interval: Optional[int] = 10000, write_behind: bool = False, flush_interval: float = 1.0,
+                 sync: bool = True) -> None:
+        self.directory_path: str = directory_path.rstrip("/")
+        self._store: model.AbstractObjectStore[_IT] = store if store is not None else model.DictObjectStore()
+        if len(self._store):
+            raise ValueError("The underlying ObjectStore of a LogStructuredObjectStore must be empty")
+        self.snapshot_interval: Optional[int] = snapshot_interval
+        self.sync: bool = sync
+        self._lock = threading.RLock()
+        # Identity of stored objects → Identifier they are logged with, for noticing changed Identifiers in `reindex()`
+        self._logged_ids: Dict[int, model.Identifier] = {}
+        # Mutations to be written in write-behind mode: Identifier → object to be written or `None` for deletion
+        self._pending: Dict[model.Identifier, Optional[_IT]] = {}
+        self._logged_since_snapshot = 0
+        self._closed = False
+
+        os.makedirs(self.directory_path, exist_ok=True)
+        self._segment = self._load()
+        self._segment_file = open(self._segment_file_name(self._segment), "ab")
+
+        self._stop = threading.Event()
+        self._flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+        if write_behind:
+            self._thread = threading.Thread(target=self._run, name="LogStructuredObjectStore flusher", daemon=True)
+            self._thread.start()
+
+    def _segment_file_name(self, segment: int) -> str:
+        return os.path.join(self.directory_path, "segment-{:08d}.log".format(segment))
+
+    def _segments(self) -> List[int]:
+        """
+        Get the numbers of all existing segment files in ascending order
+        """
+        segments = []
+        for name in os.listdir(self.directory_path):
+            match = SEGMENT_FILE_PATTERN.match(name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def _load(self) -> int:
+        """
+        Restore the objects from the snapshot and the following segment files into the underlying store
+
+        :return: The number of the segment file to append further mutations to
+        """
+        first_segment = 0
+        try:
+            with open(os.path.join(self.directory_path, SNAPSHOT_FILE_NAME), "rb") as snapshot_file:
+                first_segment = json.loads(snapshot_file.readline())["segment"]
+                for line in snapshot_file:
+                    self._put(json.loads(line, cls=json_deserialization.AASFromJsonDecoder))
+        except FileNotFoundError:
+            pass
+
+        segments = self._segments()
+        for segment in segments:
+            if segment < first_segment:
+                # Left over from an interrupted snapshot, which already contains its mutations
+                os.remove(self._segment_file_name(segment))
+                continue
+            self._replay(segment)
+        logger.debug("Restored %s objects from %s", len(self._store), self.directory_path)
+        return max([first_segment] + segments)
+
+    def _replay(self, segment: int) -> None:
+        """
+        Apply the mutations of a segment file to the underlying store
+
+        An incomplete last line (i.e. a partially written mutation) is removed from the file.
+        """
+        file_name = self._segment_file_name(segment)
+        offset = 0
+        with open(file_name, "rb") as segment_file:
+            for line in segment_file:
+                if not line.endswith(b"\n"):
+                    logger.warning("Discarding incomplete mutation at the end of %s", file_name)
+                    break
+                record = json.loads(line, cls=json_deserialization.AASFromJsonDecoder)
+                if record["op"] == "put":
+                    self._put(record["data"])
+                else:
+                    self._delete(record["id"])
+                self._logged_since_snapshot += 1
+                offset += len(line)
+            else:
+                return
+        os.truncate(file_name, offset)
+
+    def _put(self, x: _IT) -> None:
+        try:
+            self._store.discard(cast(_IT, self._store.get_identifiable(x.id)))
+        except KeyError:
+            pass
+        self._store.add(x)
+        self._logged_ids[id(x)] = x.id
+
+    def _delete(self, identifier: model.Identifier) -> None:
+        try:
+            x = cast(_IT, self._store.get_identifiable(identifier))
+        except KeyError:
+            return
+        self._store.discard(x)
+        del self._logged_ids[id(x)]
+
+    def get_identifiable(self, identifier: model.Identifier) -> _IT:
+        return cast(_IT, self._store.get_identifiable(identifier))
+
+    def add(self, x: _IT) -> None:
+        with self._lock:
+            if x in self._store:
+                return
+            self._store.add(x)
+            self._logged_ids[id(x)] = x.id
+            self._log(x.id, x)
+
+    def discard(self, x: _IT) -> None:
+        with self._lock:
+            if x not in self._store:
+                return
+            self._store.discard(x)
+            del self._logged_ids[id(x)]
+            self._log(x.id, None)
+
+    def reindex(self, x: _IT) -> None:
+        """
+        Log the current state of a stored object, after its attributes have been changed, and update the indexes of
+        the underlying store (if it has any, like :class:`~basyx.aas.model.provider.IndexedDictObjectStore`).
+
+        A changed :class:`~basyx.aas.model.base.Identifier` of the object is only supported, if the underlying store
+        supports it in its own ``reindex()`` method.
+
+        :param x: The changed object, which must be contained in this store
+        :raises KeyError: If the object is not contained in this store or its new
+                          :class:`~basyx.aas.model.base.Identifier` cannot be used
+        """
+        with self._lock:
+            old_id = self._logged_ids.get(id(x))
+            if old_id is None:
+                raise KeyError("Identifiable object {!r} is not stored in this store".format(x))
+            if isinstance(self._store, model.IndexedDictObjectStore):
+                self._store.reindex(x)
+            elif old_id != x.id:
+                raise KeyError("The underlying store of {} does not support changing the id of {!r}"
+                               .format(self.directory_path, x))
+            if old_id != x.id:
+                self._log(old_id, None)
+                self._logged_ids[id(x)] = x.id
+            self._log(x.id, x)
+
+    def _log(self, identifier: model.Identifier, x: Optional[_IT]) -> None:
+        """
+        Log a mutation or keep it for the background thread in write-behind mode
+
+        :param identifier: The :class:`~basyx.aas.model.base.Identifier` of the changed object
+        :param x: The object to be written or ``None``, if it has been deleted
+        """
+        if self._closed:
+            raise ValueError("LogStructuredObjectStore at {} has been closed".format(self.directory_path))
+        if self._thread is not None:
+            self._pending[identifier] = x
+            return
+        self._write([(identifier, x)])
+        self._check_snapshot()
+
+    def _write(self, mutations: Iterable[Tuple[model.Identifier, Optional[_IT]]]) -> None:
+        lines = []
+        for identifier, x in mutations:
+            if x is None:
+                record: Dict[str, object] = {"op": "delete", "id": identifier}
+            else:
+                record = {"op": "put", "data": x}
+            lines.append(json.dumps(record, cls=json_serialization.AASToJsonEncoder, separators=(",", ":")) + "\n")
+        if not lines:
+            return
+        self._segment_file.write("".join(lines).encode("utf-8"))
+        self._segment_file.flush()
+        if self.sync:
+            os.fsync(self._segment_file.fileno())
+        self._logged_since_snapshot += len(lines)
+
+    def _check_snapshot(self) -> None:
+        if self.snapshot_interval is not None and self._logged_since_snapshot >= self.snapshot_interval:
+            self.snapshot()
+
+    def flush(self) -> None:
+        """
+        Write all pending mutations in write-behind mode
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._write_pending()
+            self._check_snapshot()
+
+    def _write_pending(self) -> None:
+        """
+        Write the pending mutations of write-behind mode
+
+        If writing fails, the mutations are kept pending to be written again later.
+        """
+        pending = self._pending
+        self._pending = {}
+        try:
+            self._write(pending.items())
+        except BaseException:
+            pending.update(self._pending)
+            self._pending = pending
+            raise
+
+    def snapshot(self) -> None:
+        """
+        Write a compacted snapshot of all objects and delete the segment files contained in it
+
+        Further mutations are appended to a new segment file. The snapshot is written to a temporary file first, which
+        replaces the previous snapshot afterwards. Thus, the objects can be restored at any time, even if writing the
+        snapshot fails.
+        """
+        with self._lock:
+            self._write_pending()
+            self._segment_file.close()
+            self._segment += 1
+            self._segment_file = open(self._segment_file_name(self._segment), "ab")
+
+            snapshot_file_name = os.path.join(self.directory_path, SNAPSHOT_FILE_NAME)
+            temp_file_name = os.path.join(self.directory_path, ".{}.{}.tmp".format(SNAPSHOT_FILE_NAME,
+                                                                                   uuid.uuid4().hex))
+            try:
+                with open(temp_file_name, "xb") as snapshot_file:
+                    snapshot_file.write(json.dumps({"segment": self._segment}).encode("utf-8") + b"\n")
+                    for x in self._store:
+                        snapshot_file.write(json.dumps(x, cls=json_serialization.AASToJsonEncoder,
+                                                       separators=(",", ":")).encode("utf-8") + b"\n")
+                    snapshot_file.flush()
+                    if self.sync:
+                        os.fsync(snapshot_file.fileno())
+                os.replace(temp_file_name, snapshot_file_name)
+            except BaseException:
+                try:
+                    os.remove(temp_file_name)
+                except FileNotFoundError:
+                    pass
+                raise
+            for segment in self._segments():
+                if segment < self._segment:
+                    os.remove(self._segment_file_name(segment))
+            self._logged_since_snapshot = 0
+            logger.debug("Wrote snapshot of %s objects to %s", len(self._store), snapshot_file_name)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Writing the pending mutations to %s failed", self.directory_path)
+
+    def close(self) -> None:
+        """
+        Stop the background thread (if any), write all pending mutations and close the segment file
+
+        The objects are still available afterwards, but further mutations raise a :class:`ValueError`.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            self._segment_file.close()
+            self._closed = True
+
+    def iter_from(self, after: Optional[model.Identifier] = None) -> Iterator[_IT]:
+        return self._store.iter_from(after)
+
+    def query(self, type_: Type[_QT], id_short: Optional[model.NameType] = None,
+              semantic_id: Optional[model.Reference] = None,
+              global_asset_id: Optional[model.Identifier] = None,
+              specific_asset_ids: Iterable[model.SpecificAssetId] = (),
+              after: Optional[model.Identifier] = None) -> Iterator[_QT]:
+        return self._store.query(type_, id_short, semantic_id, global_asset_id, specific_asset_ids, after)
+
+    def __contains__(self, x: object) -> bool:
+        return x in self._store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __iter__(self) -> Iterator[_IT]:
+        return iter(self._store)
@@ -0,0 +1,563 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+This module adds the functionality of storing and retrieving :class:`~basyx.aas.model.base.Identifiable` objects in a
+local SQLite database, using the :mod:`sqlite3` module of the Python standard library.
+
+In contrast to the other backends, the objects are not stored as a single document each. Instead, each element with an
+``id_short`` (e.g. each :class:`~basyx.aas.model.submodel.SubmodelElement` of a
+:class:`~basyx.aas.model.submodel.Submodel`) is stored as a separate row, keyed by the
+:class:`~basyx.aas.model.base.Identifier` of its Identifiable and its ``id_short`` path. Thus, single elements can be
+read (see :meth:`~.SQLiteObjectStore.get_referable`), updated and committed without touching the rest of the
+Identifiable.
+
+The :class:`~.SQLiteBackend` takes care of updating and committing objects from and to the database, while the
+:class:`~.SQLiteObjectStore` handles adding, deleting and otherwise managing the AAS objects in a specific database.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar, Union, \
+    cast
+import json
+import logging
+import os
+import sqlite3
+import threading
+import urllib.parse
+import weakref
+
+from . import backends
+from ..adapter.json import json_serialization, json_deserialization
+from basyx.aas import model
+
+
+logger = logging.getLogger(__name__)
+
+
+# The schema of the database. Each Identifiable has a row in the `identifiables` table for listing and querying the
+# Identifiables and a row for itself (with the empty path) and for each of its (recursively) contained elements with an
+# id_short in the `elements` table. Each element's row contains the JSON serialization of the element without its child
+# elements with an id_short and the position of the element within the JSON serialization of its parent.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS identifiables (
+    id TEXT PRIMARY KEY,
+    model_type TEXT NOT NULL,
+    id_short TEXT,
+    semantic_id TEXT
+);
+CREATE INDEX IF NOT EXISTS identifiables_model_type ON identifiables (model_type);
+CREATE INDEX IF NOT EXISTS identifiables_semantic_id ON identifiables (semantic_id);
+CREATE TABLE IF NOT EXISTS elements (
+    identifiable_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    attribute TEXT,
+    position INTEGER,
+    wrapped INTEGER NOT NULL DEFAULT 0,
+    model_type TEXT NOT NULL,
+    semantic_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (identifiable_id, path)
+);
+CREATE INDEX IF NOT EXISTS elements_model_type ON elements (model_type);
+CREATE INDEX IF NOT EXISTS elements_semantic_id ON elements (semantic_id);
+"""
+
+# The separator of the id_shorts in the paths of the elements. It is not allowed in id_shorts and the next character
+# ("/") is used as the upper bound for selecting all elements within an element.
+PATH_SEPARATOR = "."
+
+
+class _Row(NamedTuple):
+    """
+    A row of the ``elements`` table
+    """
+    path: Tuple[str, ...]
+    attribute: Optional[str]
+    position: Optional[int]
+    wrapped: bool
+    data: Dict[str, Any]
+
+
+class SQLiteBackend(backends.Backend):
+    """
+    This Backend stores each Identifiable object and each of its (recursively) contained elements with an ``id_short``
+    as a row in a local SQLite database.
+
+    The source of objects in such a database is ``sqlite://localhost/<database path>?id=<identifier>``. Elements, which
+    have been retrieved separately (via :meth:`~.SQLiteObjectStore.get_referable`), have a source with the additional
+    query parameter ``path=<id_short path>``. Updating or committing an element with an ``id_short`` path only reads or
+    writes the rows of the element and its contained elements. Elements of
+    :class:`SubmodelElementLists <basyx.aas.model.submodel.SubmodelElementList>` have no ``id_short``, so they are
+    stored within the row of their list.
+    """
+    @classmethod
+    def update_object(cls,
+                      updated_object: model.Referable,
+                      store_object: model.Referable,
+                      relative_path: List[str]) -> None:
+        database_path, identifier, path = _parse_source(store_object.source)
+        # Elements of SubmodelElementLists can't be addressed, so the nearest addressable ancestor is updated
+        named_path, updated_object = backends.find_addressable_element(store_object, relative_path)
+        data = _read_element(get_connection(database_path), identifier, path + tuple(named_path))
+        if data is None:
+            raise KeyError("No element {} of Identifiable with id {} found in SQLite database {}"
+                           .format(PATH_SEPARATOR.join(path + tuple(named_path)), identifier, database_path))
+        updated_object.update_from(json.loads(json.dumps(data), cls=json_deserialization.AASFromJsonDecoder))
+
+    @classmethod
+    def commit_object(cls,
+                      committed_object: model.Referable,
+                      store_object: model.Referable,
+                      relative_path: List[str]) -> None:
+        database_path, identifier, path = _parse_source(store_object.source)
+        # Elements of SubmodelElementLists can't be addressed, so the nearest addressable ancestor is committed
+        named_path, committed_object = backends.find_addressable_element(store_object, relative_path)
+        connection = get_connection(database_path)
+        with _connection_lock(connection), connection:
+            while not _write_element(connection, identifier, path + tuple(named_path),
+                                     _to_json_data(committed_object)):
+                # The element is not stored (e.g. since it has been added or its id_short has been changed since), so
+                # its nearest stored ancestor is committed instead
+                if not named_path:
+                    raise KeyError("No element {} of Identifiable with id {} found in SQLite database {}"
+                                   .format(PATH_SEPARATOR.join(path), identifier, database_path))
+                named_path = named_path[:-1]
+                committed_object = cast(model.Referable, committed_object.parent)
+
+
+backends.register_backend("sqlite", SQLiteBackend)
+
+
+# The connections to the databases in this process by their (absolute) path
+_connections: Dict[str, Tuple[int, sqlite3.Connection, threading.RLock]] = {}
+_connections_lock = threading.Lock()
+
+
+def get_connection(database_path: str) -> sqlite3.Connection:
+    """
+    Get the connection to the given SQLite database for this process, which is shared by all threads. The database
+    is created, if it does not exist yet.
+
+    :param database_path: The path of the database file
+    """
+    database_path = os.path.abspath(database_path)
+    with _connections_lock:
+        connection = _connections.get(database_path)
+        # Connections must not be shared with forked processes
+        if connection is None or connection[0] != os.getpid():
+            sqlite_connection = sqlite3.connect(database_path, check_same_thread=False)
+            sqlite_connection.execute("PRAGMA journal_mode=WAL")
+            sqlite_connection.executescript(SCHEMA)
+            connection = _connections[database_path] = (os.getpid(), sqlite_connection, threading.RLock())
+        return connection[1]
+
+
+def _connection_lock(connection: sqlite3.Connection) -> threading.RLock:
+    """
+    Get the lock for using the given connection (from :func:`~.get_connection`) in a thread
+    """
+    with _connections_lock:
+        for _pid, sqlite_connection, lock in _connections.values():
+            if sqlite_connection is connection:
+                return lock
+    raise ValueError("Unknown connection")
+
+
+def _parse_source(source: str) -> Tuple[str, model.Identifier, Tuple[str, ...]]:
+    """
+    Parse the source of an object in an SQLite database into the path of the database, the
+    :class:`~basyx.aas.model.base.Identifier` of the Identifiable and the ``id_short`` path of the object
+
+    :raises SQLiteBackendSourceError: If the source is not a valid source of this backend
+    """
+    if not source.startswith("sqlite://localhost/"):
+        raise SQLiteBackendSourceError("Source {} is not an SQLite database".format(source))
+    database_path, _, query = source[len("sqlite://localhost/"):].partition("?")
+    parameters = urllib.parse.parse_qs(query)
+    if "id" not in parameters:
+        raise SQLiteBackendSourceError("Source {} does not contain an identifier".format(source))
+    path = tuple(parameters["path"][0].split(PATH_SEPARATOR)) if "path" in parameters else ()
+    return database_path, parameters["id"][0], path
+
+
+def _generate_source(database_path: str, identifier: model.Identifier, path: Sequence[str] = ()) -> str:
+    parameters = {"id": identifier}
+    if path:
+        parameters["path"] = PATH_SEPARATOR.join(path)
+    return "sqlite://localhost/{}?{}".format(database_path, urllib.parse.urlencode(parameters))
+
+
+def _to_json_data(obj: object) -> Any:
+    return json.loads(json.dumps(obj, cls=json_serialization.AASToJsonEncoder))
+
+
+def _semantic_id_key(data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Get the canonical JSON serialization of a ``semanticId``, which is stored in the database for querying
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":")) if data is not None else None
+
+
+def _split_rows(data: Dict[str, Any], path: Tuple[str, ...] = (), attribute: Optional[str] = None,
+                position: Optional[int] = None, wrapped: bool = False) -> Iterator[_Row]:
+    """
+    Split the JSON serialization of a Referable into the rows of the Referable and of all its (recursively) contained
+    elements with an id_short. The child elements are removed from the JSON data of their parents.
+    """
+    children: List[Tuple[Dict[str, Any], str, int, bool]] = []
+    child_attributes = [(a, True) for a in backends.JSON_OPERATION_VARIABLE_ATTRIBUTES]
+    if data.get("modelType") in backends.JSON_CHILD_ATTRIBUTES:
+        child_attributes.insert(0, (backends.JSON_CHILD_ATTRIBUTES[data["modelType"]], False))
+    for child_attribute, container_wrapped in child_attributes:
+        container = data.get(child_attribute)
+        if not isinstance(container, list):
+            continue
+        remaining = []
+        for index, item in enumerate(container):
+            child = item.get("value") if container_wrapped and isinstance(item, dict) else item
+            if isinstance(child, dict) and isinstance(child.get("idShort"), str):
+                children.append((child, child_attribute, index, container_wrapped))
+            else:
+                remaining.append(item)
+        data[child_attribute] = remaining
+    yield _Row(path, attribute, position, wrapped, data)
+    for child, child_attribute, index, container_wrapped in children:
+        yield from _split_rows(child, path + (child["idShort"],), child_attribute, index, container_wrapped)
+
+
+def _join_rows(rows: Iterable[_Row]) -> Optional[Dict[str, Any]]:
+    """
+    Reassemble the JSON serialization of a Referable from the rows of the Referable and its contained elements (as
+    returned by :func:`~._split_rows`)
+    """
+    elements: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    root: Optional[Dict[str, Any]] = None
+    for row in sorted(rows, key=lambda r: (len(r.path), r.position or 0)):
+        if root is None:
+            root = elements[row.path] = row.data
+            continue
+        parent = elements.get(row.path[:-1])
+        if parent is None or row.attribute is None:
+            continue
+        elements[row.path] = row.data
+        parent.setdefault(row.attribute, []).insert(row.position or 0, {"value": row.data} if row.wrapped
+                                                    else row.data)
+    return root
+
+
+def _path_condition(path: Sequence[str]) -> Tuple[str, List[str]]:
+    """
+    Get an SQL condition (and its parameters) for selecting the rows of an element and all its contained elements
+    """
+    if not path:
+        return "", []
+    path_key = PATH_SEPARATOR.join(path)
+    return " AND (path = ? OR (path >= ? AND path < ?))", \
+        [path_key, path_key + PATH_SEPARATOR, path_key + chr(ord(PATH_SEPARATOR) + 1)]
+
+
+def _read_element(connection: sqlite3.Connection, identifier: model.Identifier, path: Sequence[str]) \
+        -> Optional[Dict[str, Any]]:
+    """
+    Read the JSON serialization of an element (or the Identifiable itself for an empty path) from the rows of the
+    element and its contained elements
+
+    :return: The JSON data or ``None``, if there is no such element
+    """
+    condition, parameters = _path_condition(path)
+    with _connection_lock(connection):
+        result = connection.execute("SELECT path, attribute, position, wrapped, data FROM elements "
+                                    "WHERE identifiable_id = ?" + condition, [identifier] + parameters).fetchall()
+    rows = [_Row(tuple(row_path.split(PATH_SEPARATOR)) if row_path else (), attribute, position, bool(wrapped),
+                 json.loads(data))
+            for row_path, attribute, position, wrapped, data in result]
+    return _join_rows(rows)
+
+
+def _write_element(connection: sqlite3.Connection, identifier: model.Identifier, path: Sequence[str],
+                   data: Dict[str, Any]) -> bool:
+    """
+    Replace the rows of an element (or the Identifiable itself for an empty path) and its contained elements by the
+    rows of the given JSON serialization. Must be called within a transaction.
+
+    :return: ``False`` (without writing anything), if the element is not stored in the database
+    """
+    path = tuple(path)
+    attribute: Optional[str] = None
+    position: Optional[int] = None
+    wrapped = False
+    if path:
+        existing = connection.execute("SELECT attribute, position, wrapped FROM elements "
+                                      "WHERE identifiable_id = ? AND path = ?",
+                                      (identifier, PATH_SEPARATOR.join(path))).fetchone()
+        if existing is None:
+            return False
+        attribute, position, wrapped = existing[0], existing[1], bool(existing[2])
+    condition, parameters = _path_condition(path)
+    connection.execute("DELETE FROM elements WHERE identifiable_id = ?" + condition, [identifier] + parameters)
+    rows = list(_split_rows(data, path, attribute, position, wrapped))
+    connection.executemany(
+        "INSERT INTO elements (identifiable_id, path, attribute, position, wrapped, model_type, semantic_id, data) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(identifier, PATH_SEPARATOR.join(row.path), row.attribute, row.position, int(row.wrapped),
+          row.data.get("modelType", ""), _semantic_id_key(row.data.get("semanticId")),
+          json.dumps(row.data, separators=(",", ":")))
+         for row in rows])
+    if not path:
+        connection.execute("INSERT OR REPLACE INTO identifiables (id, model_type, id_short, semantic_id) "
+                           "VALUES (?, ?, ?, ?)",
+                           (identifier, data.get("modelType", ""), data.get("idShort"),
+                            _semantic_id_key(data.get("semanticId"))))
+    return True
+
+
+_QT = TypeVar('_QT', bound=model.Identifiable)
+
+
+class SQLiteObjectStore(model.AbstractObjectStore):
+    """
+    An ObjectStore implementation for :class:`~basyx.aas.model.base.Identifiable` BaSyx Python SDK objects backed by a
+    local SQLite database
+
+    The database is created when the store is initialized. Objects are only read from the database on request, so the
+    store can hold more objects than fit into memory. Single elements can be read via :meth:`~.get_referable` and are
+    committed without rewriting the whole Identifiable (see :class:`~.SQLiteBackend`).
+    """
+    def __init__(self, database_path: str):
+        """
+        Initializer of class SQLiteObjectStore
+
+        :param database_path: Path of the SQLite database file
+        """
+        self.database_path: str = os.path.abspath(database_path)
+        self._connection = get_connection(self.database_path)
+        self._lock = _connection_lock(self._connection)
+
+        # A dictionary of weak references to local replications of stored objects. Objects are kept in this cache as
+        # long as there is any other reference in the Python application to them. We use this to make sure that only one
+        # local replication of each object is kept in the application and retrieving an object from the store always
+        # returns the **same** (not only equal) object. Still, objects are forgotten, when they are not referenced
+        # anywhere else to save memory.
+        self._object_cache: weakref.WeakValueDictionary[model.Identifier, model.Identifiable] \
+            = weakref.WeakValueDictionary()
+        self._object_cache_lock = threading.Lock()
+
+    def get_identifiable(self, identifier: model.Identifier) -> model.Identifiable:
+        """
+        Retrieve an AAS object from the SQLite database by its :class:`~basyx.aas.model.base.Identifier`
+
+        :raises KeyError: If no such object is stored in the database
+        """
+        data = _read_element(self._connection, identifier, ())
+        if data is None:
+            raise KeyError("No Identifiable with id {} found in SQLite database".format(identifier))
+        obj = json.loads(json.dumps(data), cls=json_deserialization.AASFromJsonDecoder)
+        if not isinstance(obj, model.Identifiable):
+            raise TypeError("Object with id {} in SQLite database is not an Identifiable".format(identifier))
+        obj.source = _generate_source(self.database_path, identifier)
+        # If we still have a local replication of that object (since it is referenced from anywhere else), update that
+        # replication and return it.
+        with self._object_cache_lock:
+            if identifier in self._object_cache:
+                old_obj = self._object_cache[identifier]
+                # If the source does not match the correct source for this database, the object seems to belong to
+                # another backend now, so we return a fresh copy
+                if old_obj.source == obj.source:
+                    old_obj.update_from(obj)
+                    return old_obj
+            self._object_cache[identifier] = obj
+        return obj
+
+    def get_referable(self, identifier: model.Identifier,
+                      id_short: Union[model.NameType, Iterable[model.NameType]]) -> model.Referable:
+        """
+        Retrieve a single element of an AAS object from the SQLite database by the
+        :class:`~basyx.aas.model.base.Identifier` of the object and the element's ``id_short`` path (like
+        :meth:`basyx.aas.model.base.UniqueIdShortNamespace.get_referable`), reading only the rows of the element.
+
+        The element is returned without its parent, but with its own source, so updating and committing it only
+        affects the element within the database.
+
+        :param identifier: The :class:`~basyx.aas.model.base.Identifier` of the Identifiable, containing the element
+        :param id_short: The id_short or id_short path of the element. It may contain
+                         :class:`~basyx.aas.model.submodel.SubmodelElementList` indices.
+        :raises KeyError: If no such element is stored in the database
+        """
+        path = [id_short] if isinstance(id_short, str) else list(id_short)
+        named_path: List[str] = []
+        for item in path:
+            if item.isdecimal():
+                break
+            named_path.append(item)
+        if not named_path:
+            identifiable = self.get_identifiable(identifier)
+            if not isinstance(identifiable, model.UniqueIdShortNamespace):
+                raise KeyError("Identifiable with id {} has no element {}".format(identifier, path))
+            return identifiable.get_referable(path)
+        data = _read_element(self._connection, identifier, named_path)
+        if data is None:
+            raise KeyError("No element {} of Identifiable with id {} found in SQLite database"
+                           .format(PATH_SEPARATOR.join(named_path), identifier))
+        element = json.loads(json.dumps(data), cls=json_deserialization.AASFromJsonDecoder)
+        element.source = _generate_source(self.database_path, identifier, named_path)
+        if len(named_path) < len(path):
+            if not isinstance(element, model.UniqueIdShortNamespace):
+                raise KeyError("Element {} of Identifiable with id {} has no element {}"
+                               .format(PATH_SEPARATOR.join(named_path), identifier, path[len(named_path):]))
+            return element.get_referable(path[len(named_path):])
+        return element
+
+    def add(self, x: model.Identifiable) -> None:
+        """
+        Add an object to the store
+
+        :raises KeyError: If an object with the same id exists already in the object store
+        """
+        logger.debug("Adding object %s to SQLite database ...", repr(x))
+        with self._lock, self._connection:
+            if self._connection.execute("SELECT 1 FROM identifiables WHERE id = ?", (x.id,)).fetchone() is not None:
+                raise KeyError("Identifiable with id {} already exists in SQLite database".format(x.id))
+            _write_element(self._connection, x.id, (), _to_json_data(x))
+        with self._object_cache_lock:
+            self._object_cache[x.id] = x
+        x.source = _generate_source(self.database_path, x.id)
+
+    def discard(self, x: model.Identifiable) -> None:
+        """
+        Delete an :class:`~basyx.aas.model.base.Identifiable` AAS object from the SQLite database
+
+        :param x: The object to be deleted
+        :raises KeyError: If the object does not exist in the database
+        """
+        logger.debug("Deleting object %s from SQLite database ...", repr(x))
+        with self._lock, self._connection:
+            if self._connection.execute("DELETE FROM identifiables WHERE id = ?", (x.id,)).rowcount == 0:
+                raise KeyError("No AAS object with id {} exists in SQLite database".format(x.id))
+            self._connection.execute("DELETE FROM elements WHERE identifiable_id = ?", (x.id,))
+        with self._object_cache_lock:
+            self._object_cache.pop(x.id, None)
+        x.source = ""
+
+    def __contains__(self, x: object) -> bool:
+        """
+        Check if an object with the given :class:`~basyx.aas.model.base.Identifier` or the same
+        :class:`~basyx.aas.model.base.Identifier` as the given object is contained in the SQLite database
+
+        :param x: AAS object :class:`~basyx.aas.model.base.Identifier` or :class:`~basyx.aas.model.base.Identifiable`
+                  AAS object
+        :return: ``True`` if such an object exists in the database, ``False`` otherwise
+        """
+        if isinstance(x, model.Identifier):
+            identifier = x
+        elif isinstance(x, model.Identifiable):
+            identifier = x.id
+        else:
+            return False
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM identifiables WHERE id = ?",
+                                            (identifier,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        """
+        Retrieve the number of objects in the SQLite database
+        """
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM identifiables").fetchone()[0]
+
+    def __iter__(self) -> Iterator[model.Identifiable]:
+        """
+        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the SQLite database, ordered by their
+        :class:`~basyx.aas.model.base.Identifier`. The objects are retrieved on the fly.
+        """
+        return self.iter_from()
+
+    def iter_from(self, after: Optional[model.Identifier] = None, batch_size: int = 100) \
+            -> Iterator[model.Identifiable]:
+        """
+        Iterate all :class:`~basyx.aas.model.base.Identifiable` objects in the SQLite database, ordered by their
+        :class:`~basyx.aas.model.base.Identifier`, starting after the given :class:`~basyx.aas.model.base.Identifier`
+
+        :param after: The :class:`~basyx.aas.model.base.Identifier` to start after or ``None`` to start at the first
+                      object
+        :param batch_size: The number of identifiers to fetch from the database at once
+        """
+        return self._iter_identifiables("", [], after, batch_size)
+
+    def query(self, type_: Type[_QT], id_short: Optional[model.NameType] = None,
+              semantic_id: Optional[model.Reference] = None, global_asset_id: Optional[model.Identifier] = None,
+              specific_asset_ids: Iterable[model.SpecificAssetId] = (),
+              after: Optional[model.Identifier] = None) -> Iterator[_QT]:
+        """
+        Iterate all stored objects of the given type, which match all of the given criteria, ordered like
+        :meth:`~.iter_from`.
+
+        The type, ``id_short`` and ``semantic_id`` are checked via the indexes of the database, so only matching
+        objects are read. See :meth:`basyx.aas.model.provider.AbstractObjectStore.query` for the parameters.
+        """
+        specific_asset_ids = list(specific_asset_ids)
+        model_types = sorted(t.__name__ for t in model.KEY_TYPES_CLASSES
+                             if issubclass(t, type_) or issubclass(type_, t))
+        condition = " AND model_type IN ({})".format(", ".join("?" * len(model_types)))
+        parameters: List[Any] = list(model_types)
+        if id_short is not None:
+            condition += " AND id_short = ?"
+            parameters.append(id_short)
+        if semantic_id is not None:
+            condition += " AND semantic_id = ?"
+            parameters.append(_semantic_id_key(_to_json_data(semantic_id)))
+        for obj in self._iter_identifiables(condition, parameters, after, 100):
+            if isinstance(obj, type_) and self._matches(obj, id_short, semantic_id, global_asset_id,
+                                                        specific_asset_ids):
+                yield obj
+
+    def query_elements(self, type_: Type[model.Referable] = model.SubmodelElement,
+                       semantic_id: Optional[model.Reference] = None) -> Iterator[Tuple[model.Identifier, str]]:
+        """
+        Find the stored elements (with an ``id_short``) of the given type and with the given ``semantic_id`` via the
+        indexes of the database, without reading any elements
+
+        :param type_: The type of the elements
+        :param semantic_id: The ``semantic_id`` of the elements or ``None`` to find elements with any ``semantic_id``
+        :return: An iterator of the :class:`~basyx.aas.model.base.Identifier` of the containing Identifiable and the
+                 ``id_short`` path of each element, which can be passed to :meth:`~.get_referable`
+        """
+        model_types = sorted(t.__name__ for t in model.KEY_TYPES_CLASSES if issubclass(t, type_))
+        condition = "model_type IN ({}) AND path != ''".format(", ".join("?" * len(model_types)))
+        parameters: List[Any] = list(model_types)
+        if semantic_id is not None:
+            condition += " AND semantic_id = ?"
+            parameters.append(_semantic_id_key(_to_json_data(semantic_id)))
+        with self._lock:
+            result = self._connection.execute("SELECT identifiable_id, path FROM elements WHERE " + condition
+                                              + " ORDER BY identifiable_id, path", parameters).fetchall()
+        for identifier, path in result:
+            yield identifier, path
+
+    def _iter_identifiables(self, condition: str, parameters: List[Any], after: Optional[model.Identifier],
+                            batch_size: int) -> Iterator[model.Identifiable]:
+        """
+        Iterate the stored objects, whose rows in the ``identifiables`` table match the given SQL condition, in batches
+        """
+        while True:
+            with self._lock:
+                identifiers = [row[0] for row in self._connection.execute(
+                    "SELECT id FROM identifiables WHERE id > ?" + condition + " ORDER BY id LIMIT ?",
+                    [after if after is not None else ""] + parameters + [batch_size]).fetchall()]
+            for identifier in identifiers:
+                try:
+                    yield self.get_identifiable(identifier)
+                except KeyError:
+                    # The object has been deleted in the meantime
+                    continue
+            if len(identifiers) < batch_size:
+                return
+            after = identifiers[-1]
+
+
+class SQLiteBackendSourceError(Exception):
+    """
+    Raised, if the given object's source is not resolvable as an object in an SQLite database
+    """
+    pass
@@ -27,6 +27,7 @@ The following types aliased in the :mod:`~basyx.aas.model.base` module are const
 - :class:`~basyx.aas.model.base.ValueTypeIEC61360`
 """
 
+import functools
 import re
 
 from typing import Callable, Optional, Type, TypeVar
@@ -119,9 +120,9 @@ def create_check_function(min_length: int = 0, max_length: Optional[int] = None,
     values are :class:`ShortNames <basyx.aas.model.base.ShortNameType>`. All other
     :class:`:class:`ConstrainedLangStringSets <basyx.aas.model.base.ConstrainedLangStringSet>` use custom constraints.
     """
-    def check_fn(value: str, type_name: str) -> None:
-        return check(value, type_name, min_length, max_length, pattern)
-    return check_fn
+    # A partial object of the module-level function is used instead of a closure to keep the objects using the check
+    # function picklable (e.g. for transferring them between processes).
+    return functools.partial(check, min_length=min_length, max_length=max_length, pattern=pattern)
 
 
 # Decorator functions to add getter/setter to classes for verification, whenever a value is updated.
@@ -12,6 +12,7 @@ the higher level classes to inherit from.
 import abc
 import inspect
 import itertools
+import time
 from enum import Enum, unique
 from typing import List, Optional, Set, TypeVar, MutableSet, Generic, Iterable, Dict, Iterator, Union, overload, \
     MutableSequence, Type, Any, TYPE_CHECKING, Tuple, Callable, MutableMapping
@@ -606,6 +607,11 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
     :ivar source: Source of the object, a URI, that defines where this object's data originates from.
                   This is used to specify where the Referable should be updated from and committed to.
                   Default is an empty string, making it use the source of its ancestor, if possible.
+    :ivar last_source_update: Time of the last successful :meth:`~.update` of this object from its (or its ancestor's)
+                              source, as returned by :func:`time.monotonic`, or ``None``, if it has not been updated yet
+    :ivar commit_version: Number of calls of :meth:`~.commit` on this object or any of its descendants. It allows users
+                          of the object (e.g. caches) to notice changes, which have been committed, even if the object
+                          has no source.
     """
     @abc.abstractmethod
     def __init__(self):
@@ -618,6 +624,8 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         # simpler and faster navigation/checks and it has no effect in the serialized data formats anyway.
         self.parent: Optional[UniqueIdShortNamespace] = None
         self.source: str = ""
+        self.last_source_update: Optional[float] = None
+        self.commit_version: int = 0
 
     def __repr__(self) -> str:
         reversed_path = []
@@ -744,31 +752,38 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         If there is no source in any ancestor, this function will do nothing
 
         :param max_age: Maximum age of the local data in seconds. This method may return early, if the previous update
-                        of the object has been performed less than ``max_age`` seconds ago.
+                        of the object (or one of its ancestors up to the one with the source) has been performed less
+                        than ``max_age`` seconds ago. Children with their own source are checked individually.
         :param recursive: Also call update on all children of this object. Default is True
         :param _indirect_source: Internal parameter to avoid duplicate updating.
         :raises backends.BackendError: If no appropriate backend or the data source is not available
         """
-        # TODO consider max_age
         if not _indirect_source:
             # Update was already called on an ancestor of this Referable. Only update it, if it has its own source
-            if self.source != "":
+            if self.source != "" and not self._updated_within(max_age, self):
+                update_time = time.monotonic()
                 backends.get_backend(self.source).update_object(updated_object=self,
                                                                 store_object=self,
                                                                 relative_path=[])
+                self.last_source_update = update_time
 
         else:
             # Try to find a valid source for this Referable
             if self.source != "":
-                backends.get_backend(self.source).update_object(updated_object=self,
-                                                                store_object=self,
-                                                                relative_path=[])
+                if not self._updated_within(max_age, self):
+                    update_time = time.monotonic()
+                    backends.get_backend(self.source).update_object(updated_object=self,
+                                                                    store_object=self,
+                                                                    relative_path=[])
+                    self.last_source_update = update_time
             else:
                 store_object, relative_path = self.find_source()
-                if store_object and relative_path is not None:
+                if store_object and relative_path is not None and not self._updated_within(max_age, store_object):
+                    update_time = time.monotonic()
                     backends.get_backend(store_object.source).update_object(updated_object=self,
                                                                             store_object=store_object,
                                                                             relative_path=list(relative_path))
+                    self.last_source_update = update_time
 
         if recursive:
             # update all the children who have their own source
@@ -779,6 +794,27 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                     for referable in namespace_set:
                         referable.update(max_age, recursive=True, _indirect_source=False)
 
+    def _updated_within(self, max_age: float, store_object: "Referable") -> bool:
+        """
+        Checks if this object has been updated from the source of ``store_object`` less than ``max_age`` seconds ago.
+        This is the case, if this object or any of its ancestors up to ``store_object`` has been updated since then,
+        as the update of an object includes all of its descendants without an own source.
+
+        :param max_age: Maximum age of the local data in seconds
+        :param store_object: This object or the ancestor, whose source is used to update this object
+        """
+        if max_age <= 0:
+            return False
+        threshold = time.monotonic() - max_age
+        referable: Referable = self
+        while True:
+            if referable.last_source_update is not None and referable.last_source_update > threshold:
+                return True
+            if referable is store_object or referable.parent is None:
+                return False
+            assert isinstance(referable.parent, Referable)
+            referable = referable.parent
+
     def find_source(self) -> Tuple[Optional["Referable"], Optional[List[str]]]:  # type: ignore
         """
         Finds the closest source in these objects ancestors. If there is no source, returns None
@@ -812,8 +848,10 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                               recursively
         """
         for name, var in vars(other).items():
-            # do not update the parent, namespace_element_sets or source (depending on update_source parameter)
-            if name in ("parent", "namespace_element_sets") or name == "source" and not update_source:
+            # do not update the parent, namespace_element_sets, last_source_update, commit_version or source (depending
+            # on update_source parameter)
+            if name in ("parent", "namespace_element_sets", "last_source_update", "commit_version") \
+                    or name == "source" and not update_source:
                 continue
             if isinstance(var, NamespaceSet):
                 # update the elements of the NameSpaceSet
@@ -826,13 +864,16 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         Transfer local changes on this object to all underlying external data sources.
 
         This function commits the current state of this object to its own and each external data source of its
-        ancestors. If there is no source, this function will do nothing.
+        ancestors. If there is no source, this function will only increment the ``commit_version`` of this object and
+        its ancestors.
         """
+        self.commit_version += 1
         current_ancestor = self.parent
         relative_path: List[NameType] = [self.id_short]
         # Commit to all ancestors with sources
         while current_ancestor:
             assert isinstance(current_ancestor, Referable)
+            current_ancestor.commit_version += 1
             if current_ancestor.source != "":
                 backends.get_backend(current_ancestor.source).commit_object(committed_object=self,
                                                                             store_object=current_ancestor,
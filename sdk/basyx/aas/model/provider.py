@@ -11,9 +11,18 @@ This module implements Registries for the AAS, in order to enable resolving glob
 """
 
 import abc
-from typing import MutableSet, Iterator, Generic, TypeVar, Dict, List, Optional, Iterable
+import bisect
+import collections
+import heapq
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import MutableSet, Iterator, Generic, TypeVar, Dict, List, Optional, Iterable, Any, Tuple, Type, \
+    Callable, NamedTuple, cast
 
-from .base import Identifier, Identifiable
+from .base import Identifier, Identifiable, HasSemantics, NameType, Reference, SpecificAssetId
+from .aas import AssetAdministrationShell
 
 
 class AbstractObjectProvider(metaclass=abc.ABCMeta):
@@ -57,6 +66,7 @@ class AbstractObjectProvider(metaclass=abc.ABCMeta):
 
 
 _IT = TypeVar('_IT', bound=Identifiable)
+_QT = TypeVar('_QT', bound=Identifiable)
 
 
 class AbstractObjectStore(AbstractObjectProvider, MutableSet[_IT], Generic[_IT], metaclass=abc.ABCMeta):
@@ -79,6 +89,94 @@ class AbstractObjectStore(AbstractObjectProvider, MutableSet[_IT], Generic[_IT],
         for x in other:
             self.add(x)
 
+    def iter_from(self, after: Optional[Identifier] = None) -> Iterator[_IT]:
+        """
+        Iterate the objects of this store in a stable order, starting after the position of the object with the given
+        :class:`~basyx.aas.model.base.Identifier`.
+
+        This allows keyset pagination, where the next page of objects is requested by the
+        :class:`~basyx.aas.model.base.Identifier` of the last object of the previous page. The order is defined by the
+        store, but it must not change when objects are added or removed, and the position of an
+        :class:`~basyx.aas.model.base.Identifier` must be determinable, even if there is no such object in the store
+        (anymore).
+
+        The default implementation sorts all objects of the store by their :class:`~basyx.aas.model.base.Identifier`.
+        Stores should override it with an implementation, which does not need to retrieve the skipped objects.
+
+        :param after: The :class:`~basyx.aas.model.base.Identifier` to start after or ``None`` to start at the first
+                      object
+        :return: An iterator over the objects of this store following the given position
+        """
+        for x in sorted(self, key=lambda obj: obj.id):
+            if after is None or x.id > after:
+                yield x
+
+    def query(self, type_: Type[_QT], id_short: Optional[NameType] = None, semantic_id: Optional[Reference] = None,
+              global_asset_id: Optional[Identifier] = None,
+              specific_asset_ids: Iterable[SpecificAssetId] = (),
+              after: Optional[Identifier] = None) -> Iterator[_QT]:
+        """
+        Iterate all stored objects of the given type, which match all of the given criteria, ordered like
+        :meth:`~.iter_from`.
+
+        The default implementation filters the objects returned by :meth:`~.iter_from`. Stores should override it with
+        an implementation, which makes use of indexes to avoid retrieving non-matching objects.
+
+        :param type_: Only objects of this type (including subtypes) are returned
+        :param id_short: If given, only objects with this ``id_short`` are returned
+        :param semantic_id: If given, only objects with this ``semantic_id`` are returned
+        :param global_asset_id: If given, only :class:`AssetAdministrationShells
+                                <basyx.aas.model.aas.AssetAdministrationShell>` with this ``global_asset_id`` are
+                                returned
+        :param specific_asset_ids: If given, only :class:`AssetAdministrationShells
+                                   <basyx.aas.model.aas.AssetAdministrationShell>` with all of these
+                                   :class:`SpecificAssetIds <basyx.aas.model.base.SpecificAssetId>` are returned
+        :param after: If given, only objects following the position of this :class:`~basyx.aas.model.base.Identifier`
+                      are returned
+        :return: An iterator over the matching objects
+        """
+        specific_asset_ids = list(specific_asset_ids)
+        for obj in self.iter_from(after):
+            if isinstance(obj, type_) and self._matches(obj, id_short, semantic_id, global_asset_id,
+                                                        specific_asset_ids):
+                yield obj
+
+    @staticmethod
+    def _matches(obj: Identifiable, id_short: Optional[NameType], semantic_id: Optional[Reference],
+                 global_asset_id: Optional[Identifier], specific_asset_ids: List[SpecificAssetId]) -> bool:
+        if id_short is not None and obj.id_short != id_short:
+            return False
+        if semantic_id is not None and (not isinstance(obj, HasSemantics) or obj.semantic_id != semantic_id):
+            return False
+        if global_asset_id is not None or specific_asset_ids:
+            if not isinstance(obj, AssetAdministrationShell):
+                return False
+            asset_information = obj.asset_information
+            if global_asset_id is not None and asset_information.global_asset_id != global_asset_id:
+                return False
+            return all(specific_asset_id in asset_information.specific_asset_id
+                       for specific_asset_id in specific_asset_ids)
+        return True
+
+
+def _iter_sorted_after(sorted_ids: List[Identifier], after: Optional[Identifier]) -> Iterator[Identifier]:
+    """
+    Iterate the :class:`Identifiers <basyx.aas.model.base.Identifier>` of a sorted list, which are greater than
+    ``after``. The list may be modified (keeping it sorted) while iterating.
+    """
+    while True:
+        index = bisect.bisect_right(sorted_ids, after) if after is not None else 0
+        if index >= len(sorted_ids):
+            return
+        after = sorted_ids[index]
+        yield after
+
+
+def _sorted_remove(sorted_ids: List[Identifier], identifier: Identifier) -> None:
+    index = bisect.bisect_left(sorted_ids, identifier)
+    if index < len(sorted_ids) and sorted_ids[index] == identifier:
+        del sorted_ids[index]
+
 
 class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
     """
@@ -87,6 +185,9 @@ class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
     """
     def __init__(self, objects: Iterable[_IT] = ()) -> None:
         self._backend: Dict[Identifier, _IT] = {}
+        # Sorted list of all stored Identifiers for `iter_from()`. It is only created on demand and kept up to date
+        # afterwards.
+        self._sorted_ids: Optional[List[Identifier]] = None
         for x in objects:
             self.add(x)
 
@@ -94,14 +195,34 @@ class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
         return self._backend[identifier]
 
     def add(self, x: _IT) -> None:
-        if x.id in self._backend and self._backend.get(x.id) is not x:
-            raise KeyError("Identifiable object with same id {} is already stored in this store"
-                           .format(x.id))
+        if x.id in self._backend:
+            if self._backend.get(x.id) is not x:
+                raise KeyError("Identifiable object with same id {} is already stored in this store"
+                               .format(x.id))
+            return
         self._backend[x.id] = x
+        if self._sorted_ids is not None:
+            bisect.insort(self._sorted_ids, x.id)
 
     def discard(self, x: _IT) -> None:
         if self._backend.get(x.id) is x:
             del self._backend[x.id]
+            if self._sorted_ids is not None:
+                _sorted_remove(self._sorted_ids, x.id)
+
+    def iter_from(self, after: Optional[Identifier] = None) -> Iterator[_IT]:
+        """
+        Iterate the objects of this store ordered by their :class:`~basyx.aas.model.base.Identifier`, starting after
+        the given :class:`~basyx.aas.model.base.Identifier`.
+
+        :param after: The :class:`~basyx.aas.model.base.Identifier` to start after or ``None`` to start at the first
+                      object
+        :return: An iterator over the objects of this store following the given position
+        """
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self._backend)
+        for identifier in _iter_sorted_after(self._sorted_ids, after):
+            yield self._backend[identifier]
 
     def __contains__(self, x: object) -> bool:
         if isinstance(x, Identifier):
@@ -117,6 +238,401 @@ class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
         return iter(self._backend.values())
 
 
+class IndexedDictObjectStore(DictObjectStore[_IT], Generic[_IT]):
+    """
+    A local in-memory object store like :class:`~.DictObjectStore`, which additionally maintains a partition of the
+    stored objects per type and secondary indexes on their ``id_short``, ``semantic_id``, ``global_asset_id`` and
+    ``specific_asset_id``. These allow to answer filtered queries via :meth:`~.query` without iterating all stored
+    objects.
+
+    The indexes are updated automatically, when objects are added to or discarded from the store. However, stored
+    objects may be modified in place, so :meth:`~.reindex` must be called, after the indexed attributes of a stored
+    object have been changed (e.g. when committing the changes). Results of :meth:`~.query` are always checked against
+    the given criteria, so a stale index can only cause objects to be missing from the results, but never causes
+    non-matching objects to be returned.
+    """
+    def __init__(self, objects: Iterable[_IT] = ()) -> None:
+        self._type_index: Dict[type, Dict[Identifier, _IT]] = {}
+        self._id_short_index: Dict[NameType, Dict[Identifier, _IT]] = {}
+        self._semantic_id_index: Dict[Reference, Dict[Identifier, _IT]] = {}
+        self._global_asset_id_index: Dict[Identifier, Dict[Identifier, _IT]] = {}
+        self._specific_asset_id_index: Dict[SpecificAssetId, Dict[Identifier, _IT]] = {}
+        # Sorted lists of the Identifiers in each bucket of the indexes (including the type partitions) for ordered
+        # queries, by the id of the index and the key of the bucket. They are only created on demand and kept up to
+        # date afterwards.
+        self._sorted_bucket_ids: Dict[Tuple[int, Any], List[Identifier]] = {}
+        # The (index, key) pairs each stored object is currently indexed with, to be able to remove the object from the
+        # indexes, even if its attributes have been changed in the meantime
+        self._index_entries: Dict[Identifier, List[Tuple[Dict[Any, Dict[Identifier, _IT]], Any]]] = {}
+        super().__init__(objects)
+
+    def add(self, x: _IT) -> None:
+        super().add(x)
+        self._unindex(x.id)
+        self._index(x)
+
+    def discard(self, x: _IT) -> None:
+        if self._backend.get(x.id) is x:
+            self._unindex(x.id)
+        super().discard(x)
+
+    def reindex(self, x: _IT) -> None:
+        """
+        Update the indexes of this store for a stored object, after its attributes have been changed.
+
+        This also handles a changed :class:`~basyx.aas.model.base.Identifier` of the object.
+
+        :param x: The changed object, which must be contained in this store
+        :raises KeyError: If the object is not contained in this store or its new
+                          :class:`~basyx.aas.model.base.Identifier` is already used by another object in this store
+        """
+        if self._backend.get(x.id) is x:
+            old_id = x.id
+        else:
+            # The identifier of the object has been changed, so we need to find it by identity
+            for identifier, obj in self._backend.items():
+                if obj is x:
+                    old_id = identifier
+                    break
+            else:
+                raise KeyError("Identifiable object {!r} is not stored in this store".format(x))
+            if x.id in self._backend:
+                raise KeyError("Identifiable object with same id {} is already stored in this store"
+                               .format(x.id))
+            del self._backend[old_id]
+            self._backend[x.id] = x
+            if self._sorted_ids is not None:
+                _sorted_remove(self._sorted_ids, old_id)
+                bisect.insort(self._sorted_ids, x.id)
+        self._unindex(old_id)
+        self._index(x)
+
+    def query(self, type_: Type[_QT], id_short: Optional[NameType] = None, semantic_id: Optional[Reference] = None,
+              global_asset_id: Optional[Identifier] = None,
+              specific_asset_ids: Iterable[SpecificAssetId] = (),
+              after: Optional[Identifier] = None) -> Iterator[_QT]:
+        """
+        Iterate all stored objects of the given type, which match all of the given criteria, ordered by their
+        :class:`~basyx.aas.model.base.Identifier` (like :meth:`~.iter_from`).
+
+        The candidate objects are taken from the most selective index, matching one of the given criteria, or from the
+        type partitions, if no further criteria are given. See :meth:`.AbstractObjectStore.query` for the parameters.
+        """
+        specific_asset_ids = list(specific_asset_ids)
+        candidate_buckets: List[Tuple[Dict[Any, Dict[Identifier, _IT]], Any]] = []
+        if id_short is not None:
+            candidate_buckets.append((self._id_short_index, id_short))
+        if semantic_id is not None:
+            candidate_buckets.append((self._semantic_id_index, semantic_id))
+        if global_asset_id is not None:
+            candidate_buckets.append((self._global_asset_id_index, global_asset_id))
+        for specific_asset_id in specific_asset_ids:
+            candidate_buckets.append((self._specific_asset_id_index, specific_asset_id))
+
+        candidates: Iterable[Identifiable]
+        if candidate_buckets:
+            index, key = min(candidate_buckets, key=lambda bucket: len(bucket[0].get(bucket[1], ())))
+            candidates = self._iter_bucket(index, key, after)
+        else:
+            candidates = heapq.merge(*(self._iter_bucket(self._type_index, partition_type, after)
+                                       for partition_type in list(self._type_index)
+                                       if issubclass(partition_type, type_)),
+                                     key=lambda obj: obj.id)
+
+        for obj in candidates:
+            if isinstance(obj, type_) and self._matches(obj, id_short, semantic_id, global_asset_id,
+                                                        specific_asset_ids):
+                yield obj
+
+    def _iter_bucket(self, index: Dict[Any, Dict[Identifier, _IT]], key: Any, after: Optional[Identifier]) \
+            -> Iterator[_IT]:
+        """
+        Iterate the objects in a bucket of an index ordered by their :class:`~basyx.aas.model.base.Identifier`,
+        starting after the given :class:`~basyx.aas.model.base.Identifier`
+        """
+        bucket = index.get(key)
+        if not bucket:
+            return
+        sorted_ids = self._sorted_bucket_ids.get((id(index), key))
+        if sorted_ids is None:
+            sorted_ids = self._sorted_bucket_ids[(id(index), key)] = sorted(bucket)
+        for identifier in _iter_sorted_after(sorted_ids, after):
+            obj = self._backend.get(identifier)
+            if obj is not None:
+                yield obj
+
+    def _index(self, x: _IT) -> None:
+        entries: List[Tuple[Dict[Any, Dict[Identifier, _IT]], Any]] = [(self._type_index, type(x))]
+        if x.id_short is not None:
+            entries.append((self._id_short_index, x.id_short))
+        if isinstance(x, HasSemantics) and x.semantic_id is not None:
+            entries.append((self._semantic_id_index, x.semantic_id))
+        if isinstance(x, AssetAdministrationShell):
+            if x.asset_information.global_asset_id is not None:
+                entries.append((self._global_asset_id_index, x.asset_information.global_asset_id))
+            for specific_asset_id in x.asset_information.specific_asset_id:
+                entries.append((self._specific_asset_id_index, specific_asset_id))
+        for index, key in entries:
+            index.setdefault(key, {})[x.id] = x
+            sorted_ids = self._sorted_bucket_ids.get((id(index), key))
+            if sorted_ids is not None:
+                bisect.insort(sorted_ids, x.id)
+        self._index_entries[x.id] = entries
+
+    def _unindex(self, identifier: Identifier) -> None:
+        for index, key in self._index_entries.pop(identifier, ()):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(identifier, None)
+            if not bucket:
+                del index[key]
+                self._sorted_bucket_ids.pop((id(index), key), None)
+            elif (id(index), key) in self._sorted_bucket_ids:
+                _sorted_remove(self._sorted_bucket_ids[(id(index), key)], identifier)
+
+
+def _estimate_size(obj: object) -> int:
+    """
+    Estimate the memory size of an object in bytes, including all objects reachable from it via containers and instance
+    attributes
+
+    :param obj: The object to estimate the size of
+    :return: The sum of :func:`sys.getsizeof` of all reachable objects
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, int, float, bool)) or current is None:
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+    return size
+
+
+class _FrequencySketch:
+    """
+    A Count-Min sketch of the access frequencies of :class:`Identifiers <basyx.aas.model.base.Identifier>` for the
+    TinyLFU admission policy of the :class:`~.CachingObjectStore`
+
+    All counters are halved, after ``sample_size`` accesses have been recorded, such that the sketch reflects the recent
+    frequencies.
+    """
+    DEPTH = 4
+
+    def __init__(self, width: int, sample_size: int) -> None:
+        self._width = width
+        self._rows: List[List[int]] = [[0] * width for _ in range(self.DEPTH)]
+        self._sample_size = sample_size
+        self._count = 0
+
+    def _positions(self, identifier: Identifier) -> Iterator[Tuple[List[int], int]]:
+        for seed, row in enumerate(self._rows):
+            yield row, hash((seed, identifier)) % self._width
+
+    def increment(self, identifier: Identifier) -> None:
+        for row, position in self._positions(identifier):
+            row[position] += 1
+        self._count += 1
+        if self._count >= self._sample_size:
+            for row in self._rows:
+                row[:] = [counter // 2 for counter in row]
+            self._count //= 2
+
+    def frequency(self, identifier: Identifier) -> int:
+        return min(row[position] for row, position in self._positions(identifier))
+
+
+class _CacheEntry(NamedTuple):
+    obj: Identifiable
+    size: int
+    expires: Optional[float]
+
+
+class CachingObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
+    """
+    A wrapper around any :class:`~.AbstractObjectStore`, which keeps (strong references to) the most recently used
+    :class:`~basyx.aas.model.base.Identifiable` objects in a bounded cache, such that they are not retrieved from the
+    wrapped store again.
+
+    The cache is limited by the number of objects and/or the estimated memory size of the objects. When a limit is
+    exceeded, the least recently used objects are evicted. With ``admission=True``, the TinyLFU admission policy is
+    applied additionally: A newly retrieved object is only cached, if it has been accessed more frequently than the
+    object, which would be evicted for it. This prevents a scan over many objects from evicting the frequently used
+    ones.
+
+    Adding, discarding and reindexing (see :meth:`~.reindex`) objects is passed through to the wrapped store
+    immediately. All other read accesses (iterating, querying, etc.) are answered by the wrapped store. Changes of the
+    objects in the wrapped store by other parties are only noticed after the cached object has expired, thus the
+    ``ttl`` should be set, if such changes are expected.
+
+    :param store: The wrapped object store
+    :param max_items: The maximum number of cached objects or ``None`` for no limit
+    :param max_bytes: The maximum estimated memory size of all cached objects in bytes or ``None`` for no limit
+    :param ttl: The time in seconds, after which a cached object is retrieved from the wrapped store again or ``None``
+                to keep the objects until they are evicted
+    :param admission: If ``True``, the TinyLFU admission policy is applied
+    :param size_estimator: A function to estimate the memory size of an object in bytes, used for the ``max_bytes``
+                           limit. Defaults to summing up :func:`sys.getsizeof` of all objects reachable from the object.
+    """
+    def __init__(self, store: AbstractObjectStore[_IT], max_items: Optional[int] = 1000,
+                 max_bytes: Optional[int] = None, ttl: Optional[float] = None, admission: bool = False,
+                 size_estimator: Callable[[Identifiable], int] = _estimate_size) -> None:
+        self.store: AbstractObjectStore[_IT] = store
+        self.max_items: Optional[int] = max_items
+        self.max_bytes: Optional[int] = max_bytes
+        self.ttl: Optional[float] = ttl
+        self._size_estimator = size_estimator
+        self._entries: "collections.OrderedDict[Identifier, _CacheEntry]" = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._sketch: Optional[_FrequencySketch] = None
+        if admission:
+            width = max(64, 2 * (max_items if max_items is not None else 1000))
+            self._sketch = _FrequencySketch(width, 10 * width)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get_identifiable(self, identifier: Identifier) -> _IT:
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(identifier)
+            entry = self._entries.get(identifier)
+            if entry is not None:
+                if entry.expires is None or entry.expires > time.monotonic():
+                    self._entries.move_to_end(identifier)
+                    self.hits += 1
+                    return cast(_IT, entry.obj)
+                self._remove_entry(identifier)
+            self.misses += 1
+        obj = cast(_IT, self.store.get_identifiable(identifier))
+        size = self._size(obj)
+        with self._lock:
+            self._cache(obj, size, admit=False)
+        return obj
+
+    def add(self, x: _IT) -> None:
+        self.store.add(x)
+        size = self._size(x)
+        with self._lock:
+            self._cache(x, size, admit=True)
+
+    def discard(self, x: _IT) -> None:
+        self.store.discard(x)
+        with self._lock:
+            entry = self._entries.get(x.id)
+            if entry is not None and entry.obj is x:
+                self._remove_entry(x.id)
+
+    def reindex(self, x: _IT) -> None:
+        """
+        Notify the wrapped store (if it supports it, like :class:`~.IndexedDictObjectStore`) and the cache, that the
+        attributes of a stored object have been changed
+
+        :param x: The changed object
+        """
+        reindex = getattr(self.store, "reindex", None)
+        if reindex is not None:
+            reindex(x)
+        size = self._size(x)
+        with self._lock:
+            entry = self._entries.get(x.id)
+            if entry is None or entry.obj is not x:
+                # The Identifier of the object may have been changed
+                old_ids = [identifier for identifier, cached in self._entries.items() if cached.obj is x]
+                if not old_ids:
+                    return
+                for identifier in old_ids:
+                    self._remove_entry(identifier)
+            self._cache(x, size, admit=True)
+
+    def invalidate(self, identifier: Optional[Identifier] = None) -> None:
+        """
+        Remove an object or all objects from the cache, such that they are retrieved from the wrapped store again
+
+        :param identifier: The :class:`~basyx.aas.model.base.Identifier` of the object to remove or ``None`` to clear
+                           the whole cache
+        """
+        with self._lock:
+            if identifier is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif identifier in self._entries:
+                self._remove_entry(identifier)
+
+    def _remove_entry(self, identifier: Identifier) -> None:
+        self._bytes -= self._entries.pop(identifier).size
+
+    def _size(self, obj: _IT) -> int:
+        """
+        Estimate the size of an object for the ``max_bytes`` limit. This is done before taking the lock, since it
+        traverses the whole object.
+        """
+        return self._size_estimator(obj) if self.max_bytes is not None else 0
+
+    def _cache(self, obj: _IT, size: int, admit: bool) -> None:
+        """
+        Insert an object into the cache and evict the least recently used objects, if the limits are exceeded. Must be
+        called with the lock held.
+
+        :param obj: The object to cache
+        :param size: The estimated size of the object (see :meth:`_size`)
+        :param admit: If ``True``, the object is cached regardless of the admission policy
+        """
+        if obj.id in self._entries:
+            self._remove_entry(obj.id)
+        if (self.max_items is not None and self.max_items <= 0) \
+                or (self.max_bytes is not None and size > self.max_bytes):
+            return
+        if not admit and self._sketch is not None and self._exceeds_limits(1, size):
+            victim = next(iter(self._entries))
+            if self._sketch.frequency(obj.id) <= self._sketch.frequency(victim):
+                return
+        self._entries[obj.id] = _CacheEntry(obj, size, time.monotonic() + self.ttl if self.ttl is not None else None)
+        self._bytes += size
+        while self._exceeds_limits(0, 0):
+            self._remove_entry(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _exceeds_limits(self, additional_items: int, additional_bytes: int) -> bool:
+        """
+        Check if the cache exceeds its limits (or would exceed them with the given additional objects and bytes)
+        """
+        if self.max_items is not None and len(self._entries) + additional_items > self.max_items:
+            return True
+        return self.max_bytes is not None and self._bytes + additional_bytes > self.max_bytes
+
+    def iter_from(self, after: Optional[Identifier] = None) -> Iterator[_IT]:
+        return self.store.iter_from(after)
+
+    def query(self, type_: Type[_QT], id_short: Optional[NameType] = None, semantic_id: Optional[Reference] = None,
+              global_asset_id: Optional[Identifier] = None,
+              specific_asset_ids: Iterable[SpecificAssetId] = (),
+              after: Optional[Identifier] = None) -> Iterator[_QT]:
+        return self.store.query(type_, id_short, semantic_id, global_asset_id, specific_asset_ids, after)
+
+    def __contains__(self, x: object) -> bool:
+        return x in self.store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __iter__(self) -> Iterator[_IT]:
+        return iter(self.store)
+
+
 class ObjectProviderMultiplexer(AbstractObjectProvider):
     """
     A multiplexer for Providers of :class:`~basyx.aas.model.base.Identifiable` objects.
@@ -125,17 +641,163 @@ class ObjectProviderMultiplexer(AbstractObjectProvider):
     to allow retrieving :class:`~basyx.aas.model.base.Identifiable` objects from different sources.
     It implements the :class:`~.AbstractObjectProvider` interface to be used as registry itself.
 
+    By default, the providers are queried one after another in the given order. To avoid unnecessary queries to slow
+    (e.g. remote) providers, the multiplexer can remember
+
+    - for each provider, which :class:`Identifiers <basyx.aas.model.base.Identifier>` it did not find (for
+      ``negative_ttl`` seconds) and skip it for these :class:`Identifiers <basyx.aas.model.base.Identifier>`, and
+    - for each found :class:`~basyx.aas.model.base.Identifier`, which provider it has been found in (if ``routing`` is
+      ``True``) and query this provider first.
+
+    With ``concurrent=True``, the providers are queried in parallel threads and the first found object is returned.
+    Thus, if multiple providers contain an object with the same :class:`~basyx.aas.model.base.Identifier`, it is
+    undefined, which one is returned.
+
+    When objects are added to a provider, :meth:`~.invalidate` should be called, to make the multiplexer find them
+    immediately. Both caches are limited to ``cache_size`` entries (per provider, for the misses). When the limit is
+    reached, the least recently used entries are dropped. :meth:`~.close` should be called, when the multiplexer is not
+    used anymore, to stop the threads of concurrent mode.
+
     :param registries: A list of :class:`AbstractObjectProviders <.AbstractObjectProvider>` to query when looking up an
                       object
+    :param negative_ttl: The time in seconds to skip a provider for an :class:`~basyx.aas.model.base.Identifier`, which
+                         it did not find, or ``None`` to disable the negative cache
+    :param concurrent: If ``True``, the providers are queried in parallel
+    :param routing: If ``True``, the provider of each found object is remembered and queried first for its
+                    :class:`~basyx.aas.model.base.Identifier`
+    :param max_workers: The maximum number of threads for querying the providers in parallel. Defaults to the default of
+                        :class:`~concurrent.futures.ThreadPoolExecutor`.
+    :param cache_size: The maximum number of remembered misses per provider and of remembered providers
     """
-    def __init__(self, registries: Optional[List[AbstractObjectProvider]] = None):
+    def __init__(self, registries: Optional[List[AbstractObjectProvider]] = None,
+                 negative_ttl: Optional[float] = None, concurrent: bool = False, routing: bool = False,
+                 max_workers: Optional[int] = None, cache_size: int = 10000):
         self.providers: List[AbstractObjectProvider] = registries if registries is not None else []
+        self.negative_ttl: Optional[float] = negative_ttl
+        self.concurrent: bool = concurrent
+        self.routing: bool = routing
+        self.cache_size: int = cache_size
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # id(provider) → (Identifier → expiry time) of the Identifiers not found by the provider, in LRU order
+        self._negative_cache: Dict[int, "collections.OrderedDict[Identifier, float]"] = {}
+        # Identifier → provider, which the object with this Identifier has been found in, in LRU order
+        self._routes: "collections.OrderedDict[Identifier, AbstractObjectProvider]" = collections.OrderedDict()
 
     def get_identifiable(self, identifier: Identifier) -> Identifiable:
-        for provider in self.providers:
+        with self._lock:
+            route = self._routes.get(identifier)
+            if route is not None:
+                self._routes.move_to_end(identifier)
+        if route is not None and any(provider is route for provider in self.providers):
             try:
-                return provider.get_identifiable(identifier)
+                return route.get_identifiable(identifier)
             except KeyError:
-                pass
+                with self._lock:
+                    self._routes.pop(identifier, None)
+
+        providers = [provider for provider in self.providers if not self._is_known_miss(provider, identifier)]
+        if self.concurrent and len(providers) > 1:
+            result = self._get_concurrently(providers, identifier)
+            if result is not None:
+                return result
+        else:
+            for provider in providers:
+                try:
+                    result = provider.get_identifiable(identifier)
+                except KeyError:
+                    self._record_miss(provider, identifier)
+                    continue
+                self._record_hit(provider, identifier)
+                return result
         raise KeyError("Identifier could not be found in any of the {} consulted registries."
                        .format(len(self.providers)))
+
+    def _get_concurrently(self, providers: List[AbstractObjectProvider],
+                          identifier: Identifier) -> Optional[Identifiable]:
+        """
+        Query the given providers in parallel and return the first found object
+
+        :return: The first found object or ``None``, if none of the providers found it
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="ObjectProviderMultiplexer")
+            executor = self._executor
+        futures = {executor.submit(provider.get_identifiable, identifier): provider for provider in providers}
+        try:
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except KeyError:
+                    self._record_miss(futures[future], identifier)
+                    continue
+                self._record_hit(futures[future], identifier)
+                return result
+        finally:
+            for future in futures:
+                future.cancel()
+        return None
+
+    def _is_known_miss(self, provider: AbstractObjectProvider, identifier: Identifier) -> bool:
+        if self.negative_ttl is None:
+            return False
+        with self._lock:
+            negative_cache = self._negative_cache.get(id(provider))
+            if negative_cache is None or identifier not in negative_cache:
+                return False
+            if negative_cache[identifier] <= time.monotonic():
+                del negative_cache[identifier]
+                return False
+            negative_cache.move_to_end(identifier)
+            return True
+
+    def _record_miss(self, provider: AbstractObjectProvider, identifier: Identifier) -> None:
+        if self.negative_ttl is None:
+            return
+        with self._lock:
+            negative_cache = self._negative_cache.setdefault(id(provider), collections.OrderedDict())
+            negative_cache[identifier] = time.monotonic() + self.negative_ttl
+            negative_cache.move_to_end(identifier)
+            while len(negative_cache) > self.cache_size:
+                negative_cache.popitem(last=False)
+
+    def _record_hit(self, provider: AbstractObjectProvider, identifier: Identifier) -> None:
+        with self._lock:
+            negative_cache = self._negative_cache.get(id(provider))
+            if negative_cache is not None:
+                negative_cache.pop(identifier, None)
+            if self.routing:
+                self._routes[identifier] = provider
+                self._routes.move_to_end(identifier)
+                while len(self._routes) > self.cache_size:
+                    self._routes.popitem(last=False)
+
+    def invalidate(self, identifier: Optional[Identifier] = None) -> None:
+        """
+        Forget the remembered misses and providers for an :class:`~basyx.aas.model.base.Identifier` or for all
+        :class:`Identifiers <basyx.aas.model.base.Identifier>`
+
+        :param identifier: The :class:`~basyx.aas.model.base.Identifier` to forget or ``None`` to forget everything
+        """
+        with self._lock:
+            if identifier is None:
+                self._negative_cache.clear()
+                self._routes.clear()
+                return
+            for negative_cache in self._negative_cache.values():
+                negative_cache.pop(identifier, None)
+            self._routes.pop(identifier, None)
+
+    def close(self) -> None:
+        """
+        Stop the threads for querying the providers in parallel (if any have been started)
+
+        The multiplexer can still be used afterwards, but starts new threads when needed.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,336 @@
+# Copyright (c) 2023 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+A minimal in-memory fake of the CouchDB HTTP API, to test the CouchDB backend without a CouchDB server.
+
+Only the parts of the API used by the :mod:`basyx.aas.backend.couchdb` module are implemented and only as far as the
+backend relies on them. All requests are recorded in the ``requests`` list of the :class:`~.FakeCouchDB`, to allow
+checking the number of round trips in tests.
+"""
+import copy
+import http.server
+import json
+import threading
+import time
+import urllib.parse
+import uuid
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from basyx.aas.backend import backends
+
+
+class FakeCouchDB:
+    """
+    A fake CouchDB server listening on a random local port in a background thread
+
+    :ivar url: The URL of the server
+    :ivar databases: The documents of each database, mapping their ids to the documents (including ``_id`` and
+                     ``_rev``)
+    :ivar requests: The ``(method, path)`` of each request received
+    :ivar changes: The changes feed of each database as a list of ``(id, rev, deleted)``, the sequence number of a
+                   change being its index + 1
+    :ivar delay: Time in seconds to wait before handling each request, to simulate the latency of a remote server
+    :ivar max_concurrent_requests: The maximum number of requests handled at the same time so far
+    """
+    def __init__(self):
+        self.databases: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.changes: Dict[str, List[Tuple[str, str, bool]]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.delay: float = 0
+        self.max_concurrent_requests: int = 0
+        self._concurrent_requests: int = 0
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self.url = "http://127.0.0.1:{}".format(self._server.server_address[1])
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> "FakeCouchDB":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeCouchDB":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def put_document(self, database: str, doc: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Creates, updates or deletes (if ``_deleted`` is set) a document, like a PUT request or an entry of a
+        ``_bulk_docs`` request
+
+        :return: The HTTP status code and the response object
+        """
+        with self.lock:
+            db = self.databases[database]
+            doc_id = doc["_id"]
+            current = db.get(doc_id)
+            if current is not None and doc.get("_rev") != current["_rev"]:
+                return 409, {"id": doc_id, "error": "conflict", "reason": "Document update conflict."}
+            if current is None and doc.get("_rev") is not None:
+                return 404, {"id": doc_id, "error": "not_found", "reason": "missing"}
+            if doc.get("_deleted"):
+                del db[doc_id]
+                rev = self._next_rev(current)
+                self._add_change(database, doc_id, rev, True)
+                return 200, {"ok": True, "id": doc_id, "rev": rev}
+            new_doc = dict(doc)
+            new_doc["_rev"] = self._next_rev(current)
+            db[doc_id] = new_doc
+            self._add_change(database, doc_id, new_doc["_rev"], False)
+            return 201, {"ok": True, "id": doc_id, "rev": new_doc["_rev"]}
+
+    def _add_change(self, database: str, doc_id: str, rev: str, deleted: bool) -> None:
+        self.changes[database].append((doc_id, rev, deleted))
+        self.changed.notify_all()
+
+    @staticmethod
+    def _next_rev(doc: Optional[Dict[str, Any]]) -> str:
+        number = int(doc["_rev"].split("-")[0]) + 1 if doc is not None else 1
+        return "{}-{}".format(number, uuid.uuid4().hex)
+
+
+def _make_handler(server: FakeCouchDB):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+        def do_HEAD(self) -> None:
+            self._handle("HEAD")
+
+        def do_GET(self) -> None:
+            self._handle("GET")
+
+        def do_PUT(self) -> None:
+            self._handle("PUT")
+
+        def do_POST(self) -> None:
+            self._handle("POST")
+
+        def do_DELETE(self) -> None:
+            self._handle("DELETE")
+
+        def _handle(self, method: str) -> None:
+            url = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            path = [urllib.parse.unquote(part) for part in url.path.strip("/").split("/")]
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length)) if length else None
+            server.requests.append((method, url.path))
+            with server.lock:
+                server._concurrent_requests += 1
+                server.max_concurrent_requests = max(server.max_concurrent_requests, server._concurrent_requests)
+            time.sleep(server.delay)
+            with server.lock:
+                server._concurrent_requests -= 1
+                status, data, headers = self._dispatch(method, path, query, body)
+            self._respond(method, status, data, headers)
+
+        def _respond(self, method: str, status: int, data: Any, headers: Dict[str, str]) -> None:
+            payload = json.dumps(data).encode("utf-8") if data is not None else b""
+            self.send_response(status)
+            if data is not None:
+                self.send_header("Content-Type", "application/json")
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if method != "HEAD":
+                self.wfile.write(payload)
+
+        def _dispatch(self, method: str, path: List[str], query: Dict[str, str], body: Any) \
+                -> Tuple[int, Any, Dict[str, str]]:
+            not_found: Tuple[int, Any, Dict[str, str]] = (404, {"error": "not_found", "reason": "missing"}, {})
+            database = path[0]
+            if len(path) == 1:
+                if method == "PUT":
+                    if database in server.databases:
+                        return 412, {"error": "file_exists", "reason": "The database could not be created."}, {}
+                    server.databases[database] = {}
+                    server.changes[database] = []
+                    return 201, {"ok": True}, {}
+                if database not in server.databases:
+                    return not_found
+                return 200, {"db_name": database, "doc_count": len(server.databases[database]),
+                             "update_seq": str(len(server.changes[database]))}, {}
+            if database not in server.databases:
+                return not_found
+            db = server.databases[database]
+            if path[1] == "_changes":
+                return self._changes(database, query)
+            if path[1] == "_all_docs":
+                return self._all_docs(db, query, body)
+            if path[1] == "_find" and method == "POST":
+                return self._find(db, body)
+            if path[1] == "_index" and method == "POST":
+                return self._index(database, body)
+            if path[1] == "_design" and len(path) > 5 and path[3] == "_update" and method == "PUT":
+                return self._update(database, "_design/" + path[2], path[4], "/".join(path[5:]), body)
+            if path[1] == "_bulk_docs" and method == "POST":
+                return 201, [server.put_document(database, doc)[1] for doc in body["docs"]], {}
+            doc_id = "/".join(path[1:])
+            if method in ("GET", "HEAD"):
+                doc = db.get(doc_id)
+                if doc is None:
+                    return not_found
+                etag = '"{}"'.format(doc["_rev"])
+                if self.headers.get("If-None-Match") == etag:
+                    return 304, None, {"ETag": etag}
+                return 200, doc, {"ETag": etag}
+            if method == "PUT":
+                status, result = server.put_document(database, dict(body, _id=doc_id))
+                return status, result, {}
+            if method == "DELETE":
+                status, result = server.put_document(database, {"_id": doc_id, "_rev": query.get("rev"),
+                                                                "_deleted": True})
+                return status, result, {}
+            return 405, {"error": "method_not_allowed", "reason": "Method not allowed"}, {}
+
+        @staticmethod
+        def _changes(database: str, query: Dict[str, str]) -> Tuple[int, Any, Dict[str, str]]:
+            since = int(query.get("since", "0"))
+            changes = server.changes[database]
+            if query.get("feed") == "longpoll" and len(changes) <= since:
+                server.changed.wait_for(lambda: len(changes) > since, int(query.get("timeout", "60000")) / 1000)
+            # only the latest change of each document is reported
+            latest: Dict[str, int] = {}
+            for seq, (doc_id, _rev, _deleted) in enumerate(changes[since:], since + 1):
+                latest[doc_id] = seq
+            results = []
+            for doc_id, seq in sorted(latest.items(), key=lambda item: item[1]):
+                _doc_id, rev, deleted = changes[seq - 1]
+                result: Dict[str, Any] = {"seq": str(seq), "id": doc_id, "changes": [{"rev": rev}]}
+                if deleted:
+                    result["deleted"] = True
+                results.append(result)
+            return 200, {"results": results, "last_seq": str(len(changes))}, {}
+
+        @staticmethod
+        def _all_docs(db: Dict[str, Dict[str, Any]], query: Dict[str, str], body: Any) \
+                -> Tuple[int, Any, Dict[str, str]]:
+            include_docs = query.get("include_docs") == "true"
+            rows: List[Dict[str, Any]] = []
+            if body is not None:
+                for key in body["keys"]:
+                    doc = db.get(key)
+                    if doc is None:
+                        rows.append({"key": key, "error": "not_found"})
+                    else:
+                        rows.append({"id": key, "key": key, "value": {"rev": doc["_rev"]}})
+            else:
+                ids = sorted(db)
+                if "startkey" in query:
+                    start_key = json.loads(query["startkey"])
+                    ids = [doc_id for doc_id in ids if doc_id >= start_key]
+                if "endkey" in query:
+                    end_key = json.loads(query["endkey"])
+                    ids = [doc_id for doc_id in ids if doc_id <= end_key]
+                if "limit" in query:
+                    ids = ids[:int(query["limit"])]
+                rows = [{"id": doc_id, "key": doc_id, "value": {"rev": db[doc_id]["_rev"]}} for doc_id in ids]
+            if include_docs:
+                for row in rows:
+                    if "id" in row:
+                        row["doc"] = db[row["id"]]
+            return 200, {"total_rows": len(db), "offset": 0, "rows": rows}, {}
+
+        @staticmethod
+        def _find(db: Dict[str, Dict[str, Any]], body: Any) -> Tuple[int, Any, Dict[str, str]]:
+            # The order of the results of a Mango query without sort is not defined. We return them in reverse order of
+            # their ids, to make sure the client does not rely on them being sorted. Only ascending sorts are supported.
+            sort = body.get("sort", [])
+            if any(direction != "asc" for item in sort for direction in item.values()):
+                return 400, {"error": "bad_request", "reason": "Unsupported sort"}, {}
+            sort_fields = [field for item in sort for field in item]
+            # Like the CouchDB, sorting by other fields than `_id` requires an index of exactly these fields
+            if sort_fields not in ([], ["_id"]) and sort_fields not in (
+                    view["options"]["def"]["fields"] for doc_id, doc in db.items() if doc_id.startswith("_design/")
+                    for view in doc.get("views", {}).values() if "options" in view):
+                return 400, {"error": "no_usable_index", "reason": "No index exists for this sort"}, {}
+            docs = [doc for doc_id, doc in sorted(db.items(), reverse=not sort)
+                    if _selector_matches(body["selector"], doc)]
+            docs.sort(key=lambda doc: [json.dumps(_get_field(doc, field), sort_keys=True) for field in sort_fields])
+            offset = int(body.get("bookmark", "0"))
+            limit = body.get("limit", 25)
+            docs = docs[offset:offset+limit]
+            if "fields" in body:
+                docs = [{field: doc[field] for field in body["fields"] if field in doc} for doc in docs]
+            return 200, {"docs": docs, "bookmark": str(offset + len(docs))}, {}
+
+        @staticmethod
+        def _update(database: str, ddoc_id: str, name: str, doc_id: str, body: Any) -> Tuple[int, Any, Dict[str, str]]:
+            # Instead of running the JavaScript function of the update handler, its behaviour is implemented here
+            ddoc = server.databases[database].get(ddoc_id)
+            if ddoc is None or name not in ddoc.get("updates", {}):
+                return 404, {"error": "not_found", "reason": "missing"}, {}
+            doc = server.databases[database].get(doc_id)
+            if doc is None:
+                return 404, {"error": "not_found", "reason": "missing"}, {}
+            if body["rev"] != doc["_rev"]:
+                return 409, {"error": "conflict", "reason": "Document update conflict."}, {}
+            doc = copy.deepcopy(doc)
+            if not backends.set_json_element(doc["data"], body["path"], body["element"]):
+                return 404, {"error": "element_not_found", "reason": "Element not found"}, {}
+            status, result = server.put_document(database, doc)
+            return status, {"ok": True}, {"X-Couch-Update-NewRev": result["rev"]}
+
+        @staticmethod
+        def _index(database: str, body: Any) -> Tuple[int, Any, Dict[str, str]]:
+            ddoc_id = "_design/{}".format(body["ddoc"])
+            name = body["name"]
+            ddoc = server.databases[database].get(ddoc_id, {"_id": ddoc_id, "language": "query", "views": {}})
+            if name in ddoc["views"]:
+                return 200, {"result": "exists", "id": ddoc_id, "name": name}, {}
+            ddoc = dict(ddoc, views=dict(ddoc["views"], **{name: {"options": {"def": body["index"]}}}))
+            server.put_document(database, ddoc)
+            return 200, {"result": "created", "id": ddoc_id, "name": name}, {}
+
+    return Handler
+
+
+def _selector_matches(selector: Dict[str, Any], doc: Any) -> bool:
+    """
+    Evaluate the subset of the Mango selector syntax used by the backend: Equality of (nested) fields, given as dotted
+    paths, and the operators ``$eq``, ``$gt``, ``$in`` and ``$all``
+    """
+    for field, condition in selector.items():
+        value = _get_field(doc, field)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        for operator, argument in condition.items():
+            if operator == "$eq":
+                matches = value == argument
+            elif operator == "$gt":
+                matches = value is not None and value > argument
+            elif operator == "$in":
+                matches = value in argument
+            elif operator == "$all":
+                matches = isinstance(value, list) and all(item in value for item in argument)
+            else:
+                raise NotImplementedError("Operator {} is not implemented".format(operator))
+            if not matches:
+                return False
+    return True
+
+
+def _get_field(doc: Any, field: str) -> Any:
+    """
+    Get the value of a (nested) field, given as dotted path, of a document or ``None``, if it does not exist
+    """
+    value: Any = doc
+    for part in field.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
@@ -15,9 +15,13 @@ import io
 import json
 import logging
 import unittest
+import unittest.mock
 from basyx.aas.adapter.json import AASFromJsonDecoder, StrictAASFromJsonDecoder, StrictStrippedAASFromJsonDecoder, \
-    read_aas_json_file, read_aas_json_file_into
+    read_aas_json_file, read_aas_json_file_into, iter_aas_json_file, json_deserialization, write_aas_json_file
 from basyx.aas import model
+from basyx.aas.adapter import _generic
+from basyx.aas.examples.data import example_aas
+from basyx.aas.examples.data._helper import AASDataChecker
 
 
 class JsonDeserializationTest(unittest.TestCase):
@@ -212,6 +216,109 @@ class JsonDeserializationTest(unittest.TestCase):
         self.assertIsInstance(submodel, model.Submodel)
         self.assertEqual(submodel.id_short, "test123")
 
+    def test_deferred_error_formatting(self) -> None:
+        data = """
+            [
+                {
+                    "modelType": "Submodel",
+                    "id": "https://acplt.org/Test_Submodel_broken_id",
+                    "assetKind": "Instance",
+                    "submodelElements": [{"modelType": "Property", "idShort": "broken"}]
+                }
+            ]"""
+        # The broken JSON object is only pretty-printed, when the error message is actually emitted
+        with unittest.mock.patch.object(json_deserialization.pprint, "pformat") as pformat, \
+                unittest.mock.patch.object(json_deserialization.logger, "isEnabledFor", return_value=False):
+            parsed_data = json.loads(data, cls=AASFromJsonDecoder)
+        pformat.assert_not_called()
+        self.assertEqual(0, len(parsed_data[0].submodel_element))
+
+        with self.assertLogs(logging.getLogger(), level=logging.ERROR) as cm:
+            json.loads(data, cls=AASFromJsonDecoder)
+        self.assertIn("{'idShort': 'broken', 'modelType': 'Property'}", cm.output[0])
+        self.assertIn("Expected a SubmodelElement in Submodel[https://acplt.org/Test_Submodel_broken_id], but found "
+                      "{'modelType': 'Property', 'idShort': 'broken'}", cm.output[1])
+
+        with self.assertRaisesRegex(KeyError, r"{'idShort': 'broken', 'modelType': 'Property'}"):
+            json.loads(data, cls=StrictAASFromJsonDecoder)
+
+    def test_garbage_collection_paused(self) -> None:
+        data = '[{"modelType": "Submodel", "id": "https://acplt.org/Test_Submodel1"}, ' \
+               '{"modelType": "Submodel", "id": "https://acplt.org/Test_Submodel2"}]'
+        with unittest.mock.patch.object(_generic, "gc") as gc:
+            gc.isenabled.return_value = True
+            # Plain decoding (e.g. of HTTP request bodies) does not touch the garbage collector
+            json.loads(data, cls=AASFromJsonDecoder)
+            gc.disable.assert_not_called()
+
+            # The garbage collector is only paused while decoding each single object, not while it is added to the
+            # object store
+            object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+            add = object_store.add
+
+            def check_add(item: model.Identifiable) -> None:
+                self.assertEqual(gc.disable.call_count, gc.enable.call_count)
+                add(item)
+
+            with unittest.mock.patch.object(object_store, "add", side_effect=check_add):
+                read_aas_json_file_into(object_store, io.StringIO('{"submodels": ' + data + '}'))
+            self.assertEqual(2, len(object_store))
+            self.assertEqual(2, gc.disable.call_count)
+            self.assertEqual(2, gc.enable.call_count)
+
+            # The garbage collector is enabled again, if an error occurs
+            gc.reset_mock()
+            with self.assertRaises(json.JSONDecodeError):
+                read_aas_json_file(io.StringIO('{"submodels": [{"modelType": "Submodel", "id": }]}'))
+            gc.enable.assert_called_once()
+
+            # The garbage collector is not enabled, if it has been disabled before
+            gc.reset_mock()
+            gc.isenabled.return_value = False
+            read_aas_json_file(io.StringIO('{"submodels": ' + data + '}'))
+            gc.disable.assert_not_called()
+            gc.enable.assert_not_called()
+
+
+class JsonStreamingDeserializationTest(unittest.TestCase):
+    def test_small_chunks(self) -> None:
+        data = example_aas.create_full_example()
+        submodel = data.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel)
+        submodel.description = model.MultiLanguageTextType({"en": 'Escaped "quotes", \\ backslashes\\" and [brackets}'})
+        file = io.StringIO()
+        write_aas_json_file(file, data)
+        document = json.loads(file.getvalue())
+        document["unknown"] = [{"x": ["]", 1.5e3, None, True]}, "}"]
+        document["number"] = 12345
+        text = json.dumps(document, indent=1)
+
+        for chunk_size in (1, 7, 4096):
+            with self.subTest(chunk_size=chunk_size), \
+                    unittest.mock.patch.object(json_deserialization._JsonStreamParser, "CHUNK_SIZE", chunk_size):
+                objects = list(iter_aas_json_file(io.StringIO(text), failsafe=False))
+                self.assertEqual([len(document[name]) for name in ("assetAdministrationShells", "submodels",
+                                                                   "conceptDescriptions")],
+                                 [sum(1 for obj in objects if isinstance(obj, type_))
+                                  for type_ in (model.AssetAdministrationShell, model.Submodel,
+                                                model.ConceptDescription)])
+                checker = AASDataChecker(raise_immediately=True)
+                streamed_submodel = next(obj for obj in objects if obj.id == submodel.id)
+                assert isinstance(streamed_submodel, model.Submodel) and streamed_submodel.description is not None
+                checker.check_submodel_equal(streamed_submodel, submodel)
+
+                # Binary files are decoded like by json.load()
+                binary_objects = list(iter_aas_json_file(io.BytesIO(b"\xef\xbb\xbf" + text.encode("utf-8"))))
+                self.assertEqual([obj.id for obj in objects], [obj.id for obj in binary_objects])
+
+    def test_empty_and_invalid_documents(self) -> None:
+        self.assertEqual([], list(iter_aas_json_file(io.StringIO(" { } "))))
+        self.assertEqual(0, len(read_aas_json_file(io.StringIO('{"submodels": {}, "assetAdministrationShells": []}'))))
+        for data in ('{"submodels": [', '{"submodels": [{"modelType": "Submodel"', '{"submodels": []} []', '[]',
+                     '{"submodels": [] "conceptDescriptions": []}', '{"submodels": ["\\'):
+            with self.subTest(data=data), self.assertRaises(json.JSONDecodeError):
+                list(iter_aas_json_file(io.StringIO(data)))
+
 
 class JsonDeserializationDerivingTest(unittest.TestCase):
     def test_asset_constructor_overriding(self) -> None:
@@ -232,6 +339,8 @@ class JsonDeserializationDerivingTest(unittest.TestCase):
                     "id": "https://acplt.org/Test_Submodel"
                 }
             ]"""
+        # The constructor methods are resolved separately for each decoder class
+        self.assertIs(model.Submodel, type(json.loads(data, cls=StrictAASFromJsonDecoder)[0]))
         parsed_data = json.loads(data, cls=EnhancedAASDecoder)
         self.assertEqual(1, len(parsed_data))
         self.assertIsInstance(parsed_data[0], EnhancedSubmodel)
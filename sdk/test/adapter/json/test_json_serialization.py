@@ -7,10 +7,12 @@
 import os
 import io
 import unittest
+import unittest.mock
 import json
 
 from basyx.aas import model
-from basyx.aas.adapter.json import AASToJsonEncoder, StrippedAASToJsonEncoder, write_aas_json_file
+from basyx.aas.adapter.json import AASToJsonEncoder, StrippedAASToJsonEncoder, write_aas_json_file, \
+    json_serialization
 from jsonschema import validate  # type: ignore
 from typing import Set, Union
 
@@ -46,6 +48,49 @@ class JsonSerializationTest(unittest.TestCase):
             }, cls=AASToJsonEncoder)
         json_data_new = json.loads(json_data)
 
+    def test_write_iterable(self) -> None:
+        data = example_aas.create_full_example()
+        for kwargs in ({}, {"indent": 4}, {"indent": "\t", "sort_keys": True}, {"separators": (",", ":")}):
+            with self.subTest(kwargs=kwargs):
+                # The objects are only iterated once, in any order
+                objects = sorted(data, key=lambda obj: obj.id, reverse=True)
+                expected = json.dumps(json_serialization._create_dict(objects), cls=AASToJsonEncoder,  # type: ignore
+                                      **kwargs)
+                file = io.StringIO()
+                write_aas_json_file(file, iter(objects), **kwargs)
+                self.assertEqual(expected, file.getvalue())
+
+        # Sections are spooled to temporary files
+        with unittest.mock.patch.object(json_serialization, "SPOOL_MAX_SIZE", 16):
+            file = io.StringIO()
+            write_aas_json_file(file, data, indent=2)
+        self.assertEqual(json.dumps(json_serialization._create_dict(data), cls=AASToJsonEncoder, indent=2),
+                         file.getvalue())
+
+        file = io.StringIO()
+        write_aas_json_file(file, iter([model.Property("test", model.datatypes.String)]))  # type: ignore
+        self.assertEqual("{}", file.getvalue())
+
+    def test_serializer_dispatch(self) -> None:
+        class DerivedProperty(model.Property):
+            pass
+
+        class PropertyEncoder(AASToJsonEncoder):
+            @classmethod
+            def _property_to_json(cls, obj: model.Property):
+                data = super()._property_to_json(obj)
+                data['value'] = "overridden"
+                return data
+
+        derived = DerivedProperty("test", model.datatypes.String, "value")
+        data = json.loads(json.dumps(derived, cls=AASToJsonEncoder))
+        self.assertEqual({"idShort": "test", "modelType": "Property", "valueType": "xs:string", "value": "value"}, data)
+        # Overridden transformation functions of subclasses are used, also for subclasses of the model types
+        self.assertEqual("overridden", json.loads(json.dumps(derived, cls=PropertyEncoder))["value"])
+        self.assertEqual("value", json.loads(json.dumps(derived, cls=AASToJsonEncoder))["value"])
+        with self.assertRaises(TypeError):
+            json.dumps(object(), cls=PropertyEncoder)
+
 
 class JsonSerializationSchemaTest(unittest.TestCase):
     @classmethod
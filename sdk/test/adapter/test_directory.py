@@ -0,0 +1,97 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from basyx.aas import model
+from basyx.aas.adapter import aasx
+from basyx.aas.adapter.directory import load_directory_into
+from basyx.aas.adapter.json import write_aas_json_file
+from basyx.aas.adapter.xml import write_aas_xml_file
+from basyx.aas.examples.data import example_aas, example_aas_mandatory_attributes, _helper
+
+
+class LoadDirectoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _write_aasx(self, name: str, file_content: bytes) -> None:
+        data = example_aas.create_full_example()
+        files = aasx.DictSupplementaryFileContainer()
+        files.add_file("/TestFile.pdf", io.BytesIO(file_content), "application/pdf")
+        with aasx.AASXWriter(os.path.join(self.directory, name)) as writer:
+            writer.write_all_aas_objects("/aasx/data.xml", data, files)
+
+    def test_load_directory(self) -> None:
+        self._write_aasx("a.aasx", b"content")
+        write_aas_json_file(os.path.join(self.directory, "b.json"),
+                            example_aas_mandatory_attributes.create_full_example())
+        os.mkdir(os.path.join(self.directory, "subdirectory"))
+        with open(os.path.join(self.directory, "ignored.txt"), "w") as f:
+            f.write("not an AAS file")
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+                file_store = aasx.DictSupplementaryFileContainer()
+                result = load_directory_into(object_store, file_store, self.directory, workers=workers)
+
+                self.assertEqual(["a.aasx", "b.json"], [loaded.path.name for loaded in result])
+                self.assertEqual({item.id for item in example_aas.create_full_example()}, result[0].identifiers)
+                self.assertEqual({item.id for item in object_store}, result[0].identifiers | result[1].identifiers)
+                for loaded in result:
+                    self.assertGreater(loaded.parse_time, 0)
+                    self.assertGreater(loaded.merge_time, 0)
+
+                checker = _helper.AASDataChecker(raise_immediately=True)
+                example_aas.check_full_example(checker, model.DictObjectStore(
+                    object_store.get_identifiable(identifier) for identifier in result[0].identifiers))
+                example_aas_mandatory_attributes.check_full_example(checker, model.DictObjectStore(
+                    object_store.get_identifiable(identifier) for identifier in result[1].identifiers))
+                self.assertEqual(["/TestFile.pdf"], list(file_store))
+
+    def test_duplicates(self) -> None:
+        self._write_aasx("a.aasx", b"content")
+        self._write_aasx("b.aasx", b"other content")
+        write_aas_xml_file(os.path.join(self.directory, "c.xml"), model.DictObjectStore([
+            model.ConceptDescription("https://acplt.org/Test_ConceptDescription"),
+            model.Submodel("https://acplt.org/Another_Submodel")]))
+
+        object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+        file_store = aasx.DictSupplementaryFileContainer()
+        with self.assertRaisesRegex(KeyError, r"already exists in the object store"):
+            load_directory_into(object_store, file_store, self.directory, workers=2)
+        self.assertEqual(5, len(object_store))
+
+        # Existing objects are skipped, so are their supplementary files
+        object_store = model.DictObjectStore()
+        file_store = aasx.DictSupplementaryFileContainer()
+        result = load_directory_into(object_store, file_store, self.directory, workers=2, ignore_existing=True)
+        self.assertEqual([5, 0, 1], [len(loaded.identifiers) for loaded in result])
+        self.assertEqual({"https://acplt.org/Another_Submodel"}, result[2].identifiers)
+        self.assertEqual(["/TestFile.pdf"], list(file_store))
+
+        # Replaced objects bring their supplementary files, which are renamed in case of a conflict
+        object_store = model.DictObjectStore()
+        file_store = aasx.DictSupplementaryFileContainer()
+        result = load_directory_into(object_store, file_store, self.directory, workers=1, replace_existing=True)
+        self.assertEqual([5, 5, 2], [len(loaded.identifiers) for loaded in result])
+        self.assertEqual(["/TestFile.pdf", "/TestFile_0001.pdf"], list(file_store))
+        submodel = object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel)
+        file = submodel.get_referable(["ExampleSubmodelCollection", "ExampleFile"])
+        assert isinstance(file, model.File) and file.value is not None
+        self.assertEqual("/TestFile_0001.pdf", file.value)
+        content = io.BytesIO()
+        file_store.write_file(file.value, content)
+        self.assertEqual(b"other content", content.getvalue())
@@ -24,17 +24,26 @@ and offer an automatically generated python unittest TestCase.
 # TODO: check required properties of schema
 # TODO: add id_short format to schemata
 
+import json
 import os
 import random
 import pathlib
+import shutil
+import tempfile
+import unittest
+import unittest.mock
 import urllib.parse
 
+from lxml import etree
 import schemathesis
 import hypothesis.strategies
+from werkzeug.test import Client
 
 from basyx.aas import model
 from basyx.aas.adapter.aasx import DictSupplementaryFileContainer
-from basyx.aas.adapter.http import WSGIApp
+from basyx.aas.adapter.http import WSGIApp, JsonResponse, PagingMetadata, XmlResponse, base64url_encode
+from basyx.aas.adapter.json import AASToJsonEncoder
+from basyx.aas.backend import local_file, log_structured
 from basyx.aas.examples.data.example_aas import create_full_example
 
 from typing import Set
@@ -129,3 +138,276 @@ class APIWorkflowSubmodel(SUBMODEL_SCHEMA.as_state_machine()):  # type: ignore
 
 # ApiTestSubmodel = APIWorkflowSubmodel.TestCase
 # ApiTestSubmodel.settings = HYPOTHESIS_SETTINGS
+
+
+class WSGIAppTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.object_store: model.IndexedDictObjectStore[model.Identifiable] = \
+            model.IndexedDictObjectStore(create_full_example())
+        self.client = Client(WSGIApp(self.object_store, DictSupplementaryFileContainer(), base_path="/api/v3.0"))
+
+    def test_submodel_filter_indexed(self) -> None:
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel) and submodel.semantic_id is not None
+        semantic_id = json.dumps(submodel.semantic_id, cls=AASToJsonEncoder)
+        response = self.client.get("/api/v3.0/submodels",
+                                   query_string={"semanticId": base64url_encode(semantic_id)})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["https://acplt.org/Test_Submodel"], [sm["id"] for sm in json.loads(response.data)["result"]])
+
+        response = self.client.get("/api/v3.0/submodels", query_string={"idShort": "TestSubmodel"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["https://acplt.org/Test_Submodel"], [sm["id"] for sm in json.loads(response.data)["result"]])
+
+        # Changes through the API are reflected in the indexes of the store
+        response = self.client.get("/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel"))
+        changed_submodel = json.loads(response.data)
+        changed_submodel["idShort"] = "ChangedSubmodel"
+        response = self.client.put("/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel"),
+                                   json=changed_submodel)
+        self.assertEqual(204, response.status_code)
+        response = self.client.get("/api/v3.0/submodels", query_string={"idShort": "ChangedSubmodel"})
+        self.assertEqual(["https://acplt.org/Test_Submodel"], [sm["id"] for sm in json.loads(response.data)["result"]])
+        response = self.client.get("/api/v3.0/submodels", query_string={"idShort": "TestSubmodel"})
+        self.assertEqual([], json.loads(response.data)["result"])
+
+    def _get_all_pages(self, url: str, limit: int) -> list:
+        results = []
+        query_string = {"limit": str(limit)}
+        while True:
+            response = self.client.get(url, query_string=query_string)
+            self.assertEqual(200, response.status_code)
+            data = json.loads(response.data)
+            self.assertLessEqual(len(data["result"]), limit)
+            results.extend(data["result"])
+            if "cursor" not in data["paging_metadata"]:
+                return results
+            query_string["cursor"] = data["paging_metadata"]["cursor"]
+
+    def test_pagination(self) -> None:
+        submodel_ids = sorted(obj.id for obj in self.object_store if isinstance(obj, model.Submodel))
+        for limit in (1, 2, len(submodel_ids), len(submodel_ids) + 1):
+            with self.subTest(limit=limit):
+                self.assertEqual(submodel_ids, [sm["id"] for sm in self._get_all_pages("/api/v3.0/submodels", limit)])
+
+        # A cursor stays valid, even if the object it refers to is deleted
+        response = self.client.get("/api/v3.0/submodels", query_string={"limit": "1"})
+        cursor = json.loads(response.data)["paging_metadata"]["cursor"]
+        self.object_store.discard(self.object_store.get_identifiable(submodel_ids[0]))
+        response = self.client.get("/api/v3.0/submodels", query_string={"limit": "1", "cursor": cursor})
+        self.assertEqual([submodel_ids[1]], [sm["id"] for sm in json.loads(response.data)["result"]])
+
+        submodel_url = "/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel")
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel)
+        id_shorts = [se.id_short for se in submodel.submodel_element]
+        self.assertEqual(id_shorts,
+                         [se["idShort"] for se in self._get_all_pages(submodel_url + "/submodel-elements", 2)])
+
+        # Submodel elements keep the order of the model and are sought by the id_short in the cursor
+        response = self.client.get(submodel_url + "/submodel-elements", query_string={"limit": "1"})
+        cursor = json.loads(response.data)["paging_metadata"]["cursor"]
+        response = self.client.get(submodel_url + "/submodel-elements", query_string={"limit": "1", "cursor": cursor})
+        self.assertEqual([id_shorts[1]], [se["idShort"] for se in json.loads(response.data)["result"]])
+        submodel.submodel_element.remove_by_id("id_short", id_shorts[0])
+        response = self.client.get(submodel_url + "/submodel-elements", query_string={"limit": "1", "cursor": cursor})
+        self.assertEqual(400, response.status_code)
+
+        for invalid_query in ({"limit": "0"}, {"limit": "-1"}, {"limit": "abc"}, {"limit": "1", "cursor": "_w"}):
+            response = self.client.get("/api/v3.0/submodels", query_string=invalid_query)
+            self.assertEqual(400, response.status_code)
+
+    def test_streamed_response(self) -> None:
+        submodels = sorted((obj for obj in self.object_store if isinstance(obj, model.Submodel)), key=lambda sm: sm.id)
+        for cursor in (None, "", "abc"):
+            for response_t in (JsonResponse, XmlResponse):
+                with self.subTest(cursor=cursor, response_t=response_t.__name__):
+                    paging_metadata = PagingMetadata() if cursor is not None else None
+                    if paging_metadata is not None and cursor:
+                        paging_metadata.cursor = cursor
+                    response = response_t(submodels, paging_metadata=paging_metadata)
+                    streamed_response = response_t(iter(submodels), paging_metadata=paging_metadata, stream=True)
+                    self.assertTrue(streamed_response.is_streamed)
+                    if response_t is XmlResponse:
+                        self.assertEqual(response.get_data(), streamed_response.get_data())
+                    else:
+                        self.assertEqual(json.loads(response.get_data()), json.loads(streamed_response.get_data()))
+
+        # The cursor is only known after the page has been iterated, but is still part of the streamed response
+        for accept, get_cursor in (("application/json", lambda data: json.loads(data)["paging_metadata"]["cursor"]),
+                                   ("application/xml", lambda data: etree.fromstring(data).get("cursor"))):
+            with self.subTest(accept=accept):
+                test_response = self.client.get("/api/v3.0/submodels", query_string={"limit": "1"},
+                                                headers={"Accept": accept})
+                self.assertEqual(200, test_response.status_code)
+                self.assertEqual(base64url_encode(submodels[0].id), get_cursor(test_response.data))
+
+    def test_conditional_requests(self) -> None:
+        submodel_url = "/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel")
+        response = self.client.get(submodel_url)
+        self.assertEqual(200, response.status_code)
+        etag = response.headers["ETag"]
+        submodel_json = json.loads(response.data)
+        # The ETag doesn't depend on the format and applies to all resources within the Submodel
+        self.assertEqual(etag, self.client.get(submodel_url, headers={"Accept": "application/xml"}).headers["ETag"])
+        self.assertEqual(etag, self.client.get(submodel_url + "/submodel-elements/ExampleRelationshipElement")
+                         .headers["ETag"])
+
+        response = self.client.get(submodel_url, headers={"If-None-Match": etag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.data)
+        self.assertEqual(etag, response.headers["ETag"])
+
+        # A change through the API invalidates the ETag
+        response = self.client.delete(submodel_url + "/submodel-elements/ExampleRelationshipElement",
+                                      headers={"If-Match": etag})
+        self.assertEqual(204, response.status_code)
+        response = self.client.get(submodel_url, headers={"If-None-Match": etag})
+        self.assertEqual(200, response.status_code)
+        new_etag = response.headers["ETag"]
+        self.assertNotEqual(etag, new_etag)
+
+        # Modifications with an outdated ETag are rejected
+        response = self.client.put(submodel_url, json=submodel_json, headers={"If-Match": etag})
+        self.assertEqual(412, response.status_code)
+        response = self.client.put(submodel_url, json=submodel_json, headers={"If-Match": new_etag})
+        self.assertEqual(204, response.status_code)
+        self.assertNotEqual(new_etag, self.client.get(submodel_url).headers["ETag"])
+
+        response = self.client.delete("/api/v3.0/submodels/" + base64url_encode("urn:x-test:does-not-exist"),
+                                      headers={"If-Match": "*"})
+        self.assertEqual(412, response.status_code)
+
+        # The ETag of the Submodel applies to the Submodel below the AAS, the one of the AAS to its references
+        aas_url = "/api/v3.0/shells/" + base64url_encode("https://acplt.org/Test_AssetAdministrationShell")
+        etag = self.client.get(submodel_url).headers["ETag"]
+        aas_etag = self.client.get(aas_url).headers["ETag"]
+        self.assertNotEqual(etag, aas_etag)
+        aas_submodel_url = aas_url + "/submodels/" + base64url_encode("https://acplt.org/Test_Submodel")
+        response = self.client.put(aas_submodel_url, json=submodel_json, headers={"If-Match": aas_etag})
+        self.assertEqual(412, response.status_code)
+        response = self.client.put(aas_submodel_url, json=submodel_json, headers={"If-Match": etag})
+        self.assertEqual(204, response.status_code)
+        response = self.client.delete(aas_url + "/submodel-refs/" + base64url_encode("https://acplt.org/Test_Submodel"),
+                                      headers={"If-Match": self.client.get(submodel_url).headers["ETag"]})
+        self.assertEqual(412, response.status_code)
+
+    def test_committed_changes(self) -> None:
+        submodel_url = "/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel")
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel)
+        etag = self.client.get(submodel_url).headers["ETag"]
+
+        # Changes of objects without a source, which are committed in-process, invalidate the ETag
+        range_ = submodel.get_referable(["ExampleSubmodelCollection", "ExampleRange"])
+        assert isinstance(range_, model.Range)
+        range_.max = 42
+        range_.commit()
+        response = self.client.get(submodel_url, headers={"If-None-Match": etag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers["ETag"])
+
+        # ... and the cached responses
+        range_url = submodel_url + "/submodel-elements/ExampleSubmodelCollection.ExampleRange"
+        self.assertEqual("42", json.loads(self.client.get(range_url).data)["max"])
+        range_.max = 43
+        range_.commit()
+        self.assertEqual("43", json.loads(self.client.get(range_url).data)["max"])
+
+    def test_caching_log_structured_store(self) -> None:
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        log_store: log_structured.LogStructuredObjectStore[model.Identifiable] = \
+            log_structured.LogStructuredObjectStore(directory)
+        for identifiable in create_full_example():
+            log_store.add(identifiable)
+        client = Client(WSGIApp(model.CachingObjectStore(log_store), DictSupplementaryFileContainer(),
+                                base_path="/api/v3.0"))
+        range_url = "/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel") \
+            + "/submodel-elements/ExampleSubmodelCollection.ExampleRange"
+        range_json = json.loads(client.get(range_url).data)
+        range_json["max"] = "42"
+        self.assertEqual(204, client.put(range_url, json=range_json).status_code)
+        self.assertEqual("42", json.loads(client.get(range_url).data)["max"])
+        log_store.close()
+
+        # Changes through the API are passed through the cache and logged by the wrapped store
+        restored: log_structured.LogStructuredObjectStore[model.Identifiable] = \
+            log_structured.LogStructuredObjectStore(directory)
+        self.addCleanup(restored.close)
+        client = Client(WSGIApp(model.CachingObjectStore(restored), DictSupplementaryFileContainer(),
+                                base_path="/api/v3.0"))
+        self.assertEqual("42", json.loads(client.get(range_url).data)["max"])
+
+    def test_response_cache(self) -> None:
+        submodel_url = "/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel")
+        collection_url = submodel_url + "/submodel-elements/ExampleSubmodelCollection"
+        property_url = collection_url + ".ExampleMultiLanguageProperty"
+        sibling_url = submodel_url + "/submodel-elements/ExampleRelationshipElement"
+        app = WSGIApp(self.object_store, DictSupplementaryFileContainer(), base_path="/api/v3.0",
+                      response_cache_size=6)
+        client = Client(app)
+        urls = (submodel_url, submodel_url + "?level=core", collection_url, property_url + "/$metadata", sibling_url)
+        for url in urls:
+            response = client.get(url)
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(response.data, client.get(url).data)
+        self.assertEqual((5, 5), (app.response_cache.hits, app.response_cache.misses))
+        # The format is part of the key
+        response = client.get(submodel_url, headers={"Accept": "application/xml"})
+        self.assertEqual(6, app.response_cache.misses)
+        self.assertTrue(response.data.startswith(b"<?xml"))
+
+        # Changing an element invalidates the cached responses of the element, its ancestors and descendants, but not
+        # of its siblings
+        collection = json.loads(client.get(collection_url).data)
+        collection["category"] = "PARAMETER"
+        self.assertEqual(204, client.put(collection_url, json=collection).status_code)
+        app.response_cache.hits = app.response_cache.misses = 0
+        for url in urls:
+            client.get(url)
+        self.assertEqual((1, 4), (app.response_cache.hits, app.response_cache.misses))
+        self.assertEqual("PARAMETER", json.loads(client.get(collection_url).data)["category"])
+
+        # The cache is bounded
+        self.assertEqual(5, len(app.response_cache))
+        client.get(collection_url + "/$metadata")
+        client.get(submodel_url, headers={"Accept": "application/xml"})
+        self.assertEqual(6, len(app.response_cache))
+
+    def test_source_revision(self) -> None:
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        object_store = local_file.LocalFileObjectStore(directory)
+        object_store.check_directory(create=True)
+        object_store.add(self.object_store.get_identifiable("https://acplt.org/Test_Submodel"))
+        app = WSGIApp(object_store, DictSupplementaryFileContainer(), base_path="/api/v3.0")
+        client = Client(app)
+        submodel_url = "/api/v3.0/submodels/" + base64url_encode("https://acplt.org/Test_Submodel")
+        submodel = object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        response = client.get(submodel_url)
+        etag = response.headers["ETag"]
+
+        # The ETag of an unchanged document stays the same, without serializing the Submodel. The Submodel is updated
+        # only once per request.
+        with unittest.mock.patch.object(model.Submodel, "update", autospec=True,
+                                        side_effect=model.Submodel.update) as update:
+            with unittest.mock.patch.object(json, "dumps") as dumps:
+                self.assertEqual(304, client.get(submodel_url, headers={"If-None-Match": etag}).status_code)
+            dumps.assert_not_called()
+            self.assertEqual(1, update.call_count)
+            cached_response = client.get(submodel_url, headers={"If-None-Match": '"other"'})
+            self.assertEqual(2, update.call_count)
+        # The cached responses stay valid, as long as the document is unchanged
+        self.assertEqual(response.data, cached_response.data)
+        self.assertEqual(1, app.response_cache.hits)
+
+        # A change of the document by someone else is detected
+        other_submodel = local_file.LocalFileObjectStore(directory).get_identifiable("https://acplt.org/Test_Submodel")
+        other_submodel.category = "PARAMETER"
+        other_submodel.commit()
+        response = client.get(submodel_url, headers={"If-None-Match": etag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers["ETag"])
+        self.assertEqual("PARAMETER", json.loads(response.data)["category"])
+        self.assertEqual("PARAMETER", submodel.category)
@@ -4,13 +4,20 @@
 # the LICENSE file of this project.
 #
 # SPDX-License-Identifier: MIT
+import asyncio
+import json
+import shutil
+import subprocess
+import time
 import unittest
 import unittest.mock
 import urllib.error
+from typing import Any, Dict, List
 
-from basyx.aas.backend import couchdb
+from basyx.aas.backend import backends, couchdb
 from basyx.aas.examples.data.example_aas import *
 
+from test._helper.fake_couchdb import FakeCouchDB
 from test._helper.test_helpers import TEST_CONFIG, COUCHDB_OKAY, COUCHDB_ERROR
 
 
@@ -43,6 +50,40 @@ class CouchDBBackendOfflineMethodsTest(unittest.TestCase):
                          "{wrong_scheme:plt.rwth-aachen.couchdb:5984/path_to_db/path_to_doc}",
                          str(cm.exception))
 
+    @unittest.skipUnless(shutil.which("node"), "Node.js is required to run the JavaScript update handler")
+    def test_update_handler_function(self):
+        document = {"_id": "urn:x-test:submodel", "_rev": "1-a", "data": {
+            "modelType": "Submodel", "id": "urn:x-test:submodel", "submodelElements": [
+                {"modelType": "SubmodelElementCollection", "idShort": "Collection", "value": [
+                    {"modelType": "Property", "idShort": "Property", "valueType": "xs:int", "value": "1"}]},
+                {"modelType": "Operation", "idShort": "Operation", "inputVariables": [
+                    {"value": {"modelType": "Property", "idShort": "Input", "valueType": "xs:int"}}]}]}}
+        element = {"modelType": "Property", "idShort": "New", "valueType": "xs:int", "value": "2"}
+        cases = [
+            (["Collection", "Property"], "1-a"),
+            (["Collection", "New"], "1-a"),
+            (["Operation", "Input"], "1-a"),
+            (["Operation", "New"], "1-a"),
+            (["Missing", "New"], "1-a"),
+            (["Collection", "Property"], "1-b"),
+        ]
+        for path, rev in cases:
+            with self.subTest(path=path, rev=rev):
+                script = "var f = {};\nconsole.log(JSON.stringify(f({}, {{body: {}}})));".format(
+                    couchdb._UPDATE_HANDLER_FUNCTION, json.dumps(document),
+                    json.dumps(json.dumps({"rev": rev, "path": path, "element": element})))
+                new_document, response = json.loads(subprocess.run(["node", "-e", script], capture_output=True,
+                                                                   check=True, text=True).stdout)
+                expected = json.loads(json.dumps(document))
+                if rev != document["_rev"]:
+                    self.assertIsNone(new_document)
+                    self.assertEqual(409, response["code"])
+                elif backends.set_json_element(expected["data"], path, element):
+                    self.assertEqual(expected, new_document)
+                else:
+                    self.assertIsNone(new_document)
+                    self.assertEqual("element_not_found", response["json"]["error"])
+
 
 @unittest.skipUnless(COUCHDB_OKAY, "No CouchDB is reachable at {}/{}: {}".format(TEST_CONFIG['couchdb']['url'],
                                                                                  TEST_CONFIG['couchdb']['database'],
@@ -116,6 +157,30 @@ class CouchDBBackendTest(unittest.TestCase):
         checker = AASDataChecker(raise_immediately=True)
         check_full_example(checker, retrieved_data_store)
 
+    def test_iter_from(self) -> None:
+        example_data = create_full_example()
+        for item in example_data:
+            self.object_store.add(item)
+
+        ordered = list(self.object_store.iter_from(batch_size=2))
+        self.assertEqual(sorted(item.id for item in example_data), [item.id for item in ordered])
+        self.assertEqual(ordered[2:], list(self.object_store.iter_from(ordered[1].id, batch_size=2)))
+        self.assertEqual([], list(self.object_store.iter_from(ordered[-1].id)))
+
+    def test_query_index(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        self.object_store.create_indexes()
+        with unittest.mock.patch.object(couchdb.CouchDBBackend, "do_request",
+                                        wraps=couchdb.CouchDBBackend.do_request) as do_request:
+            self.assertEqual([submodel.id], [item.id for item in self.object_store.query(
+                model.Submodel, id_short=submodel.id_short, after="https://acplt.org/")])
+        url, method, headers, body = do_request.call_args[0]
+
+        # The CouchDB server answers the query from the compound index of the id_short and the document id
+        explanation = couchdb.CouchDBBackend.do_request(url.replace("/_find", "/_explain"), method, headers, body)
+        self.assertEqual("data.idShort", explanation["index"]["name"])
+
     def test_key_errors(self) -> None:
         # Double adding an object should raise a KeyError
         example_submodel = create_example_submodel()
@@ -181,3 +246,297 @@ class CouchDBBackendTest(unittest.TestCase):
         test_object.id_short = "AnotherIdShort"
         test_object.update()
         self.assertEqual("SomeNewIdShort", test_object.id_short)
+
+
+class CouchDBFakeServerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = FakeCouchDB().start()
+        self.object_store = couchdb.CouchDBObjectStore(self.server.url, "aas_test")
+        self.object_store.check_database(create=True)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def test_bulk_operations(self) -> None:
+        example_data = list(create_full_example())
+        self.server.requests.clear()
+        self.object_store.add_many(example_data, batch_size=3)
+        self.assertEqual(2, len(self.server.requests))
+        for item in example_data:
+            self.assertTrue(item.source.startswith("couchdb://"))
+
+        # Iterating the store fetches the documents with the ids
+        self.server.requests.clear()
+        self.assertEqual(sorted(item.id for item in example_data), [item.id for item in self.object_store])
+        self.assertEqual(1, len(self.server.requests))
+        retrieved_data_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore(
+            self.object_store.iter_from(batch_size=2))
+        checker = AASDataChecker(raise_immediately=True)
+        check_full_example(checker, retrieved_data_store)
+
+        # Conflicts are reported per object, while all other objects are processed
+        submodel = create_example_submodel()
+        concept_description = model.ConceptDescription("urn:x-test:concept_description")
+        with self.assertRaises(couchdb.CouchDBBulkError) as cm:
+            self.object_store.add_many([submodel, concept_description])
+        self.assertEqual(["https://acplt.org/Test_Submodel"], list(cm.exception.errors))
+        self.assertIsInstance(cm.exception.errors["https://acplt.org/Test_Submodel"], KeyError)
+        self.assertIn(concept_description, self.object_store)
+        # update() keeps the semantics of a MutableSet, i.e. it adds the objects one by one
+        with self.assertRaises(KeyError):
+            self.object_store.update([model.ConceptDescription("urn:x-test:other"), create_example_submodel()])
+        self.assertIn("urn:x-test:other", self.object_store)
+
+        for item in example_data:
+            item.category = "PARAMETER" if isinstance(item, model.Submodel) else None
+        self.server.requests.clear()
+        self.object_store.commit_many(example_data)
+        self.assertEqual(1, len(self.server.requests))
+        stored_submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        self.assertEqual("PARAMETER", stored_submodel.category)
+
+        # Simulate a concurrent modification of one object
+        with unittest.mock.patch("basyx.aas.backend.couchdb.set_couchdb_revision"):
+            stored_submodel.commit()
+        with self.assertRaises(couchdb.CouchDBBulkError) as cm:
+            self.object_store.commit_many(example_data)
+        self.assertEqual(["https://acplt.org/Test_Submodel"], list(cm.exception.errors))
+        self.assertIsInstance(cm.exception.errors["https://acplt.org/Test_Submodel"], couchdb.CouchDBConflictError)
+        with self.assertRaises(couchdb.CouchDBBulkError) as cm:
+            self.object_store.discard_many(example_data, safe_delete=True)
+        self.assertEqual(["https://acplt.org/Test_Submodel"], list(cm.exception.errors))
+
+        self.object_store.discard_many(list(self.object_store))
+        self.assertEqual(0, len(self.object_store))
+        self.assertEqual("", stored_submodel.source)
+        with self.assertRaises(couchdb.CouchDBBulkError) as cm:
+            self.object_store.discard_many([submodel])
+        self.assertIsInstance(cm.exception.errors["https://acplt.org/Test_Submodel"], KeyError)
+        self.assertEqual("", stored_submodel.source)
+
+    def test_conditional_update(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        with unittest.mock.patch.object(submodel, "update_from") as update_from:
+            submodel.update()
+            self.assertIs(submodel, self.object_store.get_identifiable(submodel.id))
+            update_from.assert_not_called()
+
+        # After a change in the database, the object is updated
+        document = dict(self.server.databases["aas_test"][submodel.id])
+        document["data"] = dict(document["data"], idShort="OtherIdShort")
+        self.server.put_document("aas_test", document)
+        submodel.update()
+        self.assertEqual("OtherIdShort", submodel.id_short)
+        document = dict(self.server.databases["aas_test"][submodel.id])
+        document["data"] = dict(document["data"], idShort="NewIdShort")
+        self.server.put_document("aas_test", document)
+        self.assertIs(submodel, self.object_store.get_identifiable(submodel.id))
+        self.assertEqual("NewIdShort", submodel.id_short)
+
+    def test_query(self) -> None:
+        example_data = list(create_full_example())
+        self.object_store.add_many(example_data)
+        self.object_store.create_indexes()
+        self.object_store.create_indexes()
+        self.assertEqual(len(example_data), len(self.object_store))
+        self.assertEqual(sorted(item.id for item in example_data), [item.id for item in self.object_store])
+
+        local_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore(example_data)
+        submodel = create_example_submodel()
+        shell = next(item for item in example_data if isinstance(item, model.AssetAdministrationShell))
+        queries: List[Dict[str, Any]] = [
+            {'type_': model.Submodel},
+            {'type_': model.Identifiable},
+            {'type_': model.Submodel, 'semantic_id': submodel.semantic_id},
+            {'type_': model.Submodel, 'id_short': submodel.id_short},
+            {'type_': model.AssetAdministrationShell, 'id_short': submodel.id_short},
+            {'type_': model.AssetAdministrationShell,
+             'global_asset_id': shell.asset_information.global_asset_id,
+             'specific_asset_ids': shell.asset_information.specific_asset_id},
+            {'type_': model.Submodel, 'after': submodel.id},
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                expected = [item.id for item in local_store.query(**query)]  # type: ignore[arg-type]
+                self.server.requests.clear()
+                self.assertEqual(expected, [item.id for item in self.object_store.query(  # type: ignore[arg-type]
+                    **query, batch_size=2)])
+                if len(query) > 1 and 'after' not in query:
+                    # Only the matching documents are requested, in batches
+                    self.assertEqual([("POST", "/aas_test/_find")] * (len(expected) // 2 + 1), self.server.requests)
+                else:
+                    # Queries by type only are answered via iter_from()
+                    self.assertEqual({("GET", "/aas_test/_all_docs")}, set(self.server.requests))
+
+        # Unfiltered queries are lazy
+        self.server.requests.clear()
+        next(self.object_store.query(model.Identifiable, batch_size=2))  # type: ignore[type-abstract]
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_async_store(self) -> None:
+        example_data = list(create_full_example())
+        async_store = couchdb.AsyncCouchDBObjectStore(self.server.url, "aas_test", max_concurrency=3)
+
+        async def run() -> None:
+            await async_store.check_database()
+            await async_store.add_many(example_data, batch_size=2)
+            self.assertEqual(len(example_data), await async_store.count())
+            self.assertTrue(await async_store.contains(example_data[0]))
+
+            # Objects are retrieved concurrently, but with at most 3 requests at a time
+            self.server.delay = 0.05
+            self.server.max_concurrent_requests = 0
+            identifiers = [item.id for item in reversed(example_data)]
+            retrieved = await async_store.get_many(identifiers)
+            self.assertEqual(identifiers, [item.id for item in retrieved])
+            self.assertEqual(3, self.server.max_concurrent_requests)
+            self.server.delay = 0
+
+            # The async store and its synchronous facade return the same objects
+            for item in retrieved:
+                self.assertIs(item, async_store.sync_store.get_identifiable(item.id))
+            self.assertEqual(sorted(identifiers), [item.id async for item in async_store.iter_from(batch_size=2)])
+            self.assertEqual(sorted(identifiers)[1:], [item.id async for item in async_store.iter_from(
+                sorted(identifiers)[0], batch_size=2)])
+
+            for item in example_data:
+                item.category = "PARAMETER" if isinstance(item, model.Submodel) else None
+            await async_store.commit_many(example_data, batch_size=2)
+            submodel = await async_store.get_identifiable("https://acplt.org/Test_Submodel")
+            self.assertEqual("PARAMETER", submodel.category)
+            document = dict(self.server.databases["aas_test"][submodel.id])
+            document["data"] = dict(document["data"], idShort="OtherIdShort")
+            self.server.put_document("aas_test", document)
+            await couchdb.AsyncCouchDBBackend.update_object(submodel, submodel, [])
+            self.assertEqual("OtherIdShort", submodel.id_short)
+
+            with self.assertRaises(KeyError):
+                await async_store.get_many(["urn:x-test:does-not-exist"])
+            self.assertIsNone(await async_store.get("urn:x-test:does-not-exist"))
+            with self.assertRaises(couchdb.CouchDBBulkError) as cm:
+                await async_store.add_many(example_data[:3], batch_size=2)
+            self.assertEqual(3, len(cm.exception.errors))
+            await async_store.discard(submodel)
+            self.assertFalse(await async_store.contains(submodel))
+
+        asyncio.run(run())
+
+    def test_delta_commit(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        range_ = submodel.get_referable(["ExampleSubmodelCollection", "ExampleRange"])
+        assert isinstance(range_, model.Range)
+
+        # Without the update handler, the whole submodel is sent
+        range_.max = 42
+        self.server.requests.clear()
+        range_.commit()
+        self.assertEqual([("PUT", "/aas_test/https%3A%2F%2Facplt.org%2FTest_Submodel")], self.server.requests)
+
+        self.object_store.create_update_handler()
+        self.object_store.create_update_handler()
+        range_.max = 43
+        self.server.requests.clear()
+        range_.commit()
+        self.assertEqual([("PUT", "/aas_test/_design/basyx/_update/set_element/"
+                                  "https%3A%2F%2Facplt.org%2FTest_Submodel")], self.server.requests)
+        document = self.server.databases["aas_test"]["https://acplt.org/Test_Submodel"]
+        collection = next(element for element in document["data"]["submodelElements"]
+                          if element["idShort"] == "ExampleSubmodelCollection")
+        self.assertIn({"idShort": "ExampleRange", "max": "43"},
+                      [{key: element[key] for key in ("idShort", "max") if key in element}
+                       for element in collection["value"]])
+        # The revision of the document is known, so the submodel is up to date
+        with unittest.mock.patch.object(submodel, "update_from") as update_from:
+            submodel.update()
+            update_from.assert_not_called()
+        self.assertEqual(1, len(self.object_store))
+
+        # An element within a new collection can only be committed with the whole submodel, after trying to commit its
+        # ancestors
+        new_collection = model.SubmodelElementCollection("NewCollection", [model.Property("Inner", model.datatypes.Int,
+                                                                                          1)])
+        submodel.add_referable(new_collection)
+        self.server.requests.clear()
+        new_collection.get_referable("Inner").commit()
+        self.assertEqual(3, len(self.server.requests))
+        document = self.server.databases["aas_test"]["https://acplt.org/Test_Submodel"]
+        self.assertIn("NewCollection", [element["idShort"] for element in document["data"]["submodelElements"]])
+
+        # Concurrent modifications are detected
+        with unittest.mock.patch("basyx.aas.backend.couchdb.set_couchdb_revision"):
+            submodel.commit()
+        with self.assertRaises(couchdb.CouchDBConflictError):
+            range_.commit()
+
+    def test_renamed_element_commit(self) -> None:
+        submodel = model.Submodel("urn:x-test:renamed", submodel_element=[
+            model.Property("a", model.datatypes.Int, 1), model.Property("c", model.datatypes.Int, 2),
+            model.SubmodelElementCollection("collection", [model.Property("x", model.datatypes.Int, 3)])])
+        self.object_store.add(submodel)
+        self.object_store.create_update_handler()
+
+        # A renamed element is not contained in the document, so it is committed with its parent instead of being
+        # added next to the outdated element
+        for path, new_id_short in ((["a"], "b"), (["collection", "x"], "y")):
+            element = submodel.get_referable(path)
+            element.id_short = new_id_short
+            element.commit()
+        document = self.server.databases["aas_test"]["urn:x-test:renamed"]
+        self.assertEqual(["c", "collection", "b"], [element["idShort"]
+                                                    for element in document["data"]["submodelElements"]])
+        self.assertEqual(["y"], [element["idShort"] for element in document["data"]["submodelElements"][1]["value"]])
+
+    def _document_requests(self) -> list:
+        return [request for request in self.server.requests if not request[1].endswith("/_changes")]
+
+    def _wait_for_changes(self, follower: couchdb.CouchDBChangesFollower) -> None:
+        # wait until the follower has processed all changes of the database
+        update_seq = str(len(self.server.changes["aas_test"]))
+        deadline = time.monotonic() + 5
+        while follower._last_seq != update_seq:
+            if time.monotonic() > deadline:
+                self.fail("The changes follower did not process the changes")
+            time.sleep(0.01)
+
+    def test_changes_follower(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        follower = self.object_store.follow_changes(timeout=0.5)
+        try:
+            # The revision of the submodel has been stored before the follower has been started, so it is not known
+            # to be up to date
+            self.server.requests.clear()
+            submodel.update()
+            self.assertEqual(1, len(self._document_requests()))
+
+            # Now, it is known to be up to date
+            self._wait_for_changes(follower)
+            self.server.requests.clear()
+            submodel.update()
+            self.assertIs(submodel, self.object_store.get_identifiable(submodel.id))
+            self.assertEqual([], self._document_requests())
+
+            # A change of the submodel by another client is recorded from the _changes feed
+            document = dict(self.server.databases["aas_test"][submodel.id])
+            document["data"] = dict(document["data"], idShort="OtherIdShort")
+            self.server.put_document("aas_test", document)
+            self._wait_for_changes(follower)
+            submodel.update()
+            self.assertEqual("OtherIdShort", submodel.id_short)
+
+            # Our own commits are recorded as well
+            submodel.id_short = "NewIdShort"
+            submodel.commit()
+            self._wait_for_changes(follower)
+            self.server.requests.clear()
+            submodel.update()
+            self.assertEqual([], self._document_requests())
+        finally:
+            follower.stop()
+
+        # Without the follower, the submodel is updated again
+        self.server.requests.clear()
+        submodel.update()
+        self.assertEqual(1, len(self._document_requests()))
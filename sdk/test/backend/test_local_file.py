@@ -4,11 +4,18 @@
 # the LICENSE file of this project.
 #
 # SPDX-License-Identifier: MIT
+import gc
+import json
+import multiprocessing
+import multiprocessing.synchronize
 import os.path
 import shutil
+import threading
+import time
 import unittest
 import unittest.mock
 
+from basyx.aas.adapter.json import json_serialization
 from basyx.aas.backend import local_file
 from basyx.aas.examples.data.example_aas import *
 
@@ -17,6 +24,18 @@ store_path: str = os.path.dirname(__file__) + "/local_file_test_folder"
 source_core: str = "file://localhost/{}/".format(store_path)
 
 
+def _change_in_other_process(lock_held: "multiprocessing.synchronize.Event") -> None:
+    object_store = local_file.LocalFileObjectStore(store_path)
+    submodel = object_store.get_identifiable("https://acplt.org/Test_Submodel")
+    submodel.category = "PARAMETER"
+    submodel.commit()
+    object_store.discard(object_store.get_identifiable("https://acplt.org/Test_AssetAdministrationShell"))
+    object_store.add(model.ConceptDescription("urn:x-test:other-process"))
+    with local_file.LocalFileBackend.lock(store_path):
+        lock_held.set()
+        time.sleep(0.5)
+
+
 class LocalFileBackendTest(unittest.TestCase):
     def setUp(self) -> None:
         self.object_store = local_file.LocalFileObjectStore(store_path)
@@ -54,6 +73,20 @@ class LocalFileBackendTest(unittest.TestCase):
         test_object_retrieved_third = self.object_store.get_identifiable('https://acplt.org/Test_Submodel')
         self.assertIsNot(test_object_retrieved, test_object_retrieved_third)
 
+    def test_synced_objects_pruned(self) -> None:
+        test_object = create_example_submodel()
+        self.object_store.add(test_object)
+        synced_objects = local_file.LocalFileBackend._synced_objects[os.path.abspath(store_path)]
+        hash_ = local_file.LocalFileObjectStore._transform_id(test_object.id)
+        self.assertIn(hash_, synced_objects)
+
+        # The entry is removed, when the object is garbage collected
+        del test_object
+        gc.collect()
+        self.assertNotIn(hash_, synced_objects)
+        self.assertEqual('https://acplt.org/Test_Submodel',
+                         self.object_store.get_identifiable('https://acplt.org/Test_Submodel').id)
+
     def test_example_submodel_storing(self) -> None:
         example_submodel = create_example_submodel()
 
@@ -124,3 +157,403 @@ class LocalFileBackendTest(unittest.TestCase):
         test_object.id_short = "AnotherIdShort"
         test_object.update()
         self.assertEqual("SomeNewIdShort", test_object.id_short)
+
+    def test_unchanged_update(self) -> None:
+        self.object_store.add(create_example_submodel())
+        submodel = local_file.LocalFileObjectStore(store_path).get_identifiable("https://acplt.org/Test_Submodel")
+        file_name = submodel.source.replace("file://localhost/", "")
+
+        # Objects, which have been read from their unchanged files, are not decoded again on update
+        with unittest.mock.patch.object(local_file.LocalFileBackend, "load_document",
+                                        wraps=local_file.LocalFileBackend.load_document) as load_document:
+            submodel.update()
+            load_document.assert_not_called()
+
+            # A committed object is read again once, to discard any local changes since the commit
+            submodel.category = "PARAMETER"
+            submodel.commit()
+            submodel.category = "VARIABLE"
+            submodel.update()
+            self.assertEqual("PARAMETER", submodel.category)
+            submodel.update()
+            self.assertEqual(1, load_document.call_count)
+
+            # Changed files are read again
+            stored = local_file.LocalFileBackend.load_document(file_name)["data"]
+            stored.id_short = "ChangedIdShort"
+            with open(file_name, "w") as file:
+                json.dump({"data": stored}, file, cls=json_serialization.AASToJsonEncoder)
+            submodel.update()
+            self.assertEqual("ChangedIdShort", submodel.id_short)
+            self.assertEqual(3, load_document.call_count)
+
+    def test_iter_from(self) -> None:
+        example_data = create_full_example()
+        for item in example_data:
+            self.object_store.add(item)
+
+        ordered = list(self.object_store.iter_from())
+        self.assertEqual(5, len(ordered))
+        self.assertEqual(ordered[2:], list(self.object_store.iter_from(ordered[1].id)))
+        self.assertEqual([], list(self.object_store.iter_from(ordered[-1].id)))
+
+    def test_delta_commit(self) -> None:
+        test_object = create_example_submodel()
+        self.object_store.add(test_object)
+        file_name = test_object.source.replace("file://localhost/", "")
+        journal_name = file_name[:-len(".json")] + ".journal"
+        with open(file_name) as file:
+            document = file.read()
+
+        # Committing a single element only appends it to the patch journal
+        range_ = test_object.get_referable(["ExampleSubmodelCollection", "ExampleRange"])
+        assert isinstance(range_, model.Range)
+        range_.max = 42
+        range_.commit()
+        with open(file_name) as file:
+            self.assertEqual(document, file.read())
+        self.assertTrue(os.path.exists(journal_name))
+        range_.max = 1
+        test_object.update()
+        self.assertEqual(42, range_.max)
+        self.assertEqual(42, local_file.LocalFileBackend.load_document(file_name)["data"]
+                         .get_referable(["ExampleSubmodelCollection", "ExampleRange"]).max)
+        self.assertEqual(1, len(self.object_store))
+        self.assertEqual([test_object.id], [item.id for item in self.object_store.iter_from()])
+
+        # A new element is committed with its parent
+        collection = test_object.get_referable("ExampleSubmodelCollection")
+        assert isinstance(collection, model.SubmodelElementCollection)
+        collection.add_referable(model.Property("NewProperty", model.datatypes.Int, 5))
+        collection.get_referable("NewProperty").commit()
+        stored = local_file.LocalFileBackend.load_document(file_name)["data"]
+        self.assertEqual(5, stored.get_referable(["ExampleSubmodelCollection", "NewProperty"]).value)
+
+        # The element of a new collection can't be committed separately, so the whole submodel is written
+        new_collection = model.SubmodelElementCollection("NewCollection", [model.Property("Inner", model.datatypes.Int,
+                                                                                          1)])
+        test_object.add_referable(new_collection)
+        new_collection.get_referable("Inner").commit()
+        self.assertFalse(os.path.exists(journal_name))
+        stored = local_file.LocalFileBackend.load_document(file_name)["data"]
+        self.assertEqual(1, stored.get_referable(["NewCollection", "Inner"]).value)
+
+        # The journal is merged into the document after a limited number of changes
+        for i in range(local_file.LocalFileBackend.COMPACT_JOURNAL_ENTRIES):
+            range_.max = i
+            range_.commit()
+            if not os.path.exists(journal_name):
+                break
+        else:
+            self.fail("The patch journal has not been compacted")
+        with open(file_name) as file:
+            self.assertNotEqual(document, file.read())
+        stored = local_file.LocalFileBackend.load_document(file_name)["data"]
+        self.assertEqual(range_.max, stored.get_referable(["ExampleSubmodelCollection", "ExampleRange"]).max)
+        self.assertEqual(5, stored.get_referable(["ExampleSubmodelCollection", "NewProperty"]).value)
+
+        # Committing the whole submodel discards the journal
+        range_.max = 7
+        range_.commit()
+        self.assertTrue(os.path.exists(journal_name))
+        test_object.commit()
+        self.assertFalse(os.path.exists(journal_name))
+        self.object_store.discard(test_object)
+        self.assertEqual([".changes", ".lock", ".manifest"], sorted(os.listdir(store_path)))
+
+    def test_manifest(self) -> None:
+        example_data = list(create_full_example())
+        for item in example_data:
+            self.object_store.add(item)
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel)
+
+        # Objects, which are in sync with their unchanged files, are not read again
+        with unittest.mock.patch.object(local_file.LocalFileBackend, "load_document",
+                                        wraps=local_file.LocalFileBackend.load_document) as load_document:
+            self.assertIs(submodel, self.object_store.get_identifiable(submodel.id))
+            load_document.assert_not_called()
+            submodel.category = "PARAMETER"
+            submodel.commit()
+            self.assertIs(submodel, self.object_store.get_identifiable(submodel.id))
+            load_document.assert_not_called()
+
+        # A new store for the directory uses the persisted manifest for counting and filtering
+        object_store = local_file.LocalFileObjectStore(store_path)
+        with unittest.mock.patch.object(local_file.LocalFileBackend, "load_document",
+                                        wraps=local_file.LocalFileBackend.load_document) as load_document, \
+                unittest.mock.patch.object(local_file.LocalFileBackend, "_load_raw_document") as load_raw_document:
+            self.assertEqual(len(example_data), len(object_store))
+            self.assertEqual([submodel.id], [item.id for item in object_store.query(
+                model.Submodel, semantic_id=submodel.semantic_id)])
+            self.assertEqual(1, load_document.call_count)
+            self.assertEqual([], list(object_store.query(model.ConceptDescription, id_short="NoSuchIdShort")))
+            self.assertEqual(1, load_document.call_count)
+            load_raw_document.assert_not_called()
+        self.assertEqual("PARAMETER", object_store.get_identifiable(submodel.id).category)
+        self.assertEqual(sorted(item.id for item in self.object_store.query(model.Submodel)),
+                         sorted(item.id for item in example_data if isinstance(item, model.Submodel)))
+
+        # Changes by other stores of the directory are applied to the manifest
+        self.object_store.discard(submodel)
+        self.assertEqual(len(example_data) - 1, len(object_store))
+
+        # Files changed outside of the store are found, when the manifest is loaded
+        os.remove(os.path.join(store_path, ".manifest"))
+        with open(os.path.join(store_path, "{}.json".format("0" * 64)), "w") as file:
+            json.dump({"data": model.ConceptDescription("urn:x-test:cd", id_short="ExternalCD")}, file,
+                      cls=json_serialization.AASToJsonEncoder)
+        object_store = local_file.LocalFileObjectStore(store_path)
+        self.assertEqual(len(example_data), len(object_store))
+        self.assertEqual(["urn:x-test:cd"],
+                         [item.id for item in object_store.query(model.ConceptDescription, id_short="ExternalCD")])
+
+    def test_document_formats(self) -> None:
+        self.addCleanup(local_file.LocalFileBackend.set_compact, store_path, False)
+        with self.assertRaises(ValueError):
+            local_file.LocalFileObjectStore(store_path, compression="zip")
+        for compact, compression, suffix in ((True, None, ".json"), (False, "gzip", ".json.gz"),
+                                             (True, "lzma", ".json.xz")):
+            with self.subTest(compact=compact, compression=compression):
+                object_store = local_file.LocalFileObjectStore(store_path, compact=compact, compression=compression)
+                submodel = create_example_submodel()
+                object_store.add(submodel)
+                file_name = "{}/{}{}".format(store_path, object_store._transform_id(submodel.id), suffix)
+                self.assertEqual("file://localhost/" + file_name, submodel.source)
+                submodel.category = "PARAMETER"
+                submodel.commit()
+                with local_file._open_document(file_name) as file:
+                    content = file.read()
+                self.assertEqual(compact, "\n" not in content)
+                self.assertEqual("PARAMETER", json.loads(content)["data"]["category"])
+
+                # Documents of other forms are still found by other stores of the directory
+                self.assertIn(submodel.id, self.object_store)
+                self.assertEqual(1, len(self.object_store))
+                self.assertEqual("PARAMETER", local_file.LocalFileObjectStore(store_path)
+                                 .get_identifiable(submodel.id).category)
+                object_store.discard(submodel)
+                self.assertEqual([".changes", ".lock", ".manifest"], sorted(os.listdir(store_path)))
+
+    def test_atomic_writes(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        file_name = submodel.source.replace("file://localhost/", "")
+        with open(file_name) as file:
+            content = file.read()
+
+        # If writing the document fails, the old document is kept and no temporary file is left behind
+        submodel.category = "PARAMETER"
+        with unittest.mock.patch("json.dump", side_effect=OSError("No space left on device")):
+            with self.assertRaises(OSError):
+                submodel.commit()
+        with open(file_name) as file:
+            self.assertEqual(content, file.read())
+        self.assertEqual(sorted([".changes", ".lock", ".manifest", os.path.basename(file_name)]),
+                         sorted(os.listdir(store_path)))
+        submodel.commit()
+        self.assertEqual("PARAMETER", local_file.LocalFileObjectStore(store_path)
+                         .get_identifiable(submodel.id).category)
+
+    def test_sharding(self) -> None:
+        self.addCleanup(local_file.LocalFileBackend.set_sharding, store_path, 0)
+        example_data = list(create_full_example())
+        for item in example_data:
+            self.object_store.add(item)
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        hash_ = self.object_store._transform_id(submodel.id)
+        flat_file_name = "{}/{}.json".format(store_path, hash_)
+        self.assertEqual("file://localhost/" + flat_file_name, submodel.source)
+
+        # Documents in the flat layout are still found by a sharded store
+        object_store = local_file.LocalFileObjectStore(store_path, shard_levels=2)
+        self.assertEqual(len(example_data), len(object_store))
+        self.assertIn(submodel.id, object_store)
+        sharded_submodel = object_store.get_identifiable(submodel.id)
+        self.assertEqual("file://localhost/" + flat_file_name, sharded_submodel.source)
+        with unittest.mock.patch("os.path.exists", wraps=os.path.exists) as exists:
+            self.assertNotIn("urn:x-test:missing", object_store)
+        self.assertEqual(2, exists.call_count)
+
+        # Migrating moves the documents and updates the source of cached objects
+        self.assertEqual(len(example_data), object_store.migrate_layout())
+        self.assertEqual(0, object_store.migrate_layout())
+        sharded_file_name = "{}/{}/{}/{}.json".format(store_path, hash_[0:2], hash_[2:4], hash_)
+        self.assertTrue(os.path.exists(sharded_file_name))
+        self.assertEqual("file://localhost/" + sharded_file_name, sharded_submodel.source)
+        self.assertEqual([".changes", ".lock", ".manifest"], sorted(
+            name for name in os.listdir(store_path) if not os.path.isdir(os.path.join(store_path, name))))
+
+        # Once migrated, documents are only looked up at their place in the layout
+        with unittest.mock.patch("os.path.exists", wraps=os.path.exists) as exists:
+            self.assertNotIn("urn:x-test:missing", object_store)
+            self.assertIn(submodel.id, object_store)
+        self.assertEqual(2, exists.call_count)
+
+        # Objects with outdated sources are resolved by the backend
+        submodel.category = "PARAMETER"
+        submodel.commit()
+        self.assertEqual("file://localhost/" + sharded_file_name, submodel.source)
+        self.assertFalse(os.path.exists(flat_file_name))
+        sharded_submodel.update()
+        self.assertEqual("PARAMETER", sharded_submodel.category)
+
+        # New documents are placed in the subdirectories and a new store finds all documents
+        cd = model.ConceptDescription("urn:x-test:sharded-cd")
+        object_store.add(cd)
+        cd_hash = object_store._transform_id(cd.id)
+        self.assertEqual("file://localhost/{}/{}/{}/{}.json".format(store_path, cd_hash[0:2], cd_hash[2:4], cd_hash),
+                         cd.source)
+        os.remove(os.path.join(store_path, ".manifest"))
+        object_store = local_file.LocalFileObjectStore(store_path, shard_levels=2)
+        self.assertEqual(len(example_data) + 1, len(object_store))
+        self.assertEqual(sorted([item.id for item in example_data] + [cd.id]),
+                         sorted(item.id for item in object_store))
+        object_store.clear()
+        self.assertEqual(0, len(object_store))
+
+    @unittest.skipIf(local_file.fcntl is None, "fcntl is not available")
+    def test_multiple_processes(self) -> None:
+        example_data = list(create_full_example())
+        for item in example_data:
+            self.object_store.add(item)
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        self.assertEqual(len(example_data), len(self.object_store))
+
+        lock_held = multiprocessing.Event()
+        process = multiprocessing.Process(target=_change_in_other_process, args=(lock_held,))
+        process.start()
+        try:
+            self.assertTrue(lock_held.wait(30))
+            # The other process holds the lock of the directory, so we have to wait for reading
+            start = time.monotonic()
+            self.assertEqual(len(example_data), len(self.object_store))
+            self.assertGreater(time.monotonic() - start, 0.1)
+        finally:
+            process.join(30)
+        self.assertEqual(0, process.exitcode)
+
+        # The changes of the other process are applied to the manifest and cached objects are read again
+        with unittest.mock.patch.object(local_file.LocalFileBackend, "load_document",
+                                        wraps=local_file.LocalFileBackend.load_document) as load_document:
+            self.assertIs(submodel, self.object_store.get_identifiable(submodel.id))
+            self.assertEqual(1, load_document.call_count)
+        self.assertEqual("PARAMETER", submodel.category)
+        self.assertNotIn("https://acplt.org/Test_AssetAdministrationShell", self.object_store)
+        self.assertEqual(["urn:x-test:other-process"],
+                         [cd.id for cd in self.object_store.query(model.ConceptDescription)
+                          if cd.id == "urn:x-test:other-process"])
+        self.assertEqual(len(example_data), len(self.object_store))
+
+    def test_lock_threads(self) -> None:
+        shared_acquired = threading.Event()
+        exclusive_acquired = threading.Event()
+
+        def acquire(shared: bool) -> None:
+            with local_file.LocalFileBackend.lock(store_path, shared=shared):
+                (shared_acquired if shared else exclusive_acquired).set()
+
+        # Threads of the same process read concurrently, but are excluded from changing documents meanwhile
+        with local_file.LocalFileBackend.lock(store_path, shared=True):
+            threads = [threading.Thread(target=acquire, args=(shared,)) for shared in (True, False)]
+            for thread in threads:
+                thread.start()
+            self.assertTrue(shared_acquired.wait(30))
+            self.assertFalse(exclusive_acquired.wait(0.1))
+            # A nested exclusive lock converts the shared lock of the thread
+            with local_file.LocalFileBackend.lock(store_path):
+                self.assertFalse(exclusive_acquired.is_set())
+        for thread in threads:
+            thread.join(30)
+        self.assertTrue(exclusive_acquired.is_set())
+
+    def test_read_only_directory(self) -> None:
+        example_data = list(create_full_example())
+        for item in example_data:
+            self.object_store.add(item)
+        for name in (".lock", ".manifest"):
+            os.remove(os.path.join(store_path, name))
+        lock_file = local_file.LocalFileBackend._directory_locks.pop(os.path.abspath(store_path)).file
+        if lock_file is not None:
+            lock_file.close()
+        self.addCleanup(local_file.LocalFileBackend._directory_locks.pop, os.path.abspath(store_path))
+
+        def open_read_only(file, mode="r", *args, **kwargs):
+            if any(character in mode for character in "wax+"):
+                raise PermissionError(13, "Permission denied", file)
+            return open(file, mode, *args, **kwargs)
+
+        # The lock file and the manifest can't be written, so the objects are read without them
+        with unittest.mock.patch.object(local_file, "open", side_effect=open_read_only, create=True):
+            object_store = local_file.LocalFileObjectStore(store_path)
+            self.assertEqual(len(example_data), len(object_store))
+            self.assertEqual(sorted(item.id for item in example_data), sorted(item.id for item in object_store))
+            self.assertEqual(["https://acplt.org/Test_Submodel"],
+                             [sm.id for sm in object_store.query(model.Submodel, id_short="TestSubmodel")])
+        self.assertEqual([".changes"], sorted(name for name in os.listdir(store_path) if name.startswith(".")))
+
+    def test_incomplete_journal(self) -> None:
+        test_object = create_example_submodel()
+        self.object_store.add(test_object)
+        file_name = test_object.source.replace("file://localhost/", "")
+        journal_name = file_name[:-len(".json")] + ".journal"
+        range_ = test_object.get_referable(["ExampleSubmodelCollection", "ExampleRange"])
+        assert isinstance(range_, model.Range)
+        range_.max = 42
+        range_.commit()
+        with open(journal_name) as file:
+            journal = file.read()
+
+        # A partially written change (e.g. after a crash) is discarded and removed from the journal
+        with open(journal_name, "a") as file:
+            file.write('{"path":["ExampleSubmodelCollection","ExampleRange"],"data":{"modelTy')
+        with self.assertLogs(local_file.logger, level="WARNING"):
+            stored = local_file.LocalFileBackend.load_document(file_name)["data"]
+        self.assertEqual(42, stored.get_referable(["ExampleSubmodelCollection", "ExampleRange"]).max)
+        with open(journal_name) as file:
+            self.assertEqual(journal, file.read())
+
+    def test_list_element_commit(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        item = submodel.get_referable(["ExampleSubmodelCollection", "ExampleSubmodelList", "0"])
+        assert isinstance(item, model.Property)
+        item.value = "changed"
+        item.commit()
+
+        # The list is committed as a whole, so its elements are not duplicated
+        retrieved_submodel = local_file.LocalFileObjectStore(store_path).get_identifiable(submodel.id)
+        assert isinstance(retrieved_submodel, model.Submodel)
+        retrieved_list = retrieved_submodel.get_referable(["ExampleSubmodelCollection", "ExampleSubmodelList"])
+        assert isinstance(retrieved_list, model.SubmodelElementList)
+        self.assertEqual(2, len(retrieved_list.value))
+        self.assertEqual("changed", list(retrieved_list.value)[0].value)
+
+        # Elements of the list can't be addressed, so they are committed with the list, even if committed directly
+        file_name = submodel.source.replace("file://localhost/", "")
+        self.assertTrue(local_file.LocalFileBackend._commit_delta(
+            file_name, item, ["ExampleSubmodelCollection", "ExampleSubmodelList", str(item.id_short)]))
+        retrieved_submodel = local_file.LocalFileObjectStore(store_path).get_identifiable(submodel.id)
+        assert isinstance(retrieved_submodel, model.Submodel)
+        retrieved_list = retrieved_submodel.get_referable(["ExampleSubmodelCollection", "ExampleSubmodelList"])
+        assert isinstance(retrieved_list, model.SubmodelElementList)
+        self.assertEqual(2, len(retrieved_list.value))
+
+    def test_renamed_element_commit(self) -> None:
+        submodel = model.Submodel("urn:x-test:renamed", submodel_element=[
+            model.Property("a", model.datatypes.Int, 1), model.Property("c", model.datatypes.Int, 2),
+            model.SubmodelElementCollection("collection", [model.Property("x", model.datatypes.Int, 3)])])
+        self.object_store.add(submodel)
+
+        # A renamed element is not contained in the document, so it is committed with its parent instead of being
+        # added next to the outdated element
+        for path, new_id_short in ((["a"], "b"), (["collection", "x"], "y")):
+            element = submodel.get_referable(path)
+            element.id_short = new_id_short
+            element.commit()
+        retrieved = local_file.LocalFileObjectStore(store_path).get_identifiable(submodel.id)
+        assert isinstance(retrieved, model.Submodel)
+        self.assertEqual({"b", "c", "collection"}, {element.id_short for element in retrieved.submodel_element})
+        collection = retrieved.get_referable("collection")
+        assert isinstance(collection, model.SubmodelElementCollection)
+        self.assertEqual(["y"], [element.id_short for element in collection.value])
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+from basyx.aas.backend import log_structured
+from basyx.aas.examples.data.example_aas import *
+
+
+class LogStructuredObjectStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.object_store: log_structured.LogStructuredObjectStore[model.Identifiable] = \
+            log_structured.LogStructuredObjectStore(self.directory)
+
+    def tearDown(self) -> None:
+        self.object_store.close()
+        shutil.rmtree(self.directory)
+
+    def _restore(self, **kwargs) -> log_structured.LogStructuredObjectStore[model.Identifiable]:
+        object_store: log_structured.LogStructuredObjectStore[model.Identifiable] = \
+            log_structured.LogStructuredObjectStore(self.directory, **kwargs)
+        self.addCleanup(object_store.close)
+        return object_store
+
+    def test_restore(self) -> None:
+        for item in create_full_example():
+            self.object_store.add(item)
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        self.object_store.discard(submodel)
+        self.assertEqual(4, len(self.object_store))
+
+        object_store = self._restore()
+        self.assertEqual(4, len(object_store))
+        self.assertNotIn("https://acplt.org/Test_Submodel", object_store)
+        object_store.add(create_example_submodel())
+        checker = AASDataChecker(raise_immediately=True)
+        check_full_example(checker, model.DictObjectStore(object_store))
+
+    def test_snapshot(self) -> None:
+        for item in create_full_example():
+            self.object_store.add(item)
+        self.object_store.snapshot()
+        self.object_store.discard(self.object_store.get_identifiable("https://acplt.org/Test_Submodel"))
+        self.assertEqual(["segment-00000001.log", "snapshot.jsonl"], sorted(os.listdir(self.directory)))
+
+        object_store = self._restore()
+        self.assertEqual(4, len(object_store))
+        self.assertNotIn("https://acplt.org/Test_Submodel", object_store)
+
+        # Snapshots are written automatically after the given number of mutations (including the replayed ones)
+        object_store.close()
+        object_store = self._restore(snapshot_interval=2)
+        object_store.add(create_example_submodel())
+        self.assertEqual(["segment-00000002.log", "snapshot.jsonl"], sorted(os.listdir(self.directory)))
+        self.assertEqual(0, os.path.getsize(os.path.join(self.directory, "segment-00000002.log")))
+        object_store.discard(object_store.get_identifiable("https://acplt.org/Test_Submodel"))
+        object_store.close()
+        self.assertEqual(4, len(self._restore()))
+
+    def test_reindex(self) -> None:
+        object_store: log_structured.LogStructuredObjectStore[model.Identifiable] = \
+            log_structured.LogStructuredObjectStore(os.path.join(self.directory, "indexed"),
+                                                    model.IndexedDictObjectStore())
+        self.addCleanup(object_store.close)
+        submodel = create_example_submodel()
+        object_store.add(submodel)
+        submodel.id_short = "NewIdShort"
+        submodel.id = "https://acplt.org/New_Submodel"
+        object_store.reindex(submodel)
+        self.assertEqual([submodel], list(object_store.query(model.Submodel, id_short="NewIdShort")))
+        with self.assertRaises(KeyError):
+            object_store.reindex(create_example_submodel())
+        object_store.close()
+
+        restored = self._restore()
+        self.assertEqual(0, len(restored))
+        restored = log_structured.LogStructuredObjectStore(os.path.join(self.directory, "indexed"))
+        self.addCleanup(restored.close)
+        self.assertEqual(["https://acplt.org/New_Submodel"], [item.id for item in restored])
+        self.assertEqual("NewIdShort", restored.get_identifiable("https://acplt.org/New_Submodel").id_short)
+
+        # The id can only be changed if the underlying store supports it
+        restored_submodel = restored.get_identifiable("https://acplt.org/New_Submodel")
+        restored_submodel.id = "https://acplt.org/Another_Submodel"
+        with self.assertRaises(KeyError):
+            restored.reindex(restored_submodel)
+
+    def test_incomplete_mutation(self) -> None:
+        self.object_store.add(create_example_submodel())
+        self.object_store.close()
+        segment_file_name = os.path.join(self.directory, "segment-00000000.log")
+        with open(segment_file_name, "ab") as segment_file:
+            segment_file.write(b'{"op":"delete","id":"https://acp')
+        with self.assertLogs(log_structured.logger, "WARNING"):
+            object_store = self._restore()
+        self.assertIn("https://acplt.org/Test_Submodel", object_store)
+        object_store.add(create_example_concept_description())
+        object_store.close()
+        self.assertEqual(2, len(self._restore()))
+
+    def test_write_behind(self) -> None:
+        object_store = self._restore(write_behind=True, flush_interval=3600)
+        submodel = create_example_submodel()
+        object_store.add(submodel)
+        for i in range(3):
+            submodel.id_short = "IdShort{}".format(i)
+            object_store.reindex(submodel)
+        segment_file_name = os.path.join(self.directory, "segment-00000000.log")
+        self.assertEqual(0, os.path.getsize(segment_file_name))
+
+        # Multiple changes of an object are written only once
+        object_store.flush()
+        with open(segment_file_name, "rb") as segment_file:
+            self.assertEqual(1, len(segment_file.readlines()))
+        object_store.discard(submodel)
+        object_store.close()
+        with self.assertRaises(ValueError):
+            object_store.add(submodel)
+        self.assertEqual(0, len(self._restore()))
+
+    def test_write_behind_failure(self) -> None:
+        object_store = self._restore(write_behind=True, flush_interval=3600, snapshot_interval=None)
+        submodel = create_example_submodel()
+        object_store.add(submodel)
+        with unittest.mock.patch.object(object_store, "_write", side_effect=OSError("No space left on device")):
+            with self.assertRaises(OSError):
+                object_store.flush()
+            with self.assertRaises(OSError):
+                object_store.snapshot()
+
+        # The mutations are still pending and written by the next flush
+        object_store.flush()
+        object_store.close()
+        self.assertIn(submodel.id, self._restore())
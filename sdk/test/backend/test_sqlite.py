@@ -0,0 +1,204 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+import os.path
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+from basyx.aas.backend import sqlite
+from basyx.aas.examples.data.example_aas import *
+
+
+class SQLiteBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.database_path = os.path.join(self.directory, "test.sqlite3")
+        self.object_store = sqlite.SQLiteObjectStore(self.database_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_object_store_add(self):
+        test_object = create_example_submodel()
+        self.object_store.add(test_object)
+        self.assertEqual("sqlite://localhost/{}?id=https%3A%2F%2Facplt.org%2FTest_Submodel"
+                         .format(self.database_path), test_object.source)
+
+    def test_retrieval(self):
+        test_object = create_example_submodel()
+        self.object_store.add(test_object)
+
+        # When retrieving the object, we should get the *same* instance as we added
+        test_object_retrieved = self.object_store.get_identifiable('https://acplt.org/Test_Submodel')
+        self.assertIs(test_object, test_object_retrieved)
+
+        # A new store reads the object from the database
+        submodel = sqlite.SQLiteObjectStore(self.database_path).get_identifiable('https://acplt.org/Test_Submodel')
+        self.assertIsNot(test_object, submodel)
+        assert isinstance(submodel, model.Submodel)
+        checker = AASDataChecker(raise_immediately=True)
+        check_example_submodel(checker, submodel)
+
+    def test_iterating(self) -> None:
+        example_data = create_full_example()
+        for item in example_data:
+            self.object_store.add(item)
+        self.assertEqual(5, len(self.object_store))
+
+        object_store = sqlite.SQLiteObjectStore(self.database_path)
+        retrieved_data_store: model.provider.DictObjectStore[model.Identifiable] = model.provider.DictObjectStore()
+        for item in object_store:
+            retrieved_data_store.add(item)
+        checker = AASDataChecker(raise_immediately=True)
+        check_full_example(checker, retrieved_data_store)
+
+        ordered = list(object_store.iter_from(batch_size=2))
+        self.assertEqual(sorted(item.id for item in example_data), [item.id for item in ordered])
+        self.assertEqual(ordered[2:], list(object_store.iter_from(ordered[1].id, batch_size=2)))
+
+    def test_key_errors(self) -> None:
+        example_submodel = create_example_submodel()
+        self.object_store.add(example_submodel)
+        with self.assertRaises(KeyError) as cm:
+            self.object_store.add(example_submodel)
+        self.assertEqual("'Identifiable with id https://acplt.org/Test_Submodel already exists in "
+                         "SQLite database'", str(cm.exception))
+
+        self.object_store.discard(example_submodel)
+        self.assertNotIn(example_submodel, self.object_store)
+        self.assertEqual(0, len(self.object_store))
+        with self.assertRaises(KeyError) as cm:
+            self.object_store.get_identifiable('https://acplt.org/Test_Submodel')
+        self.assertEqual("'No Identifiable with id https://acplt.org/Test_Submodel found in SQLite database'",
+                         str(cm.exception))
+        with self.assertRaises(KeyError) as cm:
+            self.object_store.discard(example_submodel)
+        self.assertEqual("'No AAS object with id https://acplt.org/Test_Submodel exists in SQLite database'",
+                         str(cm.exception))
+
+    def test_editing(self) -> None:
+        test_object = create_example_submodel()
+        self.object_store.add(test_object)
+
+        test_object.id_short = "SomeNewIdShort"
+        test_object.commit()
+        test_object.id_short = "AnotherIdShort"
+        test_object.update()
+        self.assertEqual("SomeNewIdShort", test_object.id_short)
+        self.assertEqual(["https://acplt.org/Test_Submodel"],
+                         [item.id for item in self.object_store.query(model.Submodel, id_short="SomeNewIdShort")])
+
+    def test_element_access(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        collection = submodel.get_referable("ExampleSubmodelCollection")
+        assert isinstance(collection, model.SubmodelElementCollection)
+
+        # Committing a nested element only writes the rows of the element
+        range_element = collection.get_referable("ExampleRange")
+        assert isinstance(range_element, model.Range)
+        range_element.max = 42
+        with unittest.mock.patch.object(sqlite, "_split_rows", wraps=sqlite._split_rows) as split_rows:
+            range_element.commit()
+        split_rows.assert_called_once()
+        self.assertEqual(("ExampleSubmodelCollection", "ExampleRange"), split_rows.call_args[0][1])
+
+        # Elements can be read separately
+        object_store = sqlite.SQLiteObjectStore(self.database_path)
+        retrieved_range = object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "ExampleRange"])
+        assert isinstance(retrieved_range, model.Range)
+        self.assertEqual(42, retrieved_range.max)
+        self.assertIsNone(retrieved_range.parent)
+
+        # Committing a separately read element changes it within the Identifiable
+        retrieved_range.min = 1
+        retrieved_range.commit()
+        submodel.update()
+        self.assertEqual(1, range_element.min)
+        self.assertEqual(42, range_element.max)
+
+        # Updating a separately read element only reads its rows
+        range_element.max = 43
+        range_element.commit()
+        retrieved_range.update()
+        self.assertEqual(43, retrieved_range.max)
+
+        # The order of the elements is kept and new elements are committed with their parent
+        collection.add_referable(model.Property("NewProperty", model.datatypes.String, "new"))
+        collection.get_referable("NewProperty").commit()
+        restored = object_store.get_identifiable(submodel.id)
+        assert isinstance(restored, model.Submodel)
+        restored_collection = restored.get_referable("ExampleSubmodelCollection")
+        assert isinstance(restored_collection, model.SubmodelElementCollection)
+        self.assertEqual([element.id_short for element in collection.value],
+                         [element.id_short for element in restored_collection.value])
+        new_property = object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "NewProperty"])
+        assert isinstance(new_property, model.Property)
+        self.assertEqual("new", new_property.value)
+
+        # Elements of SubmodelElementLists are committed with their list
+        submodel_list = collection.get_referable("ExampleSubmodelList")
+        assert isinstance(submodel_list, model.SubmodelElementList)
+        item = submodel_list.get_referable("0")
+        assert isinstance(item, model.Property)
+        item.value = "changed"
+        item.commit()
+        retrieved_item = object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "ExampleSubmodelList",
+                                                                  "0"])
+        assert isinstance(retrieved_item, model.Property)
+        self.assertEqual("changed", retrieved_item.value)
+        retrieved_list = object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "ExampleSubmodelList"])
+        assert isinstance(retrieved_list, model.SubmodelElementList)
+        self.assertEqual(2, len(retrieved_list.value))
+
+        with self.assertRaises(KeyError):
+            object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "NoSuchElement"])
+
+    def test_renamed_element_commit(self) -> None:
+        submodel = create_example_submodel()
+        self.object_store.add(submodel)
+        collection = submodel.get_referable("ExampleSubmodelCollection")
+        assert isinstance(collection, model.SubmodelElementCollection)
+        id_shorts = [element.id_short for element in collection.value]
+
+        # A renamed element replaces its old rows instead of being stored in addition to them
+        range_element = collection.get_referable("ExampleRange")
+        collection.remove_referable("ExampleRange")
+        range_element.id_short = "RenamedRange"
+        collection.add_referable(range_element)
+        range_element.commit()
+        object_store = sqlite.SQLiteObjectStore(self.database_path)
+        restored_collection = object_store.get_referable(submodel.id, ["ExampleSubmodelCollection"])
+        assert isinstance(restored_collection, model.SubmodelElementCollection)
+        self.assertEqual([element.id_short for element in collection.value],
+                         [element.id_short for element in restored_collection.value])
+        self.assertEqual(len(id_shorts), len(restored_collection.value))
+        with self.assertRaises(KeyError):
+            object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "ExampleRange"])
+        self.assertIsInstance(object_store.get_referable(submodel.id, ["ExampleSubmodelCollection", "RenamedRange"]),
+                              model.Range)
+
+    def test_query(self) -> None:
+        example_data = list(create_full_example())
+        for item in example_data:
+            self.object_store.add(item)
+        submodel = self.object_store.get_identifiable("https://acplt.org/Test_Submodel")
+        assert isinstance(submodel, model.Submodel)
+
+        self.assertEqual(sorted(item.id for item in example_data if isinstance(item, model.Submodel)),
+                         [item.id for item in self.object_store.query(model.Submodel)])
+        self.assertEqual([submodel.id], [item.id for item in self.object_store.query(
+            model.Submodel, semantic_id=submodel.semantic_id)])
+        self.assertEqual([], list(self.object_store.query(model.ConceptDescription, id_short="NoSuchIdShort")))
+
+        self.assertIn((submodel.id, "ExampleSubmodelCollection.ExampleRange"),
+                      list(self.object_store.query_elements(model.Range)))
+        range_element = submodel.get_referable(["ExampleSubmodelCollection", "ExampleRange"])
+        assert isinstance(range_element, model.Range) and range_element.semantic_id is not None
+        self.assertEqual([(submodel.id, "ExampleSubmodelCollection.ExampleRange")],
+                         list(self.object_store.query_elements(semantic_id=range_element.semantic_id)))
@@ -5,6 +5,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import time
 import unittest
 from unittest import mock
 from typing import Callable, Dict, Iterable, List, Optional, Type, TypeVar
@@ -201,6 +202,38 @@ class ReferableTest(unittest.TestCase):
         example_referable.update(recursive=False)
         MockBackend.update_object.assert_not_called()
 
+    def test_update_max_age(self):
+        backends.register_backend("mockScheme", MockBackend)
+        MockBackend.update_object.reset_mock()
+        example_referable = generate_example_referable_tree()
+        example_grandparent = example_referable.parent.parent
+        example_grandchild = example_referable.get_referable("exampleChild").get_referable("exampleGrandchild")
+
+        example_grandparent.update(max_age=10)
+        self.assertEqual(2, MockBackend.update_object.call_count)
+        self.assertIsNotNone(example_grandparent.last_source_update)
+        self.assertIsNotNone(example_grandchild.last_source_update)
+        MockBackend.update_object.reset_mock()
+
+        # The grandparent and the grandchild with its own source have been updated recently, so this is a no-op
+        example_grandparent.update(max_age=10)
+        example_referable.update(max_age=10)
+        MockBackend.update_object.assert_not_called()
+
+        # Without max_age, the objects are always updated
+        example_referable.update()
+        self.assertEqual(2, MockBackend.update_object.call_count)
+        MockBackend.update_object.reset_mock()
+
+        # Outdated data is updated again
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 20):
+            example_referable.update(max_age=10, recursive=False)
+        MockBackend.update_object.assert_called_once_with(
+            updated_object=example_referable,
+            store_object=example_grandparent,
+            relative_path=["exampleGrandparent", "exampleParent", "exampleReferable"]
+        )
+
     def test_commit(self):
         backends.register_backend("mockScheme", MockBackend)
         example_referable = generate_example_referable_tree()
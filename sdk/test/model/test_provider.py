@@ -5,7 +5,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import time
 import unittest
+import unittest.mock
 
 from basyx.aas import model
 
@@ -69,3 +71,222 @@ class ProvidersTest(unittest.TestCase):
         with self.assertRaises(KeyError) as cm:
             multiplexer.get_identifiable("urn:x-test:submodel3")
         self.assertEqual("'Identifier could not be found in any of the 2 consulted registries.'", str(cm.exception))
+
+    def test_indexed_store_query(self) -> None:
+        semantic_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:semantic"),))
+        self.submodel1.semantic_id = semantic_id
+        self.submodel1.id_short = "Sub1"
+        self.aas1.id_short = "Shell1"
+        specific_asset_id = model.SpecificAssetId("serial", "1234")
+        self.aas2.asset_information.specific_asset_id = [specific_asset_id]
+        object_store: model.IndexedDictObjectStore[model.Identifiable] = model.IndexedDictObjectStore(
+            [self.aas1, self.aas2, self.submodel1, self.submodel2])
+
+        self.assertEqual([self.aas1, self.aas2], list(object_store.query(model.AssetAdministrationShell)))
+        self.assertEqual([self.submodel1, self.submodel2], list(object_store.query(model.Submodel)))
+        self.assertEqual(4, len(list(object_store.query(model.Identifiable))))  # type: ignore[type-abstract]
+        self.assertEqual([self.aas1], list(object_store.query(model.AssetAdministrationShell, id_short="Shell1")))
+        self.assertEqual([], list(object_store.query(model.Submodel, id_short="Shell1")))
+        self.assertEqual([self.submodel1], list(object_store.query(model.Submodel, semantic_id=semantic_id)))
+        self.assertEqual([self.aas2], list(object_store.query(model.AssetAdministrationShell,
+                                                              specific_asset_ids=[specific_asset_id])))
+        self.assertEqual([self.aas1], list(object_store.query(model.AssetAdministrationShell,
+                                                              global_asset_id="http://acplt.org/TestAsset1/")))
+
+        # Changed attributes are only found after reindexing
+        self.submodel2.id_short = "Sub2"
+        self.assertEqual([], list(object_store.query(model.Submodel, id_short="Sub2")))
+        object_store.reindex(self.submodel2)
+        self.assertEqual([self.submodel2], list(object_store.query(model.Submodel, id_short="Sub2")))
+
+        # Stale index entries must not be returned
+        self.submodel1.id_short = "Sub3"
+        self.assertEqual([], list(object_store.query(model.Submodel, id_short="Sub1")))
+
+        # Reindexing handles a changed identifier
+        self.submodel2.id = "urn:x-test:submodel2_new"
+        object_store.reindex(self.submodel2)
+        self.assertIs(self.submodel2, object_store.get_identifiable("urn:x-test:submodel2_new"))
+        self.assertNotIn("urn:x-test:submodel2", object_store)
+
+        object_store.discard(self.submodel1)
+        self.assertEqual([self.submodel2], list(object_store.query(model.Submodel)))
+        self.assertEqual([], list(object_store.query(model.Submodel, semantic_id=semantic_id)))
+        with self.assertRaises(KeyError):
+            object_store.reindex(self.submodel1)
+
+        # The sorted index buckets are kept up to date, instead of being sorted again for each query
+        pages = [model.Submodel("urn:x-test:page{}".format(i), id_short="Page") for i in range(5)]
+        for submodel in pages:
+            object_store.add(submodel)
+        self.assertEqual(pages[2:], list(object_store.query(model.Submodel, id_short="Page", after=pages[1].id)))
+        with unittest.mock.patch("basyx.aas.model.provider.sorted", side_effect=AssertionError, create=True):
+            object_store.discard(pages[3])
+            object_store.add(model.Submodel("urn:x-test:page9", id_short="Page"))
+            self.assertEqual(["urn:x-test:page2", "urn:x-test:page4", "urn:x-test:page9"],
+                             [submodel.id for submodel in object_store.query(model.Submodel, id_short="Page",
+                                                                             after=pages[1].id)])
+
+    def test_store_iter_from(self) -> None:
+        for object_store in (model.DictObjectStore([self.submodel2, self.aas2, self.submodel1]),
+                             model.IndexedDictObjectStore([self.submodel2, self.aas2, self.submodel1])):
+            with self.subTest(store=type(object_store).__name__):
+                self.assertEqual([self.aas2, self.submodel1, self.submodel2], list(object_store.iter_from()))
+                self.assertEqual([self.submodel1, self.submodel2], list(object_store.iter_from("urn:x-test:aas2")))
+                # The position of an identifier is found, even if there is no object with it
+                self.assertEqual([self.submodel1, self.submodel2], list(object_store.iter_from("urn:x-test:b")))
+                # The store is kept sorted, when objects are added or discarded
+                object_store.add(self.aas1)
+                object_store.discard(self.submodel1)
+                self.assertEqual([self.aas1, self.aas2, self.submodel2], list(object_store.iter_from()))
+
+    def test_caching_store(self) -> None:
+        store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore([self.aas1, self.aas2])
+        caching_store = model.CachingObjectStore(store, max_items=2)
+        caching_store.add(self.submodel1)
+        self.assertIn(self.submodel1, store)
+        with unittest.mock.patch.object(store, "get_identifiable", wraps=store.get_identifiable) as get_identifiable:
+            self.assertIs(self.submodel1, caching_store.get_identifiable("urn:x-test:submodel1"))
+            self.assertIs(self.aas1, caching_store.get_identifiable("urn:x-test:aas1"))
+            self.assertIs(self.aas1, caching_store.get_identifiable("urn:x-test:aas1"))
+            self.assertEqual(1, get_identifiable.call_count)
+            # The least recently used object is evicted
+            self.assertIs(self.aas2, caching_store.get_identifiable("urn:x-test:aas2"))
+            self.assertIs(self.submodel1, caching_store.get_identifiable("urn:x-test:submodel1"))
+            self.assertEqual(3, get_identifiable.call_count)
+            with self.assertRaises(KeyError):
+                caching_store.get_identifiable("urn:x-test:submodel2")
+        self.assertEqual((2, 4, 2), (caching_store.hits, caching_store.misses, caching_store.evictions))
+
+        caching_store.discard(self.submodel1)
+        self.assertNotIn(self.submodel1, store)
+        with self.assertRaises(KeyError):
+            caching_store.get_identifiable("urn:x-test:submodel1")
+        self.assertEqual(2, len(caching_store))
+        self.assertEqual([self.aas1, self.aas2], list(caching_store.iter_from()))
+
+    def test_caching_store_reindex(self) -> None:
+        store: model.IndexedDictObjectStore[model.Identifiable] = model.IndexedDictObjectStore(
+            [self.submodel1, self.submodel2])
+        caching_store = model.CachingObjectStore(store)
+        self.assertIs(self.submodel1, caching_store.get_identifiable("urn:x-test:submodel1"))
+
+        # Reindexing is passed through to the wrapped store
+        self.submodel1.id_short = "Sub1"
+        caching_store.reindex(self.submodel1)
+        self.assertEqual([self.submodel1], list(caching_store.query(model.Submodel, id_short="Sub1")))
+
+        # The cache follows a changed identifier
+        self.submodel1.id = "urn:x-test:submodel1_new"
+        caching_store.reindex(self.submodel1)
+        self.assertIs(self.submodel1, store.get_identifiable("urn:x-test:submodel1_new"))
+        with unittest.mock.patch.object(store, "get_identifiable", wraps=store.get_identifiable) as get_identifiable:
+            self.assertIs(self.submodel1, caching_store.get_identifiable("urn:x-test:submodel1_new"))
+            self.assertEqual(0, get_identifiable.call_count)
+            with self.assertRaises(KeyError):
+                caching_store.get_identifiable("urn:x-test:submodel1")
+
+        # Objects, which are not cached, are only reindexed in the wrapped store
+        self.submodel2.id_short = "Sub2"
+        caching_store.reindex(self.submodel2)
+        self.assertEqual([self.submodel2], list(caching_store.query(model.Submodel, id_short="Sub2")))
+
+    def test_caching_store_limits(self) -> None:
+        store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore([self.aas1, self.aas2, self.submodel1])
+        caching_store = model.CachingObjectStore(store, max_items=None, max_bytes=100, size_estimator=lambda obj: 40,
+                                                 ttl=60)
+        for identifier in ("urn:x-test:aas1", "urn:x-test:aas2", "urn:x-test:submodel1"):
+            caching_store.get_identifiable(identifier)
+        self.assertEqual(1, caching_store.evictions)
+
+        # Expired objects are retrieved again
+        with unittest.mock.patch("time.monotonic", return_value=time.monotonic() + 61), \
+                unittest.mock.patch.object(store, "get_identifiable", wraps=store.get_identifiable) as get_identifiable:
+            caching_store.get_identifiable("urn:x-test:submodel1")
+        get_identifiable.assert_called_once_with("urn:x-test:submodel1")
+
+        # With the admission policy, rarely used objects do not evict frequently used ones
+        caching_store = model.CachingObjectStore(store, max_items=1, admission=True)
+        for _ in range(3):
+            caching_store.get_identifiable("urn:x-test:aas1")
+        caching_store.get_identifiable("urn:x-test:aas2")
+        caching_store.get_identifiable("urn:x-test:aas1")
+        self.assertEqual((3, 2, 0), (caching_store.hits, caching_store.misses, caching_store.evictions))
+
+        # The size is estimated without holding the lock of the cache
+        def size_estimator(obj: model.Identifiable) -> int:
+            self.assertFalse(caching_store._lock.locked())
+            return 40
+        caching_store = model.CachingObjectStore(store, max_bytes=100, size_estimator=size_estimator)
+        caching_store.get_identifiable("urn:x-test:aas1")
+        caching_store.add(model.Submodel("urn:x-test:submodel2"))
+        self.assertEqual(80, caching_store._bytes)
+
+    def test_provider_multiplexer_caches(self) -> None:
+        aas_object_store: model.DictObjectStore[model.AssetAdministrationShell] = model.DictObjectStore([self.aas1])
+        submodel_object_store: model.DictObjectStore[model.Submodel] = model.DictObjectStore([self.submodel1])
+        multiplexer = model.ObjectProviderMultiplexer([aas_object_store, submodel_object_store], negative_ttl=60,
+                                                      routing=True)
+        with unittest.mock.patch.object(aas_object_store, "get_identifiable",
+                                        wraps=aas_object_store.get_identifiable) as get_identifiable:
+            self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+            self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+            with self.assertRaises(KeyError):
+                multiplexer.get_identifiable("urn:x-test:aas2")
+            with self.assertRaises(KeyError):
+                multiplexer.get_identifiable("urn:x-test:aas2")
+            self.assertEqual(2, get_identifiable.call_count)
+
+            # Misses are forgotten after the TTL or when invalidating the multiplexer
+            aas_object_store.add(self.aas2)
+            with unittest.mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+                self.assertIs(self.aas2, multiplexer.get_identifiable("urn:x-test:aas2"))
+            aas_object_store.discard(self.aas2)
+            with self.assertRaises(KeyError):
+                multiplexer.get_identifiable("urn:x-test:aas2")
+            aas_object_store.add(self.aas2)
+            multiplexer.invalidate("urn:x-test:aas2")
+            self.assertIs(self.aas2, multiplexer.get_identifiable("urn:x-test:aas2"))
+
+        # Outdated routes are dropped
+        submodel_object_store.discard(self.submodel1)
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel1")
+        submodel_object_store.add(self.submodel1)
+        multiplexer.invalidate()
+        self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+
+    def test_provider_multiplexer_cache_size(self) -> None:
+        aas_object_store: model.DictObjectStore[model.AssetAdministrationShell] = model.DictObjectStore([self.aas1])
+        submodel_object_store: model.DictObjectStore[model.Submodel] = model.DictObjectStore([self.submodel1])
+        multiplexer = model.ObjectProviderMultiplexer([aas_object_store, submodel_object_store], negative_ttl=60,
+                                                      routing=True, cache_size=2)
+        for i in range(5):
+            with self.assertRaises(KeyError):
+                multiplexer.get_identifiable("urn:x-test:missing{}".format(i))
+        self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+        self.assertIs(self.aas1, multiplexer.get_identifiable("urn:x-test:aas1"))
+        self.assertEqual([2, 2], [len(negative_cache) for negative_cache in multiplexer._negative_cache.values()])
+        self.assertEqual(["urn:x-test:submodel1", "urn:x-test:aas1"], list(multiplexer._routes))
+
+        # The least recently used entries are dropped
+        self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:missing4")
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:missing5")
+        self.assertEqual(["urn:x-test:missing4", "urn:x-test:missing5"],
+                         list(multiplexer._negative_cache[id(aas_object_store)]))
+
+    def test_provider_multiplexer_concurrent(self) -> None:
+        aas_object_store: model.DictObjectStore[model.AssetAdministrationShell] = model.DictObjectStore([self.aas1])
+        submodel_object_store: model.DictObjectStore[model.Submodel] = model.DictObjectStore([self.submodel1])
+        multiplexer = model.ObjectProviderMultiplexer([aas_object_store, submodel_object_store], concurrent=True)
+        self.assertIs(self.aas1, multiplexer.get_identifiable("urn:x-test:aas1"))
+        self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel2")
+        multiplexer.close()
+        self.assertIsNone(multiplexer._executor)
+        self.assertIs(self.aas1, multiplexer.get_identifiable("urn:x-test:aas1"))
+        multiplexer.close()
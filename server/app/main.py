@@ -1,9 +1,9 @@
 import os
-import pathlib
 import sys
 
-from basyx.aas import model, adapter
+from basyx.aas import model
 from basyx.aas.adapter import aasx
+from basyx.aas.adapter.directory import load_directory_into
 
 from basyx.aas.backend.local_file import LocalFileObjectStore
 from basyx.aas.adapter.http import WSGIApp
@@ -11,33 +11,29 @@ from basyx.aas.adapter.http import WSGIApp
 storage_path = os.getenv("STORAGE_PATH", "/storage")
 storage_type = os.getenv("STORAGE_TYPE", "LOCAL_FILE_READ_ONLY")
 base_path = os.getenv("API_BASE_PATH")
+update_max_age = os.getenv("UPDATE_MAX_AGE")
+load_workers = os.getenv("STORAGE_LOAD_WORKERS")
 
 wsgi_optparams = {}
 
 if base_path is not None:
     wsgi_optparams["base_path"] = base_path
+if update_max_age is not None:
+    wsgi_optparams["update_max_age"] = float(update_max_age)
 
 if storage_type == "LOCAL_FILE_BACKEND":
     application = WSGIApp(LocalFileObjectStore(storage_path), aasx.DictSupplementaryFileContainer(), **wsgi_optparams)
 
 elif storage_type in "LOCAL_FILE_READ_ONLY":
-    object_store: model.DictObjectStore = model.DictObjectStore()
+    object_store: model.DictObjectStore = model.IndexedDictObjectStore()
     file_store: aasx.DictSupplementaryFileContainer = aasx.DictSupplementaryFileContainer()
 
-    for file in pathlib.Path(storage_path).iterdir():
-        if not file.is_file():
-            continue
-        print(f"Loading {file}")
-
-        if file.suffix.lower() == ".json":
-            with open(file) as f:
-                adapter.json.read_aas_json_file_into(object_store, f)
-        elif file.suffix.lower() == ".xml":
-            with open(file) as f:
-                adapter.xml.read_aas_xml_file_into(object_store, file)
-        elif file.suffix.lower() == ".aasx":
-            with aasx.AASXReader(file) as reader:
-                reader.read_into(object_store=object_store, file_store=file_store)
+    # The files are parsed in parallel. Objects with an identifier which has already been loaded from another file are
+    # skipped.
+    for loaded in load_directory_into(object_store, file_store, storage_path, ignore_existing=True,
+                                      workers=int(load_workers) if load_workers is not None else None):
+        print(f"Loaded {loaded.path} ({len(loaded.identifiers)} objects) in {loaded.parse_time:.2f} s "
+              f"(+ {loaded.merge_time:.2f} s merging)")
 
     application = WSGIApp(object_store, file_store, **wsgi_optparams)
 